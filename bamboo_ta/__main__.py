@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+# __main__.py
+
+"""
+Run the bamboo-ta command with ``python -m bamboo_ta`` (see ``cli``).
+"""
+
+import sys
+
+from bamboo_ta.cli import main
+
+sys.exit(main())
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# _jit.py
+
+"""
+Optional just-in-time compilation support for bamboo-ta kernels.
+
+Path-dependent indicators (trailing stops, clamped recursions, adaptive
+smoothers) cannot be expressed with vectorised pandas operations, so their
+inner loops are written as plain functions over NumPy arrays. When Numba is
+installed these kernels are compiled to machine code with ``njit``; when it
+is not, the very same Python functions run unchanged, except the rolling and
+EWM kernels of the core layer, which then run through pandas' window
+functions (see ``core._kernels``). Numba therefore stays an optional
+dependency and both paths produce the same results.
+
+Compiled kernels release the GIL while they run, so indicators computed on
+several threads (see ``bamboo_ta.executor``) run their kernels in parallel.
+
+Set the environment variable ``BAMBOO_TA_DISABLE_JIT=1`` to force the pure
+Python path (and the pandas window functions), e.g. when debugging a kernel.
+"""
+
+import os
+
+try:
+    from numba import njit as _numba_njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    _numba_njit = None
+    NUMBA_AVAILABLE = False
+
+JIT_ENABLED = NUMBA_AVAILABLE and os.environ.get(
+    "BAMBOO_TA_DISABLE_JIT", ""
+).lower() not in ("1", "true", "yes")
+
+
+def njit(*args, **kwargs):
+    """
+    Compile a kernel with ``numba.njit`` when available.
+
+    Can be used both as ``@njit`` and as ``@njit(...)``. Compiled kernels are
+    cached on disk by default so the compilation cost is paid only once, and
+    release the GIL by default. When Numba is missing (or disabled) the
+    decorated function is returned as-is.
+
+    Parameters:
+    - *args: The function to decorate (bare decorator form) or nothing.
+    - **kwargs: Options forwarded to ``numba.njit``.
+
+    Returns:
+    - Callable: The compiled kernel, or the original Python function.
+    """
+    kwargs.setdefault("cache", True)
+    kwargs.setdefault("nogil", True)
+
+    def decorate(func):
+        if not JIT_ENABLED:
+            return func
+        return _numba_njit(**kwargs)(func)
+
+    # Bare decorator usage: @njit
+    if len(args) == 1 and callable(args[0]):
+        return decorate(args[0])
+
+    return decorate
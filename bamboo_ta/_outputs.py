@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# _outputs.py
+
+"""
+Output dtype policy for signal and label columns.
+
+Flags (0/1), directions (-1/1) and trade signals (-1/0/1) only need one
+byte, and string labels repeat a handful of values, so by default they are
+returned in compact dtypes:
+
+- Flags, directions and trade signals are int8 instead of int64/float64.
+  The warm-up bars of a direction without a value are 0 instead of NaN.
+- Labels (candle types and patterns, FRAMA colours) are pandas Categoricals
+  with a fixed set of categories instead of object strings.
+
+This cuts their memory by 8x or more and keeps comparisons such as
+``df['signal'] == 1`` or ``df['type'] == 'hammer'`` working unchanged.
+
+The policy is set globally with ``set_output_policy('legacy')`` (or the
+environment variable ``BAMBOO_TA_OUTPUT_POLICY=legacy``) to get back the
+previous int64/float64/object outputs.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+_POLICIES = ("compact", "legacy")
+
+
+def _validate_policy(policy: str) -> str:
+    """
+    Check the name of an output policy.
+
+    Parameters:
+    - policy (str): 'compact' or 'legacy'.
+
+    Returns:
+    - str: The validated policy.
+    """
+    if policy not in _POLICIES:
+        raise ValueError(f"output policy must be one of {_POLICIES}, got {policy!r}")
+    return policy
+
+
+_output_policy = _validate_policy(os.environ.get("BAMBOO_TA_OUTPUT_POLICY", "compact"))
+
+
+def set_output_policy(policy: str) -> None:
+    """
+    Set the dtype policy of flag, direction and label outputs.
+
+    Parameters:
+    - policy (str): 'compact' (int8 flags and directions, Categorical
+      labels) or 'legacy' (int64/float64 flags and directions, object labels).
+
+    Returns:
+    - None
+    """
+    global _output_policy
+    _output_policy = _validate_policy(policy)
+
+
+def get_output_policy() -> str:
+    """
+    Get the dtype policy of flag, direction and label outputs.
+
+    Returns:
+    - str: 'compact' or 'legacy'.
+    """
+    return _output_policy
+
+
+def _flag_dtype():
+    """
+    Get the dtype of flag and trade signal columns.
+
+    Returns:
+    - np.dtype: int8 (compact) or int64 (legacy).
+    """
+    return np.int8 if _output_policy == "compact" else np.int64
+
+
+def _signal_dtype(values):
+    """
+    Get the dtype of an integer signal column whose values are not bounded.
+
+    Parameters:
+    - values (np.ndarray or pd.Series): Integer values.
+
+    Returns:
+    - np.dtype: The flag dtype, or int64 when a value does not fit int8.
+    """
+    dtype = _flag_dtype()
+    bounds = np.iinfo(dtype)
+    if len(values) and (values.min() < bounds.min or values.max() > bounds.max):
+        return np.int64
+    return dtype
+
+
+def _direction(values):
+    """
+    Convert a -1/1 direction with NaN warm-up bars to the policy dtype.
+
+    Parameters:
+    - values (np.ndarray): float direction values.
+
+    Returns:
+    - np.ndarray: int8 with 0 for NaN (compact) or the float values (legacy).
+    """
+    if _output_policy == "legacy":
+        return values
+    return np.nan_to_num(values, nan=0.0).astype(np.int8)
+
+
+def _labels(values, categories):
+    """
+    Convert string labels to the policy dtype.
+
+    Parameters:
+    - values (pd.Series): object labels.
+    - categories (list): All possible labels, in display order.
+
+    Returns:
+    - pd.Series: Categorical (compact) or the object labels (legacy).
+    """
+    if _output_policy == "legacy":
+        return values
+    return values.astype(pd.CategoricalDtype(categories))
@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+# _results.py
+
+"""
+Assembly of multi-output indicator results.
+
+Building a result with ``pd.DataFrame(index=...)`` and assigning the columns
+one by one gives pandas one block per column, and selecting ``df_copy[[...]]``
+from a full copy of the input copies every input column first. Instead the
+indicators hand their output arrays to ``_build_result``:
+
+- 'frame' allocates one 2D block per dtype, copies the outputs into it and
+  wraps the blocks in a DataFrame without further copies, so the result is
+  consolidated from the start.
+- 'dict' returns the output arrays as they are, without any copy.
+- 'ndarray' returns one 2D array of shape (rows, outputs) in the common
+  dtype of the outputs.
+
+The dict and ndarray containers skip the DataFrame construction and suit hot
+paths that only need the values.
+
+Indicators on a single source column also accept a list of columns. The
+columns are taken from the input as one 2D block (``_source_values``), the
+core function runs over the whole block at once, and ``_wide_columns``
+names the outputs ``<output>_<column>``, grouped by output in the order of
+the list. The other indicators of the bta namespace get the same list support
+by one call per column (``_column_lists``).
+"""
+
+import functools
+import inspect
+
+import numpy as np
+import pandas as pd
+
+try:
+    from pandas.core.internals import BlockManager
+    from pandas.core.internals.api import make_block
+except ImportError:  # Block API moved or removed, use the dict constructor
+    BlockManager = make_block = None
+
+RETURN_TYPES = ("frame", "dict", "ndarray")
+
+
+def _validate_return_type(return_type: str) -> str:
+    """
+    Check the name of a result container.
+
+    Parameters:
+    - return_type (str): 'frame', 'dict' or 'ndarray'.
+
+    Returns:
+    - str: The validated return type.
+    """
+    if return_type not in RETURN_TYPES:
+        raise ValueError(
+            f"return_type must be one of {RETURN_TYPES}, got {return_type!r}"
+        )
+    return return_type
+
+
+def _source_values(df: pd.DataFrame, column) -> np.ndarray:
+    """
+    Get the source values of one column or of a list of columns.
+
+    Parameters:
+    - df (pd.DataFrame): Input DataFrame.
+    - column (str or list): A column name, or a list of column names.
+
+    Returns:
+    - np.ndarray: The column as a 1D array, or the columns as a 2D array of
+      shape (rows, columns).
+    """
+    if isinstance(column, str):
+        return df[column].to_numpy()
+    return df[list(column)].to_numpy()
+
+
+def _output_arrays(result, name: str) -> dict:
+    """
+    Get the outputs of an indicator result by output name.
+
+    Parameters:
+    - result (pd.DataFrame, pd.Series, dict or np.ndarray): The result.
+    - name (str): Output name of unnamed Series and arrays.
+
+    Returns:
+    - dict: Output name -> values (see ``_values``).
+    """
+    if isinstance(result, pd.DataFrame):
+        return {str(column): _values(result[column]) for column in result.columns}
+    if isinstance(result, dict):
+        return {str(column): _values(values) for column, values in result.items()}
+    if isinstance(result, pd.Series) and result.name is not None:
+        name = str(result.name)
+    return {name: _values(result)}
+
+
+def _column_lists(func):
+    """
+    Let an indicator reading one source column take a list of columns.
+
+    A list or tuple for ``column`` runs the indicator once per column and
+    names the outputs '<output>_<column>', grouped by output, as the
+    indicators computing all columns in one call do. Lists for the other
+    column parameters (the high, low or trend column of an indicator) raise
+    a TypeError.
+
+    Parameters:
+    - func (Callable): The indicator function.
+
+    Returns:
+    - Callable: ``func`` itself when no parameter is a plain ``str`` column
+      name, otherwise the wrapped function.
+    """
+    try:
+        signature = inspect.signature(func)
+    except (TypeError, ValueError):
+        return func
+    positions = {
+        parameter.name: position
+        for position, parameter in enumerate(signature.parameters.values())
+        if parameter.annotation in (str, "str")
+        and (parameter.name == "column" or parameter.name.endswith(("_column", "_col")))
+    }
+    if not positions:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        columns = None
+        for name, position in positions.items():
+            value = args[position] if position < len(args) else kwargs.get(name)
+            if not isinstance(value, (list, tuple)):
+                continue
+            if name != "column":
+                raise TypeError(
+                    f"{func.__name__}() takes a single column name for {name!r}, "
+                    f"got {type(value).__name__}"
+                )
+            columns = list(value)
+        if columns is None:
+            return func(*args, **kwargs)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return_type = bound.arguments.get("return_type", "frame")
+        if "return_type" in bound.arguments:
+            bound.arguments["return_type"] = "dict"
+        outputs = {}
+        index = None
+        for source in columns:
+            bound.arguments["column"] = source
+            result = func(*bound.args, **bound.kwargs)
+            if index is None and isinstance(result, (pd.DataFrame, pd.Series)):
+                index = result.index
+            for output, values in _output_arrays(result, func.__name__).items():
+                outputs.setdefault(output, {})[source] = values
+        if index is None:
+            index = next(iter(bound.arguments.values())).index
+        wide = {
+            f"{output}_{source}": values
+            for output, per_source in outputs.items()
+            for source, values in per_source.items()
+        }
+        return _build_result(wide, index, _validate_return_type(return_type))
+
+    return wrapper
+
+
+def _wide_columns(outputs: dict, column) -> dict:
+    """
+    Name the outputs of an indicator computed on one or several columns.
+
+    Parameters:
+    - outputs (dict): Output name -> values, 1D for a single column or 2D
+      with one column per source column.
+    - column (str or list): The ``column`` argument of the indicator.
+
+    Returns:
+    - dict: ``outputs`` unchanged for a single column, otherwise
+      '<output>_<column>' -> 1D values, grouped by output.
+    """
+    if isinstance(column, str):
+        return outputs
+    return {
+        f"{name}_{source}": values[:, position]
+        for name, values in outputs.items()
+        for position, source in enumerate(column)
+    }
+
+
+def _values(column):
+    """
+    Get the values of an output column.
+
+    Parameters:
+    - column (np.ndarray, pd.Series or pd.Categorical): The output.
+
+    Returns:
+    - np.ndarray or pd.Categorical: The values, without copying.
+    """
+    if isinstance(column, pd.Series):
+        column = column.array if isinstance(column.dtype, pd.CategoricalDtype) else column.to_numpy()
+    if isinstance(column, pd.Categorical):
+        return column
+    return np.asarray(column)
+
+
+def _consolidated_frame(columns: dict, index) -> pd.DataFrame:
+    """
+    Build a DataFrame with one block per dtype.
+
+    Parameters:
+    - columns (dict): Column name -> values (see ``_values``).
+    - index (pd.Index): Index of the result.
+
+    Returns:
+    - pd.DataFrame: The result.
+    """
+    names = list(columns)
+    if BlockManager is None or not hasattr(pd.DataFrame, "_from_mgr"):
+        # pandas stacks the arrays of each dtype into one block itself
+        return pd.DataFrame(columns, index=index, columns=names)
+
+    groups = {}
+    blocks = []
+    for position, (name, values) in enumerate(columns.items()):
+        if isinstance(values, pd.Categorical):
+            blocks.append(make_block(values, placement=[position], ndim=2))
+        else:
+            groups.setdefault(values.dtype, []).append(position)
+
+    for dtype, positions in groups.items():
+        block = np.empty((len(positions), len(index)), dtype=dtype)
+        for row, position in enumerate(positions):
+            block[row] = columns[names[position]]
+        blocks.append(make_block(block, placement=positions, ndim=2))
+
+    manager = BlockManager(blocks, [pd.Index(names), index])
+    return pd.DataFrame._from_mgr(manager, axes=manager.axes)
+
+
+def _build_result(columns: dict, index, return_type: str = "frame"):
+    """
+    Assemble the outputs of an indicator in the requested container.
+
+    Parameters:
+    - columns (dict): Column name -> output values (NumPy arrays, Series or
+      Categoricals of the same length as index), in result order.
+    - index (pd.Index): Index of the result (used by 'frame' only).
+    - return_type (str): 'frame' for a DataFrame, 'dict' for a dict of
+      NumPy arrays or 'ndarray' for a 2D array with one column per output.
+      Default is 'frame'.
+
+    Returns:
+    - pd.DataFrame, dict or np.ndarray: The result. In the ndarray, columns
+      are in dict order and share one dtype (object when labels are present).
+    """
+    _validate_return_type(return_type)
+    columns = {name: _values(values) for name, values in columns.items()}
+
+    if return_type == "dict":
+        return columns
+    if return_type == "ndarray":
+        dtype = np.result_type(
+            *(
+                object if isinstance(values, pd.Categorical) else values.dtype
+                for values in columns.values()
+            )
+        )
+        # Column-major, so each output column is contiguous as in a DataFrame block
+        result = np.empty((len(columns), len(index)), dtype=dtype)
+        for row, values in enumerate(columns.values()):
+            result[row] = values
+        return result.T
+    return _consolidated_frame(columns, index)
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+# aio.py
+
+"""
+asyncio facade over ``run_many``.
+
+Computing a strategy's indicators takes tens to hundreds of milliseconds. In
+an asyncio bot that time blocks the event loop, and with it the websocket
+handling and order management of every pair. These coroutines run the
+computation in an executor instead and leave the event loop free:
+
+- ``acompute`` runs ``run_many`` for one frame in an executor, with an
+  optional timeout. Cancelling it (or hitting the timeout) stops
+  ``run_many`` from starting further indicators.
+- ``astream`` fans out over many pairs with at most ``concurrency`` frames
+  in flight and yields the results as they finish. It takes the next frame
+  from its input only when a slot frees, so a slow consumer or a slow
+  computation holds back an async producer (back-pressure).
+- ``acompute_many`` collects ``astream`` into a dict.
+
+The executor is the event loop's default thread pool unless one is passed.
+A ``ProcessPoolExecutor`` sidesteps the GIL completely, at the cost of
+pickling every frame to the worker. Its specs must then be picklable:
+indicator names, the functions of the ``bta`` namespace or other
+module-level functions, but not lambdas or closures, which raise
+``PicklingError``. Cancellation cannot reach a call that already runs in
+another process; only its result is discarded.
+
+The results are exactly those of ``run_many``; this module only schedules.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from bamboo_ta.executor import run_many
+
+
+async def acompute(
+    df,
+    specs: list,
+    executor=None,
+    timeout: float = None,
+    workers: int = 1,
+    report: bool = False,
+    return_type: str = "frame",
+):
+    """Compute indicators without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    # An Event cannot be sent to another process
+    cancel_event = None if isinstance(executor, ProcessPoolExecutor) else threading.Event()
+    call = functools.partial(
+        run_many,
+        df,
+        specs,
+        workers=workers,
+        report=report,
+        return_type=return_type,
+        cancel_event=cancel_event,
+    )
+    try:
+        return await asyncio.wait_for(loop.run_in_executor(executor, call), timeout)
+    except (asyncio.CancelledError, asyncio.TimeoutError):
+        if cancel_event is not None:
+            cancel_event.set()
+        raise
+
+
+acompute.__doc__ = """
+Name:
+    Async Compute
+
+Description:
+    Awaitable version of run_many. The indicators are computed in an executor, so the
+    event loop keeps serving websockets and orders meanwhile. The results are the same
+    as those of run_many.
+
+    On cancellation or timeout, run_many starts no further indicators. The indicator
+    that is running at that moment still finishes in its thread. With a process pool,
+    a call that has already started cannot be stopped; its result is discarded.
+
+Parameters:
+    - df (pandas.DataFrame): Input DataFrame.
+    - specs (list): Indicator specs, see run_many.
+    - executor (concurrent.futures.Executor): Where to compute. Default is None, the
+      event loop's default thread pool. A ProcessPoolExecutor needs picklable specs:
+      indicator names, bta functions or other module-level functions; lambdas and
+      closures raise PicklingError.
+    - timeout (float): Seconds before asyncio.TimeoutError is raised. Default is None
+      (no timeout).
+    - workers (int): Threads run_many uses for this frame. Default is 1, which runs the
+      indicators one after the other; fan-out over pairs gives the parallelism.
+    - report (bool): Also return the timing report of run_many. Default is False.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
+
+Call with:
+    result = await bta.acompute(df, specs, timeout=1.0)
+    df = df.join(result)
+
+Returns:
+    pd.DataFrame: The run_many result (a tuple with the report when report=True).
+"""
+
+
+async def _pairs(frames):
+    """
+    Iterate the (key, frame) pairs of a fan-out input.
+
+    Parameters:
+    - frames (dict, iterable or async iterable): key -> frame dict, or
+      (key, frame) pairs.
+
+    Returns:
+    - AsyncIterator: The pairs.
+    """
+    if hasattr(frames, "__aiter__"):
+        async for pair in frames:
+            yield pair
+    else:
+        for pair in frames.items() if isinstance(frames, dict) else frames:
+            yield pair
+
+
+async def _keyed(key, coroutine) -> tuple:
+    """
+    Await a coroutine and tag its result with a key.
+
+    Parameters:
+    - key: The tag.
+    - coroutine (Coroutine): The computation.
+
+    Returns:
+    - tuple: (key, result).
+    """
+    return key, await coroutine
+
+
+async def astream(frames, specs: list, concurrency: int = 4, **options):
+    """Compute indicators for many pairs with bounded concurrency"""
+    if concurrency < 1:
+        raise ValueError("concurrency must be a positive integer")
+
+    source = _pairs(frames)
+    pending = set()
+    exhausted = False
+    try:
+        while True:
+            # Take the next frames only while a slot is free
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    key, df = await source.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(_keyed(key, acompute(df, specs, **options))))
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+astream.__doc__ = """
+Name:
+    Async Stream
+
+Description:
+    Computes the same indicator specs for many pairs and yields (key, result) pairs as
+    the computations finish. At most `concurrency` frames are in flight. The next frame
+    is taken from `frames` only when a slot frees. With an async iterable input this
+    throttles the producer to the speed of the computation (back-pressure).
+
+    If one computation fails, the others are cancelled and its exception is raised.
+    Leaving the loop early also cancels the computations in flight.
+
+Parameters:
+    - frames (dict, iterable or async iterable): key -> DataFrame dict, or
+      (key, DataFrame) pairs.
+    - specs (list): Indicator specs, see run_many.
+    - concurrency (int): Maximum number of frames in flight. Default is 4.
+    - **options: executor, timeout (per frame), workers, report and return_type, as
+      in acompute.
+
+Call with:
+    async for pair, result in bta.astream(frames, specs, concurrency=8):
+        dataframes[pair] = dataframes[pair].join(result)
+
+Returns:
+    AsyncIterator: (key, result) tuples in completion order.
+"""
+
+
+async def acompute_many(frames, specs: list, concurrency: int = 4, **options) -> dict:
+    """Compute indicators for many pairs and collect the results"""
+    order = []
+
+    async def tracked():
+        async for key, df in _pairs(frames):
+            order.append(key)
+            yield key, df
+
+    results = {}
+    async for key, result in astream(tracked(), specs, concurrency, **options):
+        results[key] = result
+    return {key: results[key] for key in order}
+
+
+acompute_many.__doc__ = """
+Name:
+    Async Compute Many
+
+Description:
+    Runs astream over all frames and collects the results into a dict in input order.
+
+Parameters:
+    - frames (dict, iterable or async iterable): key -> DataFrame dict, or
+      (key, DataFrame) pairs.
+    - specs (list): Indicator specs, see run_many.
+    - concurrency (int): Maximum number of frames in flight. Default is 4.
+    - **options: executor, timeout (per frame), workers, report and return_type, as
+      in acompute.
+
+Call with:
+    results = await bta.acompute_many(dataframes, specs, concurrency=8, timeout=2.0)
+
+Returns:
+    dict: key -> run_many result.
+"""
@@ -1,6 +1,7 @@
 # bamboo_ta.py
 # -*- coding: utf-8 -*-
 # Import the individual bamboo ta libraries
+from bamboo_ta import core
 from bamboo_ta.candles import *
 from bamboo_ta.cycles import *
 from bamboo_ta.momentum import *
@@ -10,6 +11,41 @@ from bamboo_ta.trend import *
 from bamboo_ta.utility import *
 from bamboo_ta.volatility import *
 from bamboo_ta.volume import *
+from bamboo_ta import interop
+from bamboo_ta._results import _column_lists
+
+# Accept pyarrow and Polars inputs in every indicator of the bta namespace, and
+# take lists of columns where the indicator reads a single column
+for _name, _func in list(globals().items()):
+    if (
+        callable(_func)
+        and not _name.startswith("_")
+        and getattr(_func, "__module__", "").startswith("bamboo_ta.")
+        and not isinstance(_func, type)
+    ):
+        _wrapped = interop.table_support(_column_lists(_func))
+        # Pickle by reference to this module, where the wrapper is bound
+        _wrapped.__module__, _wrapped.__qualname__ = __name__, _name
+        globals()[_name] = _wrapped
+del _name, _func, _wrapped
+
+from bamboo_ta._outputs import get_output_policy, set_output_policy
+from bamboo_ta.executor import run_many
+from bamboo_ta.aio import acompute, acompute_many, astream
+from bamboo_ta.chunked import run_chunked, write_chunked
+from bamboo_ta.metadata import indicator_metadata, registered_indicators, update_tail
+from bamboo_ta.bars import (
+    dollar_bars,
+    range_bars,
+    renko_bars,
+    tick_imbalance_bars,
+    volume_bars,
+)
+from bamboo_ta import store
+from bamboo_ta.expr import expr
+from bamboo_ta.screener import screen
+from bamboo_ta import shared_cache
+from bamboo_ta.events import densify_events
 
 def test_indicator(indicator_func, timeframe="1d", *args, **kwargs):
     """
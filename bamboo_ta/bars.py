@@ -0,0 +1,514 @@
+# -*- coding: utf-8 -*-
+# bars.py
+
+"""
+Alternative bars built from 1-minute candles or raw trades.
+
+Time bars sample the market at a fixed clock. The builders here sample it by
+activity instead and return a standard OHLCV frame ('date', 'open', 'high',
+'low', 'close', 'volume') that every indicator accepts:
+
+- volume_bars and dollar_bars close a bar each time the cumulative volume
+  (or traded value) crosses the next multiple of the threshold. The bar
+  ends are found with one ``np.searchsorted`` over the cumulative sum.
+- range_bars close a bar when its high - low reaches a fixed range.
+- renko_bars emit a brick each time the close moves one brick beyond the
+  last brick (two bricks for a reversal).
+- tick_imbalance_bars close a bar when the signed tick count (tick rule)
+  since its start reaches a threshold in either direction.
+
+Range, Renko and tick-imbalance bars are path dependent; their boundaries
+come from small kernels (see ``_jit``) over the rows, and the OHLCV values of
+every bar type are aggregated with ``ufunc.reduceat`` over the bar ends.
+
+The input is a DataFrame (or a dict of arrays) of candles with 'date',
+'open', 'high', 'low', 'close' and 'volume', or of trades with 'timestamp',
+'price' and 'size'. The 'date' of a bar is the timestamp of its first row.
+Only completed bars are returned. With a ``state`` dict the rows of the bar
+still forming are carried into the next call, so feeding the input chunk by
+chunk through the same state gives the bars of a single call:
+
+    state = {}
+    for chunk in chunks:
+        bars = bta.volume_bars(chunk, threshold=1_000, state=state)
+"""
+
+import numpy as np
+import pandas as pd
+
+from bamboo_ta._jit import njit
+
+_BAR_COLUMNS = ("date", "open", "high", "low", "close", "volume")
+
+
+@njit
+def _range_ends_kernel(high, low, size, ends):
+    """
+    Ends of the range bars.
+
+    Parameters:
+    - high (np.ndarray): High prices (NaN values are skipped).
+    - low (np.ndarray): Low prices.
+    - size (float): Range of a bar.
+    - ends (np.ndarray): int64 output array, as long as the input.
+
+    Returns:
+    - int: Number of bars, whose last rows fill the start of ``ends``.
+    """
+    count = 0
+    top = -np.inf
+    bottom = np.inf
+    for i in range(high.shape[0]):
+        if high[i] > top:
+            top = high[i]
+        if low[i] < bottom:
+            bottom = low[i]
+        if top - bottom >= size:
+            ends[count] = i
+            count += 1
+            top = -np.inf
+            bottom = np.inf
+    return count
+
+
+@njit
+def _imbalance_ends_kernel(signs, threshold, ends):
+    """
+    Ends of the tick-imbalance bars.
+
+    Parameters:
+    - signs (np.ndarray): Tick rule signs (-1, 0 or 1) of the rows.
+    - threshold (float): Absolute imbalance that closes a bar.
+    - ends (np.ndarray): int64 output array, as long as the input.
+
+    Returns:
+    - int: Number of bars, whose last rows fill the start of ``ends``.
+    """
+    count = 0
+    imbalance = 0.0
+    for i in range(signs.shape[0]):
+        imbalance += signs[i]
+        if abs(imbalance) >= threshold:
+            ends[count] = i
+            count += 1
+            imbalance = 0.0
+    return count
+
+
+@njit
+def _renko_kernel(close, brick, level, direction, rows, opens, closes):
+    """
+    Renko bricks of a close series.
+
+    Parameters:
+    - close (np.ndarray): Close prices (NaN values are skipped).
+    - brick (float): Brick size.
+    - level (float): Close of the last brick, NaN to start at the first close.
+    - direction (int): Direction of the last brick (1, -1, or 0 before the first).
+    - rows (np.ndarray): int64 output, the row completing each brick.
+    - opens (np.ndarray): Output, the open of each brick.
+    - closes (np.ndarray): Output, the close of each brick.
+
+    Returns:
+    - tuple: (number of bricks, close of the last brick, its direction).
+    """
+    count = 0
+    for i in range(close.shape[0]):
+        price = close[i]
+        if price != price:
+            continue
+        if level != level:
+            level = price
+            continue
+        while True:
+            if direction >= 0 and price >= level + brick:
+                opens[count] = level
+                level += brick
+                direction = 1
+            elif direction <= 0 and price <= level - brick:
+                opens[count] = level
+                level -= brick
+                direction = -1
+            elif direction == 1 and price <= level - 2 * brick:
+                # A reversal opens one brick away from the last close
+                opens[count] = level - brick
+                level -= 2 * brick
+                direction = -1
+            elif direction == -1 and price >= level + 2 * brick:
+                opens[count] = level + brick
+                level += 2 * brick
+                direction = 1
+            else:
+                break
+            closes[count] = level
+            rows[count] = i
+            count += 1
+    return count, level, direction
+
+
+def _bar_inputs(data) -> dict:
+    """
+    Get the columns of candles or trades as arrays.
+
+    Parameters:
+    - data (pd.DataFrame or dict): Candles with 'date', 'open', 'high',
+      'low', 'close' and 'volume', or trades with 'timestamp', 'price' and
+      'size'.
+
+    Returns:
+    - dict: 'date', 'open', 'high', 'low', 'close' and 'volume' arrays. The
+      four prices of trades are the same array.
+    """
+    if "price" in data:
+        price = np.asarray(data["price"], dtype=np.float64)
+        return {
+            "date": np.asarray(data["timestamp"]),
+            "open": price,
+            "high": price,
+            "low": price,
+            "close": price,
+            "volume": np.asarray(data["size"], dtype=np.float64),
+        }
+    missing = [column for column in _BAR_COLUMNS if column not in data]
+    if missing:
+        raise KeyError(
+            f"bars need candles with {list(_BAR_COLUMNS)} or trades with "
+            f"['timestamp', 'price', 'size'], missing {missing}"
+        )
+    inputs = {"date": np.asarray(data["date"])}
+    for column in _BAR_COLUMNS[1:]:
+        inputs[column] = np.asarray(data[column], dtype=np.float64)
+    return inputs
+
+
+def _carried(state, inputs: dict) -> dict:
+    """
+    Prepend the rows of the bar still forming at the end of the previous call.
+
+    Parameters:
+    - state (dict or None): State of the builder.
+    - inputs (dict): Arrays of the current call.
+
+    Returns:
+    - dict: The carried rows followed by ``inputs`` (``inputs`` itself
+      without state or carried rows).
+    """
+    tail = None if state is None else state.get("rows")
+    if not tail:
+        return inputs
+    return {key: np.concatenate((tail[key], values)) for key, values in inputs.items()}
+
+
+def _bars(inputs: dict, ends: np.ndarray, state) -> pd.DataFrame:
+    """
+    Aggregate the rows of each bar into OHLCV values.
+
+    Parameters:
+    - inputs (dict): Arrays of the rows (see ``_bar_inputs``).
+    - ends (np.ndarray): Last row of each completed bar, increasing.
+    - state (dict or None): State of the builder; receives the rows after
+      the last bar.
+
+    Returns:
+    - pd.DataFrame: One row per bar with 'date', 'open', 'high', 'low',
+      'close' and 'volume'.
+    """
+    stop = int(ends[-1]) + 1 if len(ends) else 0
+    if state is not None:
+        state["rows"] = {key: values[stop:].copy() for key, values in inputs.items()}
+
+    starts = np.empty(len(ends), dtype=np.int64)
+    starts[:1] = 0
+    starts[1:] = ends[:-1] + 1
+    columns = {"date": inputs["date"][starts], "open": inputs["open"][starts]}
+    if len(ends):
+        columns["high"] = np.maximum.reduceat(inputs["high"][:stop], starts)
+        columns["low"] = np.minimum.reduceat(inputs["low"][:stop], starts)
+        columns["close"] = inputs["close"][ends]
+        columns["volume"] = np.add.reduceat(inputs["volume"][:stop], starts)
+    else:
+        for column in ("high", "low", "close", "volume"):
+            columns[column] = np.empty(0)
+    return pd.DataFrame(columns)
+
+
+def _check_positive(name: str, value: float) -> float:
+    """
+    Check a bar size.
+
+    Parameters:
+    - name (str): Name of the argument.
+    - value (float): Its value.
+
+    Returns:
+    - float: The value.
+    """
+    if not value > 0:
+        raise ValueError(f"{name} must be positive, got {value!r}")
+    return float(value)
+
+
+def _threshold_bars(inputs: dict, weights: np.ndarray, threshold: float, state) -> pd.DataFrame:
+    """
+    Bars closing where the cumulative weight crosses a multiple of the threshold.
+
+    Parameters:
+    - inputs (dict): Arrays of the rows, carried rows included.
+    - weights (np.ndarray): Weight of each row (volume or traded value).
+    - threshold (float): Weight of a bar.
+    - state (dict or None): State of the builder.
+
+    Returns:
+    - pd.DataFrame: The completed bars.
+    """
+    # What the last bar of the previous call took beyond its threshold
+    excess = 0.0 if state is None else state.get("excess", 0.0)
+    cumulative = np.cumsum(weights)
+    cumulative += excess
+    count = int(cumulative[-1] // threshold) if len(cumulative) else 0
+    levels = threshold * np.arange(1, count + 1)
+    # A row crossing several levels closes a single bar
+    ends = np.unique(np.searchsorted(cumulative, levels, side="left"))
+    if state is not None:
+        state["excess"] = cumulative[ends[-1]] - count * threshold if count else excess
+    return _bars(inputs, ends, state)
+
+
+def volume_bars(data, threshold: float, state: dict = None) -> pd.DataFrame:
+    """Aggregate candles or trades into bars of a fixed volume"""
+    threshold = _check_positive("threshold", threshold)
+    inputs = _carried(state, _bar_inputs(data))
+    return _threshold_bars(inputs, inputs["volume"], threshold, state)
+
+
+volume_bars.__doc__ = """
+Name:
+    Volume Bars
+
+Description:
+    Aggregates 1-minute candles or trades into bars that each hold the same traded
+    volume. A bar closes on the row where the cumulative volume reaches the next
+    multiple of the threshold; what that row takes beyond it counts towards the next
+    bar, so the bars average exactly the threshold. The bar ends come from a single
+    searchsorted over the cumulative volume.
+
+Parameters:
+    - data (pd.DataFrame or dict): Candles with 'date', 'open', 'high', 'low', 'close'
+      and 'volume', or trades with 'timestamp', 'price' and 'size'.
+    - threshold (float): Volume of a bar.
+    - state (dict): State carried between calls on consecutive chunks of the input,
+      which then give the bars of a single call. Default is None.
+
+Call with:
+    bars = bta.volume_bars(df_1m, threshold=5_000)
+    bars['rsi'] = bta.relative_strength_index(bars)['rsi']
+
+Returns:
+    pd.DataFrame: One row per completed bar with 'date' (first row of the bar), 'open',
+    'high', 'low', 'close' and 'volume'.
+"""
+
+
+def dollar_bars(data, threshold: float, state: dict = None) -> pd.DataFrame:
+    """Aggregate candles or trades into bars of a fixed traded value"""
+    threshold = _check_positive("threshold", threshold)
+    inputs = _carried(state, _bar_inputs(data))
+    value = inputs["close"] * inputs["volume"]
+    return _threshold_bars(inputs, value, threshold, state)
+
+
+dollar_bars.__doc__ = """
+Name:
+    Dollar Bars
+
+Description:
+    Aggregates 1-minute candles or trades into bars that each hold the same traded
+    value (price * size for trades, close * volume for candles). A bar closes on the
+    row where the cumulative value reaches the next multiple of the threshold, as in
+    volume_bars. Unlike volume bars they keep a stable count when the price level
+    changes a lot.
+
+Parameters:
+    - data (pd.DataFrame or dict): Candles with 'date', 'open', 'high', 'low', 'close'
+      and 'volume', or trades with 'timestamp', 'price' and 'size'.
+    - threshold (float): Traded value of a bar, in the quote currency.
+    - state (dict): State carried between calls on consecutive chunks of the input,
+      which then give the bars of a single call. Default is None.
+
+Call with:
+    bars = bta.dollar_bars(trades, threshold=1_000_000)
+
+Returns:
+    pd.DataFrame: One row per completed bar with 'date' (first row of the bar), 'open',
+    'high', 'low', 'close' and 'volume'.
+"""
+
+
+def range_bars(data, size: float, state: dict = None) -> pd.DataFrame:
+    """Aggregate candles or trades into bars of a fixed high - low range"""
+    size = _check_positive("size", size)
+    inputs = _carried(state, _bar_inputs(data))
+    ends = np.empty(len(inputs["close"]), dtype=np.int64)
+    count = _range_ends_kernel(inputs["high"], inputs["low"], size, ends)
+    return _bars(inputs, ends[:count], state)
+
+
+range_bars.__doc__ = """
+Name:
+    Range Bars
+
+Description:
+    Aggregates 1-minute candles or trades into bars whose high - low range reaches a
+    fixed size. A bar closes on the first row that extends its range to the size, and
+    the next bar starts on the following row. Quiet markets give few bars, volatile
+    ones many.
+
+Parameters:
+    - data (pd.DataFrame or dict): Candles with 'date', 'open', 'high', 'low', 'close'
+      and 'volume', or trades with 'timestamp', 'price' and 'size'.
+    - size (float): Range of a bar, in price units.
+    - state (dict): State carried between calls on consecutive chunks of the input,
+      which then give the bars of a single call. Default is None.
+
+Call with:
+    bars = bta.range_bars(df_1m, size=50.0)
+
+Returns:
+    pd.DataFrame: One row per completed bar with 'date' (first row of the bar), 'open',
+    'high', 'low', 'close' and 'volume'.
+"""
+
+
+def renko_bars(data, brick: float, state: dict = None) -> pd.DataFrame:
+    """Build Renko bricks from candles or trades"""
+    brick = _check_positive("brick", brick)
+    inputs = _carried(state, _bar_inputs(data))
+    close = inputs["close"]
+    level = np.nan if state is None else state.get("level", np.nan)
+    direction = 0 if state is None else state.get("direction", 0)
+
+    # Each brick takes at least one brick of price movement, measured over the
+    # prices the kernel reads (NaN gaps skipped, not dropped with their move)
+    prices = close[~np.isnan(close)]
+    path = np.abs(np.diff(prices)).sum() if len(prices) > 1 else 0.0
+    if len(prices) and level == level:
+        path += abs(prices[0] - level)
+    capacity = int(path // brick) + 1
+    rows = np.empty(capacity, dtype=np.int64)
+    opens = np.empty(capacity)
+    closes = np.empty(capacity)
+    count, level, direction = _renko_kernel(
+        close, brick, level, direction, rows, opens, closes
+    )
+    rows, opens, closes = rows[:count], opens[:count], closes[:count]
+    if state is not None:
+        state["level"] = level
+        state["direction"] = direction
+
+    # The rows since the previous brick go to the first brick of a row; the
+    # further bricks of the same row open and close on it without volume
+    stop = int(rows[-1]) + 1 if count else 0
+    first = np.ones(count, dtype=bool)
+    first[1:] = rows[1:] != rows[:-1]
+    starts = np.where(first, np.concatenate(([0], rows[:-1] + 1)), rows)
+    volume = np.zeros(count)
+    if count:
+        volume[first] = np.add.reduceat(inputs["volume"][:stop], starts[first])
+    if state is not None:
+        state["rows"] = {key: values[stop:].copy() for key, values in inputs.items()}
+    return pd.DataFrame(
+        {
+            "date": inputs["date"][starts],
+            "open": opens,
+            "high": np.maximum(opens, closes),
+            "low": np.minimum(opens, closes),
+            "close": closes,
+            "volume": volume,
+        }
+    )
+
+
+renko_bars.__doc__ = """
+Name:
+    Renko Bars
+
+Description:
+    Builds Renko bricks from the closes of 1-minute candles or from trade prices. A
+    brick is added each time the price moves one brick size beyond the close of the
+    last brick in its direction, or two brick sizes against it (a reversal, whose
+    brick opens one brick away from the last close). A large move adds several
+    bricks on the same row. The first price sets the starting level.
+
+    Bricks have no wicks: high and low are the larger and smaller of open and close.
+    The volume of the rows since the previous brick goes to the first brick they
+    complete, the further bricks of the same row have none.
+
+Parameters:
+    - data (pd.DataFrame or dict): Candles with 'date', 'open', 'high', 'low', 'close'
+      and 'volume', or trades with 'timestamp', 'price' and 'size'.
+    - brick (float): Brick size, in price units.
+    - state (dict): State carried between calls on consecutive chunks of the input,
+      which then give the bricks of a single call. Default is None.
+
+Call with:
+    bricks = bta.renko_bars(df_1m, brick=100.0)
+    bricks['direction'] = np.sign(bricks['close'] - bricks['open'])
+
+Returns:
+    pd.DataFrame: One row per brick with 'date' (first row of the brick), 'open',
+    'high', 'low', 'close' and 'volume'.
+"""
+
+
+def tick_imbalance_bars(data, threshold: float, state: dict = None) -> pd.DataFrame:
+    """Aggregate candles or trades into bars of a fixed tick imbalance"""
+    threshold = _check_positive("threshold", threshold)
+    inputs = _bar_inputs(data)
+    close = inputs["close"]
+
+    # Tick rule: the sign of the price change, the previous sign when unchanged
+    previous = np.nan if state is None else state.get("close", np.nan)
+    last_sign = 0.0 if state is None else state.get("sign", 0.0)
+    signs = np.sign(np.diff(close, prepend=previous))
+    signs[np.isnan(signs)] = 0.0
+    moved = np.where(signs != 0, np.arange(len(signs)), -1)
+    np.maximum.accumulate(moved, out=moved)
+    signs = np.where(moved >= 0, signs[moved], last_sign)
+    if state is not None and len(close):
+        state["close"] = close[-1]
+        state["sign"] = signs[-1]
+
+    inputs["sign"] = signs
+    inputs = _carried(state, inputs)
+    ends = np.empty(len(inputs["close"]), dtype=np.int64)
+    count = _imbalance_ends_kernel(inputs["sign"], threshold, ends)
+    return _bars(inputs, ends[:count], state)
+
+
+tick_imbalance_bars.__doc__ = """
+Name:
+    Tick Imbalance Bars
+
+Description:
+    Aggregates trades (or 1-minute candles, on their closes) into bars that close when
+    the order flow becomes one-sided. Each row is signed with the tick rule: +1 when
+    the price rises, -1 when it falls, the previous sign when it is unchanged. A bar
+    closes when the sum of the signs since its start reaches the threshold in either
+    direction, so bars form faster while informed traders push the price one way.
+    This is the fixed threshold variant of the bars in "Advances in Financial Machine
+    Learning" (Lopez de Prado, 2018).
+
+Parameters:
+    - data (pd.DataFrame or dict): Candles with 'date', 'open', 'high', 'low', 'close'
+      and 'volume', or trades with 'timestamp', 'price' and 'size'.
+    - threshold (float): Absolute tick imbalance that closes a bar.
+    - state (dict): State carried between calls on consecutive chunks of the input,
+      which then give the bars of a single call. Default is None.
+
+Call with:
+    bars = bta.tick_imbalance_bars(trades, threshold=200)
+
+Returns:
+    pd.DataFrame: One row per completed bar with 'date' (first row of the bar), 'open',
+    'high', 'low', 'close' and 'volume'.
+"""
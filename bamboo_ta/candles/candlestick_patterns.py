@@ -3,6 +3,33 @@
 import pandas as pd
 import numpy as np
 
+from bamboo_ta._outputs import _labels
+from bamboo_ta.core._dtype import _resolve_dtype
+from bamboo_ta.events import _label_events
+
+# All labels of the result columns (no match is an empty string)
+CANDLE_TYPES = [
+    "", "four_price_doji", "dragonfly_doji", "gravestone_doji", "long_legged_doji",
+    "doji", "hammer", "inverted_hammer", "hanging_man", "shooting_star",
+    "bullish_belt_hold", "bearish_belt_hold", "bullish_marubozu", "bearish_marubozu",
+    "high_wave", "bullish_spinning_top", "bearish_spinning_top", "bullish", "bearish",
+]
+CANDLE_PATTERNS = [
+    "", "morning_star", "evening_star", "abandoned_baby_bullish",
+    "abandoned_baby_bearish", "three_white_soldiers", "three_black_crows",
+    "three_inside_up", "three_inside_down", "three_outside_up", "three_outside_down",
+    "rising_three_methods", "falling_three_methods", "mat_hold", "tri_star_bullish",
+    "tri_star_bearish", "unique_three_river_bottom", "concealing_baby_swallow",
+    "advance_block", "deliberation", "bullish_engulfing", "bearish_engulfing",
+    "bullish_harami_cross", "bearish_harami_cross", "bullish_harami", "bearish_harami",
+    "piercing_line", "dark_cloud_cover", "tweezer_tops", "tweezer_bottoms",
+    "up_gap_side_by_side_white_lines", "down_gap_side_by_side_white_lines",
+    "separating_lines_bullish", "separating_lines_bearish", "hook_reversal_bullish",
+    "hook_reversal_bearish", "on_neck_line", "in_neck_line", "thrusting_pattern",
+    "tower_top", "tower_bottom", "ladder_bottom", "ladder_top", "fry_pan_bottom",
+    "dumpling_top", "island_reversal_bullish", "island_reversal_bearish",
+]
+
 def safe_divide(a, b, default=0):
     """Safely divide a by b, returning default if b is 0 or if result is NaN."""
     if np.isscalar(b):
@@ -25,16 +52,17 @@ def safe_compare(a, b, comparison='<', tolerance=0):
             return (a == b) & ~np.isnan(a) & ~np.isnan(b)
     # Add more comparisons as needed
 
-def candlestick_patterns(df, include_indicators=False):
+def candlestick_patterns(df, include_indicators=False, dtype=None, events=False):
     """Detects candlestick types and patterns"""
-    df_copy = df.copy()
-    
     # Ensure the DataFrame contains the required columns
     required_columns = ["open", "high", "low", "close"]
     for col in required_columns:
         if col not in df.columns:
             raise KeyError(f"DataFrame must contain '{col}' column")
     
+    # Only the prices are needed; all intermediates inherit their precision
+    df_copy = df[required_columns].astype(_resolve_dtype(dtype))
+    
     # Add volume column check for volume-based patterns
     has_volume = "volume" in df.columns
     
@@ -863,10 +891,13 @@ def candlestick_patterns(df, include_indicators=False):
             warnings.warn(f"Error processing row at index {idx}: {str(e)}")
             continue
     
+    if events:
+        return _label_events(candle_pattern, CANDLE_PATTERNS)
+    
     # Create result DataFrame without indicator patterns
     result_df = pd.DataFrame({
-        'type': candle_type,
-        'pattern': candle_pattern
+        'type': _labels(candle_type, CANDLE_TYPES),
+        'pattern': _labels(candle_pattern, CANDLE_PATTERNS)
     }, index=df_copy.index)
     
     # Warning if include_indicators is True
@@ -900,6 +931,12 @@ candlestick_patterns.__doc__ = """
             'open', 'high', 'low', and 'close'.
         - include_indicators (bool, optional): If True, provides a warning that indicator-based
             pattern detection has been removed. Default is False.
+        - dtype (np.dtype, optional): Precision of the price columns and the ~50 intermediate
+            columns, np.float64 or np.float32. Default is None, which uses the global setting
+            (see bta.core.set_default_dtype).
+        - events (bool, optional): Return only the multi-candle pattern hits, as sparse
+            events: a dict with one entry per pattern name, {'positions': sorted int32 row
+            positions, 'values': None} (see bta.densify_events). Default is False.
 
     Single Candlestick Types:
         - "doji": A candle with a very small body, indicating indecision.
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+# chunked.py
+
+"""
+Out-of-core computation over data that does not fit in memory.
+
+Years of 1-minute candles across hundreds of pairs do not fit in RAM at once.
+``run_chunked`` streams the input chunk by chunk (the row groups of a Parquet
+file, or any iterable of DataFrames) and yields the indicator outputs of each
+chunk, so the memory use is bounded by the chunk size:
+
+- Indicators whose core function carries a ``state`` (the moving averages,
+  RSI, MACD, Bollinger Bands, (A)TR, Supertrend and PSAR) resume their
+  recursions and rolling windows from the previous chunk. Their chunked
+  output is identical to a single in-memory call.
+- Every other indicator gets a ``warmup``: the number of previous rows it
+  needs. Those rows are prepended to each chunk and their outputs dropped.
+  Indicators that only look back a fixed window take it from their metadata
+  (see ``metadata``) and match a single call up to the rounding of pandas'
+  running window sums. Recursive ones need it in their spec and converge
+  within it.
+
+``write_chunked`` writes the chunks to a Parquet file as they are computed.
+
+Call with:
+    specs = [
+        {"name": "ema200", "func": "exponential_moving_average", "kwargs": {"period": 200}},
+        {"name": "st", "func": "supertrend", "kwargs": {"multiplier": 3.0}},
+        {"name": "cci", "func": "commodity_channel_index"},
+        {"name": "kc", "func": "keltner_channel", "warmup": 500},
+    ]
+    for result in bta.run_chunked("btc_1m.parquet", specs, include=["date"]):
+        ...
+"""
+
+import inspect
+import os
+
+import pandas as pd
+
+from bamboo_ta._results import _build_result
+from bamboo_ta.executor import _resolve_func, _result_columns
+from bamboo_ta.metadata import _REGISTRY, indicator_metadata
+
+_SPEC_KEYS = {"name", "func", "args", "kwargs", "warmup"}
+
+
+def _accepts_state(func) -> bool:
+    """
+    Check whether an indicator carries state between chunks.
+
+    Parameters:
+    - func (Callable): The indicator.
+
+    Returns:
+    - bool: True when it takes a ``state`` argument.
+    """
+    try:
+        return "state" in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _declared_warmup(func, kwargs: dict):
+    """
+    Get the warm-up a windowed indicator declares in its metadata.
+
+    Parameters:
+    - func (Callable): The indicator.
+    - kwargs (dict): Its keyword arguments.
+
+    Returns:
+    - int or None: The warm-up, None for recursive or unregistered indicators.
+    """
+    name = getattr(func, "__name__", "")
+    if name not in _REGISTRY:
+        return None
+    meta = indicator_metadata(name, **kwargs)
+    return None if meta["recursive"] else meta["warmup"]
+
+
+def _normalize_chunked_specs(specs) -> list:
+    """
+    Validate the specs of a chunked run.
+
+    Parameters:
+    - specs (list): Dicts with 'name', 'func' and optionally 'args',
+      'kwargs' and 'warmup'.
+
+    Returns:
+    - list: Normalised specs, each with a fresh 'state' dict or a 'warmup'.
+    """
+    normalized = []
+    names = set()
+    for spec in specs:
+        unknown = set(spec) - _SPEC_KEYS
+        if unknown:
+            raise ValueError(f"unknown spec keys {sorted(unknown)}")
+        if "name" not in spec or "func" not in spec:
+            raise ValueError("every spec needs a 'name' and a 'func'")
+        name = spec["name"]
+        if name in names:
+            raise ValueError(f"duplicate spec name {name!r}")
+        names.add(name)
+
+        func = _resolve_func(spec["func"])
+        warmup = spec.get("warmup")
+        if warmup is None and not _accepts_state(func):
+            if not spec.get("args"):
+                warmup = _declared_warmup(func, spec.get("kwargs", {}))
+            if warmup is None:
+                raise ValueError(
+                    f"{name!r} carries no state between chunks, give its 'warmup' rows"
+                )
+        if warmup is not None and warmup < 0:
+            raise ValueError(f"the warmup of {name!r} must be non-negative")
+        normalized.append(
+            {
+                "name": name,
+                "func": func,
+                "args": tuple(spec.get("args", ())),
+                "kwargs": dict(spec.get("kwargs", {})),
+                "warmup": warmup,
+                "state": {} if warmup is None else None,
+                "tail": None,
+            }
+        )
+    return normalized
+
+
+def _chunks(source, batch_size: int = None, columns: list = None):
+    """
+    Iterate the input chunks with a continuous index.
+
+    Parameters:
+    - source (str, os.PathLike or iterable): Path of a Parquet file, read
+      one row group (or ``batch_size`` rows) at a time, or an iterable of
+      DataFrames.
+    - batch_size (int): Rows per chunk read from Parquet. Default is None,
+      one row group per chunk.
+    - columns (list): Columns to read from Parquet. Default is None (all).
+
+    Returns:
+    - Iterator[pd.DataFrame]: The chunks. Parquet chunks get a RangeIndex
+      continuing from the previous chunk.
+    """
+    if not isinstance(source, (str, os.PathLike)):
+        yield from source
+        return
+
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(source)
+    if batch_size is None:
+        batches = (
+            parquet.read_row_group(i, columns=columns)
+            for i in range(parquet.num_row_groups)
+        )
+    else:
+        batches = parquet.iter_batches(batch_size=batch_size, columns=columns)
+
+    offset = 0
+    for batch in batches:
+        chunk = batch.to_pandas()
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+        offset += len(chunk)
+        yield chunk
+
+
+def _run_spec(spec: dict, chunk: pd.DataFrame):
+    """
+    Compute one spec on one chunk.
+
+    Parameters:
+    - spec (dict): Normalised spec; its state or tail is updated.
+    - chunk (pd.DataFrame): The current chunk.
+
+    Returns:
+    - pd.DataFrame or pd.Series: The outputs for the rows of ``chunk``.
+    """
+    if spec["warmup"] is None:
+        return spec["func"](chunk, *spec["args"], state=spec["state"], **spec["kwargs"])
+
+    tail = spec["tail"]
+    source = chunk if tail is None or tail.empty else pd.concat([tail, chunk])
+    spec["tail"] = source.iloc[max(len(source) - spec["warmup"], 0) :]
+    # Positional index, as in a single run: some indicators look rows up by label
+    result = spec["func"](source.reset_index(drop=True), *spec["args"], **spec["kwargs"])
+    result = result.iloc[len(source) - len(chunk) :]
+    result.index = chunk.index
+    return result
+
+
+def run_chunked(
+    source,
+    specs: list,
+    batch_size: int = None,
+    columns: list = None,
+    include: list = None,
+    return_type: str = "frame",
+):
+    """Compute indicators chunk by chunk over data larger than memory"""
+    specs = _normalize_chunked_specs(specs)
+    for chunk in _chunks(source, batch_size, columns):
+        merged = {}
+        for column in include or []:
+            merged[column] = chunk[column].to_numpy()
+        for spec in specs:
+            merged.update(_result_columns(spec["name"], _run_spec(spec, chunk)))
+        yield _build_result(merged, chunk.index, return_type)
+
+
+run_chunked.__doc__ = """
+Name:
+    Run Chunked
+
+Description:
+    Streams the input chunk by chunk (the row groups of a Parquet file or any iterable
+    of DataFrames) and yields the indicator outputs of every chunk. Only one chunk and
+    the carried state are in memory at a time.
+
+    Indicators that take a state argument carry their recursions and rolling windows
+    from chunk to chunk; their output is identical to a single in-memory call. These
+    are the simple, exponential, rolling, weighted, Hull and Jurik moving averages,
+    RSI, MACD, Bollinger Bands, True Range, ATR, Supertrend and PSAR. Every other
+    indicator gets a 'warmup': the previous rows prepended to each chunk. Indicators
+    that look back a fixed window take it from indicator_metadata and match a single
+    call up to the rounding of pandas' running window sums. Recursive indicators need
+    it in their spec and converge within it.
+
+Parameters:
+    - source (str, os.PathLike or iterable): Parquet file path, or an iterable of
+      DataFrames in time order. Reading Parquet needs pyarrow.
+    - specs (list): One dict per call with the keys:
+        - name (str): Unique name, used for the output columns.
+        - func (str or callable): Indicator name in the bta namespace, or a function
+          taking the frame as first argument.
+        - args (tuple, optional): Further positional arguments.
+        - kwargs (dict, optional): Keyword arguments.
+        - warmup (int, optional): Rows of look-back to prepend to each chunk. Required
+          for recursive indicators without state, defaults to the declared warm-up of
+          windowed ones; when given, the state is not used.
+    - batch_size (int): Rows per chunk read from Parquet. Default is None, one row group
+      per chunk.
+    - columns (list): Columns to read from Parquet. Default is None (all).
+    - include (list): Input columns copied in front of the outputs, e.g. the dates.
+      Default is None.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
+
+Call with:
+    specs = [
+        {"name": "ema200", "func": "exponential_moving_average", "kwargs": {"period": 200}},
+        {"name": "st", "func": "supertrend", "kwargs": {"multiplier": 3.0}},
+        {"name": "cci", "func": "commodity_channel_index"},
+        {"name": "kc", "func": "keltner_channel", "warmup": 500},
+    ]
+    for result in bta.run_chunked("btc_1m.parquet", specs, include=["date"]):
+        ...
+
+Returns:
+    Iterator[pd.DataFrame]: One result per chunk, indexed like the chunk (Parquet chunks
+    get a RangeIndex continuing over the file). The columns are named as in run_many.
+"""
+
+
+def write_chunked(
+    source,
+    specs: list,
+    path,
+    batch_size: int = None,
+    columns: list = None,
+    include: list = None,
+) -> int:
+    """Compute indicators chunk by chunk and write them to Parquet"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    rows = 0
+    try:
+        for result in run_chunked(source, specs, batch_size, columns, include):
+            table = pa.Table.from_pandas(result, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            rows += len(result)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+write_chunked.__doc__ = """
+Name:
+    Write Chunked
+
+Description:
+    Runs run_chunked and writes every chunk's result to a Parquet file as a row group,
+    so neither the input nor the output needs to fit in memory. Needs pyarrow.
+
+Parameters:
+    - source (str, os.PathLike or iterable): Parquet file path, or an iterable of
+      DataFrames in time order.
+    - specs (list): Indicator specs, see run_chunked.
+    - path (str or os.PathLike): Output Parquet file.
+    - batch_size (int): Rows per chunk read from Parquet. Default is None, one row group
+      per chunk.
+    - columns (list): Columns to read from Parquet. Default is None (all).
+    - include (list): Input columns copied in front of the outputs. Default is None.
+
+Call with:
+    bta.write_chunked("btc_1m.parquet", specs, "btc_1m_features.parquet", include=["date"])
+
+Returns:
+    int: Number of rows written.
+"""
@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+# cli.py
+
+"""
+Command line entry point.
+
+``bamboo-ta compute`` computes a spec of indicators for many OHLCV files in
+one go, one file per worker process, and writes one output file per input:
+
+    bamboo-ta compute data/*.feather --spec features.yaml --output features/ --workers 8
+
+- Inputs are freqtrade-style JSON (lists of [timestamp, open, high, low,
+  close, volume] rows, like data/BTC_USDT-1d.json), Feather, Parquet or CSV
+  files.
+- The spec is a JSON or YAML list of ``run_many`` specs (YAML needs
+  PyYAML), or a mapping with that list under 'indicators':
+
+      indicators:
+        - {name: ema200, func: exponential_moving_average, kwargs: {period: 200}}
+        - {name: rsi, func: relative_strength_index}
+        - {name: bb, func: bollinger_bands, kwargs: {period: 20}}
+
+- The outputs hold the 'date' column (see ``--include``) followed by the
+  indicator columns named as in ``run_many``, as Parquet, Feather or CSV.
+
+After the run a timing report lists every file (rows, read, compute and
+write time) and the compute time of every indicator summed over the files.
+The same runs as ``python -m bamboo_ta compute ...`` without installing.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+_INPUT_FORMATS = (".json", ".feather", ".parquet", ".csv")
+_OUTPUT_FORMATS = ("parquet", "feather", "csv")
+_FREQTRADE_COLUMNS = ["date", "open", "high", "low", "close", "volume"]
+
+
+def _load_specs(path: str) -> list:
+    """
+    Read an indicator spec file.
+
+    Parameters:
+    - path (str): JSON or YAML file (.json, .yaml or .yml).
+
+    Returns:
+    - list: The ``run_many`` specs.
+    """
+    with open(path, "r", encoding="utf-8") as handle:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("YAML specs need PyYAML: pip install pyyaml") from None
+            specs = yaml.safe_load(handle)
+        else:
+            specs = json.load(handle)
+    if isinstance(specs, dict):
+        specs = specs.get("indicators")
+    if not isinstance(specs, list) or not specs:
+        raise ValueError(f"{path} must hold a list of specs, or one under 'indicators'")
+    return specs
+
+
+def _input_paths(patterns: list) -> list:
+    """
+    Expand the input arguments.
+
+    Parameters:
+    - patterns (list): File paths or glob patterns (for shells that do not
+      expand them).
+
+    Returns:
+    - list: The files, without duplicates, in the order given.
+    """
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        if not matches:
+            raise FileNotFoundError(f"no input matches {pattern!r}")
+        paths += [path for path in matches if path not in paths]
+    for path in paths:
+        if not path.endswith(_INPUT_FORMATS):
+            raise ValueError(
+                f"unsupported input {path!r}, expected one of {_INPUT_FORMATS}"
+            )
+    return paths
+
+
+def _read_ohlcv(path: str) -> pd.DataFrame:
+    """
+    Read an OHLCV file.
+
+    Parameters:
+    - path (str): freqtrade-style JSON, Feather, Parquet or CSV file.
+
+    Returns:
+    - pd.DataFrame: The candles, with a datetime 'date' column for JSON.
+    """
+    if path.endswith(".json"):
+        df = pd.read_json(path)
+        df.columns = _FREQTRADE_COLUMNS
+        df["date"] = pd.to_datetime(df["date"], unit="ms", utc=True)
+        return df
+    if path.endswith(".feather"):
+        return pd.read_feather(path)
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def _write_output(result: pd.DataFrame, path: str) -> None:
+    """
+    Write an output file in the format of its suffix.
+
+    Parameters:
+    - result (pd.DataFrame): The output columns.
+    - path (str): Target .parquet, .feather or .csv file.
+
+    Returns:
+    - None
+    """
+    if path.endswith(".feather"):
+        result.to_feather(path)
+    elif path.endswith(".csv"):
+        result.to_csv(path, index=False)
+    else:
+        result.to_parquet(path, index=False)
+
+
+def _output_path(input_path: str, output: str, output_format: str, single: bool) -> str:
+    """
+    Get the output file of an input.
+
+    Parameters:
+    - input_path (str): The input file.
+    - output (str): The --output argument, a directory or, for a single
+      input, a file.
+    - output_format (str): 'parquet', 'feather' or 'csv'.
+    - single (bool): Whether there is a single input.
+
+    Returns:
+    - str: The output file.
+    """
+    if single and output.endswith(tuple(f".{fmt}" for fmt in _OUTPUT_FORMATS)):
+        return output
+    stem = os.path.splitext(os.path.basename(input_path))[0]
+    return os.path.join(output, f"{stem}.{output_format}")
+
+
+def _compute_file(
+    input_path: str, output_path: str, specs: list, include: list, threads: int
+) -> dict:
+    """
+    Compute the specs for one file, in a worker process.
+
+    Parameters:
+    - input_path (str): The OHLCV file.
+    - output_path (str): The output file.
+    - specs (list): ``run_many`` specs.
+    - include (list): Input columns copied in front of the outputs, when present.
+    - threads (int): Threads of ``run_many`` within the file.
+
+    Returns:
+    - dict: 'file', 'rows', 'read', 'compute' and 'write' (seconds) and
+      'timings' (spec name -> seconds).
+    """
+    from bamboo_ta.executor import run_many
+
+    start = time.perf_counter()
+    df = _read_ohlcv(input_path)
+    read_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result, report = run_many(df, specs, workers=threads, report=True)
+    compute_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    kept = [column for column in include if column in df.columns]
+    if kept:
+        result = pd.concat([df[kept], result], axis=1)
+    _write_output(result, output_path)
+    write_time = time.perf_counter() - start
+    return {
+        "file": input_path,
+        "rows": len(df),
+        "read": read_time,
+        "compute": compute_time,
+        "write": write_time,
+        "timings": report["timings"],
+    }
+
+
+def _print_report(stats: list, failures: dict, wall_time: float) -> None:
+    """
+    Print the timing report of a compute run.
+
+    Parameters:
+    - stats (list): The dicts of ``_compute_file``, one per finished file.
+    - failures (dict): File -> error message of the failed files.
+    - wall_time (float): Duration of the whole run in seconds.
+
+    Returns:
+    - None
+    """
+    width = max([len(os.path.basename(s["file"])) for s in stats] + [4])
+    print(
+        f"\n{'file':<{width}} {'rows':>10} {'read (s)':>9} {'compute (s)':>12} "
+        f"{'write (s)':>10}"
+    )
+    for s in stats:
+        print(
+            f"{os.path.basename(s['file']):<{width}} {s['rows']:>10,} {s['read']:>9.3f} "
+            f"{s['compute']:>12.3f} {s['write']:>10.3f}"
+        )
+
+    per_spec = {}
+    for s in stats:
+        for name, seconds in s["timings"].items():
+            per_spec[name] = per_spec.get(name, 0.0) + seconds
+    if per_spec:
+        width = max(len(name) for name in per_spec)
+        print(f"\n{'indicator':<{width}} {'compute (s)':>12}")
+        for name, seconds in sorted(per_spec.items(), key=lambda item: -item[1]):
+            print(f"{name:<{width}} {seconds:>12.3f}")
+
+    rows = sum(s["rows"] for s in stats)
+    print(
+        f"\n{len(stats)} files, {rows:,} rows in {wall_time:.2f} s "
+        f"({rows / wall_time if wall_time > 0 else 0:,.0f} rows/s)"
+    )
+    for path, error in failures.items():
+        print(f"FAILED {path}: {error}")
+
+
+def _compute(args) -> int:
+    """
+    Run the compute command.
+
+    Parameters:
+    - args (argparse.Namespace): The parsed arguments.
+
+    Returns:
+    - int: Exit code, 1 when a file failed.
+    """
+    specs = _load_specs(args.spec)
+    paths = _input_paths(args.inputs)
+    single = len(paths) == 1
+    outputs = {
+        path: _output_path(path, args.output, args.format, single) for path in paths
+    }
+    for output in set(os.path.dirname(path) for path in outputs.values()):
+        if output:
+            os.makedirs(output, exist_ok=True)
+    if len(set(outputs.values())) != len(outputs):
+        raise ValueError("several inputs have the same name, their outputs would collide")
+    include = [column for column in args.include.split(",") if column]
+
+    # Check the specs once before starting the workers
+    from bamboo_ta.executor import _normalize_specs
+
+    _normalize_specs(specs)
+
+    stats, failures = [], {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=min(args.workers, len(paths))) as pool:
+        futures = {
+            pool.submit(
+                _compute_file, path, outputs[path], specs, include, args.threads
+            ): path
+            for path in paths
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                stats.append(future.result())
+            except Exception as error:
+                failures[path] = f"{type(error).__name__}: {error}"
+                continue
+            if not args.quiet:
+                print(f"done {path} -> {outputs[path]}")
+    wall_time = time.perf_counter() - start
+
+    stats.sort(key=lambda s: paths.index(s["file"]))
+    if not args.quiet:
+        _print_report(stats, failures, wall_time)
+    else:
+        for path, error in failures.items():
+            print(f"FAILED {path}: {error}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser.
+
+    Returns:
+    - argparse.ArgumentParser: The parser of the bamboo-ta command.
+    """
+    parser = argparse.ArgumentParser(
+        prog="bamboo-ta", description="Technical analysis indicators for pandas."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compute = commands.add_parser(
+        "compute",
+        help="compute indicators for OHLCV files",
+        description="Compute a spec of indicators for OHLCV files on a process pool.",
+    )
+    compute.add_argument(
+        "inputs", nargs="+", help="OHLCV files (freqtrade JSON, Feather, Parquet or CSV)"
+    )
+    compute.add_argument(
+        "--spec", required=True, help="JSON or YAML file with the indicator specs"
+    )
+    compute.add_argument(
+        "--output",
+        required=True,
+        help="output directory, or output file for a single input",
+    )
+    compute.add_argument(
+        "--format",
+        choices=_OUTPUT_FORMATS,
+        default="parquet",
+        help="output format in a directory (default: parquet)",
+    )
+    compute.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="worker processes, one file each (default: number of CPUs)",
+    )
+    compute.add_argument(
+        "--threads",
+        type=int,
+        default=1,
+        help="threads per file for independent indicators (default: 1)",
+    )
+    compute.add_argument(
+        "--include",
+        default="date",
+        help="comma-separated input columns copied to the output (default: date)",
+    )
+    compute.add_argument("--quiet", action="store_true", help="only report failures")
+    compute.set_defaults(handler=_compute)
+    return parser
+
+
+def main(argv: list = None) -> int:
+    """Run the bamboo-ta command"""
+    args = _parser().parse_args(argv)
+    if getattr(args, "workers", 1) < 1 or getattr(args, "threads", 1) < 1:
+        print("bamboo-ta: --workers and --threads must be positive", file=sys.stderr)
+        return 2
+    try:
+        return args.handler(args)
+    except (OSError, ValueError, ImportError) as error:
+        print(f"bamboo-ta: {error}", file=sys.stderr)
+        return 2
+
+
+main.__doc__ = """
+Name:
+    bamboo-ta Command
+
+Description:
+    Entry point of the bamboo-ta console script. 'bamboo-ta compute' computes a JSON or
+    YAML spec of indicators (see run_many) for freqtrade-style JSON, Feather, Parquet
+    or CSV files, one file per worker process, writes one output file per input and
+    prints a timing report.
+
+Parameters:
+    - argv (list): Command line arguments. Default is None, sys.argv[1:].
+
+Call with:
+    bamboo-ta compute data/*.feather --spec features.yaml --output features/ --workers 8
+    python -m bamboo_ta compute data/BTC_USDT-1d.json --spec specs.json --output btc.parquet
+
+Returns:
+    int: Exit code: 0 on success, 1 when a file failed, 2 for invalid arguments.
+"""
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# core/__init__.py
+
+"""
+Array-in/array-out layer beneath the DataFrame API.
+
+Every function takes 1D float64 arrays (or anything ``np.asarray`` accepts,
+such as lists or pandas Series) and returns NumPy arrays, or a tuple of
+arrays in the same order as the columns of the matching DataFrame function.
+The core layer runs on NumPy arrays and avoids index alignment and Series
+construction in the inner computations. Its kernels are compiled with Numba
+when it is installed; without it the rolling and EWM windows run through
+pandas' window functions. The DataFrame functions of the same name are thin
+wrappers around it and produce the same values.
+
+All functions take a ``dtype`` argument (float64 or float32). Without it they
+use the global precision, float64 unless changed with ``set_default_dtype``
+or the ``BAMBOO_TA_DTYPE`` environment variable. See ``core._dtype`` and
+documentation/float32.md for the float32 mode.
+
+The hot functions (EMA, SMA, RMA, RSI, MACD, stochastics, true range, ATR,
+Bollinger Bands, supertrend) also take ``out`` and ``workspace``:
+
+- ``out`` is an array, or a tuple of arrays for multi-output functions, that
+  receives the results. It may be one of the inputs, e.g.
+  ``simple_moving_average(close, out=close)``, which overwrites the input
+  with the same values as a separate array would get; where a kernel
+  would read values it has already written, the result goes through a
+  scratch buffer.
+- ``workspace`` is a dict the caller keeps between calls. It holds the
+  scratch buffers, so repeated calls on inputs of the same length allocate
+  no array memory.
+
+The moving averages, RSI, MACD, Bollinger Bands, true range, ATR, supertrend
+and PSAR take a ``state`` dict as well. Consecutive calls on chunks of one
+series with the same dict give exactly the values of a single call (see
+``bta.run_chunked``).
+
+Call with:
+    from bamboo_ta import core
+    ema = core.exponential_moving_average(close, 21)
+    upper, middle, lower = core.bollinger_bands(close, period=20)
+    rsi32 = core.relative_strength_index(close, 14, dtype=np.float32)
+    positions, levels, last_high, _ = core.pivot_high(high, left_bars=5, right_bars=5)
+
+    workspace, ema_out = {}, np.empty(len(close))
+    core.exponential_moving_average(close, 21, out=ema_out, workspace=workspace)
+
+    state = {}
+    ema_chunks = [core.exponential_moving_average(c, 21, state=state) for c in chunks]
+"""
+
+from ._dtype import get_default_dtype, set_default_dtype
+from .momentum import macd, relative_strength_index, stochastics_oscillator
+from .trend import (
+    exponential_moving_average,
+    hull_moving_average,
+    jurik_moving_average,
+    parabolic_sar,
+    pivot_high,
+    pivot_low,
+    rolling_moving_average,
+    simple_moving_average,
+    supertrend,
+    weighted_moving_average,
+)
+from .volatility import average_true_range, bollinger_bands, true_range
+from .volume import on_balance_volume
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# _dtype.py
+
+"""
+Floating point precision of the core layer.
+
+The core functions compute in float64 by default. In float32 mode the
+inputs, outputs and element-wise intermediates (differences, ranges, bands,
+ratios) are float32, which halves their memory and bandwidth. Recursive
+kernels and running sums (EWM, rolling sums and variances, JMA, supertrend,
+PSAR, cumulative volume) accumulate rounding errors over the whole series,
+so they are promoted to float64 internally and only their results are
+stored as float32. The expected deviations from float64 are listed in
+documentation/float32.md.
+
+The mode can be set globally with ``set_default_dtype`` (or the environment
+variable ``BAMBOO_TA_DTYPE=float32``) or per call with the ``dtype``
+parameter of the core and DataFrame functions.
+"""
+
+import os
+
+import numpy as np
+
+_SUPPORTED_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+def _validate_dtype(dtype) -> np.dtype:
+    """
+    Check that a dtype is float32 or float64.
+
+    Parameters:
+    - dtype: Anything ``np.dtype`` accepts ('float32', np.float32, ...).
+
+    Returns:
+    - np.dtype: The validated dtype.
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in _SUPPORTED_DTYPES:
+        raise ValueError(f"dtype must be float32 or float64, got {dtype}")
+    return dtype
+
+
+_default_dtype = _validate_dtype(os.environ.get("BAMBOO_TA_DTYPE", "float64"))
+
+
+def set_default_dtype(dtype) -> None:
+    """
+    Set the floating point precision used when no ``dtype`` is passed.
+
+    Parameters:
+    - dtype: np.float32 or np.float64 (or their names).
+
+    Returns:
+    - None
+    """
+    global _default_dtype
+    _default_dtype = _validate_dtype(dtype)
+
+
+def get_default_dtype() -> np.dtype:
+    """
+    Get the floating point precision used when no ``dtype`` is passed.
+
+    Returns:
+    - np.dtype: float32 or float64.
+    """
+    return _default_dtype
+
+
+def _resolve_dtype(dtype) -> np.dtype:
+    """
+    Resolve the ``dtype`` argument of a core function.
+
+    Parameters:
+    - dtype: None for the default precision, otherwise float32 or float64.
+
+    Returns:
+    - np.dtype: The dtype to compute in.
+    """
+    return _default_dtype if dtype is None else _validate_dtype(dtype)
@@ -0,0 +1,1059 @@
+# -*- coding: utf-8 -*-
+# _kernels.py
+
+"""
+Array kernels of the core layer.
+
+The rolling and exponentially weighted kernels follow pandas' own window
+algorithms step by step (the same update order, Kahan compensation and
+special cases), so the core functions produce the same values as the
+DataFrame API did when it called ``rolling()`` and ``ewm()`` directly, while
+running on plain NumPy arrays.
+
+Kernels with a ``state`` argument can resume where an earlier call on the
+preceding rows stopped. The state is a float64 array of the size given by the
+matching ``_*_STATE`` helper. It holds the recursion variables and, for the
+rolling kernels, the values still inside the window. A zeroed state starts
+from scratch. Feeding a series chunk by chunk through the same state gives
+exactly the values of one call on the whole series (see
+``bamboo_ta.chunked``).
+
+Single-source functions also accept a 2D block of shape (rows, columns) and
+run along axis 0. Blocks are kept in column-major (Fortran) order, so every
+column is contiguous, and the ``_columns`` variants of the kernels run the
+1D recursion over all columns in one compiled call.
+
+The kernels are compiled with Numba when it is installed. Without it, the
+stateless rolling and EWM calls run through the matching pandas window
+functions instead of the Python loops (see ``_PANDAS_KERNELS``).
+"""
+
+import math
+
+import numpy as np
+
+from bamboo_ta._jit import JIT_ENABLED, njit
+
+
+def _as_float(values, dtype=np.float64) -> np.ndarray:
+    """
+    Convert array-like input into a contiguous floating point array.
+
+    Parameters:
+    - values (array-like): NumPy array, pandas Series, list, ... or a 2D
+      block with one column per series.
+    - dtype (np.dtype): float64 or float32. Default is float64.
+
+    Returns:
+    - np.ndarray: The values as a 1D contiguous array, or a column-major
+      2D array (no copy when the input already is one of the requested
+      dtype and layout).
+    """
+    if np.ndim(values) == 2:
+        return np.asfortranarray(values, dtype=dtype)
+    return np.ascontiguousarray(values, dtype=dtype)
+
+
+def _shape(shape) -> tuple:
+    """
+    Normalise a length or a block shape.
+
+    Parameters:
+    - shape (int or tuple): Length of a 1D array or shape of a 2D block.
+
+    Returns:
+    - tuple: The shape as a tuple.
+    """
+    return (shape,) if isinstance(shape, (int, np.integer)) else tuple(shape)
+
+
+def _output(out, n, dtype) -> np.ndarray:
+    """
+    Check a caller-supplied output array, or allocate one.
+
+    Parameters:
+    - out (np.ndarray or None): The ``out`` argument of a core function.
+    - n (int or tuple): Required length, or shape of a 2D block.
+    - dtype (np.dtype): Required dtype (the computation precision).
+
+    Returns:
+    - np.ndarray: ``out`` itself, or a new uninitialised (column-major)
+      array.
+    """
+    shape = _shape(n)
+    if out is None:
+        return np.empty(shape, dtype=dtype, order="F")
+    if not isinstance(out, np.ndarray) or out.shape != shape or out.dtype != dtype:
+        raise ValueError(
+            f"out must be a {np.dtype(dtype)} array of shape {shape}, got "
+            f"{getattr(out, 'dtype', type(out).__name__)} {getattr(out, 'shape', '')}"
+        )
+    return out
+
+
+def _outputs(out, count: int, n, dtype) -> tuple:
+    """
+    Check the ``out`` tuple of a multi-output core function, or allocate it.
+
+    Parameters:
+    - out (tuple or None): One array per output, in the order of the result.
+    - count (int): Number of outputs.
+    - n (int or tuple): Required length, or shape of a 2D block.
+    - dtype (np.dtype): Required dtype.
+
+    Returns:
+    - tuple: The output arrays.
+    """
+    if out is None:
+        return tuple(np.empty(_shape(n), dtype=dtype, order="F") for _ in range(count))
+    if len(out) != count:
+        raise ValueError(f"out must hold {count} arrays, got {len(out)}")
+    return tuple(_output(array, n, dtype) for array in out)
+
+
+def _buffer(workspace, key: str, n, dtype=np.float64) -> np.ndarray:
+    """
+    Get a scratch array, reused from the workspace when possible.
+
+    A workspace is a plain dict owned by the caller. Buffers are stored under
+    their key and reallocated only when the length or dtype changes, so
+    repeated calls on inputs of the same shape allocate nothing.
+
+    Parameters:
+    - workspace (dict or None): Scratch buffers of earlier calls.
+    - key (str): Name of the buffer, unique within one call chain.
+    - n (int or tuple): Required length, or shape of a 2D block.
+    - dtype (np.dtype): Required dtype. Default is float64.
+
+    Returns:
+    - np.ndarray: An uninitialised (column-major) array of that shape.
+    """
+    shape = _shape(n)
+    if workspace is None:
+        return np.empty(shape, dtype=dtype, order="F")
+    buffer = workspace.get(key)
+    if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+        buffer = workspace[key] = np.empty(shape, dtype=dtype, order="F")
+    return buffer
+
+
+def _promoted(
+    kernel, values: np.ndarray, *args, out=None, workspace=None, state=None
+) -> np.ndarray:
+    """
+    Run a recursive kernel in float64 and return its result in the dtype of
+    the input.
+
+    Recursions and running sums carry their rounding errors along the whole
+    series, so float32 inputs are promoted for the kernel; float64 inputs are
+    passed through without a copy. 2D blocks run through the ``_columns``
+    variant of the kernel, one column after the other in a single call.
+    Window kernels read values the result has already overwritten when
+    ``out`` is the input itself, so such a result is computed in a scratch
+    buffer and copied. Without Numba, stateless window kernels run through
+    pandas instead (see ``_PANDAS_KERNELS``).
+
+    Parameters:
+    - kernel (Callable): Kernel taking the values as first and its result
+      array as last argument.
+    - values (np.ndarray): float32 or float64 input, 1D or a column-major
+      2D block.
+    - *args: Remaining kernel arguments.
+    - out (np.ndarray): Array for the result. Allocated when None.
+    - workspace (dict): Scratch buffers for the float64 copies. Optional.
+    - state (np.ndarray): Kernel state to resume from and update (1D
+      values only). Optional.
+
+    Returns:
+    - np.ndarray: The kernel result with the dtype of ``values``.
+    """
+    n = values.shape
+    result = _output(out, n, values.dtype)
+    if values.ndim == 2 and state is not None:
+        raise ValueError("state is only supported for 1D values")
+    if not JIT_ENABLED and state is None and kernel in _PANDAS_KERNELS:
+        kernel = _PANDAS_KERNELS[kernel]
+    elif values.ndim == 2:
+        kernel = _COLUMN_KERNELS[kernel]
+    extra = () if state is None else (state,)
+    if values.dtype == np.float64 and not np.may_share_memory(result, values):
+        kernel(values, *args, result, *extra)
+        return result
+    if values.dtype == np.float64:
+        target = _buffer(workspace, "float64_result", n)
+        kernel(values, *args, target, *extra)
+        result[:] = target
+        return result
+
+    source = _buffer(workspace, "float64_source", n)
+    source[:] = values
+    target = _buffer(workspace, "float64_result", n)
+    kernel(source, *args, target, *extra)
+    result[:] = target
+    return result
+
+
+def _kernel_state(state, key: str, size: int):
+    """
+    Get a kernel state array from a state dict.
+
+    Parameters:
+    - state (dict or None): State of a core function (see ``_substate``).
+    - key (str): Name of the kernel state, unique within the function.
+    - size (int): Size of the state array.
+
+    Returns:
+    - np.ndarray or None: The stored array (zeroed on first use), or None
+      when no state is carried.
+    """
+    if state is None:
+        return None
+    array = state.get(key)
+    if array is None:
+        array = state[key] = np.zeros(size)
+    return array
+
+
+def _substate(state, key: str):
+    """
+    Get the nested state dict of a called core function.
+
+    Parameters:
+    - state (dict or None): State of the calling function.
+    - key (str): Name of the callee.
+
+    Returns:
+    - dict or None: The nested dict, or None when no state is carried.
+    """
+    if state is None:
+        return None
+    return state.setdefault(key, {})
+
+
+def _advance(state, n: int) -> int:
+    """
+    Count the rows seen by a stateful core function.
+
+    Parameters:
+    - state (dict or None): State of the function.
+    - n (int): Rows of the current call.
+
+    Returns:
+    - int: Rows seen before the current call (0 without state).
+    """
+    if state is None:
+        return 0
+    seen = state.get("seen", 0)
+    state["seen"] = seen + n
+    return seen
+
+
+def _carry(state, key: str, values: np.ndarray, count: int) -> np.ndarray:
+    """
+    Prepend the last rows of the previous call to the current values.
+
+    Used by indicators that only look back a fixed number of rows (weighted
+    windows, the previous close), where recomputing over the carried rows
+    gives exactly the values of a single call.
+
+    Parameters:
+    - state (dict or None): State of the function.
+    - key (str): Name of the carried series.
+    - values (np.ndarray): Values of the current call.
+    - count (int): Number of rows to carry to the next call.
+
+    Returns:
+    - np.ndarray: The carried rows followed by ``values`` (``values``
+      itself without state).
+    """
+    if state is None:
+        return values
+    tail = state.get(key)
+    combined = values if tail is None else np.concatenate((tail, values))
+    state[key] = combined[max(combined.shape[0] - count, 0) :].copy()
+    return combined
+
+
+def _ewm_state() -> int:
+    """Size of the ``_ewm_mean_kernel`` state."""
+    return 4
+
+
+def _rolling_state(window: int) -> int:
+    """Size of the ``_rolling_mean_kernel`` and ``_rolling_var_kernel`` state."""
+    return 9 + window
+
+
+_JMA_HISTORY = 66
+
+
+def _jma_state() -> int:
+    """Size of the ``_jma_kernel`` state."""
+    return 8 + 2 * _JMA_HISTORY
+
+
+def _supertrend_state() -> int:
+    """Size of the ``_supertrend_kernel`` state."""
+    return 4
+
+
+def _psar_state() -> int:
+    """Size of the ``_psar_kernel`` state."""
+    return 10
+
+
+@njit
+def _shift_history(history, values):
+    """
+    Append values to a fixed-length history, dropping the oldest entries.
+
+    Parameters:
+    - history (np.ndarray): The history, most recent value last.
+    - values (np.ndarray): New values.
+    """
+    size = history.shape[0]
+    n = values.shape[0]
+    if n >= size:
+        history[:] = values[n - size :]
+    else:
+        history[: size - n] = history[n:].copy()
+        history[size - n :] = values
+
+
+@njit
+def _ewm_mean_kernel(values, com, adjust, min_periods, result, state=None):
+    """
+    Exponentially weighted mean, equivalent to ``Series.ewm(com=com).mean()``.
+
+    Parameters:
+    - values (np.ndarray): Input values (NaN allowed).
+    - com (float): Center of mass; alpha = 1 / (1 + com).
+    - adjust (bool): pandas' ``adjust`` flag.
+    - min_periods (int): Minimum number of observations.
+    - result (np.ndarray): Output array, filled with the weighted mean.
+    - state (np.ndarray): ``_ewm_state()`` floats (started, weighted mean,
+      old weight, observations). Optional.
+    """
+    n = values.shape[0]
+    if n == 0:
+        return
+
+    alpha = 1.0 / (1.0 + com)
+    old_wt_factor = 1.0 - alpha
+    new_wt = 1.0 if adjust else alpha
+
+    resume = False
+    if state is not None:
+        resume = state[0] != 0
+    if resume:
+        weighted = state[1]
+        old_wt = state[2]
+        nobs = int(state[3])
+        first = 0
+    else:
+        weighted = values[0]
+        nobs = 1 if weighted == weighted else 0
+        result[0] = weighted if nobs >= min_periods else np.nan
+        old_wt = 1.0
+        first = 1
+
+    for i in range(first, n):
+        cur = values[i]
+        is_observation = cur == cur
+        if is_observation:
+            nobs += 1
+        if weighted == weighted:
+            old_wt *= old_wt_factor
+            if is_observation:
+                # Avoid numerical errors on constant series
+                if weighted != cur:
+                    weighted = old_wt * weighted + new_wt * cur
+                    weighted /= old_wt + new_wt
+                if adjust:
+                    old_wt += new_wt
+                else:
+                    old_wt = 1.0
+        elif is_observation:
+            weighted = cur
+        result[i] = weighted if nobs >= min_periods else np.nan
+
+    if state is not None:
+        state[0] = 1.0
+        state[1] = weighted
+        state[2] = old_wt
+        state[3] = nobs
+
+
+@njit
+def _rolling_mean_kernel(values, window, min_periods, result, state=None):
+    """
+    Rolling mean, equivalent to ``Series.rolling(window, min_periods).mean()``.
+
+    Parameters:
+    - values (np.ndarray): Input values (NaN values are skipped).
+    - window (int): Window length.
+    - min_periods (int): Minimum number of observations.
+    - result (np.ndarray): Output array, filled with the rolling mean.
+    - state (np.ndarray): ``_rolling_state(window)`` floats (the running
+      sums followed by the last ``window`` values). Optional.
+    """
+    n = values.shape[0]
+    nobs = 0
+    neg_ct = 0
+    same_count = 0
+    sum_x = 0.0
+    compensation_add = 0.0
+    compensation_remove = 0.0
+    prev_value = values[0] if n > 0 else 0.0
+    seen = 0
+    history = np.empty(0)
+
+    resume = False
+    if state is not None:
+        resume = state[0] != 0
+        history = state[9:]
+    if resume:
+        nobs = int(state[1])
+        neg_ct = int(state[2])
+        same_count = int(state[3])
+        sum_x = state[4]
+        compensation_add = state[5]
+        compensation_remove = state[6]
+        prev_value = state[7]
+        seen = int(state[8])
+
+    for i in range(n):
+        # Remove the value leaving the window (from the history on resume)
+        if seen + i >= window:
+            val = values[i - window] if i >= window else history[i]
+            if val == val:
+                nobs -= 1
+                y = -val - compensation_remove
+                t = sum_x + y
+                compensation_remove = t - sum_x - y
+                sum_x = t
+                if math.copysign(1.0, val) < 0:
+                    neg_ct -= 1
+
+        # Add the new value
+        val = values[i]
+        if val == val:
+            nobs += 1
+            y = val - compensation_add
+            t = sum_x + y
+            compensation_add = t - sum_x - y
+            sum_x = t
+            if math.copysign(1.0, val) < 0:
+                neg_ct += 1
+            if val == prev_value:
+                same_count += 1
+            else:
+                same_count = 1
+            prev_value = val
+
+        if nobs >= min_periods and nobs > 0:
+            mean = sum_x / nobs
+            if same_count >= nobs:
+                mean = prev_value
+            elif neg_ct == 0 and mean < 0:
+                mean = 0.0
+            elif neg_ct == nobs and mean > 0:
+                mean = 0.0
+            result[i] = mean
+        else:
+            result[i] = np.nan
+
+    if state is not None:
+        state[0] = 1.0
+        state[1] = nobs
+        state[2] = neg_ct
+        state[3] = same_count
+        state[4] = sum_x
+        state[5] = compensation_add
+        state[6] = compensation_remove
+        state[7] = prev_value
+        state[8] = seen + n
+        _shift_history(history, values)
+
+
+@njit
+def _rolling_var_kernel(values, window, min_periods, ddof, result, state=None):
+    """
+    Rolling variance, equivalent to ``Series.rolling(window).var(ddof=ddof)``.
+
+    Parameters:
+    - values (np.ndarray): Input values (NaN values are skipped).
+    - window (int): Window length.
+    - min_periods (int): Minimum number of observations.
+    - ddof (int): Delta degrees of freedom.
+    - result (np.ndarray): Output array, filled with the rolling variance.
+    - state (np.ndarray): ``_rolling_state(window)`` floats (the running
+      moments followed by the last ``window`` values). Optional.
+    """
+    n = values.shape[0]
+    nobs = 0.0
+    mean_x = 0.0
+    ssqdm_x = 0.0
+    compensation_add = 0.0
+    compensation_remove = 0.0
+    same_count = 0
+    prev_value = values[0] if n > 0 else 0.0
+    seen = 0
+    history = np.empty(0)
+
+    resume = False
+    if state is not None:
+        resume = state[0] != 0
+        history = state[9:]
+    if resume:
+        nobs = state[1]
+        mean_x = state[2]
+        ssqdm_x = state[3]
+        compensation_add = state[4]
+        compensation_remove = state[5]
+        same_count = int(state[6])
+        prev_value = state[7]
+        seen = int(state[8])
+
+    for i in range(n):
+        # Remove the value leaving the window (Welford with Kahan summation)
+        if seen + i >= window:
+            val = values[i - window] if i >= window else history[i]
+            if val == val:
+                nobs -= 1
+                if nobs:
+                    prev_mean = mean_x - compensation_remove
+                    y = val - compensation_remove
+                    t = y - mean_x
+                    compensation_remove = t + mean_x - y
+                    mean_x = mean_x - t / nobs
+                    ssqdm_x = ssqdm_x - (val - prev_mean) * (val - mean_x)
+                else:
+                    mean_x = 0.0
+                    ssqdm_x = 0.0
+
+        # Add the new value
+        val = values[i]
+        if val == val:
+            nobs += 1
+            if val == prev_value:
+                same_count += 1
+            else:
+                same_count = 1
+            prev_value = val
+            prev_mean = mean_x - compensation_add
+            y = val - compensation_add
+            t = y - mean_x
+            compensation_add = t + mean_x - y
+            if nobs:
+                mean_x = mean_x + t / nobs
+            else:
+                mean_x = 0.0
+            ssqdm_x = ssqdm_x + (val - prev_mean) * (val - mean_x)
+
+        if nobs >= min_periods and nobs > ddof:
+            if nobs == 1 or same_count >= nobs:
+                result[i] = 0.0
+            else:
+                result[i] = ssqdm_x / (nobs - ddof)
+        else:
+            result[i] = np.nan
+
+    if state is not None:
+        state[0] = 1.0
+        state[1] = nobs
+        state[2] = mean_x
+        state[3] = ssqdm_x
+        state[4] = compensation_add
+        state[5] = compensation_remove
+        state[6] = same_count
+        state[7] = prev_value
+        state[8] = seen + n
+        _shift_history(history, values)
+
+
+@njit
+def _rolling_extreme_kernel(values, window, min_periods, find_max, queue, result):
+    """
+    Rolling maximum or minimum using a monotonic deque (O(n)).
+
+    Parameters:
+    - values (np.ndarray): Input values (NaN values are skipped).
+    - window (int): Window length.
+    - min_periods (int): Minimum number of non-NaN observations.
+    - find_max (bool): True for the maximum, False for the minimum.
+    - queue (np.ndarray): int64 scratch array of the same length as values.
+    - result (np.ndarray): Output array, filled with the rolling extreme.
+    """
+    n = values.shape[0]
+    head = 0
+    tail = 0
+    nobs = 0
+
+    for i in range(n):
+        if i >= window:
+            if values[i - window] == values[i - window]:
+                nobs -= 1
+            if head < tail and queue[head] <= i - window:
+                head += 1
+
+        val = values[i]
+        if val == val:
+            nobs += 1
+            if find_max:
+                while head < tail and values[queue[tail - 1]] <= val:
+                    tail -= 1
+            else:
+                while head < tail and values[queue[tail - 1]] >= val:
+                    tail -= 1
+            queue[tail] = i
+            tail += 1
+
+        if nobs >= min_periods and head < tail:
+            result[i] = values[queue[head]]
+        else:
+            result[i] = np.nan
+
+
+def _weighted_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Linearly weighted rolling mean (weights 1..window, newest heaviest).
+
+    Parameters:
+    - values (np.ndarray): Input values, 1D or a 2D block (along axis 0).
+      Windows containing NaN are NaN.
+    - window (int): Window length.
+
+    Returns:
+    - np.ndarray: The weighted mean, NaN for the first window - 1 values.
+    """
+    result = np.full(values.shape, np.nan, dtype=values.dtype, order="F")
+    if values.shape[0] < window:
+        return result
+    weights = np.arange(1, window + 1, dtype=values.dtype)
+    windows = np.lib.stride_tricks.sliding_window_view(values, window, axis=0)
+    result[window - 1 :] = (windows * weights).sum(axis=-1) / weights.sum()
+    return result
+
+
+@njit
+def _pairwise_sum(values, start, stop):
+    """
+    Sum of values[start:stop] with NumPy's pairwise summation order.
+
+    Parameters:
+    - values (np.ndarray): Input values.
+    - start (int): First index.
+    - stop (int): End index (exclusive).
+
+    Returns:
+    - float: The sum, bit-identical to ``values[start:stop].sum()``.
+    """
+    n = stop - start
+    if n < 8:
+        total = 0.0
+        for i in range(start, stop):
+            total += values[i]
+        return total
+    if n <= 128:
+        r0 = values[start]
+        r1 = values[start + 1]
+        r2 = values[start + 2]
+        r3 = values[start + 3]
+        r4 = values[start + 4]
+        r5 = values[start + 5]
+        r6 = values[start + 6]
+        r7 = values[start + 7]
+        i = start + 8
+        limit = start + n - n % 8
+        while i < limit:
+            r0 += values[i]
+            r1 += values[i + 1]
+            r2 += values[i + 2]
+            r3 += values[i + 3]
+            r4 += values[i + 4]
+            r5 += values[i + 5]
+            r6 += values[i + 6]
+            r7 += values[i + 7]
+            i += 8
+        total = ((r0 + r1) + (r2 + r3)) + ((r4 + r5) + (r6 + r7))
+        while i < stop:
+            total += values[i]
+            i += 1
+        return total
+    half = n // 2
+    half -= half % 8
+    return _pairwise_sum(values, start, start + half) + _pairwise_sum(
+        values, start + half, stop
+    )
+
+
+@njit
+def _jma_kernel(values, length1, pow1, bet, beta, pr, jma, state=None):
+    """
+    Jurik Moving Average recursion.
+
+    Parameters:
+    - values (np.ndarray): Source prices.
+    - length1, pow1, bet, beta, pr (float): Jurik constants derived from
+      the length and phase.
+    - jma (np.ndarray): Output array, filled with the JMA (without the
+      warm-up NaNs).
+    - state (np.ndarray): ``_jma_state()`` floats (the filter variables
+      followed by the last volatility and volatility-sum values). Optional.
+    """
+    n = values.shape[0]
+    if n == 0:
+        return
+
+    resume = False
+    if state is not None:
+        resume = state[0] != 0
+
+    # Volatility and its running sum, after the history of earlier calls
+    seen = int(state[1]) if resume else 0
+    carried = min(seen, _JMA_HISTORY)
+    volty = np.zeros(carried + n)
+    v_sum = np.zeros(carried + n)
+    # Position of the first bar of the series (negative once it has left the history)
+    origin = carried - seen
+
+    sum_length = 10
+    max_volty = np.power(length1, 1 / pow1)
+    if resume:
+        volty[:carried] = state[8 + _JMA_HISTORY - carried : 8 + _JMA_HISTORY]
+        v_sum[:carried] = state[8 + 2 * _JMA_HISTORY - carried :]
+        ma1 = state[2]
+        u_band = state[3]
+        l_band = state[4]
+        det0 = state[5]
+        det1 = state[6]
+        prev_jma = state[7]
+        first = 0
+    else:
+        det0 = 0.0
+        det1 = 0.0
+        jma[0] = ma1 = u_band = l_band = prev_jma = values[0]
+        first = 1
+
+    for i in range(first, n):
+        k = carried + i
+        price = values[i]
+
+        # Price volatility
+        del1 = price - u_band
+        del2 = price - l_band
+        volty[k] = max(abs(del1), abs(del2)) if abs(del1) != abs(del2) else 0
+
+        # Relative price volatility factor
+        v_sum[k] = v_sum[k - 1] + (volty[k] - volty[max(k - sum_length, origin)]) / sum_length
+        start = max(k - 65, origin)
+        avg_volty = _pairwise_sum(v_sum, start, k + 1) / (k + 1 - start)
+        d_volty = 0 if avg_volty == 0 else volty[k] / avg_volty
+        r_volty = max(1.0, min(max_volty, d_volty))
+
+        # Jurik volatility bands
+        pow2 = np.power(r_volty, pow1)
+        kv = np.power(bet, np.sqrt(pow2))
+        u_band = price if (del1 > 0) else price - (kv * del1)
+        l_band = price if (del2 < 0) else price - (kv * del2)
+
+        # Jurik dynamic factor
+        alpha = np.power(beta, pow2)
+
+        # Preliminary smoothing by an adaptive EMA, then a Kalman filter
+        ma1 = ((1 - alpha) * price) + (alpha * ma1)
+        det0 = ((price - ma1) * (1 - beta)) + (beta * det0)
+        ma2 = ma1 + pr * det0
+
+        # Final smoothing by the Jurik adaptive filter
+        det1 = ((ma2 - prev_jma) * (1 - alpha) * (1 - alpha)) + (alpha * alpha * det1)
+        jma[i] = prev_jma = prev_jma + det1
+
+    if state is not None:
+        state[0] = 1.0
+        state[1] = seen + n
+        state[2] = ma1
+        state[3] = u_band
+        state[4] = l_band
+        state[5] = det0
+        state[6] = det1
+        state[7] = prev_jma
+        _shift_history(state[8 : 8 + _JMA_HISTORY], volty[carried:])
+        _shift_history(state[8 + _JMA_HISTORY :], v_sum[carried:])
+
+
+@njit
+def _ewm_mean_columns(values, com, adjust, min_periods, result):
+    """Column-wise ``_ewm_mean_kernel`` over a 2D block."""
+    for j in range(values.shape[1]):
+        _ewm_mean_kernel(values[:, j], com, adjust, min_periods, result[:, j])
+
+
+@njit
+def _rolling_mean_columns(values, window, min_periods, result):
+    """Column-wise ``_rolling_mean_kernel`` over a 2D block."""
+    for j in range(values.shape[1]):
+        _rolling_mean_kernel(values[:, j], window, min_periods, result[:, j])
+
+
+@njit
+def _rolling_var_columns(values, window, min_periods, ddof, result):
+    """Column-wise ``_rolling_var_kernel`` over a 2D block."""
+    for j in range(values.shape[1]):
+        _rolling_var_kernel(values[:, j], window, min_periods, ddof, result[:, j])
+
+
+@njit
+def _jma_columns(values, length1, pow1, bet, beta, pr, jma):
+    """Column-wise ``_jma_kernel`` over a 2D block."""
+    for j in range(values.shape[1]):
+        _jma_kernel(values[:, j], length1, pow1, bet, beta, pr, jma[:, j])
+
+
+@njit
+def _rolling_extreme_columns(values, window, min_periods, find_max, queue, result):
+    """Column-wise ``_rolling_extreme_kernel`` over a 2D block."""
+    for j in range(values.shape[1]):
+        _rolling_extreme_kernel(
+            values[:, j], window, min_periods, find_max, queue[:, j], result[:, j]
+        )
+
+
+# 2D variants used by _promoted for blocks of several series
+_COLUMN_KERNELS = {
+    _ewm_mean_kernel: _ewm_mean_columns,
+    _rolling_mean_kernel: _rolling_mean_columns,
+    _rolling_var_kernel: _rolling_var_columns,
+    _jma_kernel: _jma_columns,
+    _rolling_extreme_kernel: _rolling_extreme_columns,
+}
+
+
+def _pandas_frame(values: np.ndarray):
+    """
+    Wrap kernel input in a pandas object for the vectorised fallbacks.
+
+    Parameters:
+    - values (np.ndarray): 1D values or a 2D block.
+
+    Returns:
+    - pd.Series or pd.DataFrame: The values, one column per series.
+    """
+    import pandas as pd
+
+    return pd.Series(values) if values.ndim == 1 else pd.DataFrame(values)
+
+
+def _ewm_mean_pandas(values, com, adjust, min_periods, result):
+    """``_ewm_mean_kernel`` through ``pandas.ewm``."""
+    ewm = _pandas_frame(values).ewm(com=com, adjust=adjust, min_periods=min_periods)
+    result[:] = ewm.mean().to_numpy()
+
+
+def _rolling_mean_pandas(values, window, min_periods, result):
+    """``_rolling_mean_kernel`` through ``pandas.rolling``."""
+    rolling = _pandas_frame(values).rolling(window, min_periods=min_periods)
+    result[:] = rolling.mean().to_numpy()
+
+
+def _rolling_var_pandas(values, window, min_periods, ddof, result):
+    """``_rolling_var_kernel`` through ``pandas.rolling``."""
+    rolling = _pandas_frame(values).rolling(window, min_periods=min_periods)
+    result[:] = rolling.var(ddof=ddof).to_numpy()
+
+
+def _rolling_extreme_pandas(values, window, min_periods, find_max, queue, result):
+    """``_rolling_extreme_kernel`` through ``pandas.rolling``."""
+    rolling = _pandas_frame(values).rolling(window, min_periods=min_periods)
+    result[:] = (rolling.max() if find_max else rolling.min()).to_numpy()
+
+
+# Without Numba the window kernels would run as Python loops. pandas' own
+# compiled window functions give the same values (the kernels follow their
+# algorithms), so stateless calls use them instead; resumed calls still need
+# the kernels, which carry their state.
+_PANDAS_KERNELS = {
+    _ewm_mean_kernel: _ewm_mean_pandas,
+    _rolling_mean_kernel: _rolling_mean_pandas,
+    _rolling_var_kernel: _rolling_var_pandas,
+    _rolling_extreme_kernel: _rolling_extreme_pandas,
+}
+
+
+@njit
+def _supertrend_kernel(
+    close, upper_band, lower_band, trend, direction, long_values, short_values, state=None
+):
+    """
+    Supertrend direction and trailing bands.
+
+    Parameters:
+    - close (np.ndarray): Close prices.
+    - upper_band (np.ndarray): hl2 + multiplier * ATR (modified in place).
+    - lower_band (np.ndarray): hl2 - multiplier * ATR (modified in place).
+    - trend, direction, long_values, short_values (np.ndarray): Output
+      arrays, filled with the supertrend line, the direction and the long
+      and short lines.
+    - state (np.ndarray): ``_supertrend_state()`` floats (started, last
+      direction, last upper and lower band). Optional.
+    """
+    n = close.shape[0]
+    direction[:] = 1.0
+    trend[:] = np.nan
+    long_values[:] = np.nan
+    short_values[:] = np.nan
+    if n == 0:
+        return
+
+    resume = False
+    if state is not None:
+        resume = state[0] != 0
+    if resume:
+        prev_direction = state[1]
+        prev_upper = state[2]
+        prev_lower = state[3]
+        first = 0
+    else:
+        prev_direction = 1.0
+        prev_upper = upper_band[0]
+        prev_lower = lower_band[0]
+        first = 1
+
+    for i in range(first, n):
+        if close[i] > prev_upper:
+            direction[i] = 1
+        elif close[i] < prev_lower:
+            direction[i] = -1
+        else:
+            direction[i] = prev_direction
+
+            # Adjust the bands to prevent whipsaws
+            if direction[i] > 0 and lower_band[i] < prev_lower:
+                lower_band[i] = prev_lower
+            if direction[i] < 0 and upper_band[i] > prev_upper:
+                upper_band[i] = prev_upper
+
+        if direction[i] > 0:
+            trend[i] = long_values[i] = lower_band[i]
+        else:
+            trend[i] = short_values[i] = upper_band[i]
+        prev_direction = direction[i]
+        prev_upper = upper_band[i]
+        prev_lower = lower_band[i]
+
+    if state is not None:
+        state[0] = 1.0
+        state[1] = prev_direction
+        state[2] = prev_upper
+        state[3] = prev_lower
+
+
+@njit
+def _psar_kernel(
+    high, low, initial_sar, falling, initial_af, af_step, max_af, state=None
+):
+    """
+    Parabolic SAR recursion.
+
+    Parameters:
+    - high (np.ndarray): High prices.
+    - low (np.ndarray): Low prices.
+    - initial_sar (float): SAR of the first bar.
+    - falling (bool): Initial trend direction.
+    - initial_af, af_step, max_af (float): Acceleration factor settings.
+    - state (np.ndarray): ``_psar_state()`` floats (started, bars seen, SAR,
+      extreme point, acceleration factor, direction and the last two highs
+      and lows). On resume initial_sar and falling are ignored. Optional.
+
+    Returns:
+    - tuple: (long, short, af, reversal) arrays.
+    """
+    n = high.shape[0]
+    psar_long = np.full(n, np.nan)
+    psar_short = np.full(n, np.nan)
+    psar_af = np.full(n, np.nan)
+    psar_reversal = np.zeros(n, dtype=np.int64)
+    if n == 0:
+        return psar_long, psar_short, psar_af, psar_reversal
+
+    resume = False
+    if state is not None:
+        resume = state[0] != 0
+    if resume:
+        seen = int(state[1])
+        sar = state[2]
+        ep = state[3]
+        af = state[4]
+        falling = state[5] != 0
+        high_1, high_2 = state[6], state[7]
+        low_1, low_2 = state[8], state[9]
+        first = 0
+    else:
+        seen = 0
+        sar = initial_sar
+        ep = low[0] if falling else high[0]
+        af = initial_af
+        psar_af[0] = af
+        if falling:
+            psar_short[0] = sar
+        else:
+            psar_long[0] = sar
+        high_1, high_2 = high[0], np.nan
+        low_1, low_2 = low[0], np.nan
+        first = 1
+
+    for i in range(first, n):
+        high_val = high[i]
+        low_val = low[i]
+
+        sar_val = sar + af * (ep - sar)
+
+        if falling:
+            # In a downtrend the SAR must not be below the prior two highs
+            sar_val = max(sar_val, high_1)
+            if seen + i >= 2:
+                sar_val = max(sar_val, high_2)
+            reverse = high_val > sar_val
+            if low_val < ep:
+                ep = low_val
+                af = min(af + af_step, max_af)
+        else:
+            # In an uptrend the SAR must not be above the prior two lows
+            sar_val = min(sar_val, low_1)
+            if seen + i >= 2:
+                sar_val = min(sar_val, low_2)
+            reverse = low_val < sar_val
+            if high_val > ep:
+                ep = high_val
+                af = min(af + af_step, max_af)
+
+        if reverse:
+            sar_val = ep
+            af = initial_af
+            falling = not falling
+            ep = low_val if falling else high_val
+            psar_reversal[i] = 1
+
+        sar = sar_val
+        psar_af[i] = af
+        if falling:
+            psar_short[i] = sar
+        else:
+            psar_long[i] = sar
+        high_1, high_2 = high_val, high_1
+        low_1, low_2 = low_val, low_1
+
+    if state is not None:
+        state[0] = 1.0
+        state[1] = seen + n
+        state[2] = sar
+        state[3] = ep
+        state[4] = af
+        state[5] = 1.0 if falling else 0.0
+        state[6] = high_1
+        state[7] = high_2
+        state[8] = low_1
+        state[9] = low_2
+
+    return psar_long, psar_short, psar_af, psar_reversal
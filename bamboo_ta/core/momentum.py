@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+# momentum.py
+
+"""
+Array implementations of the momentum indicators.
+"""
+
+import numpy as np
+
+from bamboo_ta.core._dtype import _resolve_dtype
+from bamboo_ta.core._kernels import (
+    _as_float,
+    _buffer,
+    _ewm_mean_kernel,
+    _ewm_state,
+    _kernel_state,
+    _output,
+    _outputs,
+    _promoted,
+    _rolling_extreme_kernel,
+    _rolling_mean_kernel,
+)
+
+
+def relative_strength_index(
+    values,
+    period: int = 14,
+    scalar: float = 100,
+    dtype=None,
+    out=None,
+    workspace=None,
+    state=None,
+) -> np.ndarray:
+    """
+    Relative Strength Index with Wilder's smoothing.
+
+    Parameters:
+    - values (array-like): Source values, or a 2D block with one series per
+      column (computed along axis 0).
+    - period (int): Smoothing period. Default is 14.
+    - scalar (float): Output scale. Default is 100.
+    - dtype: float64 or float32. Defaults to the global precision.
+    - out (np.ndarray): Array to write the result to. Optional.
+    - workspace (dict): Reusable scratch buffers. Optional.
+    - state (dict): State carried between calls on consecutive chunks of
+      one series. Optional.
+
+    Returns:
+    - np.ndarray: The RSI, NaN until ``period`` changes are available.
+    """
+    values = _as_float(values, _resolve_dtype(dtype))
+    n = values.shape
+    rsi = _output(out, n, values.dtype)
+    delta = _buffer(workspace, "rsi_delta", n, values.dtype)
+    if state is None or "last" not in state:
+        delta[:1] = np.nan
+    else:
+        delta[:1] = values[:1] - state["last"]
+    np.subtract(values[1:], values[:-1], out=delta[1:])
+    if state is not None and n[0]:
+        state["last"] = values[-1]
+
+    # Gains and losses (the leading NaN is kept)
+    mask = _buffer(workspace, "rsi_mask", n, np.bool_)
+    positive = _buffer(workspace, "rsi_positive", n, values.dtype)
+    np.copyto(positive, delta)
+    np.copyto(positive, 0.0, where=np.less(delta, 0, out=mask))
+    negative = _buffer(workspace, "rsi_negative", n, values.dtype)
+    np.copyto(negative, delta)
+    np.copyto(negative, 0.0, where=np.greater(delta, 0, out=mask))
+    np.abs(negative, out=negative)
+
+    com = 1.0 / (1.0 / period) - 1.0
+    min_periods = max(period, 1)
+    positive_avg = _buffer(workspace, "rsi_positive_avg", n, values.dtype)
+    negative_avg = _buffer(workspace, "rsi_negative_avg", n, values.dtype)
+    _promoted(
+        _ewm_mean_kernel,
+        positive,
+        com,
+        True,
+        min_periods,
+        out=positive_avg,
+        workspace=workspace,
+        state=_kernel_state(state, "positive", _ewm_state()),
+    )
+    _promoted(
+        _ewm_mean_kernel,
+        negative,
+        com,
+        True,
+        min_periods,
+        out=negative_avg,
+        workspace=workspace,
+        state=_kernel_state(state, "negative", _ewm_state()),
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.multiply(float(scalar), positive_avg, out=rsi)
+        total = np.add(positive_avg, negative_avg, out=negative)
+        return np.divide(rsi, total, out=rsi)
+
+
+def macd(
+    values,
+    short_window: int = 12,
+    long_window: int = 26,
+    signal_window: int = 9,
+    dtype=None,
+    out=None,
+    workspace=None,
+    state=None,
+) -> tuple:
+    """
+    Moving Average Convergence Divergence.
+
+    Parameters:
+    - values (array-like): Source values, or a 2D block with one series per
+      column (computed along axis 0).
+    - short_window (int): Fast EMA span. Default is 12.
+    - long_window (int): Slow EMA span. Default is 26.
+    - signal_window (int): Signal EMA span. Default is 9.
+    - dtype: float64 or float32. Defaults to the global precision.
+    - out (tuple): Three arrays to write the results to. Optional.
+    - workspace (dict): Reusable scratch buffers. Optional.
+    - state (dict): State carried between calls on consecutive chunks of
+      one series. Optional.
+
+    Returns:
+    - tuple: (macd, signal, histogram).
+    """
+    values = _as_float(values, _resolve_dtype(dtype))
+    n = values.shape
+    macd_line, signal, histogram = _outputs(out, 3, n, values.dtype)
+
+    short_ema = _promoted(
+        _ewm_mean_kernel,
+        values,
+        (short_window - 1) / 2.0,
+        False,
+        1,
+        out=_buffer(workspace, "macd_short_ema", n, values.dtype),
+        workspace=workspace,
+        state=_kernel_state(state, "short_ema", _ewm_state()),
+    )
+    long_ema = _promoted(
+        _ewm_mean_kernel,
+        values,
+        (long_window - 1) / 2.0,
+        False,
+        1,
+        out=_buffer(workspace, "macd_long_ema", n, values.dtype),
+        workspace=workspace,
+        state=_kernel_state(state, "long_ema", _ewm_state()),
+    )
+    np.subtract(short_ema, long_ema, out=macd_line)
+    _promoted(
+        _ewm_mean_kernel,
+        macd_line,
+        (signal_window - 1) / 2.0,
+        False,
+        1,
+        out=signal,
+        workspace=workspace,
+        state=_kernel_state(state, "signal", _ewm_state()),
+    )
+    np.subtract(macd_line, signal, out=histogram)
+    return macd_line, signal, histogram
+
+
+def stochastics_oscillator(
+    high,
+    low,
+    close,
+    window: int = 14,
+    smooth_window: int = 3,
+    fillna: bool = False,
+    dtype=None,
+    out=None,
+    workspace=None,
+) -> tuple:
+    """
+    Stochastic Oscillator.
+
+    Parameters:
+    - high, low, close (array-like): Price arrays, or 2D blocks with one
+      series per column.
+    - window (int): Look-back window of %K. Default is 14.
+    - smooth_window (int): Window of the %D signal. Default is 3.
+    - fillna (bool): Use partial windows and fill missing values (50 for
+      %K and %D, 0 for the histogram). Default is False.
+    - dtype: float64 or float32. Defaults to the global precision.
+    - out (tuple): Three arrays to write the results to. Optional.
+    - workspace (dict): Reusable scratch buffers. Optional.
+
+    Returns:
+    - tuple: (stoch, stoch_signal, stoch_hist).
+    """
+    dtype = _resolve_dtype(dtype)
+    high = _as_float(high, dtype)
+    low = _as_float(low, dtype)
+    close = _as_float(close, dtype)
+    n = close.shape
+    stoch_k, stoch_d, stoch_hist = _outputs(out, 3, n, dtype)
+    queue = _buffer(workspace, "stoch_queue", n, np.int64)
+    mask = _buffer(workspace, "stoch_mask", n, np.bool_)
+
+    min_periods = 0 if fillna else window
+    smin = _promoted(
+        _rolling_extreme_kernel,
+        low,
+        window,
+        min_periods,
+        False,
+        queue,
+        out=_buffer(workspace, "stoch_min", n, dtype),
+        workspace=workspace,
+    )
+    smax = _promoted(
+        _rolling_extreme_kernel,
+        high,
+        window,
+        min_periods,
+        True,
+        queue,
+        out=_buffer(workspace, "stoch_max", n, dtype),
+        workspace=workspace,
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.multiply(100, np.subtract(close, smin, out=stoch_k), out=stoch_k)
+        np.divide(stoch_k, np.subtract(smax, smin, out=smax), out=stoch_k)
+    if fillna:
+        np.copyto(stoch_k, 50.0, where=np.isnan(stoch_k, out=mask))
+
+    min_periods = 0 if fillna else smooth_window
+    _promoted(
+        _rolling_mean_kernel,
+        stoch_k,
+        smooth_window,
+        min_periods,
+        out=stoch_d,
+        workspace=workspace,
+    )
+    if fillna:
+        np.copyto(stoch_d, 50.0, where=np.isnan(stoch_d, out=mask))
+
+    np.subtract(stoch_k, stoch_d, out=stoch_hist)
+    if fillna:
+        np.copyto(stoch_hist, 0.0, where=np.isnan(stoch_hist, out=mask))
+
+    return stoch_k, stoch_d, stoch_hist
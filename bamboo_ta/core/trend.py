@@ -0,0 +1,547 @@
+# -*- coding: utf-8 -*-
+# trend.py
+
+"""
+Array implementations of the moving averages and trend indicators.
+"""
+
+import math
+
+import numpy as np
+
+from bamboo_ta.core._dtype import _resolve_dtype
+from bamboo_ta.core._kernels import (
+    _advance,
+    _as_float,
+    _buffer,
+    _carry,
+    _ewm_mean_kernel,
+    _ewm_state,
+    _jma_kernel,
+    _jma_state,
+    _kernel_state,
+    _outputs,
+    _promoted,
+    _psar_kernel,
+    _psar_state,
+    _rolling_extreme_kernel,
+    _rolling_mean_kernel,
+    _rolling_state,
+    _substate,
+    _supertrend_kernel,
+    _supertrend_state,
+    _weighted_mean,
+)
+from bamboo_ta.core.volatility import true_range
+
+
+def simple_moving_average(
+    values, period: int = 21, dtype=None, out=None, workspace=None, state=None
+) -> np.ndarray:
+    """
+    Simple Moving Average.
+
+    Parameters:
+    - values (array-like): Source values, or a 2D block with one series per
+      column (computed along axis 0).
+    - period (int): Window length. Default is 21.
+    - dtype: float64 or float32. Defaults to the global precision.
+    - out (np.ndarray): Array to write the result to. Optional.
+    - workspace (dict): Reusable scratch buffers. Optional.
+    - state (dict): State carried between calls on consecutive chunks of
+      one series. Optional.
+
+    Returns:
+    - np.ndarray: The SMA, NaN for the first period - 1 values.
+    """
+    values = _as_float(values, _resolve_dtype(dtype))
+    return _promoted(
+        _rolling_mean_kernel,
+        values,
+        period,
+        period,
+        out=out,
+        workspace=workspace,
+        state=_kernel_state(state, "rolling_mean", _rolling_state(period)),
+    )
+
+
+def exponential_moving_average(
+    values, period: int = 21, dtype=None, out=None, workspace=None, state=None
+) -> np.ndarray:
+    """
+    Exponential Moving Average (span = period, seeded with the first value).
+
+    Parameters:
+    - values (array-like): Source values, or a 2D block with one series per
+      column (computed along axis 0).
+    - period (int): EMA span. Default is 21.
+    - dtype: float64 or float32. Defaults to the global precision.
+    - out (np.ndarray): Array to write the result to. Optional.
+    - workspace (dict): Reusable scratch buffers. Optional.
+    - state (dict): State carried between calls on consecutive chunks of
+      one series. Optional.
+
+    Returns:
+    - np.ndarray: The EMA, NaN for the first ``period`` values.
+    """
+    values = _as_float(values, _resolve_dtype(dtype))
+    seen = _advance(state, values.shape[0])
+    ema = _promoted(
+        _ewm_mean_kernel,
+        values,
+        (period - 1) / 2.0,
+        False,
+        1,
+        out=out,
+        workspace=workspace,
+        state=_kernel_state(state, "ewm", _ewm_state()),
+    )
+    ema[: max(period - seen, 0)] = np.nan
+    return ema
+
+
+def rolling_moving_average(
+    values, period: int = 14, dtype=None, out=None, workspace=None, state=None
+) -> np.ndarray:
+    """
+    Wilder's Rolling Moving Average (RMA, alpha = 1 / period).
+
+    Parameters:
+    - values (array-like): Source values, or a 2D block with one series per
+      column (computed along axis 0).
+    - period (int): Smoothing period. Default is 14.
+    - dtype: float64 or float32. Defaults to the global precision.
+    - out (np.ndarray): Array to write the result to. Optional.
+    - workspace (dict): Reusable scratch buffers. Optional.
+    - state (dict): State carried between calls on consecutive chunks of
+      one series. Optional.
+
+    Returns:
+    - np.ndarray: The RMA (seeded with the first value, no warm-up NaNs).
+    """
+    values = _as_float(values, _resolve_dtype(dtype))
+    return _promoted(
+        _ewm_mean_kernel,
+        values,
+        1.0 / (1.0 / period) - 1.0,
+        False,
+        1,
+        out=out,
+        workspace=workspace,
+        state=_kernel_state(state, "ewm", _ewm_state()),
+    )
+
+
+def weighted_moving_average(
+    values, period: int = 10, dtype=None, state=None
+) -> np.ndarray:
+    """
+    Linearly Weighted Moving Average.
+
+    Parameters:
+    - values (array-like): Source values, or a 2D block with one series per
+      column (computed along axis 0).
+    - period (int): Window length. Default is 10.
+    - dtype: float64 or float32. Defaults to the global precision.
+    - state (dict): State carried between calls on consecutive chunks of
+      one series. Optional.
+
+    Returns:
+    - np.ndarray: The WMA, NaN for the first period - 1 values.
+    """
+    values = _as_float(values, _resolve_dtype(dtype))
+    # The last period - 1 values of the previous chunk complete the windows
+    combined = _carry(state, "values", values, period - 1)
+    return _weighted_mean(combined, period)[combined.shape[0] - values.shape[0] :]
+
+
+def hull_moving_average(values, period: int = 9, dtype=None, state=None) -> np.ndarray:
+    """
+    Hull Moving Average: WMA(2 * WMA(n / 2) - WMA(n), sqrt(n)).
+
+    Parameters:
+    - values (array-like): Source values, or a 2D block with one series per
+      column (computed along axis 0).
+    - period (int): Window length. Default is 9.
+    - dtype: float64 or float32. Defaults to the global precision.
+    - state (dict): State carried between calls on consecutive chunks of
+      one series. Optional.
+
+    Returns:
+    - np.ndarray: The HMA.
+    """
+    values = _as_float(values, _resolve_dtype(dtype))
+    n = values.shape[0]
+    half_length = math.floor(period / 2)
+    sqrt_length = math.floor(math.sqrt(period))
+
+    combined = _carry(state, "values", values, period - 1)
+    h = 2 * _weighted_mean(combined, half_length) - _weighted_mean(combined, period)
+    h = _carry(state, "h", h[h.shape[0] - n :], sqrt_length - 1)
+    return _weighted_mean(h, sqrt_length)[h.shape[0] - n :]
+
+
+def jurik_moving_average(
+    values, length: int = 7, phase: float = 0, dtype=None, state=None
+) -> np.ndarray:
+    """
+    Jurik Moving Average.
+
+    Parameters:
+    - values (array-like): Source values, or a 2D block with one series per
+      column (computed along axis 0).
+    - length (int): Period. Default is 7.
+    - phase (float): Phase between -100 and 100. Default is 0.
+    - dtype: float64 or float32. Defaults to the global precision.
+    - state (dict): State carried between calls on consecutive chunks of
+      one series. Optional.
+
+    Returns:
+    - np.ndarray: The JMA, NaN for the first length - 1 values.
+    """
+    values = _as_float(values, _resolve_dtype(dtype))
+    seen = _advance(state, values.shape[0])
+    _length = int(length) if length > 0 else 7
+    phase = float(phase)
+
+    # Constants of the Jurik filter
+    half_length = 0.5 * (_length - 1)
+    pr = 0.5 if phase < -100 else 2.5 if phase > 100 else 1.5 + phase * 0.01
+    length1 = max((np.log(np.sqrt(half_length)) / np.log(2.0)) + 2.0, 0)
+    pow1 = max(length1 - 2.0, 0.5)
+    length2 = length1 * np.sqrt(half_length)
+    bet = length2 / (length2 + 1)
+    beta = 0.45 * (_length - 1) / (0.45 * (_length - 1) + 2.0)
+
+    jma = _promoted(
+        _jma_kernel,
+        values,
+        length1,
+        pow1,
+        bet,
+        beta,
+        pr,
+        state=_kernel_state(state, "jma", _jma_state()),
+    )
+    jma[: max(_length - 1 - seen, 0)] = np.nan
+    return jma
+
+
+def supertrend(
+    high,
+    low,
+    close,
+    length: int = 7,
+    atr_length: int = None,
+    multiplier: float = 3.0,
+    atr_mamode: str = "rma",
+    dtype=None,
+    out=None,
+    workspace=None,
+    state=None,
+) -> tuple:
+    """
+    Supertrend.
+
+    Parameters:
+    - high, low, close (array-like): Price arrays.
+    - length (int): Number of initial bars without a direction. Default is 7.
+    - atr_length (int): ATR period. Defaults to ``length``.
+    - multiplier (float): ATR multiplier of the bands. Default is 3.0.
+    - atr_mamode (str): ATR smoothing: 'sma', 'ema', 'rma' or 'wma'.
+    - dtype: float64 or float32. Defaults to the global precision.
+    - out (tuple): Six arrays to write the results to. Optional.
+    - workspace (dict): Reusable scratch buffers. Optional. The 'wma' ATR
+      still allocates its sliding windows.
+    - state (dict): State carried between calls on consecutive chunks of
+      one series. Optional.
+
+    Returns:
+    - tuple: (supertrend, direction, long, short, upper_band, lower_band).
+    """
+    if atr_length is None:
+        atr_length = length
+    if length <= 0:
+        raise ValueError("length must be a positive integer")
+    if atr_length <= 0:
+        raise ValueError("atr_length must be a positive integer")
+    if multiplier <= 0:
+        raise ValueError("multiplier must be a positive number")
+    if atr_mamode not in ["sma", "ema", "rma", "wma"]:
+        raise ValueError("atr_mamode must be one of: 'sma', 'ema', 'rma', 'wma'")
+
+    dtype = _resolve_dtype(dtype)
+    high = _as_float(high, dtype)
+    low = _as_float(low, dtype)
+    close = _as_float(close, dtype)
+    n = close.shape[0]
+    seen = _advance(state, n)
+    outputs = _outputs(out, 6, n, dtype)
+    upper_band, lower_band = outputs[4], outputs[5]
+    # The band recursion reads close after the outputs are written
+    if any(np.may_share_memory(output, close) for output in outputs):
+        source = _buffer(workspace, "supertrend_close", n, dtype)
+        source[:] = close
+        close = source
+
+    hl2 = np.add(high, low, out=_buffer(workspace, "supertrend_hl2", n, dtype))
+    hl2 /= 2
+    tr = true_range(
+        high,
+        low,
+        close,
+        dtype=dtype,
+        out=_buffer(workspace, "supertrend_tr", n, dtype),
+        workspace=workspace,
+        state=_substate(state, "true_range"),
+    )
+
+    # ATR with the selected moving average
+    atr_value = _buffer(workspace, "supertrend_atr", n, dtype)
+    if atr_mamode == "sma":
+        _promoted(
+            _rolling_mean_kernel,
+            tr,
+            atr_length,
+            atr_length,
+            out=atr_value,
+            workspace=workspace,
+            state=_kernel_state(state, "atr", _rolling_state(atr_length)),
+        )
+    elif atr_mamode == "ema":
+        _promoted(
+            _ewm_mean_kernel,
+            tr,
+            (atr_length - 1) / 2.0,
+            False,
+            1,
+            out=atr_value,
+            workspace=workspace,
+            state=_kernel_state(state, "atr", _ewm_state()),
+        )
+    elif atr_mamode == "rma":
+        rolling_moving_average(
+            tr,
+            atr_length,
+            dtype=dtype,
+            out=atr_value,
+            workspace=workspace,
+            state=_substate(state, "atr"),
+        )
+    else:
+        atr_value[:] = weighted_moving_average(
+            tr, atr_length, dtype=dtype, state=_substate(state, "atr")
+        )
+
+    matr = np.multiply(float(multiplier), atr_value, out=atr_value)
+    np.add(hl2, matr, out=upper_band)
+    np.subtract(hl2, matr, out=lower_band)
+
+    # The trailing band recursion runs in float64 (it updates the bands)
+    kernel_state = _kernel_state(state, "supertrend", _supertrend_state())
+    extra = () if kernel_state is None else (kernel_state,)
+    if dtype == np.float64:
+        _supertrend_kernel(close, upper_band, lower_band, *outputs[:4], *extra)
+    else:
+        close64, upper64, lower64, *results64 = (
+            _buffer(workspace, f"supertrend_float64_{i}", n) for i in range(7)
+        )
+        close64[:] = close
+        upper64[:] = upper_band
+        lower64[:] = lower_band
+        _supertrend_kernel(close64, upper64, lower64, *results64, *extra)
+        for output, values in zip(outputs, (*results64, upper64, lower64)):
+            output[:] = values
+
+    # No direction during the initial length period
+    outputs[1][: max(length - seen, 0)] = np.nan
+
+    return outputs
+
+
+def parabolic_sar(
+    high,
+    low,
+    close=None,
+    initial_af: float = 0.02,
+    af_step: float = 0.02,
+    max_af: float = 0.2,
+    use_close: bool = False,
+    dtype=None,
+    state=None,
+) -> tuple:
+    """
+    Parabolic Stop and Reverse.
+
+    Parameters:
+    - high, low (array-like): Price arrays.
+    - close (array-like, optional): Close prices, required when use_close.
+    - initial_af (float): Initial acceleration factor. Default is 0.02.
+    - af_step (float): Acceleration factor increment. Default is 0.02.
+    - max_af (float): Maximum acceleration factor. Default is 0.2.
+    - use_close (bool): Start the SAR at the first close. Default is False.
+    - dtype: float64 or float32. Defaults to the global precision. The
+      recursion always runs in float64; psar_reversal is int64.
+    - state (dict): State carried between calls on consecutive chunks of
+      one series. The first chunk needs at least two rows. Optional.
+
+    Returns:
+    - tuple: (psar_long, psar_short, psar_af, psar_reversal).
+    """
+    initial_af = float(initial_af) if initial_af > 0 else 0.02
+    af_step = float(af_step) if af_step > 0 else 0.02
+    max_af = float(max_af) if max_af > 0 else 0.2
+
+    dtype = _resolve_dtype(dtype)
+    high = _as_float(high, dtype)
+    low = _as_float(low, dtype)
+    n = high.shape[0]
+    kernel_state = _kernel_state(state, "psar", _psar_state())
+    if kernel_state is not None and kernel_state[0] == 0 and n == 1:
+        raise ValueError("the first chunk of a parabolic_sar state needs two rows")
+    extra = () if kernel_state is None else (kernel_state,)
+
+    # Falling at the start when -DM is positive
+    falling = False
+    if n >= 2:
+        h_diff = high[1] - high[0]
+        l_diff = low[0] - low[1]
+        falling = bool(l_diff > h_diff and l_diff > 0)
+
+    if n == 0:
+        initial_sar = np.nan
+    elif use_close:
+        if close is None:
+            raise ValueError("close is required when use_close is True")
+        initial_sar = float(_as_float(close, dtype)[0])
+    else:
+        initial_sar = high[0] if falling else low[0]
+
+    psar_long, psar_short, psar_af, psar_reversal = _psar_kernel(
+        high.astype(np.float64, copy=False),
+        low.astype(np.float64, copy=False),
+        initial_sar,
+        falling,
+        initial_af,
+        af_step,
+        max_af,
+        *extra,
+    )
+    return (
+        psar_long.astype(dtype, copy=False),
+        psar_short.astype(dtype, copy=False),
+        psar_af.astype(dtype, copy=False),
+        psar_reversal,
+    )
+
+
+def _pivots(
+    values, left_bars: int, right_bars: int, find_max: bool, strict: bool, dtype
+) -> tuple:
+    """
+    Pivot highs or lows from the rolling extremes on each side of a bar.
+
+    A bar is a pivot when no bar of the left_bars before it and of the
+    right_bars after it is beyond it (strict: reaches it). Each side is a
+    trailing rolling extreme (monotonic deque, O(n)) read one bar before and
+    right_bars bars after the candidate. NaN values are skipped in the
+    windows and are never pivots.
+
+    Parameters:
+    - values (array-like): Source values.
+    - left_bars (int): Bars before the pivot.
+    - right_bars (int): Bars after the pivot.
+    - find_max (bool): True for pivot highs, False for pivot lows.
+    - strict (bool): Whether ties on either side rule a pivot out.
+    - dtype: float64 or float32.
+
+    Returns:
+    - tuple: (positions, levels, last_level, last_position).
+    """
+    if left_bars < 0 or right_bars < 0:
+        raise ValueError("left_bars and right_bars must be non-negative")
+    values = _as_float(values, dtype)
+    n = values.shape[0]
+    # Series shorter than the two sides have no candidates
+    stop = max(n - right_bars, left_bars)
+    candidates = values[left_bars:stop]
+    is_pivot = candidates == candidates
+    queue = np.empty(n, dtype=np.int64)
+    for window, offset in ((left_bars, -1), (right_bars, right_bars)):
+        if window == 0 or candidates.size == 0:
+            continue
+        side = _promoted(_rolling_extreme_kernel, values, window, 1, find_max, queue)
+        side = side[left_bars + offset : stop + offset]
+        with np.errstate(invalid="ignore"):
+            if find_max:
+                beyond = side >= candidates if strict else side > candidates
+            else:
+                beyond = side <= candidates if strict else side < candidates
+        is_pivot &= ~beyond
+
+    positions = np.flatnonzero(is_pivot) + left_bars
+    # A pivot is confirmed right_bars bars later; carry it until the next one
+    last_position = np.full(n, -1, dtype=np.int64)
+    last_position[positions + right_bars] = positions
+    np.maximum.accumulate(last_position, out=last_position)
+    last_level = np.where(last_position >= 0, values[last_position], np.nan).astype(dtype)
+    return positions, values[positions], last_level, last_position
+
+
+def pivot_high(
+    high, left_bars: int = 3, right_bars: int = 3, strict: bool = False, dtype=None
+) -> tuple:
+    """
+    Pivot (swing) highs.
+
+    A bar is a pivot high when none of the left_bars bars before it and the
+    right_bars bars after it has a higher value; with strict, none may equal
+    it either. The first left_bars and last right_bars bars are never
+    pivots. NaN bars are never pivots and are skipped as neighbours, so a
+    bar next to a NaN can be one (scipy's argrelextrema rules it out).
+    Vectorised over the whole series, O(n).
+
+    Parameters:
+    - high (array-like): High prices (or any source values).
+    - left_bars (int): Bars before the pivot. Default is 3.
+    - right_bars (int): Bars after the pivot. Default is 3.
+    - strict (bool): Rule out ties with the neighbouring bars. Default is
+      False.
+    - dtype: float64 or float32. Defaults to the global precision.
+
+    Returns:
+    - tuple: (positions, levels, last_level, last_position). positions
+      (int64) are the indices of the pivot bars and levels their values.
+      last_level and last_position have one value per bar: the level and
+      index of the last pivot confirmed by that bar (the pivot bar plus
+      right_bars), NaN and -1 before the first one.
+    """
+    return _pivots(high, left_bars, right_bars, True, strict, _resolve_dtype(dtype))
+
+
+def pivot_low(
+    low, left_bars: int = 3, right_bars: int = 3, strict: bool = False, dtype=None
+) -> tuple:
+    """
+    Pivot (swing) lows.
+
+    A bar is a pivot low when none of the left_bars bars before it and the
+    right_bars bars after it has a lower value; with strict, none may equal
+    it either. The first left_bars and last right_bars bars are never
+    pivots. NaN bars are never pivots and are skipped as neighbours, so a
+    bar next to a NaN can be one (scipy's argrelextrema rules it out).
+    Vectorised over the whole series, O(n).
+
+    Parameters:
+    - low (array-like): Low prices (or any source values).
+    - left_bars (int): Bars before the pivot. Default is 3.
+    - right_bars (int): Bars after the pivot. Default is 3.
+    - strict (bool): Rule out ties with the neighbouring bars. Default is
+      False.
+    - dtype: float64 or float32. Defaults to the global precision.
+
+    Returns:
+    - tuple: (positions, levels, last_level, last_position), as pivot_high.
+    """
+    return _pivots(low, left_bars, right_bars, False, strict, _resolve_dtype(dtype))
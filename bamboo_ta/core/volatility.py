@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+# volatility.py
+
+"""
+Array implementations of the volatility indicators.
+"""
+
+import numpy as np
+
+from bamboo_ta.core._dtype import _resolve_dtype
+from bamboo_ta.core._kernels import (
+    _as_float,
+    _buffer,
+    _kernel_state,
+    _output,
+    _outputs,
+    _promoted,
+    _rolling_mean_kernel,
+    _rolling_state,
+    _rolling_var_kernel,
+    _substate,
+)
+
+
+def true_range(
+    high, low, close, dtype=None, out=None, workspace=None, state=None
+) -> np.ndarray:
+    """
+    True Range: the largest of high - low, |high - prev close| and
+    |low - prev close|.
+
+    Parameters:
+    - high, low, close (array-like): Price arrays, or 2D blocks with one
+      series per column.
+    - dtype: float64 or float32. Defaults to the global precision.
+    - out (np.ndarray): Array to write the result to. Optional.
+    - workspace (dict): Reusable scratch buffers. Optional.
+    - state (dict): State carried between calls on consecutive chunks of
+      one series. Optional.
+
+    Returns:
+    - np.ndarray: The true range (high - low on the first bar).
+    """
+    dtype = _resolve_dtype(dtype)
+    high = _as_float(high, dtype)
+    low = _as_float(low, dtype)
+    close = _as_float(close, dtype)
+    n = close.shape
+    tr = _output(out, n, dtype)
+
+    prev_close = _buffer(workspace, "true_range_prev_close", n, dtype)
+    prev_close[:1] = np.nan if state is None else state.get("close", np.nan)
+    prev_close[1:] = close[:-1]
+    if state is not None and n:
+        state["close"] = close[-1]
+    distance = _buffer(workspace, "true_range_distance", n, dtype)
+    # high and low are read after the first write, so an out aliasing them
+    # gets the result through a scratch buffer
+    aliased = np.may_share_memory(tr, high) or np.may_share_memory(tr, low)
+    result = _buffer(workspace, "true_range_result", n, dtype) if aliased else tr
+
+    # fmax skips the NaN components of the first bar
+    np.subtract(high, low, out=result)
+    np.abs(np.subtract(high, prev_close, out=distance), out=distance)
+    np.fmax(result, distance, out=result)
+    np.abs(np.subtract(low, prev_close, out=distance), out=distance)
+    np.fmax(result, distance, out=result)
+    if aliased:
+        tr[:] = result
+    return tr
+
+
+def average_true_range(
+    high,
+    low,
+    close,
+    period: int = 14,
+    dtype=None,
+    out=None,
+    workspace=None,
+    state=None,
+) -> np.ndarray:
+    """
+    Average True Range as the simple rolling mean of the true range.
+
+    Parameters:
+    - high, low, close (array-like): Price arrays, or 2D blocks with one
+      series per column.
+    - period (int): Window length. Default is 14.
+    - dtype: float64 or float32. Defaults to the global precision.
+    - out (np.ndarray): Array to write the result to. Optional.
+    - workspace (dict): Reusable scratch buffers. Optional.
+    - state (dict): State carried between calls on consecutive chunks of
+      one series. Optional.
+
+    Returns:
+    - np.ndarray: The ATR (partial windows are averaged from the first bar).
+    """
+    dtype = _resolve_dtype(dtype)
+    close = _as_float(close, dtype)
+    tr = _buffer(workspace, "average_true_range_tr", close.shape, dtype)
+    true_range(
+        high,
+        low,
+        close,
+        dtype=dtype,
+        out=tr,
+        workspace=workspace,
+        state=_substate(state, "true_range"),
+    )
+    return _promoted(
+        _rolling_mean_kernel,
+        tr,
+        period,
+        1,
+        out=out,
+        workspace=workspace,
+        state=_kernel_state(state, "rolling_mean", _rolling_state(period)),
+    )
+
+
+def bollinger_bands(
+    values,
+    period: int = 20,
+    std_dev: float = 2.0,
+    ddof: int = 0,
+    dtype=None,
+    out=None,
+    workspace=None,
+    state=None,
+) -> tuple:
+    """
+    Bollinger Bands around a simple moving average.
+
+    Parameters:
+    - values (array-like): Source values, or a 2D block with one series per
+      column (computed along axis 0).
+    - period (int): Window length. Default is 20.
+    - std_dev (float): Standard deviation multiplier. Default is 2.0.
+    - ddof (int): Delta degrees of freedom of the standard deviation.
+      Default is 0.
+    - dtype: float64 or float32. Defaults to the global precision.
+    - out (tuple): Three arrays to write the results to. Optional.
+    - workspace (dict): Reusable scratch buffers. Optional.
+    - state (dict): State carried between calls on consecutive chunks of
+      one series. Optional.
+
+    Returns:
+    - tuple: (upper, middle, lower).
+    """
+    values = _as_float(values, _resolve_dtype(dtype))
+    n = values.shape
+    upper, sma, lower = _outputs(out, 3, n, values.dtype)
+    # The variance reads the values first, so the middle band may be written
+    # over them
+    variance = _promoted(
+        _rolling_var_kernel,
+        values,
+        period,
+        period,
+        ddof,
+        out=_buffer(workspace, "bollinger_bands_variance", n, values.dtype),
+        workspace=workspace,
+        state=_kernel_state(state, "rolling_var", _rolling_state(period)),
+    )
+    _promoted(
+        _rolling_mean_kernel,
+        values,
+        period,
+        period,
+        out=sma,
+        workspace=workspace,
+        state=_kernel_state(state, "rolling_mean", _rolling_state(period)),
+    )
+    rolling_std = np.sqrt(np.maximum(variance, 0.0, out=variance), out=variance)
+
+    width = np.multiply(rolling_std, float(std_dev), out=rolling_std)
+    np.add(sma, width, out=upper)
+    np.subtract(sma, width, out=lower)
+    return upper, sma, lower
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# volume.py
+
+"""
+Array implementations of the volume indicators.
+"""
+
+import numpy as np
+
+from bamboo_ta.core._dtype import _resolve_dtype
+from bamboo_ta.core._kernels import (
+    _as_float,
+    _ewm_mean_kernel,
+    _promoted,
+    _rolling_mean_kernel,
+)
+
+
+def on_balance_volume(
+    close,
+    volume,
+    signal_type: str = "SMA",
+    signal_length: int = 21,
+    show_signal: bool = True,
+    fillna: bool = False,
+    dtype=None,
+) -> tuple:
+    """
+    On Balance Volume with an optional signal line.
+
+    Parameters:
+    - close, volume (array-like): Close prices and volume, or 2D blocks
+      with one series per column.
+    - signal_type (str): 'SMA' or 'EMA'. Default is 'SMA'.
+    - signal_length (int): Signal period. Default is 21.
+    - show_signal (bool): Calculate the signal line. Default is True.
+    - fillna (bool): Replace missing values with 0. Default is False.
+    - dtype: float64 or float32. Defaults to the global precision. The
+      running total is always accumulated in float64.
+
+    Returns:
+    - tuple: (obv, signal).
+    """
+    dtype = _resolve_dtype(dtype)
+    close = _as_float(close, dtype)
+    volume = _as_float(volume, dtype)
+    change = np.empty_like(close)
+    change[:1] = np.nan
+    change[1:] = close[1:] - close[:-1]
+
+    # Running total of the volume signed by the price change; missing
+    # volume contributes nothing and stays missing
+    signed = np.where(change > 0, volume, np.where(change < 0, -volume, 0.0))
+    missing = np.isnan(signed)
+    obv = np.cumsum(np.where(missing, 0.0, signed), axis=0, dtype=np.float64)
+    obv[missing] = np.nan
+    obv = obv.astype(dtype, copy=False)
+
+    if show_signal:
+        if signal_type == "EMA":
+            signal = _promoted(
+                _ewm_mean_kernel, obv, (signal_length - 1) / 2.0, False, 1
+            )
+        elif signal_type == "SMA":
+            signal = _promoted(_rolling_mean_kernel, obv, signal_length, 1)
+        else:
+            raise ValueError(f"Invalid signal_type: {signal_type}. Use 'EMA' or 'SMA'.")
+    else:
+        signal = np.full(close.shape, np.nan, dtype=dtype)
+
+    if fillna:
+        obv = np.where(np.isnan(obv), 0.0, obv)
+        signal = np.where(np.isnan(signal), 0.0, signal)
+
+    return obv, signal
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+# events.py
+
+"""
+Sparse event outputs of signal indicators.
+
+Reversals, breakout signals, entries and exits, crosses and candlestick
+pattern hits fire on a small share of the bars, yet their dense columns
+take a full-length array each. With ``events=True`` the signal indicators
+return only where they fire instead:
+
+- The result is a dict with one entry per event type, holding its sorted
+  int32 row positions ('positions') and the values at those rows
+  ('values'), or None for plain 0/1 flags.
+- Signed signals (-1/1) keep their sign as values and direction changes
+  the new direction. A value attached to a flag (the FRAMA signal values)
+  is a separate event type with the name of its dense column.
+- Label outputs (candlestick patterns) give one event type per label.
+
+``densify_events`` turns the events back into full-length columns on
+demand; the dense outputs stay the default of every indicator.
+
+Call with:
+    events = bta.parabolic_sar(df, events=True)
+    reversals = events["psar_reversal"]["positions"]  # row positions, int32
+    df['psar_reversal'] = bta.densify_events(events, df.index)['psar_reversal']
+"""
+
+import numpy as np
+import pandas as pd
+
+from bamboo_ta._outputs import _flag_dtype
+from bamboo_ta._results import _build_result
+
+
+def _positions(mask) -> np.ndarray:
+    """
+    Get the rows where a mask is set.
+
+    Parameters:
+    - mask (np.ndarray or pd.Series): Boolean mask.
+
+    Returns:
+    - np.ndarray: Sorted int32 row positions.
+    """
+    return np.flatnonzero(np.asarray(mask, dtype=bool)).astype(np.int32)
+
+
+def _flag_events(flags) -> dict:
+    """
+    Get the events of a 0/1 flag.
+
+    Parameters:
+    - flags (np.ndarray or pd.Series): The flag, NaN counting as unset.
+
+    Returns:
+    - dict: 'positions' of the set rows and 'values' None.
+    """
+    flags = np.asarray(flags)
+    mask = flags != 0
+    if flags.dtype.kind == "f":
+        mask &= ~np.isnan(flags)
+    return {"positions": _positions(mask), "values": None}
+
+
+def _signed_events(signals) -> dict:
+    """
+    Get the events of a -1/0/1 signal.
+
+    Parameters:
+    - signals (np.ndarray or pd.Series): The signal, NaN counting as 0.
+
+    Returns:
+    - dict: 'positions' of the non-zero rows and 'values' their signs (int8).
+    """
+    signals = np.asarray(signals)
+    positions = _flag_events(signals)["positions"]
+    return {"positions": positions, "values": np.sign(signals[positions]).astype(np.int8)}
+
+
+def _value_events(flags, values) -> dict:
+    """
+    Get the events of a flag together with a value per event.
+
+    Parameters:
+    - flags (np.ndarray or pd.Series): The 0/1 flag.
+    - values (np.ndarray or pd.Series): Full-length values, read at the flags.
+
+    Returns:
+    - dict: 'positions' of the set rows and 'values' at those rows.
+    """
+    positions = _flag_events(flags)["positions"]
+    return {"positions": positions, "values": np.asarray(values)[positions]}
+
+
+def _change_events(direction) -> dict:
+    """
+    Get the flips of a -1/1 direction.
+
+    Parameters:
+    - direction (np.ndarray or pd.Series): The direction, 0 or NaN on
+      warm-up bars.
+
+    Returns:
+    - dict: 'positions' of the rows where the direction flips from -1 to 1
+      or back and 'values' the new direction (int8).
+    """
+    direction = np.nan_to_num(np.asarray(direction, dtype=np.float64))
+    flips = np.zeros(len(direction), dtype=bool)
+    flips[1:] = (direction[1:] * direction[:-1]) < 0
+    positions = _positions(flips)
+    return {"positions": positions, "values": direction[positions].astype(np.int8)}
+
+
+def _label_events(labels, categories) -> dict:
+    """
+    Get the events of a label output, one event type per label.
+
+    Parameters:
+    - labels (pd.Series or pd.Categorical): The labels, Categorical or
+      object strings.
+    - categories (list): All labels; the empty label is no event.
+
+    Returns:
+    - dict: Label -> 'positions' of its rows and 'values' None, for every
+      non-empty label.
+    """
+    codes = pd.Categorical(labels, categories=categories).codes
+    return {
+        label: {"positions": _positions(codes == code), "values": None}
+        for code, label in enumerate(categories)
+        if label
+    }
+
+
+def densify_events(events: dict, index, return_type: str = "frame"):
+    """Expand sparse events to full-length columns"""
+    if not isinstance(index, pd.Index):
+        index = pd.RangeIndex(index)
+    columns = {}
+    for name, event in events.items():
+        positions, values = event["positions"], event["values"]
+        if values is None:
+            column = np.zeros(len(index), dtype=_flag_dtype())
+            column[positions] = 1
+        else:
+            values = np.asarray(values)
+            if values.dtype.kind in "biu":
+                column = np.zeros(len(index), dtype=values.dtype)
+            else:
+                column = np.full(len(index), np.nan, dtype=np.result_type(values, np.float32))
+            column[positions] = values
+        columns[name] = column
+    return _build_result(columns, index, return_type)
+
+
+densify_events.__doc__ = """
+Name:
+    Densify Events
+
+Description:
+    Expands the sparse events of a signal indicator called with events=True back to
+    full-length columns, one per event type: the flag dtype (int8, or int64 with the
+    legacy output policy) with 1 at the events for plain flags, otherwise the event
+    values at the events and 0 (integer values) or NaN (float values) elsewhere.
+    For flags and signed signals this gives the dense output of the indicator.
+
+Parameters:
+    - events (dict): Event name -> dict with 'positions' (sorted row positions) and
+      'values' (values at the positions, or None), as returned with events=True.
+      Select entries to densify only some event types.
+    - index (pd.Index or int): Index of the input frame, or its number of rows.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per event type). Default is 'frame'.
+
+Call with:
+    events = bta.supertrend(df, events=True)
+    flips = events["supertrend_flip_7_3.0"]  # positions and new directions
+    dense = bta.densify_events(events, df.index)
+    df['supertrend_flip'] = dense['supertrend_flip_7_3.0']
+
+Returns:
+    pd.DataFrame, dict or np.ndarray: One full-length column per event type, in the
+    order of events.
+"""
@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+# executor.py
+
+"""
+Concurrent execution of many indicators on one frame.
+
+A strategy computes dozens of independent indicators on the same pair. Most
+of their time is spent in NumPy, pandas and the compiled kernels, which
+release the GIL, so ``run_many`` runs them on a thread pool instead of one
+after the other:
+
+- Every spec names an indicator of the ``bta`` namespace (or any callable
+  taking the frame first), its arguments and the specs it depends on.
+- A spec starts as soon as all its dependencies are done. It receives the
+  input frame extended with the output columns of its dependencies, so it
+  can use them as its ``column``.
+- The results are merged into one consolidated frame (see ``_results``).
+
+With ``report=True`` the run also returns the wall time, the summed CPU
+time of the individual calls and their ratio, the parallel speedup achieved.
+CPU time (``time.thread_time``) leaves out the time a thread waits for the
+GIL, so the speedup is not inflated by calls that merely overlap.
+
+Call with:
+    specs = [
+        {"name": "ema21", "func": "exponential_moving_average", "kwargs": {"period": 21}},
+        {"name": "bb", "func": "bollinger_bands", "kwargs": {"period": 20}},
+        {"name": "rsi_ema", "func": "relative_strength_index",
+         "kwargs": {"column": "ema21"}, "depends_on": ["ema21"]},
+    ]
+    result, report = bta.run_many(df, specs, workers=8, report=True)
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, CancelledError, ThreadPoolExecutor, wait
+
+import pandas as pd
+
+from bamboo_ta._results import _build_result, _values
+
+_SPEC_KEYS = {"name", "func", "args", "kwargs", "depends_on"}
+
+
+def _resolve_func(func):
+    """
+    Get the indicator function of a spec.
+
+    Parameters:
+    - func (str or Callable): Name of a function in the ``bta`` namespace,
+      or the function itself.
+
+    Returns:
+    - Callable: The function.
+    """
+    if callable(func):
+        return func
+    import bamboo_ta.bamboo_ta as bta
+
+    resolved = getattr(bta, func, None)
+    if not callable(resolved):
+        raise ValueError(f"unknown indicator {func!r}")
+    return resolved
+
+
+def _normalize_specs(specs) -> dict:
+    """
+    Validate the specs and index them by name.
+
+    Parameters:
+    - specs (list): Dicts with 'name', 'func' and optionally 'args',
+      'kwargs' and 'depends_on'.
+
+    Returns:
+    - dict: Name -> normalised spec, in the order given.
+    """
+    normalized = {}
+    for spec in specs:
+        unknown = set(spec) - _SPEC_KEYS
+        if unknown:
+            raise ValueError(f"unknown spec keys {sorted(unknown)}")
+        if "name" not in spec or "func" not in spec:
+            raise ValueError("every spec needs a 'name' and a 'func'")
+        name = spec["name"]
+        if name in normalized:
+            raise ValueError(f"duplicate spec name {name!r}")
+        normalized[name] = {
+            "func": _resolve_func(spec["func"]),
+            "args": tuple(spec.get("args", ())),
+            "kwargs": dict(spec.get("kwargs", {})),
+            "depends_on": list(spec.get("depends_on", [])),
+        }
+
+    for name, spec in normalized.items():
+        for dependency in spec["depends_on"]:
+            if dependency not in normalized:
+                raise ValueError(f"{name!r} depends on unknown spec {dependency!r}")
+
+    # Depth-first walk to reject dependency cycles before anything runs
+    state = {}
+
+    def visit(name, path):
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "active":
+            raise ValueError(f"dependency cycle: {' -> '.join(path + [name])}")
+        state[name] = "active"
+        for dependency in normalized[name]["depends_on"]:
+            visit(dependency, path + [name])
+        state[name] = "done"
+
+    for name in normalized:
+        visit(name, [])
+    return normalized
+
+
+def _result_columns(name: str, result) -> dict:
+    """
+    Name the outputs of one spec.
+
+    Parameters:
+    - name (str): Name of the spec.
+    - result (pd.DataFrame or pd.Series): What the indicator returned.
+
+    Returns:
+    - dict: The spec name -> values for a single output, otherwise
+      '<name>_<output>' -> values.
+    """
+    if isinstance(result, pd.Series):
+        return {name: _values(result)}
+    if not isinstance(result, pd.DataFrame):
+        raise TypeError(
+            f"{name!r} returned {type(result).__name__}, expected a DataFrame or Series"
+        )
+    if result.shape[1] == 1:
+        return {name: _values(result.iloc[:, 0])}
+    return {f"{name}_{output}": _values(result[output]) for output in result.columns}
+
+
+def _spec_input(df: pd.DataFrame, dependencies: list, columns: dict) -> pd.DataFrame:
+    """
+    Build the input frame of a spec.
+
+    Parameters:
+    - df (pd.DataFrame): The frame passed to ``run_many``.
+    - dependencies (list): Names of the specs it depends on.
+    - columns (dict): Spec name -> named output columns of the finished specs.
+
+    Returns:
+    - pd.DataFrame: ``df`` itself without dependencies, otherwise ``df``
+      extended with the output columns of the dependencies.
+    """
+    if not dependencies:
+        return df
+    extra = {}
+    for dependency in dependencies:
+        extra.update(columns[dependency])
+    return pd.concat([df, pd.DataFrame(extra, index=df.index)], axis=1)
+
+
+def _timed_call(func, df, args, kwargs) -> tuple:
+    """
+    Call an indicator and measure the CPU time of its thread.
+
+    Parameters:
+    - func (Callable): The indicator.
+    - df (pd.DataFrame): Its input frame.
+    - args (tuple): Further positional arguments.
+    - kwargs (dict): Keyword arguments.
+
+    Returns:
+    - tuple: (result, CPU seconds).
+    """
+    start = time.thread_time()
+    result = func(df, *args, **kwargs)
+    return result, time.thread_time() - start
+
+
+def run_many(
+    df: pd.DataFrame,
+    specs: list,
+    workers: int = None,
+    report: bool = False,
+    return_type: str = "frame",
+    cancel_event=None,
+):
+    """Run many indicators on one frame on a thread pool"""
+    specs = _normalize_specs(specs)
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be a positive integer")
+
+    columns = {}
+    timings = {}
+    waiting = dict(specs)
+    running = {}
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+
+        def submit_ready():
+            if cancel_event is not None and cancel_event.is_set():
+                raise CancelledError("run_many was cancelled")
+            for name in [
+                name
+                for name, spec in waiting.items()
+                if all(dependency in columns for dependency in spec["depends_on"])
+            ]:
+                spec = waiting.pop(name)
+                source = _spec_input(df, spec["depends_on"], columns)
+                future = pool.submit(
+                    _timed_call, spec["func"], source, spec["args"], spec["kwargs"]
+                )
+                running[future] = name
+
+        submit_ready()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    result, seconds = future.result()
+                except Exception:
+                    # Do not start anything else; calls already running finish
+                    for pending in running:
+                        pending.cancel()
+                    raise
+                columns[name] = _result_columns(name, result)
+                timings[name] = seconds
+            try:
+                submit_ready()
+            except CancelledError:
+                for pending in running:
+                    pending.cancel()
+                raise
+
+    wall_time = time.perf_counter() - start
+    merged = {}
+    for name in specs:
+        merged.update(columns[name])
+    result = _build_result(merged, df.index, return_type)
+
+    if not report:
+        return result
+    cpu_time = sum(timings.values())
+    return result, {
+        "workers": workers,
+        "wall_time": wall_time,
+        "cpu_time": cpu_time,
+        "speedup": cpu_time / wall_time if wall_time > 0 else 1.0,
+        "timings": {name: timings[name] for name in specs},
+    }
+
+
+run_many.__doc__ = """
+Name:
+    Run Many Indicators
+
+Description:
+    Runs a list of indicator calls on one frame concurrently on a thread pool and
+    merges their outputs into one frame. The indicators spend most of their time in
+    NumPy, pandas and compiled kernels that release the GIL, so independent calls
+    use the idle cores of a process that handles a single pair.
+
+    A spec starts as soon as the specs it depends on are done. It receives the input
+    frame extended with their output columns, so it can use them as its column.
+    Dependency cycles and unknown dependencies are rejected before anything runs.
+    If a call fails, no further specs are started and its exception is raised.
+    The async facade in bamboo_ta.aio runs it from an event loop.
+
+Parameters:
+    - df (pandas.DataFrame): Input DataFrame passed to every indicator.
+    - specs (list): One dict per call with the keys:
+        - name (str): Unique name, used for the output columns.
+        - func (str or callable): Indicator name in the bta namespace, or a function
+          taking the frame as first argument.
+        - args (tuple, optional): Further positional arguments.
+        - kwargs (dict, optional): Keyword arguments.
+        - depends_on (list, optional): Names of specs whose outputs this one uses.
+    - workers (int): Number of threads. Default is None, the number of CPUs.
+    - report (bool): Also return the timing report. Default is False.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
+    - cancel_event (threading.Event): When it is set, no further specs are started and
+      concurrent.futures.CancelledError is raised once the running calls finish.
+      Default is None.
+
+Call with:
+    specs = [
+        {"name": "ema21", "func": "exponential_moving_average", "kwargs": {"period": 21}},
+        {"name": "bb", "func": "bollinger_bands", "kwargs": {"period": 20}},
+        {"name": "rsi_ema", "func": "relative_strength_index",
+         "kwargs": {"column": "ema21"}, "depends_on": ["ema21"]},
+    ]
+    result, report = bta.run_many(df, specs, workers=8, report=True)
+    df = df.join(result)
+
+Returns:
+    pd.DataFrame: The outputs of all specs in spec order. Single-output specs give one
+    column named after the spec, the others '<name>_<output>' columns.
+    With report=True a tuple (result, report), where report is a dict with 'workers',
+    'wall_time' and 'cpu_time' (summed CPU seconds of the calls), 'speedup'
+    (cpu_time / wall_time) and 'timings' (CPU seconds per spec).
+"""
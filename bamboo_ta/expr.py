@@ -0,0 +1,505 @@
+# -*- coding: utf-8 -*-
+# expr.py
+
+"""
+Fused evaluation of element-wise formulas.
+
+Strategy conditions and composite indicators are chains of element-wise
+operations, such as ``(high + low + close) / 3`` or
+``(close - bb_lower) / (bb_upper - bb_lower)``. pandas evaluates them one
+operation at a time and every step materialises a temporary Series as long
+as the frame. ``expr`` evaluates such a formula as a whole:
+
+- The formula is parsed once with Python's ``ast`` module (and cached). It
+  may reference the columns of the frame, numbers, the operators
+  ``+ - * / // % **``, comparisons, ``& | ~`` (or ``and``, ``or``, ``not``),
+  ``a if condition else b`` and the element-wise functions abs, sqrt, log,
+  log10, exp, sign, minimum, maximum and where.
+- Calls of bta indicators with literal arguments, like
+  ``exponential_moving_average(period=12)`` or
+  ``bollinger_bands(period=20).bb_lower``, are computed once on the whole
+  frame. Calls with the same bound arguments share a single computation,
+  also across formulas when the same ``cache`` dict is passed.
+- The element-wise part is compiled into a sequence of NumPy ufunc calls
+  writing into block-sized scratch registers (Sethi-Ullman numbering keeps
+  their number minimal). The rows are processed block by block and every
+  block is written straight into the result, so the temporaries stay in
+  the CPU cache and no temporary is as long as the frame.
+
+Call with:
+    df["bb_pct"] = bta.expr(df, "(close - bb_lower) / (bb_upper - bb_lower)")
+    df["macd"] = bta.expr(
+        df, "exponential_moving_average(period=12) - exponential_moving_average(period=26)"
+    )
+"""
+
+import ast
+import functools
+import inspect
+
+import numpy as np
+import pandas as pd
+
+from bamboo_ta.core._dtype import _resolve_dtype
+
+_BLOCK_SIZE = 16_384
+
+_BINARY_OPERATORS = {
+    ast.Add: (np.add, "float"),
+    ast.Sub: (np.subtract, "float"),
+    ast.Mult: (np.multiply, "float"),
+    ast.Div: (np.true_divide, "float"),
+    ast.FloorDiv: (np.floor_divide, "float"),
+    ast.Mod: (np.remainder, "float"),
+    ast.Pow: (np.power, "float"),
+    ast.BitAnd: (np.logical_and, "bool"),
+    ast.BitOr: (np.logical_or, "bool"),
+    ast.BitXor: (np.logical_xor, "bool"),
+}
+
+_COMPARISONS = {
+    ast.Lt: np.less,
+    ast.LtE: np.less_equal,
+    ast.Gt: np.greater,
+    ast.GtE: np.greater_equal,
+    ast.Eq: np.equal,
+    ast.NotEq: np.not_equal,
+}
+
+_UNARY_OPERATORS = {
+    ast.USub: (np.negative, "float"),
+    ast.UAdd: (np.positive, "float"),
+    ast.Not: (np.logical_not, "bool"),
+    ast.Invert: (np.logical_not, "bool"),
+}
+
+
+def _where(condition, if_true, if_false, out=None):
+    """
+    Element-wise selection writing into ``out``, which may alias an operand.
+
+    Parameters:
+    - condition (np.ndarray or scalar): Non-zero where ``if_true`` is taken.
+    - if_true (np.ndarray or scalar): Values where the condition holds.
+    - if_false (np.ndarray or scalar): Values elsewhere.
+    - out (np.ndarray): Target block.
+
+    Returns:
+    - np.ndarray: ``out``.
+    """
+    if np.ndim(condition) == 0:
+        np.copyto(out, if_true if condition else if_false)
+        return out
+    mask = condition if condition.dtype == bool else condition != 0
+    if np.may_share_memory(out, if_true):
+        np.copyto(out, if_false, where=~mask)
+    else:
+        np.copyto(out, if_false)
+        np.copyto(out, if_true, where=mask)
+    return out
+
+
+# Name -> (function writing into out, number of arguments, result kind)
+_FUNCTIONS = {
+    "abs": (np.absolute, 1, "float"),
+    "sqrt": (np.sqrt, 1, "float"),
+    "log": (np.log, 1, "float"),
+    "log10": (np.log10, 1, "float"),
+    "exp": (np.exp, 1, "float"),
+    "sign": (np.sign, 1, "float"),
+    "minimum": (np.minimum, 2, "float"),
+    "maximum": (np.maximum, 2, "float"),
+    "where": (_where, 3, "float"),
+}
+
+
+def _literal(node: ast.AST, formula: str):
+    """
+    Evaluate an indicator argument.
+
+    Parameters:
+    - node (ast.AST): The argument.
+    - formula (str): The formula, for error messages.
+
+    Returns:
+    - The value of the literal.
+    """
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        raise ValueError(
+            f"indicator arguments must be literals in {formula!r}: "
+            f"{ast.unparse(node)!r}"
+        ) from None
+
+
+def _lower(node: ast.AST, leaves: list, formula: str) -> tuple:
+    """
+    Turn a parsed formula into a tree of ufunc operations.
+
+    Parameters:
+    - node (ast.AST): The node to lower.
+    - leaves (list): Column and indicator references found so far; new
+      ones are appended, repeated ones are reused.
+    - formula (str): The formula, for error messages.
+
+    Returns:
+    - tuple: ('const', value), ('leaf', index into leaves) or
+      ('op', function, kind, children), where kind is 'float' or 'bool'.
+    """
+
+    def leaf(reference):
+        if reference not in leaves:
+            leaves.append(reference)
+        return ("leaf", leaves.index(reference))
+
+    def indicator(call, output):
+        if not isinstance(call.func, ast.Name):
+            raise ValueError(f"unsupported call {ast.unparse(call)!r} in {formula!r}")
+        args = tuple(_literal(arg, formula) for arg in call.args)
+        kwargs = tuple(
+            (keyword.arg, _literal(keyword.value, formula)) for keyword in call.keywords
+        )
+        return leaf(("call", call.func.id, args, kwargs, output))
+
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, (bool, int, float)):
+            return ("const", node.value)
+        raise ValueError(f"unsupported constant {node.value!r} in {formula!r}")
+    if isinstance(node, ast.Name):
+        return leaf(("column", node.id))
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        func, kind = _BINARY_OPERATORS[type(node.op)]
+        children = [_lower(side, leaves, formula) for side in (node.left, node.right)]
+        return ("op", func, kind, children)
+    if isinstance(node, ast.UnaryOp):
+        func, kind = _UNARY_OPERATORS[type(node.op)]
+        return ("op", func, kind, [_lower(node.operand, leaves, formula)])
+    if isinstance(node, ast.BoolOp):
+        func = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+        tree = _lower(node.values[0], leaves, formula)
+        for value in node.values[1:]:
+            tree = ("op", func, "bool", [tree, _lower(value, leaves, formula)])
+        return tree
+    if isinstance(node, ast.Compare):
+        # a < b < c is (a < b) & (b < c), as in Python
+        operands = [node.left] + node.comparators
+        tree = None
+        for op, left, right in zip(node.ops, operands, operands[1:]):
+            if type(op) not in _COMPARISONS:
+                raise ValueError(f"unsupported comparison in {formula!r}")
+            children = [_lower(side, leaves, formula) for side in (left, right)]
+            comparison = ("op", _COMPARISONS[type(op)], "bool", children)
+            tree = comparison if tree is None else (
+                "op", np.logical_and, "bool", [tree, comparison]
+            )
+        return tree
+    if isinstance(node, ast.IfExp):
+        parts = (node.test, node.body, node.orelse)
+        children = [_lower(part, leaves, formula) for part in parts]
+        return ("op", _where, "float", children)
+    if isinstance(node, ast.Call):
+        if isinstance(node.func, ast.Name) and node.func.id in _FUNCTIONS:
+            func, arity, kind = _FUNCTIONS[node.func.id]
+            if len(node.args) != arity or node.keywords:
+                raise ValueError(
+                    f"{node.func.id}() takes {arity} positional arguments "
+                    f"in {formula!r}"
+                )
+            children = [_lower(arg, leaves, formula) for arg in node.args]
+            return ("op", func, kind, children)
+        return indicator(node, None)
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Call):
+        return indicator(node.value, node.attr)
+    if (
+        isinstance(node, ast.Subscript)
+        and isinstance(node.value, ast.Call)
+        and isinstance(node.slice, ast.Constant)
+    ):
+        return indicator(node.value, node.slice.value)
+    raise ValueError(f"unsupported expression {ast.unparse(node)!r} in {formula!r}")
+
+
+def _need(tree: tuple) -> int:
+    """
+    Count the registers an operation needs (its Sethi-Ullman number).
+
+    Parameters:
+    - tree (tuple): A lowered operation.
+
+    Returns:
+    - int: Registers needed to evaluate it, 0 for leaves and constants.
+    """
+    if tree[0] != "op":
+        return 0
+    needs = sorted(
+        (_need(child) for child in tree[3] if child[0] == "op"), reverse=True
+    )
+    # The i-th evaluated child runs while i earlier results occupy registers
+    return max([1] + [need + i for i, need in enumerate(needs)])
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(formula: str) -> dict:
+    """
+    Compile a formula into steps over block registers.
+
+    Parameters:
+    - formula (str): The formula.
+
+    Returns:
+    - dict: 'leaves' (column and indicator references), 'steps' (tuples of
+      function, operands and target register) and 'kinds' (the kind of
+      every register, 'float' or 'bool'; register 0 is the output block).
+    """
+    try:
+        parsed = ast.parse(formula.strip(), mode="eval").body
+    except SyntaxError as error:
+        raise ValueError(f"invalid formula {formula!r}: {error.msg}") from None
+    leaves = []
+    tree = _lower(parsed, leaves, formula)
+    if tree[0] != "op":
+        tree = ("op", np.positive, "float", [tree])
+
+    # Registers hold float or boolean blocks, register 0 is the output block
+    steps = []
+    kinds = [tree[2]]
+    free = {"float": [], "bool": []}
+
+    def allocate(kind):
+        if free[kind]:
+            return free[kind].pop()
+        kinds.append(kind)
+        return len(kinds) - 1
+
+    def emit(node, target):
+        operands = [child[:2] for child in node[3]]
+        complex_children = sorted(
+            (i for i, child in enumerate(node[3]) if child[0] == "op"),
+            key=lambda i: -_need(node[3][i]),
+        )
+        taken = []
+        for position, i in enumerate(complex_children):
+            child = node[3][i]
+            # The first child reuses the target when it has the same kind
+            if position == 0 and child[2] == kinds[target]:
+                register = target
+            else:
+                register = allocate(child[2])
+                taken.append(register)
+            emit(child, register)
+            operands[i] = ("register", register)
+        steps.append((node[1], tuple(operands), target))
+        for register in taken:
+            free[kinds[register]].append(register)
+
+    emit(tree, 0)
+    return {"leaves": leaves, "steps": steps, "kinds": kinds}
+
+
+def _as_array(values, length: int, label: str) -> np.ndarray:
+    """
+    Get the NumPy values of a column or indicator output.
+
+    Parameters:
+    - values (pd.Series, np.ndarray or list): The values.
+    - length (int): Expected length, the rows of the frame.
+    - label (str): Name of the reference, for error messages.
+
+    Returns:
+    - np.ndarray: Numeric or boolean values, NaN for missing ones.
+    """
+    if isinstance(values, pd.Series):
+        values = (
+            values.to_numpy()
+            if values.dtype.kind in "biuf"
+            else values.to_numpy(dtype=float, na_value=np.nan)
+        )
+    values = np.asarray(values)
+    if values.ndim != 1 or len(values) != length:
+        raise ValueError(f"{label} has shape {values.shape}, expected ({length},)")
+    return values
+
+
+def _call_key(func, name: str, args: tuple, kwargs: tuple) -> tuple:
+    """
+    Key an indicator call by its bound arguments.
+
+    Parameters:
+    - func (Callable): The indicator.
+    - name (str): Its name in the formula.
+    - args (tuple): Positional arguments after the frame.
+    - kwargs (tuple): (name, value) pairs of the keyword arguments.
+
+    Returns:
+    - tuple: The name and the (parameter, repr of value) pairs with the
+      defaults filled in, so equivalent calls get the same key.
+    """
+    try:
+        bound = inspect.signature(func).bind(None, *args, **dict(kwargs))
+    except TypeError as error:
+        raise ValueError(f"{name}(): {error}") from None
+    bound.apply_defaults()
+    arguments = list(bound.arguments.items())[1:]
+    return (name,) + tuple((key, repr(value)) for key, value in arguments)
+
+
+def _leaf_values(df: pd.DataFrame, reference: tuple, cache: dict) -> np.ndarray:
+    """
+    Resolve a column or indicator reference of a formula.
+
+    Parameters:
+    - df (pd.DataFrame): The frame.
+    - reference (tuple): ('column', name) or ('call', name, args, kwargs,
+      output), where output is None for single-output indicators.
+    - cache (dict): Call key -> indicator result, read and filled.
+
+    Returns:
+    - np.ndarray: The values.
+    """
+    if reference[0] == "column":
+        if reference[1] not in df.columns:
+            raise ValueError(f"unknown column {reference[1]!r}")
+        return _as_array(df[reference[1]], len(df), f"column {reference[1]!r}")
+
+    from bamboo_ta.executor import _resolve_func
+
+    _, name, args, kwargs, output = reference
+    func = _resolve_func(name)
+    key = _call_key(func, name, args, kwargs)
+    if key not in cache:
+        cache[key] = func(df, *args, **dict(kwargs))
+    result = cache[key]
+
+    if isinstance(result, pd.DataFrame):
+        result = {column: result[column] for column in result.columns}
+    if isinstance(result, dict):
+        if output is None and len(result) == 1:
+            output = next(iter(result))
+        if output not in result:
+            raise ValueError(
+                f"{name}() has the outputs {list(result)}, select one as "
+                f"{name}(...).<output>"
+            )
+        result = result[output]
+    elif output is not None:
+        raise ValueError(f"{name}() has a single output, {output!r} cannot be selected")
+    return _as_array(result, len(df), f"{name}()")
+
+
+def expr(
+    df: pd.DataFrame,
+    formula: str,
+    name: str = None,
+    dtype=None,
+    cache: dict = None,
+    block_size: int = _BLOCK_SIZE,
+) -> pd.Series:
+    """Evaluate an element-wise formula over columns and indicators in blocks"""
+    if block_size < 1:
+        raise ValueError("block_size must be a positive integer")
+    program = _compile(formula)
+    dtype = _resolve_dtype(dtype)
+    cache = {} if cache is None else cache
+    leaves = [_leaf_values(df, reference, cache) for reference in program["leaves"]]
+    # Integer leaves are computed as floats, as in pandas: the integer ufunc
+    # loops reject negative powers and give 0 for // and % by zero
+    leaves = [leaf.astype(dtype) if leaf.dtype.kind in "iu" else leaf for leaf in leaves]
+
+    length = len(df)
+    dtypes = {"float": dtype, "bool": np.dtype(bool)}
+    out = np.empty(length, dtype=dtypes[program["kinds"][0]])
+    size = min(block_size, length)
+    registers = [out]
+    registers += [np.empty(size, dtype=dtypes[kind]) for kind in program["kinds"][1:]]
+
+    with np.errstate(all="ignore"):
+        for start in range(0, length, block_size):
+            stop = min(start + block_size, length)
+            blocks = [registers[0][start:stop]] + [
+                register[: stop - start] for register in registers[1:]
+            ]
+            for func, operands, target in program["steps"]:
+                values = [
+                    value
+                    if kind == "const"
+                    else blocks[value]
+                    if kind == "register"
+                    else leaves[value][start:stop]
+                    for kind, value in operands
+                ]
+                target_block = blocks[target]
+                if (
+                    isinstance(func, np.ufunc)
+                    and target_block.dtype != bool
+                    and any(np.asarray(value).dtype == bool for value in values)
+                ):
+                    # Booleans are 0/1 in arithmetic, not logical ufunc loops
+                    func(*values, out=target_block, dtype=target_block.dtype)
+                else:
+                    func(*values, out=target_block)
+
+    return pd.Series(out, index=df.index, name=formula if name is None else name)
+
+
+expr.__doc__ = """
+Name:
+    Expression
+
+Description:
+    Evaluates an element-wise formula over the columns of a frame and bta indicators,
+    like "(close - bb_lower) / (bb_upper - bb_lower)", without materialising a
+    full-length temporary per operation as chained pandas expressions do.
+
+    The formula is parsed once (and cached) and compiled into NumPy ufunc calls over
+    block-sized scratch registers, as few as the formula allows. The rows are processed
+    in blocks of block_size, each written straight into the result, so the temporaries
+    stay in the CPU cache and the peak memory is the result plus a few blocks.
+
+    Supported syntax:
+    - Column names of df, numbers and True/False.
+    - + - * / // % ** and unary -, as float arithmetic; integer columns are cast to
+      dtype and boolean operands count as 0 and 1, so (close > open) + (close > open)
+      is 2.0 on up bars.
+    - Comparisons (chained ones like 20 < rsi < 80 too), & | ^ ~ and and/or/not, which
+      give a boolean result.
+    - a if condition else b, and the functions abs, sqrt, log, log10, exp, sign,
+      minimum(a, b), maximum(a, b) and where(condition, a, b).
+    - Indicators of the bta namespace called with literal arguments (the frame is
+      passed implicitly), like exponential_moving_average(period=12). Select an output
+      of a multi-output indicator with bollinger_bands(period=20).bb_lower or
+      bollinger_bands(period=20)["bb_lower"].
+
+    Indicator calls are computed once on the whole frame. Calls with the same bound
+    arguments (defaults included) share one computation within the formula, and across
+    formulas when the same cache dict is passed. Missing values are NaN and propagate as
+    in pandas; comparisons with NaN are False. Division by zero gives inf or NaN
+    without a warning.
+
+Parameters:
+    - df (pandas.DataFrame): Input DataFrame.
+    - formula (str): The formula.
+    - name (str): Name of the result Series. Default is None, the formula.
+    - dtype: Computation dtype for arithmetic results, np.float32 or np.float64.
+      Default is None, the default dtype of the core layer.
+    - cache (dict): Indicator results keyed by call, reused and filled. Pass the same
+      dict to several formulas over the same frame to compute shared indicators once;
+      use a new dict for a new frame. Default is None, a cache per call.
+    - block_size (int): Rows per block. Default is 16384.
+
+Call with:
+    df["typical"] = bta.expr(df, "(high + low + close) / 3")
+    df["bb_pct"] = bta.expr(df, "(close - bb_lower) / (bb_upper - bb_lower)")
+    cache = {}
+    df["macd"] = bta.expr(
+        df, "exponential_moving_average(period=12) - exponential_moving_average(period=26)",
+        cache=cache,
+    )
+    df["long"] = bta.expr(
+        df, "(close > exponential_moving_average(period=26)) & (rsi < 30)", cache=cache
+    )
+
+Returns:
+    pd.Series: The values of the formula, float (dtype) for arithmetic and bool for
+    conditions, on the index of df.
+"""
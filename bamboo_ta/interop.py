@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+# interop.py
+
+"""
+Apache Arrow and Polars input/output.
+
+Every indicator in the ``bta`` namespace accepts pyarrow Tables and
+RecordBatches, Polars DataFrames and the matching series types (pyarrow
+Arrays/ChunkedArrays and Polars Series) in place of pandas objects. The
+input is handed to the pandas implementation column by column:
+
+- Numeric columns without nulls that are stored in a single chunk are
+  exposed as read-only NumPy views of the Arrow/Polars buffers, so no data
+  is copied.
+- Columns with nulls, multiple chunks or non-numeric types (dates,
+  strings, booleans) go through the regular ``to_pandas`` conversion, and
+  nulls become NaN.
+
+Results are returned in the container type of the input: pandas DataFrames
+become pyarrow Tables/RecordBatches or Polars DataFrames and Series become
+pyarrow Arrays or Polars Series. Numeric result columns are wrapped without
+copying, and missing values stay NaN, as in the pandas output.
+
+pyarrow and Polars are optional dependencies; they are only imported when
+such an object is passed in.
+
+Call with:
+    import pyarrow.parquet as pq
+    table = pq.read_table('BTC_USDT-1h.parquet')
+    ema = bta.exponential_moving_average(table, 'close', 21)  # pyarrow.Table
+"""
+
+import functools
+
+import pandas as pd
+
+
+def container_type(data) -> str:
+    """
+    Identify the container family of an indicator input.
+
+    Parameters:
+    - data: Any object.
+
+    Returns:
+    - str: 'arrow' for pyarrow objects, 'polars' for Polars objects and
+      'pandas' for everything else.
+    """
+    module = type(data).__module__
+    if module.startswith("pyarrow"):
+        return "arrow"
+    if module.startswith("polars"):
+        return "polars"
+    return "pandas"
+
+
+def _arrow_column_to_series(column, name) -> pd.Series:
+    """
+    Convert a pyarrow Array or ChunkedArray to a pandas Series.
+
+    Parameters:
+    - column (pa.Array or pa.ChunkedArray): The column.
+    - name (str): Name of the Series.
+
+    Returns:
+    - pd.Series: A zero-copy view for null-free single-chunk numeric columns,
+      otherwise a converted copy.
+    """
+    import pyarrow as pa
+
+    if isinstance(column, pa.ChunkedArray) and column.num_chunks == 1:
+        column = column.chunk(0)
+    if (
+        isinstance(column, pa.Array)
+        and column.null_count == 0
+        and (pa.types.is_floating(column.type) or pa.types.is_integer(column.type))
+    ):
+        values = column.to_numpy(zero_copy_only=True)
+        return pd.Series(values, name=name, copy=False)
+    return column.to_pandas().rename(name)
+
+
+def _polars_column_to_series(column) -> pd.Series:
+    """
+    Convert a Polars Series to a pandas Series.
+
+    Parameters:
+    - column (pl.Series): The column.
+
+    Returns:
+    - pd.Series: A zero-copy view for null-free single-chunk numeric columns,
+      otherwise a converted copy.
+    """
+    if column.dtype.is_numeric() and column.null_count() == 0 and column.n_chunks() == 1:
+        try:
+            values = column.to_numpy(allow_copy=False)
+        except RuntimeError:
+            pass
+        else:
+            return pd.Series(values, name=column.name, copy=False)
+    return column.to_pandas()
+
+
+def to_pandas(data):
+    """
+    Convert an Arrow or Polars object to pandas without copying numeric
+    columns where the buffers allow it.
+
+    Parameters:
+    - data: pyarrow Table/RecordBatch/Array/ChunkedArray or Polars
+      DataFrame/Series. pandas objects and other values are returned as-is.
+
+    Returns:
+    - pd.DataFrame or pd.Series: The pandas equivalent with a RangeIndex.
+    """
+    kind = container_type(data)
+    if kind == "arrow":
+        import pyarrow as pa
+
+        if isinstance(data, (pa.Table, pa.RecordBatch)):
+            columns = {
+                name: _arrow_column_to_series(data.column(i), name)
+                for i, name in enumerate(data.column_names)
+            }
+            return pd.DataFrame(columns, copy=False)
+        if isinstance(data, (pa.Array, pa.ChunkedArray)):
+            return _arrow_column_to_series(data, None)
+    elif kind == "polars":
+        import polars as pl
+
+        if isinstance(data, pl.DataFrame):
+            columns = {name: _polars_column_to_series(data[name]) for name in data.columns}
+            return pd.DataFrame(columns, copy=False)
+        if isinstance(data, pl.Series):
+            return _polars_column_to_series(data)
+    return data
+
+
+def _series_to_arrow(series: pd.Series):
+    """
+    Convert a pandas Series to a pyarrow Array (zero-copy for numeric data).
+
+    Parameters:
+    - series (pd.Series): The Series.
+
+    Returns:
+    - pa.Array: The column.
+    """
+    import pyarrow as pa
+
+    values = series.to_numpy()
+    if values.dtype.kind in "fiu":
+        return pa.array(values)
+    return pa.Array.from_pandas(series)
+
+
+def _series_to_polars(series: pd.Series, name: str):
+    """
+    Convert a pandas Series to a Polars Series (zero-copy for numeric data).
+
+    Parameters:
+    - series (pd.Series): The Series.
+    - name (str): Name of the Polars Series.
+
+    Returns:
+    - pl.Series: The column.
+    """
+    import polars as pl
+
+    values = series.to_numpy()
+    if values.dtype.kind in "fiu":
+        return pl.Series(name, values)
+    return pl.from_pandas(series.rename(name))
+
+
+def from_pandas(result, kind: str, like=None):
+    """
+    Convert an indicator result back to the container family of the input.
+
+    Parameters:
+    - result: The pandas result. DataFrames, Series and tuples/lists of
+      them are converted, other values are returned as-is.
+    - kind (str): 'arrow', 'polars' or 'pandas' (see ``container_type``).
+    - like: The original input, used to return a RecordBatch for a
+      RecordBatch input. Optional.
+
+    Returns:
+    - The result as pyarrow or Polars objects.
+    """
+    if kind == "pandas":
+        return result
+    if isinstance(result, (tuple, list)):
+        return type(result)(from_pandas(item, kind, like) for item in result)
+
+    if isinstance(result, pd.DataFrame):
+        # Arrow and Polars inputs are positional; an index an indicator set
+        # (heiken_ashi's Int64 index) is not an output column
+        if not isinstance(result.index, pd.RangeIndex):
+            result = result.reset_index(drop=True)
+        names = [str(name) for name in result.columns]
+        columns = [result.iloc[:, i] for i in range(result.shape[1])]
+        if kind == "arrow":
+            import pyarrow as pa
+
+            arrays = [_series_to_arrow(column) for column in columns]
+            if isinstance(like, pa.RecordBatch):
+                return pa.RecordBatch.from_arrays(arrays, names=names)
+            return pa.Table.from_arrays(arrays, names=names)
+
+        import polars as pl
+
+        return pl.DataFrame(
+            [_series_to_polars(column, name) for column, name in zip(columns, names)]
+        )
+
+    if isinstance(result, pd.Series):
+        if kind == "arrow":
+            return _series_to_arrow(result)
+        name = "" if result.name is None else str(result.name)
+        return _series_to_polars(result, name)
+
+    return result
+
+
+def table_support(func):
+    """
+    Let a pandas indicator accept Arrow and Polars inputs.
+
+    pandas inputs are passed straight through. When any argument is a
+    pyarrow or Polars object, all such arguments are converted with
+    ``to_pandas`` and the result is converted back with ``from_pandas`` to
+    the container family of the first of them.
+
+    Parameters:
+    - func (Callable): The indicator function.
+
+    Returns:
+    - Callable: The wrapped function.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        like = None
+        for value in (*args, *kwargs.values()):
+            if container_type(value) != "pandas":
+                like = value
+                break
+        if like is None:
+            return func(*args, **kwargs)
+
+        args = [to_pandas(value) for value in args]
+        kwargs = {key: to_pandas(value) for key, value in kwargs.items()}
+        return from_pandas(func(*args, **kwargs), container_type(like), like)
+
+    return wrapper
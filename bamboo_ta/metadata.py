@@ -0,0 +1,1067 @@
+# -*- coding: utf-8 -*-
+# metadata.py
+
+"""
+Machine-readable metadata of the indicators and tail-only recomputation.
+
+Every DataFrame indicator of the ``bta`` namespace declares:
+
+- inputs: the columns it reads. ``None`` when it uses every column of the
+  frame (the rolling statistics).
+- optional inputs: the columns it reads only when the frame has them, e.g.
+  the open of the psychological line or the date of the time anchors.
+- outputs: the columns it returns. ``None`` when they are named after the
+  columns of the frame.
+- warmup: the number of preceding rows a value depends on, as a function
+  of the parameters. For recursive indicators it is the nominal warm-up
+  (the first rows without a value, or the longest period).
+- recursive: whether a value depends on the whole history (exponential
+  smoothing, cumulative sums, carried states), or on later rows (centered
+  or repainting estimates). It can depend on the parameters, e.g. on the
+  moving average type.
+
+The declarations are formulas over the parameters, evaluated with the
+arguments of a call and the defaults of the signature:
+
+    bta.indicator_metadata("bollinger_bands", period=50)
+    # {'name': 'bollinger_bands', 'inputs': ['close'], 'optional_inputs': [],
+    #  'outputs': ['bb_upper', 'bb_middle', 'bb_lower'], 'warmup': 49,
+    #  'recursive': False, 'warmup_formula': 'period - 1'}
+
+``update_tail`` uses them when one or a few candles are appended: a
+windowed indicator only recomputes the new rows from the last ``warmup``
+rows before them, so a live update computes O(window) rows instead of O(n).
+Recursive and unregistered indicators are recomputed in full.
+"""
+
+import inspect
+import math
+
+import pandas as pd
+
+from bamboo_ta.executor import _resolve_func
+from bamboo_ta.volume.anchored_volume_weighted_average_price import TIME_ANCHORS
+
+# Price columns behind the derived sources some indicators accept
+_PRICE_SOURCES = {
+    "hl2": ("high", "low"),
+    "hlc3": ("high", "low", "close"),
+    "hlcc4": ("high", "low", "close"),
+    "ohlc4": ("open", "high", "low", "close"),
+}
+
+# Names available to the formulas besides the parameters
+_FORMULA_NAMESPACE = {
+    "__builtins__": {},
+    "TIME_ANCHORS": TIME_ANCHORS,
+    "int": int,
+    "isinstance": isinstance,
+    "math": math,
+    "max": max,
+    "min": min,
+    "round": round,
+    "str": str,
+    "tuple": tuple,
+}
+
+
+def _meta(inputs, outputs, warmup: str, recursive=False, optional=()) -> dict:
+    """
+    Declare the metadata of an indicator.
+
+    Parameters:
+    - inputs (tuple, str or None): Input column names, '{parameter}'
+      templates, or a formula giving the tuple. None for every column.
+    - outputs (tuple, str or None): Output column names, '{parameter}'
+      templates, or a formula giving the tuple. None when they are named
+      after the columns of the frame.
+    - warmup (str): Formula of the warm-up length.
+    - recursive (bool or str): Whether the indicator is recursive, or a
+      formula deciding it.
+    - optional (tuple or str): Columns read only when the frame has them,
+      like inputs. Default is none.
+
+    Returns:
+    - dict: The declaration.
+    """
+    return {
+        "inputs": inputs,
+        "optional": optional,
+        "outputs": outputs,
+        "warmup": warmup,
+        "recursive": recursive,
+    }
+
+
+_REGISTRY = {
+    # Candles
+    "candlestick_patterns": _meta(
+        ("open", "high", "low", "close"), ("type", "pattern"), "7"
+    ),
+    "dynamic_exhaustion_bars": _meta(
+        ("close",), ("leledc_major", "leledc_minor"), "window + 6", recursive=True
+    ),
+    "exhaustion_bars": _meta(
+        ("open", "high", "low", "close"),
+        ("leledc_major", "leledc_minor"),
+        "max(maj_len, min_len, core_length)",
+        recursive=True,
+    ),
+    "hansen_heiken_ashi": _meta(
+        ("open", "high", "low", "close"), ("emac", "emao"), "period + 1"
+    ),
+    "heiken_ashi": _meta(
+        ("open", "high", "low", "close"),
+        ("ha_open", "ha_high", "ha_low", "ha_close"),
+        "(pre_smoothing_period or 0) + (post_smoothing_period or 0)",
+        recursive=True,
+    ),
+    "linear_regression_candles": _meta(
+        ("open", "high", "low", "close"),
+        ("bopen", "bhigh", "blow", "bclose", "signal"),
+        "linreg_length + signal_length - 2",
+        recursive="not sma_signal",
+    ),
+    "smoothed_heiken_ashi": _meta(
+        ("open", "high", "low", "close"),
+        ("sha_open", "sha_high", "sha_low", "sha_close", "sha_color"),
+        "len_ + len2",
+        recursive=True,
+    ),
+    # Cycles
+    "even_better_sinewave": _meta(("close",), ("ebsw",), "length - 1", recursive=True),
+    # Momentum
+    "absolute_price_oscillator": _meta(
+        ("close",),
+        ("apo",),
+        "max(fast_length, slow_length) - 1",
+        recursive="mamode.lower() == 'ema'",
+    ),
+    "awesome_oscillator": _meta(
+        ("{high_col}", "{low_col}"), ("ao",), "max(window1, window2) - 1"
+    ),
+    "balance_of_power": _meta(("open", "high", "low", "close"), ("bop",), "0"),
+    "bias": _meta(
+        ("close",), ("bias",), "length - 1", recursive="mamode.lower() == 'ema'"
+    ),
+    "brar": _meta(("open", "high", "low", "close"), ("ar", "br"), "length - 1 + drift"),
+    "calculate_intraday_momentum_index": _meta(("open", "close"), (None,), "length - 1"),
+    "center_of_gravity": _meta(("close",), ("cg", "cg_prev"), "length"),
+    "chande_forecast_oscillator": _meta(("close",), ("cfo",), "length - 1"),
+    "chande_momentum_oscillator": _meta(("close",), ("cmo",), "length"),
+    "commodity_channel_index": _meta(("high", "low", "close"), ("cci",), "length - 1"),
+    "coppock_curve": _meta(("close",), ("coppock",), "max(fast, slow) + length - 1"),
+    "correlation_trend_indicator": _meta(("close",), ("cti",), "length - 1"),
+    "directional_movement": _meta(
+        ("high", "low"),
+        ("dmp", "dmn"),
+        "length - 1 + drift",
+        recursive="mamode.lower() != 'sma'",
+    ),
+    "divergences": _meta(
+        ("{high_column}", "{low_column}", "{column}"),
+        (
+            "bullish_divergence", "hidden_bullish_divergence",
+            "bearish_divergence", "hidden_bearish_divergence",
+        ),
+        "max_bars + left_bars + right_bars",
+    ),
+    "efficiency_ratio": _meta(("close",), ("er",), "length + drift - 1"),
+    "ehlers_fisher_stochastic_center_of_gravity": _meta(
+        ("high", "low"), ("cg", "trigger"), "2 * length + 4"
+    ),
+    "ehlers_ray_index": _meta(
+        ("high", "low", "close"), ("bull_power", "bear_power"), "length", recursive=True
+    ),
+    "elliott_wave_oscillator": _meta(
+        ("{column}",), ("ewo",), "max(sma1_period, sma2_period) - 1"
+    ),
+    "fisher_transform": _meta(
+        ("high", "low"), ("fisher", "fisher_signal"), "length + signal", recursive=True
+    ),
+    "inertia": _meta(
+        ("open", "high", "low", "close"),
+        ("inertia",),
+        "swma_length + rvi_length + length - 3",
+    ),
+    "kaufmans_adaptive_moving_average": _meta(
+        ("{close_col}",), ("kama",), "window", recursive=True
+    ),
+    "kdj": _meta(("high", "low", "close"), ("k", "d", "j"), "length - 1", recursive=True),
+    "know_sure_thing": _meta(
+        ("close",),
+        ("kst", "kst_signal"),
+        "max(roc1 + sma1, roc2 + sma2, roc3 + sma3, roc4 + sma4) + signal - 2",
+    ),
+    "ma_streak": _meta(("{src}", "volume"), ("ma_streak",), "length", recursive=True),
+    "momentum": _meta(("close",), ("mom",), "length"),
+    "momentum_divergence": _meta(
+        ("high", "low", "close"),
+        (
+            "momentum_divergence_mom", "momentum_divergence_upperb",
+            "momentum_divergence_lowerb", "momentum_divergence_buy",
+            "momentum_divergence_sell", "momentum_divergence_coh",
+            "momentum_divergence_col",
+        ),
+        "max(mom_length + bb_length - 1, lookback - 1)",
+    ),
+    "macd": _meta(
+        ("{column}",),
+        ("macd", "macd_signal", "macd_histogram"),
+        "long_window + signal_window",
+        recursive=True,
+    ),
+    "macd_leader": _meta(("{src}",), ("macd_leader",), "slow_length", recursive=True),
+    "macd_v": _meta(
+        ("high", "low", "close", "{column}"),
+        ("macd_v", "macd_v_signal"),
+        "max(long_window, atr_window) + signal_window",
+        recursive=True,
+    ),
+    "percentage_price_oscillator": _meta(
+        ("{close_col}",),
+        ("ppo", "ppo_signal", "ppo_hist"),
+        "window_slow + window_sign",
+        recursive=True,
+    ),
+    "percentage_volume_oscillator": _meta(
+        ("{volume_col}",),
+        ("pvo", "pvo_signal", "pvo_hist"),
+        "window_slow + window_sign",
+        recursive=True,
+    ),
+    "pretty_good_oscillator": _meta(
+        ("high", "low", "close"), ("pgo",), "length", recursive=True
+    ),
+    "psychological_line": _meta(
+        ("close",), ("psl",), "length - 1 + drift", optional=("open",)
+    ),
+    "qqe_mod": _meta(
+        ("close",),
+        ("qqe_line", "hist", "qqe_up", "qqe_down"),
+        "max(rsi_period, rsi_period2) + bollinger_length",
+        recursive=True,
+    ),
+    "rate_of_change": _meta(("{column}",), ("roc",), "period"),
+    "relative_momentum_index": _meta(("close",), ("rmi",), "length + mom", recursive=True),
+    "relative_strength_index": _meta(("{column}",), ("rsi",), "period", recursive=True),
+    "relative_strength_index_exponential": _meta(
+        ("close",), ("rsx",), "length", recursive=True
+    ),
+    "relative_vigor_index": _meta(
+        ("open", "high", "low", "close"),
+        ("rvi", "rvi_signal"),
+        "2 * swma_length + length - 3",
+    ),
+    "schaff_trend_cycle": _meta(
+        ("close",),
+        ("stc", "stc_macd", "stc_stoch"),
+        "slow + 2 * tc_length",
+        recursive=True,
+    ),
+    "smi_ergodic_indicator": _meta(
+        ("close",),
+        ("smi", "smi_signal", "smi_histogram"),
+        "slow + fast + signal",
+        recursive=True,
+    ),
+    "smoothed_rate_of_change": _meta(
+        ("close",), ("sroc",), "emalen + smooth", recursive=True
+    ),
+    "stochastic_momentum_index": _meta(
+        ("high", "low", "close"), ("smi",), "k_length - 1", recursive=True
+    ),
+    "stochastic_rsi": _meta(
+        ("close",),
+        ("stoch_rsi_k", "stoch_rsi_d"),
+        "length_rsi + length_stoch + smooth_k + smooth_d - 3",
+        recursive=True,
+    ),
+    "stochastics_oscillator": _meta(
+        ("{high_col}", "{low_col}", "{close_col}"),
+        ("stoch", "stoch_signal", "stoch_hist"),
+        "window + smooth_window - 2",
+    ),
+    "td_sequential": _meta(("close",), ("td_up", "td_down"), "16"),
+    "triple_exponential_average": _meta(
+        ("close",),
+        ("trix", "trix_signal"),
+        "3 * length + drift + signal",
+        recursive=True,
+    ),
+    "true_strength_index": _meta(
+        ("{close_col}",), ("tsi",), "window_slow + window_fast", recursive=True
+    ),
+    "ttm_squeeze": _meta(
+        ("high", "low", "close"),
+        ("squeeze", "squeeze_on", "squeeze_off", "no_squeeze"),
+        "max(bb_length - 1, kc_length, mom_length + mom_smooth)",
+        recursive="mamode.lower() == 'ema'",
+    ),
+    "two_pole_oscillator": _meta(
+        ("high", "low", "{column}"),
+        ("two_pole", "two_pole_lagged", "buy_signal", "sell_signal", "area"),
+        "max(2 * sma_length, area_length)",
+        recursive=True,
+    ),
+    "ultimate_oscillator": _meta(
+        ("{high_col}", "{low_col}", "{close_col}"), ("uo",), "max(window1, window2, window3)"
+    ),
+    "waddah_attar_explosion": _meta(
+        ("open", "high", "low", "close"),
+        ("trend_up", "trend_down", "explosion_line", "dead_zone_line"),
+        "max(fast_length, slow_length, channel_length)",
+        recursive=True,
+    ),
+    "waddah_attar_explosion_atr": _meta(
+        ("open", "high", "low", "close"),
+        ("trend_up", "trend_down", "explosion_line", "dead_zone_line"),
+        "max(fast_length, slow_length, channel_length)",
+        recursive=True,
+    ),
+    "wave_trend": _meta(
+        ("high", "low", "close"), ("wt1", "wt2"), "2 * chlen + avg + smalen", recursive=True
+    ),
+    "wave_trend_oscillator": _meta(
+        ("{src}",), ("wavetrend",), "2 * n1 + n2", recursive=True
+    ),
+    "williams_r": _meta(
+        ("{high_col}", "{low_col}", "{close_col}"), ("williams_r",), "lbp - 1"
+    ),
+    # Statistics, one output per pair of columns of the frame
+    "rolling_beta": _meta(None, None, "window - 1"),
+    "rolling_correlation": _meta(None, None, "window - 1"),
+    "rolling_covariance": _meta(None, None, "window - 1"),
+    # Trend
+    "alligator_bands": _meta(
+        ("{column}",),
+        ("jaw", "teeth", "lips"),
+        "max(jaw_period - 1 + jaw_shift, teeth_period - 1 + teeth_shift, "
+        "lips_period - 1 + lips_shift)",
+    ),
+    "archer_moving_averages_trends": _meta(
+        ("{column}",),
+        ("amat_long", "amat_short"),
+        "max(fast_length, slow_length) - 1 + lookback",
+        recursive="ma_type.upper() == 'EMA'",
+    ),
+    "arnaud_legoux_moving_average": _meta(("{column}",), ("alma",), "length - 1"),
+    "aroon": _meta(("high", "low"), ("aroon_up", "aroon_down", "aroon_osc"), "length - 1"),
+    "average_directional_index": _meta(
+        ("high", "low", "close"),
+        ("adx", "dmp", "dmn"),
+        "length + signal_length",
+        recursive=True,
+    ),
+    "bollinger_trend": _meta(
+        ("{column}",), ("bbtrend",), "max(short_length, long_length) - 1"
+    ),
+    "bollinger_trend_fast_with_ma": _meta(
+        ("{column}",),
+        ("bbtrend", "bbtrend_ma"),
+        "max(short_length, long_length) + ma_length - 2 "
+        "+ (int(math.sqrt(ma_length)) - 1 if ma_type == 'HMA' else 0)",
+        recursive="ma_type == 'EMA'",
+    ),
+    "breakouts": _meta(
+        ("high", "low", "close"),
+        (
+            "support_level", "resistance_level", "support_breakout",
+            "resistance_breakout", "support_retest", "potential_support_retest",
+            "resistance_retest", "potential_resistance_retest",
+        ),
+        "3 * length",
+    ),
+    "chande_kroll_stop": _meta(
+        ("high", "low", "close"),
+        ("long_stop", "short_stop"),
+        "atr_length + stop_length - 1",
+        recursive="trading_view_mode",
+    ),
+    "choppiness_index": _meta(
+        ("high", "low", "close"), ("chop",), "atr_length + length - 1"
+    ),
+    "cross_signals": _meta(
+        ("{signal_column}",),
+        (
+            "cross_trend", "cross_trades", "cross_entries", "cross_exits",
+            "cross_long", "cross_short",
+        ),
+        "1 + trade_offset",
+        recursive=True,
+    ),
+    "decay": _meta(
+        ("{column}",),
+        "('decay_exp' if mode.lower() in ('exponential', 'exp') else 'decay_lin',)",
+        "1",
+    ),
+    "decreasing": _meta(
+        ("{column}",),
+        ("decreasing",),
+        "max(drift, length - drift) if strict else length",
+    ),
+    # Centered values look ahead, so new rows change the previous ones
+    "detrended_price_oscillator": _meta(
+        ("{column}",),
+        ("dpo",),
+        "length - 1 + int(0.5 * length) + 1",
+        recursive="centered",
+    ),
+    "double_exponential_moving_average": _meta(
+        ("{column}",), ("dema",), "2 * (length - 1)", recursive=True
+    ),
+    "exponential_moving_average": _meta(("{column}",), ("ema",), "period", recursive=True),
+    "fractal_weighted_moving_average": _meta(("{column}",), ("fwma",), "length - 1"),
+    "frama_channel": _meta(
+        ("open", "high", "low", "close"),
+        (
+            "frama", "frama_upper", "frama_lower", "frama_volatility",
+            "frama_breakout_up", "frama_breakout_down", "frama_signal_up",
+            "frama_signal_down", "frama_signal_up_value", "frama_signal_down_value",
+            "frama_color", "frama_raw", "frama_pre_smooth", "hlc3",
+            "close_cross_frama", "candle_color",
+        ),
+        "max(length, volatility_period) - 1",
+        recursive=True,
+        optional="('volume',) if signals_data == 'Average Volume' else ()",
+    ),
+    "gaussian_channel": _meta(
+        ("high", "low", "close"),
+        ("gc_middle", "gc_upper", "gc_lower", "gc_direction", "gc_bar_signal"),
+        "period",
+        recursive=True,
+    ),
+    "holt_winters_moving_average": _meta(("{column}",), ("hwma",), "0", recursive=True),
+    "hull_moving_average": _meta(
+        ("{column}",), ("hma",), "period + int(math.sqrt(period)) - 2"
+    ),
+    "increasing": _meta(
+        ("{column}",),
+        "(('strict_' if strict else '') + 'increasing'"
+        " + (f'_{percent}pct' if percent is not None and percent > 0 else ''),)",
+        "max(drift, length - drift) if strict else length",
+    ),
+    "jurik_moving_average": _meta(("{column}",), ("jma",), "length - 1", recursive=True),
+    "least_squares_moving_average": _meta(("{column}",), ("lsma",), "period - 1"),
+    "long_run": _meta(("{fast_column}", "{slow_column}"), ("long_run",), "length"),
+    "mcginley_dynamic": _meta(("{column}",), ("mcgd",), "length", recursive=True),
+    # The repainting estimate uses later rows
+    "nadaraya_watson_smoothers": _meta(
+        ("{src}",),
+        ("nwe", "nwe_trend", "nwe_reversal", "nwe_bullish", "nwe_bearish"),
+        "lookback - 1",
+        recursive=True,
+    ),
+    "parabolic_sar": _meta(
+        ("high", "low", "close"),
+        ("psar_long", "psar_short", "psar_af", "psar_reversal"),
+        "1",
+        recursive=True,
+    ),
+    "pascals_weighted_moving_average": _meta(("{column}",), ("pwma",), "length - 1"),
+    "percent_price_channel": _meta(
+        ("high", "low", "close"),
+        ("pcc_upper", "pcc_rangema", "pcc_lower"),
+        "2 * (period - 1)",
+        recursive=True,
+    ),
+    "pmax": _meta(
+        ("high", "low", "close", "{src}"),
+        ("pmax", "pmax_trend"),
+        "max(period, length)",
+        recursive=True,
+    ),
+    "price_channel": _meta(
+        ("high", "low", "close"),
+        ("ppc_upper", "ppc_mid", "ppc_lower", "percent_p"),
+        "period - 1",
+    ),
+    "q_stick": _meta(
+        ("open", "close"),
+        ("q_stick",),
+        "length - 1 + (int(math.sqrt(length)) - 1 if ma_type.upper() == 'HMA' else 0)",
+        recursive="ma_type.upper() in ('EMA', 'DEMA', 'RMA')",
+    ),
+    "range_filter": _meta(
+        ("{column}",),
+        ("range_filter", "high_band", "low_band", "long_signal", "short_signal"),
+        "2 * period",
+        recursive=True,
+    ),
+    "rolling_moving_average": _meta(("{column}",), ("rma",), "period - 1", recursive=True),
+    "sequential_weighted_moving_average": _meta(("{column}",), ("swma",), "length - 1"),
+    "short_run": _meta(("{fast_column}", "{slow_column}"), ("short_run",), "length"),
+    "simple_moving_average": _meta(("{column}",), ("sma",), "period - 1"),
+    "sine_weighted_moving_average": _meta(("{column}",), ("sinwma",), "length - 1"),
+    # The channel side is carried forward while the close stays between the bands
+    "ssl_channels": _meta(
+        ("high", "low", "close"), ("ssl_down", "ssl_up"), "length - 1", recursive=True
+    ),
+    "ssl_channels_atr": _meta(
+        ("high", "low", "close", "{column}"),
+        ("ssl_atr_down", "ssl_atr_up"),
+        "max(length - 1, atr_period)",
+        recursive=True,
+    ),
+    "supertrend": _meta(
+        ("high", "low", "close"),
+        (
+            "supertrend_{length}_{multiplier}",
+            "supertrend_direction_{length}_{multiplier}",
+            "supertrend_long_{length}_{multiplier}",
+            "supertrend_short_{length}_{multiplier}",
+            "supertrend_upper_band_{length}_{multiplier}",
+            "supertrend_lower_band_{length}_{multiplier}",
+        ),
+        "atr_length or length",
+        recursive=True,
+    ),
+    "t3_average": _meta(("close",), ("t3_average",), "6 * (length - 1)", recursive=True),
+    "trend_signals": _meta(
+        ("{trend_column}",), ("trend", "trades", "entries", "exits"), "drift + trade_offset"
+    ),
+    "triangular_moving_average": _meta(
+        ("{column}",), ("trima",), "2 * (round(0.5 * (length + 1)) - 1)"
+    ),
+    "triple_exponential_moving_average": _meta(
+        ("{column}",), ("tema",), "3 * (length - 1)", recursive=True
+    ),
+    "ttm_trend": _meta(("high", "low", "close"), ("ttm_trend",), "length - 1"),
+    "ut_bot": _meta(
+        ("high", "low", "close", "{column}"),
+        ("ut_bot_stop", "ut_bot_position", "ut_bot_buy", "ut_bot_sell"),
+        "atr_period",
+        recursive=True,
+    ),
+    "variable_index_dynamic_average": _meta(
+        ("{column}",), ("vidya",), "length + drift - 1", recursive=True
+    ),
+    "vertical_horizontal_filter": _meta(
+        ("{column}",), ("vhf",), "max(length - 1, length + drift - 1)"
+    ),
+    "volumatic_variable_index_dynamic_average": _meta(
+        ("open", "high", "low", "close", "volume", "{column}"),
+        (
+            "vidya", "vidya_smoothed", "upper_band", "lower_band", "smoothed_value",
+            "trend_up", "trend_change_up", "trend_change_down", "pivot_high",
+            "pivot_low", "up_volume", "down_volume", "volume_delta_pct", "atr",
+        ),
+        "max(vidya_momentum, atr_length)",
+        recursive=True,
+    ),
+    "volume_weighted_moving_average": _meta(
+        ("close", "volume"), ("vwma",), "length - 1"
+    ),
+    "vortex_indicator": _meta(
+        ("high", "low", "close"), ("vi_plus", "vi_minus"), "length - 1 + max(drift, 1)"
+    ),
+    "weighted_moving_average": _meta(("{column}",), ("wma",), "period - 1"),
+    "zero_exponential_moving_average": _meta(
+        ("{column}",), ("zema",), "2 * (period - 1)", recursive=True
+    ),
+    "zero_lag_exponential_moving_average": _meta(
+        ("{column}",), ("zlema",), "int((period - 1) / 2) + period - 1", recursive=True
+    ),
+    # Utility
+    "consecutive_higher_highs": _meta(
+        ("{column}",),
+        "(f'consec_higher_{column}',) if as_count else (f'consec_higher_{column}_{length}',)",
+        "length",
+        recursive="as_count",
+    ),
+    "consecutive_lower_lows": _meta(
+        ("{column}",),
+        "(f'consec_lower_{column}',) if as_count else (f'consec_lower_{column}_{length}',)",
+        "length",
+        recursive="as_count",
+    ),
+    "cross": _meta(
+        ("{column_a}", "{column_b}"),
+        "(f\"{column_a}_{'xa' if direction == 'above' else 'xb'}_{column_b}\",)",
+        "1",
+    ),
+    "cross_value": _meta(
+        ("{column}",),
+        "(f\"{column}_{'xav' if direction == 'above' else 'xbv'}_{value}\",)",
+        "1",
+    ),
+    "cumulative_return": _meta(("{column}",), ("cumulative_return",), "0", recursive=True),
+    "daily_log_return": _meta(("{column}",), ("daily_log_return",), "1"),
+    "daily_return": _meta(("{column}",), ("daily_return",), "1"),
+    "drawdown": _meta(
+        ("{column}",), ("drawdown", "drawdown_pct", "drawdown_log"), "0", recursive=True
+    ),
+    "entropy": _meta(("{column}",), ("entropy",), "2 * (length - 1)"),
+    "error_function": _meta(("{column}",), ("erf_{length}",), "length - 1"),
+    "geometric_mean": _meta(("{column}",), ("gmean_{length}",), "length - 1"),
+    "is_above": _meta(("{column_a}", "{column_b}"), ("{column_a}_above_{column_b}",), "0"),
+    "is_above_value": _meta(
+        ("{column}",), "(f\"{column}_above_{str(value).replace('.', '_')}\",)", "0"
+    ),
+    "is_below": _meta(("{column_a}", "{column_b}"), ("{column_a}_below_{column_b}",), "0"),
+    "is_below_value": _meta(
+        ("{column}",), "(f\"{column}_below_{str(value).replace('.', '_')}\",)", "0"
+    ),
+    "kurtosis": _meta(("{column}",), ("kurtosis",), "length - 1"),
+    "linear_regression_slope": _meta(
+        ("close",),
+        ("lrs", "slrs", "alrs", "trend"),
+        "curve_length + slope_length + signal_length - 2",
+        recursive=True,
+    ),
+    "log_geometric_mean": _meta(("{column}",), ("log_gmean_{length}",), "length - 1"),
+    "log_return": _meta(
+        ("{column}",),
+        "('cum_log_return',) if cumulative else ('log_return',)",
+        "length",
+        recursive="cumulative",
+    ),
+    "mean_absolute_deviation": _meta(("{column}",), ("mad",), "length - 1"),
+    "median": _meta(("{column}",), ("median",), "length - 1"),
+    "overbought_oversold": _meta(
+        ("{indicator_col}",), ("obos_condition",), "previous_rows"
+    ),
+    "percent_return": _meta(
+        ("{column}",),
+        "('cum_percent_return',) if cumulative else ('percent_return',)",
+        "length",
+        recursive="cumulative",
+    ),
+    "pump_dump_protection": _meta(
+        ("close", "volume"),
+        (
+            "volume_mean_short", "volume_mean_long", "volume_change_percentage",
+            "rsi", "pnd_volume_warn",
+        ),
+        "max(rsi_period, short_volume_window - 1, long_volume_window - 1)",
+    ),
+    "quantile": _meta(
+        ("{column}",), "(f\"quantile_{str(q).replace('.', '_')}\",)", "length - 1"
+    ),
+    "regression_slope": _meta(("close",), ("slope",), "lookback_period - 1"),
+    "skew": _meta(("{column}",), ("skew_{length}",), "length - 1"),
+    "top_percent_change": _meta(("open", "close"), (None,), "max(length - 1, 0)"),
+    "variance": _meta(("{column}",), ("var_{length}",), "length - 1"),
+    # Volatility
+    "aberration_bands": _meta(
+        ("high", "low", "close"),
+        ("aber_middle", "aber_upper", "aber_lower", "aber_atr"),
+        "max(length - 1, atr_length)",
+    ),
+    "acceleration_bands": _meta(
+        ("high", "low", "close"),
+        ("accbands_lower", "accbands_middle", "accbands_upper"),
+        "length - 1",
+        recursive="ma_type.upper() == 'EMA'",
+    ),
+    "average_true_range": _meta(("high", "low", "close"), ("atr",), "period"),
+    "bbw_expansion": _meta(
+        ("{upper_band}", "{lower_band}", "{middle_band}"),
+        ("bb_width", "bbw_expansion"),
+        "rolling_window - 1",
+    ),
+    "bollinger_bands": _meta(
+        ("{column}",), ("bb_upper", "bb_middle", "bb_lower"), "period - 1"
+    ),
+    "bollinger_bands_nadaraya_smoothed": _meta(
+        ("high", "low", "close"),
+        (
+            "bb_upper_1", "bb_lower_1", "bb_upper_2", "bb_lower_2", "bb_upper_3",
+            "bb_lower_3", "bb_upper_4", "bb_lower_4", "upper_band_break",
+            "lower_band_break", "typical_price",
+        ),
+        "n + max(short_period, med_period, long_period)",
+    ),
+    "donchian_channel": _meta(
+        ("high", "low"),
+        ("dc_upper", "dc_middle", "dc_lower", "dc_width"),
+        "period - 1",
+        optional=("close",),
+    ),
+    "hurst_winter_channel": _meta(
+        ("{column}",), ("hwc_middle", "hwc_upper", "hwc_lower"), "0", recursive=True
+    ),
+    "keltner_channel": _meta(
+        ("high", "low", "close", "{column}"),
+        ("kc_middle", "kc_upper", "kc_lower", "kc_width"),
+        "max(ema_length, atr_length)",
+        recursive=True,
+    ),
+    "mass_index": _meta(
+        ("high", "low"), ("mass_index",), "2 * fast_length + slow_length", recursive=True
+    ),
+    "normalized_average_true_range": _meta(
+        ("high", "low", "close", "{column}"), ("natr",), "length", recursive=True
+    ),
+    "percentage_distance": _meta(("open", "high", "low", "close"), ("pdist",), "drift"),
+    "relative_volatility_index": _meta(
+        ("{column}",), ("rvi",), "2 * length", recursive=True
+    ),
+    "thermometer": _meta(
+        ("high", "low"),
+        ("thermo", "thermo_ma", "thermo_long", "thermo_short"),
+        "length + drift",
+        recursive=True,
+    ),
+    "true_range": _meta(("high", "low", "close"), ("true_range",), "1"),
+    "ulcer_index": _meta(("{column}",), ("ulcer_index",), "2 * (period - 1)"),
+    "williams_vix_fix": _meta(
+        ("high", "low"),
+        (
+            "williams_vix_fix", "williams_vix_fix_upper_band",
+            "williams_vix_fix_lower_band", "williams_vix_fix_mid_line",
+            "williams_vix_fix_range_high", "williams_vix_fix_signal",
+            "williams_vix_fix_green_flash",
+        ),
+        "vix_length + bbl - 1",
+    ),
+    # Volume
+    "accumulation_distribution_index": _meta(
+        ("high", "low", "close", "volume"), ("adi",), "0", recursive=True
+    ),
+    "accumulation_distribution_oscillator": _meta(
+        ("high", "low", "close", "volume"),
+        ("adosc",),
+        "max(fast_length, slow_length)",
+        recursive=True,
+    ),
+    "accumulation_on_balance_volume": _meta(
+        ("close", "volume"),
+        (
+            "obv", "obv_min", "obv_max", "obv_fast", "obv_slow", "obv_long_run",
+            "obv_short_run",
+        ),
+        "max(fast_length, slow_length, max_lookback, min_lookback) + run_length",
+        recursive=True,
+    ),
+    "anchored_volume_weighted_average_price": _meta(
+        "('high', 'low', 'close', '{source}', '{volume_col}')"
+        " + ((anchor,) if isinstance(anchor, str) and anchor not in TIME_ANCHORS else ())",
+        "('vwap',) + (('vwap_stdev',) + tuple("
+        "f'vwap_{side}_{multiplier:g}'.replace('.', '_')"
+        " for multiplier in multipliers for side in ('upper', 'lower'))"
+        " if multipliers else ())",
+        "0",
+        recursive=True,
+        optional="('date',) if isinstance(anchor, str) and anchor in TIME_ANCHORS else ()",
+    ),
+    "chaikin_money_flow": _meta(
+        ("high", "low", "close", "volume"), ("cmf",), "window - 1"
+    ),
+    "ease_of_movement": _meta(
+        ("high", "low", "volume"), ("eom", "seom"), "seom_length"
+    ),
+    "force_index": _meta(("close", "volume"), ("fi",), "window", recursive=True),
+    "klinger_volume_oscillator": _meta(
+        ("high", "low", "close", "volume"),
+        ("kvo", "kvo_signal", "kvo_hist"),
+        "max(fast_length, slow_length) + signal_length",
+        recursive=True,
+    ),
+    "money_flow_index": _meta(
+        ("high", "low", "close", "volume"), ("mfi",), "window"
+    ),
+    "negative_volume_index": _meta(
+        ("close", "volume"), ("nvi", "nvi_signal"), "signal_length", recursive=True
+    ),
+    "on_balance_volume": _meta(
+        ("close", "volume"), ("obv", "signal"), "signal_length", recursive=True
+    ),
+    "on_balance_volume_oscillator": _meta(
+        ("close", "volume"), ("obv_oscillator",), "length", recursive=True
+    ),
+    "positive_volume_index": _meta(
+        ("close", "volume"), ("pvi", "pvi_signal"), "signal_length", recursive=True
+    ),
+    "price_volume": _meta(("{column}", "volume"), ("pvol",), "1 if signed else 0"),
+    "price_volume_rank": _meta(("close", "volume"), ("pvr",), "1"),
+    "price_volume_trend": _meta(
+        ("close", "volume"),
+        ("price_volume_trend", "signal"),
+        "signal_length",
+        recursive=True,
+    ),
+    "relative_volume": _meta(("{volume_col}",), ("rvol",), "window - 1"),
+    "time_relative_volume_oscillator": _meta(
+        ("high", "low", "close", "volume", "{column}"),
+        "('relative_buy_volume', 'relative_sell_volume', 'buy_vs_sell', 'smoothed_delta')"
+        " + (('total_volume',) if show_total_volume else ())",
+        "200",
+        recursive=True,
+    ),
+    # One row per price bin instead of one per candle
+    "volume_profile": _meta(
+        ("close", "volume"),
+        (
+            "low_price", "mean_price", "high_price", "pos_volume", "neg_volume",
+            "total_volume",
+        ),
+        "0",
+        recursive=True,
+    ),
+    "volume_weighted_average_price": _meta(
+        ("high", "low", "close", "volume"),
+        ("vwap",),
+        "window - 1",
+        recursive="anchor is not None",
+    ),
+    "volume_weighted_average_price_bands": _meta(
+        ("high", "low", "close", "volume"),
+        ("vwap_low", "vwap", "vwap_high"),
+        "window_size - 1",
+        recursive=True,
+    ),
+    "vwap_divergence": _meta(
+        "('open', 'high', 'low', 'close', '{source}', '{volume_col}')"
+        " + ((anchor,) if isinstance(anchor, str) and anchor not in TIME_ANCHORS else ())",
+        ("vwap", "atr", "vwap_trend", "bullish_divergence", "bearish_divergence"),
+        "max(atr_length, divergence_lookback + 1)",
+        recursive=True,
+        optional="('date',) if isinstance(anchor, str) and anchor in TIME_ANCHORS else ()",
+    ),
+}
+
+
+def _indicator_name(indicator) -> str:
+    """
+    Get the registry name of an indicator.
+
+    Parameters:
+    - indicator (str or Callable): Indicator name or function.
+
+    Returns:
+    - str: The function name.
+    """
+    return indicator if isinstance(indicator, str) else getattr(indicator, "__name__", "")
+
+
+def _bound_params(func, params: dict) -> dict:
+    """
+    Complete the arguments of a call with the defaults of the signature.
+
+    Parameters:
+    - func (Callable): The indicator, taking the frame first.
+    - params (dict): Keyword arguments of the call.
+
+    Returns:
+    - dict: Parameter name -> value, for every parameter with a value.
+    """
+    parameters = list(inspect.signature(func).parameters.values())[1:]
+    names = {parameter.name for parameter in parameters}
+    unknown = set(params) - names
+    if unknown:
+        raise TypeError(f"{func.__name__}() got unexpected arguments {sorted(unknown)}")
+    bound = {
+        parameter.name: parameter.default
+        for parameter in parameters
+        if parameter.default is not inspect.Parameter.empty
+    }
+    bound.update(params)
+    return bound
+
+
+def _evaluate(formula, name: str, bound: dict):
+    """
+    Evaluate a declared formula.
+
+    Parameters:
+    - formula (str): Python expression over the parameters.
+    - name (str): Indicator name, for error messages.
+    - bound (dict): Parameter name -> value.
+
+    Returns:
+    - The value of the formula.
+    """
+    try:
+        return eval(formula, {**_FORMULA_NAMESPACE, **bound})
+    except NameError as error:
+        raise TypeError(f"{name} needs the argument {error.name!r}") from None
+
+
+def _columns(declared, name: str, bound: dict, sources: bool = False):
+    """
+    Resolve declared input or output columns.
+
+    Parameters:
+    - declared (tuple, str or None): Names or templates, or a formula.
+    - name (str): Indicator name, for error messages.
+    - bound (dict): Parameter name -> value.
+    - sources (bool): Expand price sources such as 'hlc3' into their
+      columns. Default is False.
+
+    Returns:
+    - list or None: The column names, without duplicates.
+    """
+    if declared is None:
+        return None
+    if isinstance(declared, str):
+        declared = _evaluate(declared, name, bound)
+
+    columns = []
+    for template in declared:
+        if template is None or "{" not in template:
+            resolved = [template]
+        else:
+            key = template.strip("{}")
+            value = bound.get(key) if template == "{" + key + "}" else None
+            if isinstance(value, (list, tuple)):
+                resolved = list(value)
+            elif sources and value in _PRICE_SOURCES:
+                resolved = list(_PRICE_SOURCES[value])
+            else:
+                try:
+                    resolved = [template.format(**bound)]
+                except KeyError as error:
+                    raise TypeError(f"{name} needs the argument {error.args[0]!r}") from None
+        columns += [column for column in resolved if column not in columns]
+    return columns
+
+
+def indicator_metadata(indicator, **params) -> dict:
+    """Describe the inputs, outputs and warm-up of an indicator"""
+    name = _indicator_name(indicator)
+    if name not in _REGISTRY:
+        raise ValueError(f"no metadata for {name!r}")
+    declaration = _REGISTRY[name]
+    bound = _bound_params(_resolve_func(name), params)
+
+    outputs = _columns(declaration["outputs"], name, bound)
+    column = bound.get("column")
+    if outputs is not None and isinstance(column, (list, tuple)):
+        # Multi-column calls name the outputs '<output>_<column>'
+        outputs = [f"{output}_{source}" for output in outputs for source in column]
+
+    recursive = declaration["recursive"]
+    if isinstance(recursive, str):
+        recursive = _evaluate(recursive, name, bound)
+    return {
+        "name": name,
+        "inputs": _columns(declaration["inputs"], name, bound, sources=True),
+        "optional_inputs": _columns(declaration["optional"], name, bound),
+        "outputs": outputs,
+        "warmup": max(int(_evaluate(declaration["warmup"], name, bound)), 0),
+        "recursive": bool(recursive),
+        "warmup_formula": declaration["warmup"],
+    }
+
+
+indicator_metadata.__doc__ = """
+Name:
+    Indicator Metadata
+
+Description:
+    Returns the input columns, output columns, warm-up length and recursiveness of an
+    indicator for the given arguments; the missing ones take the defaults of its
+    signature. The optional inputs are the columns it reads only when the frame has
+    them (the open of psychological_line, the close of donchian_channel, the date of
+    the time anchored VWAPs); they change the result when present.
+
+    The warm-up of a windowed indicator is the number of preceding rows a value
+    depends on: its last k values only need the last k + warmup rows. A recursive
+    indicator depends on the whole history (exponential smoothing, cumulative sums,
+    carried states) or on later rows (centered or repainting estimates); its warm-up
+    is nominal, the rows it needs before its values settle.
+
+    Every indicator of the bta namespace that gives one value per row of a DataFrame
+    is registered. Not registered are the helpers taking Series or arrays (z_score,
+    st_dev, the rolling performance ratios, ...), the whole-period statistics (CAGR,
+    Sharpe ratio, TOS standard deviation), the date filters, the stop loss / take
+    profit helpers and the building blocks of the exhaustion bars.
+
+Parameters:
+    - indicator (str or callable): Indicator name in the bta namespace, or the function.
+    - **params: Arguments of the call.
+
+Call with:
+    meta = bta.indicator_metadata("donchian_channel", period=55)
+    needed = df.iloc[-(meta["warmup"] + 1):]
+
+Returns:
+    dict: 'name', 'inputs' (list of column names, None when every column is used),
+    'optional_inputs' (list of column names read when present),
+    'outputs' (list of column names, None when they are named after the columns of the
+    frame), 'warmup' (int), 'recursive' (bool) and 'warmup_formula' (str, the
+    declared formula over the parameters).
+"""
+
+
+def registered_indicators() -> list:
+    """List the indicators with metadata"""
+    return sorted(_REGISTRY)
+
+
+registered_indicators.__doc__ = """
+Name:
+    Registered Indicators
+
+Description:
+    Lists the indicators that indicator_metadata describes.
+
+Call with:
+    for name in bta.registered_indicators():
+        print(name, bta.indicator_metadata(name)["warmup_formula"])
+
+Returns:
+    list: Indicator names, sorted.
+"""
+
+
+def update_tail(prev_result, df: pd.DataFrame, fn, **params):
+    """Recompute only the rows appended since the previous result"""
+    new_rows = len(df) - len(prev_result)
+    if new_rows <= 0:
+        raise ValueError(
+            "df has no rows after those of prev_result; to refresh the last candle, "
+            "pass prev_result.iloc[:-1]"
+        )
+
+    func = _resolve_func(fn)
+    name = _indicator_name(fn)
+    meta = indicator_metadata(name, **params) if name in _REGISTRY else None
+    if meta is None or meta["recursive"]:
+        return func(df, **params)
+
+    start = max(len(df) - new_rows - meta["warmup"], 0)
+    tail = func(df.iloc[start:], **params)
+    if not isinstance(tail, (pd.DataFrame, pd.Series)):
+        raise TypeError(
+            f"update_tail needs a DataFrame or Series result, {name} returned "
+            f"{type(tail).__name__}"
+        )
+    tail = tail.iloc[len(tail) - new_rows :]
+    tail.index = df.index[len(df) - new_rows :]
+    return pd.concat([prev_result, tail])
+
+
+update_tail.__doc__ = """
+Name:
+    Update Tail
+
+Description:
+    Extends the result of an indicator after new candles were appended to its input.
+    A windowed indicator only recomputes the new rows, from the slice of the last
+    rows they depend on (see indicator_metadata), so the computation of a live update
+    grows with the window instead of the length of the frame. Recursive and
+    unregistered indicators are recomputed on the whole frame.
+
+    The result equals a call on the whole frame, up to the rounding of pandas'
+    running window sums.
+
+Parameters:
+    - prev_result (pd.DataFrame or pd.Series): Result of the indicator on the first
+      rows of df, called with the same arguments.
+    - df (pd.DataFrame): The input, extended by one or more rows.
+    - fn (str or callable): Indicator name in the bta namespace, or the function.
+    - **params: Keyword arguments of the indicator.
+
+Call with:
+    bb = bta.bollinger_bands(df, period=20)
+    # ... a new candle is appended to df
+    bb = bta.update_tail(bb, df, "bollinger_bands", period=20)
+
+    To refresh a still-forming last candle, pass the previous result without it:
+    bb = bta.update_tail(bb.iloc[:-1], df, "bollinger_bands", period=20)
+
+Returns:
+    pd.DataFrame or pd.Series: The result for every row of df.
+"""
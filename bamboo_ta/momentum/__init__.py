@@ -14,6 +14,7 @@ from .commodity_channel_index import commodity_channel_index
 from .coppock_curve import coppock_curve
 from .correlation_trend_indicator import correlation_trend_indicator
 from .directional_movement import directional_movement
+from .divergences import divergences
 from .efficiency_ratio import efficiency_ratio
 from .ehlers_fisher_stochastic_center_of_gravity import (
     ehlers_fisher_stochastic_center_of_gravity,
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+# divergences.py
+
+from typing import List, Union
+
+import numpy as np
+import pandas as pd
+
+from bamboo_ta import core
+from bamboo_ta._outputs import _flag_dtype
+from bamboo_ta._results import _build_result, _source_values, _wide_columns
+
+
+def _pivot_divergences(
+    price,
+    oscillators: np.ndarray,
+    left_bars: int,
+    right_bars: int,
+    min_bars: int,
+    max_bars: int,
+    find_highs: bool,
+) -> tuple:
+    """
+    Regular and hidden divergences between consecutive price pivots.
+
+    Parameters:
+    - price (array-like): High prices (find_highs) or low prices.
+    - oscillators (np.ndarray): Oscillator values, shape (rows, oscillators).
+    - left_bars (int): Bars before a price pivot.
+    - right_bars (int): Bars after a price pivot.
+    - min_bars (int): Minimum distance between the two pivots.
+    - max_bars (int): Maximum distance between the two pivots.
+    - find_highs (bool): True for the bearish divergences at pivot highs,
+      False for the bullish ones at pivot lows.
+
+    Returns:
+    - tuple: (regular, hidden) flag arrays of shape (rows, oscillators),
+      set on the bar confirming the second pivot.
+    """
+    pivots = core.pivot_high if find_highs else core.pivot_low
+    positions, levels = pivots(price, left_bars, right_bars, dtype=np.float64)[:2]
+    regular = np.zeros(oscillators.shape, dtype=_flag_dtype())
+    hidden = np.zeros(oscillators.shape, dtype=_flag_dtype())
+    if len(positions) < 2:
+        return regular, hidden
+
+    previous, current = positions[:-1], positions[1:]
+    distance = current - previous
+    in_range = ((distance >= min_bars) & (distance <= max_bars))[:, None]
+    price_up = (levels[1:] > levels[:-1])[:, None]
+    price_down = (levels[1:] < levels[:-1])[:, None]
+    # All oscillators at both pivots at once, shape (pairs, oscillators)
+    osc_previous = oscillators[previous]
+    osc_current = oscillators[current]
+    with np.errstate(invalid="ignore"):
+        osc_up = osc_current > osc_previous
+        osc_down = osc_current < osc_previous
+
+    if find_highs:
+        # Higher high in price with a lower high in the oscillator, and reversed
+        regular_pairs = in_range & price_up & osc_down
+        hidden_pairs = in_range & price_down & osc_up
+    else:
+        # Lower low in price with a higher low in the oscillator, and reversed
+        regular_pairs = in_range & price_down & osc_up
+        hidden_pairs = in_range & price_up & osc_down
+
+    confirmed = current + right_bars
+    regular[confirmed] = regular_pairs
+    hidden[confirmed] = hidden_pairs
+    return regular, hidden
+
+
+def divergences(
+    df: pd.DataFrame,
+    column: Union[str, List[str]] = "rsi",
+    left_bars: int = 5,
+    right_bars: int = 5,
+    min_bars: int = 5,
+    max_bars: int = 60,
+    high_column: str = "high",
+    low_column: str = "low",
+    return_type: str = "frame",
+) -> pd.DataFrame:
+    """Regular and Hidden Divergences"""
+    for col in (high_column, low_column):
+        if col not in df.columns:
+            raise KeyError(f"DataFrame must contain '{col}' column")
+
+    values = _source_values(df, column).astype(np.float64, copy=False)
+    oscillators = values.reshape(len(df), -1)
+
+    bullish, hidden_bullish = _pivot_divergences(
+        df[low_column], oscillators, left_bars, right_bars, min_bars, max_bars, False
+    )
+    bearish, hidden_bearish = _pivot_divergences(
+        df[high_column], oscillators, left_bars, right_bars, min_bars, max_bars, True
+    )
+    outputs = {
+        "bullish_divergence": bullish,
+        "hidden_bullish_divergence": hidden_bullish,
+        "bearish_divergence": bearish,
+        "hidden_bearish_divergence": hidden_bearish,
+    }
+    if isinstance(column, str):
+        outputs = {name: flags[:, 0] for name, flags in outputs.items()}
+
+    return _build_result(_wide_columns(outputs, column), df.index, return_type)
+
+
+divergences.__doc__ = """
+Name:
+    Regular and Hidden Divergences
+
+Description:
+    Detects divergences between price and any number of oscillator columns (RSI,
+    MACD, CCI, MFI, ...) in one vectorised pass. The price pivots are found once
+    (see core.pivot_high and core.pivot_low), then every pair of consecutive pivots
+    at most max_bars apart is compared with the oscillator values at the same bars:
+
+    - Bullish: lower low in price, higher low in the oscillator.
+    - Hidden bullish: higher low in price, lower low in the oscillator.
+    - Bearish: higher high in price, lower high in the oscillator.
+    - Hidden bearish: lower high in price, higher high in the oscillator.
+
+    An event is flagged on the bar that confirms the second pivot, right_bars after
+    it, so it never looks ahead. Regular divergences hint at a reversal, hidden ones
+    at a continuation of the trend.
+
+More info:
+    https://www.investopedia.com/terms/d/divergence.asp
+
+Parameters:
+    - df (pandas.DataFrame): Input DataFrame with the high and low prices and the
+      oscillator columns.
+    - column (str or list): The oscillator column(s). Default is "rsi". A list of
+      columns is computed in one pass, with the outputs named '<output>_<column>'.
+    - left_bars (int): Bars before a price pivot. Default is 5.
+    - right_bars (int): Bars after a price pivot, the confirmation delay. Default is 5.
+    - min_bars (int): Minimum distance between the two pivots. Default is 5.
+    - max_bars (int): Maximum distance between the two pivots. Default is 60.
+    - high_column (str): Column of the pivot highs. Default is "high".
+    - low_column (str): Column of the pivot lows. Default is "low".
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
+
+Call with:
+    df['rsi'] = bta.relative_strength_index(df)['rsi']
+    df['mfi'] = bta.money_flow_index(df)['mfi']
+    div = bta.divergences(df, column=['rsi', 'mfi'])
+    df['bullish_divergence_rsi'] = div['bullish_divergence_rsi']
+    df['hidden_bearish_divergence_mfi'] = div['hidden_bearish_divergence_mfi']
+
+Returns:
+    pd.DataFrame: DataFrame with the flag columns 'bullish_divergence',
+    'hidden_bullish_divergence', 'bearish_divergence' and 'hidden_bearish_divergence'
+    (int8, 1 on the bar an event is confirmed), suffixed with '_<column>' for a list
+    of columns.
+"""
+
+
+def test():
+    """
+    Test function for the divergences indicator.
+
+    This function loads the daily test data, adds RSI, MFI and CCI columns and
+    lists the divergences found for each of them.
+
+    Returns:
+        None: Displays the results to the console
+    """
+    try:
+        import os
+
+        from bamboo_ta.momentum.commodity_channel_index import commodity_channel_index
+        from bamboo_ta.momentum.relative_strength_index import relative_strength_index
+        from bamboo_ta.volume.money_flow_index import money_flow_index
+
+        file_path = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+            "data",
+            "BTC_USDT-1d.json",
+        )
+        df = pd.read_json(file_path)
+        df.columns = ["date", "open", "high", "low", "close", "volume"]
+        df["date"] = pd.to_datetime(df["date"], unit="ms")
+        df["rsi"] = relative_strength_index(df)["rsi"]
+        df["mfi"] = money_flow_index(df)["mfi"]
+        df["cci"] = commodity_channel_index(df)["cci"]
+
+        result = divergences(df, column=["rsi", "mfi", "cci"])
+        print("Divergences per column:")
+        print(result.sum())
+        print("\nLast events:")
+        print(df[["date", "close"]].join(result)[result.any(axis=1)].tail(10))
+
+    except Exception as e:
+        print(f"Error during testing: {e}")
+
+
+# Execute the test if this file is run directly
+if __name__ == "__main__":
+    test()
@@ -4,6 +4,8 @@
 import numpy as np
 import pandas as pd
 
+from bamboo_ta._jit import njit
+
 def ehlers_fisher_stochastic_center_of_gravity(df: pd.DataFrame, length: int = 8) -> pd.DataFrame:
     """Ehlers Fisher Stochastic Center of Gravity"""
     df_copy = df.copy()
@@ -16,46 +18,76 @@ def ehlers_fisher_stochastic_center_of_gravity(df: pd.DataFrame, length: int = 8
 
     price = (df['high'] + df['low']) / 2
 
-    # Initialize series
-    num = pd.Series([0.0] * len(df), index=df.index)
-    denom = pd.Series([0.0] * len(df), index=df.index)
-    sg = pd.Series([0.0] * len(df), index=df.index)
+    # Calculate the normalized center of gravity (CG)
+    denom = pd.Series(
+        _stochastic_cg_kernel(price.to_numpy(dtype=np.float64), length),
+        index=df.index,
+    )
+
+    # Calculate Value3 (V3) and Trigger
+    v3 = 0.5 * np.log((1 + 1.98 * (denom - 0.5)) / (1 - 1.98 * (denom - 0.5)))
+    trigger = v3.shift(1)
+
+    df_copy['cg'] = v3
+    df_copy['trigger'] = trigger
+
+    return df_copy[['cg', 'trigger']]
+
+@njit
+def _stochastic_cg_kernel(price: np.ndarray, length: int) -> np.ndarray:
+    """
+    Center of gravity, its stochastic and the weighted smoothing step.
+    
+    Args:
+        price (np.ndarray): Mid prices ((high + low) / 2).
+        length (int): Period for the indicator.
+        
+    Returns:
+        np.ndarray: Smoothed stochastic of the center of gravity (0.0 during warm-up).
+    """
+    m = price.shape[0]
+    num = np.zeros(m)
+    denom = np.zeros(m)
+    sg = np.zeros(m)
 
     min_bar = length + 1
     l = (length + 1) / 2
 
     # Calculate CG
-    for i in range(min_bar, len(df)):
+    for i in range(min_bar, m):
         num_val = 0.0
         denom_val = 0.0
         for count in range(length):
-            num_val += (1 + count) * price.iloc[i - count]
-            denom_val += price.iloc[i - count]
+            num_val += (1 + count) * price[i - count]
+            denom_val += price[i - count]
 
         if denom_val != 0:
-            sg.iloc[i] = l - num_val / denom_val
+            sg[i] = l - num_val / denom_val
         else:
-            sg.iloc[i] = 0.0
-
-        max_cg = sg.iloc[i - length + 1:i + 1].max()
-        min_cg = sg.iloc[i - length + 1:i + 1].min()
+            sg[i] = 0.0
+
+        # Highest and lowest CG over the window, skipping NaN values
+        max_cg = np.nan
+        min_cg = np.nan
+        for j in range(i - length + 1, i + 1):
+            value = sg[j]
+            if np.isnan(value):
+                continue
+            if np.isnan(max_cg) or value > max_cg:
+                max_cg = value
+            if np.isnan(min_cg) or value < min_cg:
+                min_cg = value
 
         if max_cg != min_cg:
-            num.iloc[i] = (sg.iloc[i] - min_cg) / (max_cg - min_cg)
+            num[i] = (sg[i] - min_cg) / (max_cg - min_cg)
         else:
-            num.iloc[i] = 0.0
+            num[i] = 0.0
 
-        denom.iloc[i] = (4 * num.iloc[i] + 3 * num.iloc[i - 1] + 
-                         2 * num.iloc[i - 2] + num.iloc[i - 3]) / 10
+        denom[i] = (4 * num[i] + 3 * num[i - 1] + 
+                    2 * num[i - 2] + num[i - 3]) / 10
 
-    # Calculate Value3 (V3) and Trigger
-    v3 = 0.5 * np.log((1 + 1.98 * (denom - 0.5)) / (1 - 1.98 * (denom - 0.5)))
-    trigger = v3.shift(1)
+    return denom
 
-    df_copy['cg'] = v3
-    df_copy['trigger'] = trigger
-
-    return df_copy[['cg', 'trigger']]
 
 ehlers_fisher_stochastic_center_of_gravity.__doc__ = \
 """
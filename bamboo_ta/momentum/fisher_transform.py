@@ -4,6 +4,8 @@
 import pandas as pd
 import numpy as np
 
+from bamboo_ta._jit import njit
+
 
 def fisher_transform(df: pd.DataFrame, length: int = 9, signal: int = 1) -> pd.DataFrame:
     """Fisher Transform"""
@@ -31,23 +33,9 @@ def fisher_transform(df: pd.DataFrame, length: int = 9, signal: int = 1) -> pd.D
     position = ((hl2 - lowest_hl2) / hl_range) - 0.5
     
     # Apply the Fisher Transform
-    fisher_result = pd.Series(index=df_copy.index)
-    v_prev = 0
-    fisher_prev = 0
-    
-    # First values will be NaN until we have enough data
-    fisher_result.iloc[:length-1] = np.nan
-    fisher_result.iloc[length-1] = 0
-    
-    # Calculate Fisher Transform iteratively
-    for i in range(length, len(df_copy)):
-        v = 0.66 * position.iloc[i] + 0.67 * v_prev
-        v = min(max(v, -0.999), 0.999)  # Bound v between -0.999 and 0.999
-        fisher_result.iloc[i] = 0.5 * (np.log((1 + v) / (1 - v)) + fisher_prev)
-        
-        # Update previous values for next iteration
-        v_prev = v
-        fisher_prev = fisher_result.iloc[i]
+    v = _fisher_position_kernel(np.asarray(position, dtype=np.float64), length)
+    fisher_values = _fisher_kernel(np.log((1 + v) / (1 - v)), length)
+    fisher_result = pd.Series(fisher_values, index=df_copy.index)
     
     # Calculate the signal line
     signal_line = fisher_result.shift(signal)
@@ -59,6 +47,64 @@ def fisher_transform(df: pd.DataFrame, length: int = 9, signal: int = 1) -> pd.D
     return df_copy[["fisher", "fisher_signal"]]
 
 
+@njit
+def _fisher_position_kernel(position: np.ndarray, length: int) -> np.ndarray:
+    """
+    Smoothed and clamped price position used by the Fisher Transform.
+    
+    Args:
+        position (np.ndarray): Normalized price position in the range (-0.5 to 0.5).
+        length (int): Lookback period used for the normalization.
+        
+    Returns:
+        np.ndarray: Smoothed position bounded between -0.999 and 0.999
+        (NaN before bar ``length``).
+    """
+    m = position.shape[0]
+    v = np.full(m, np.nan)
+    v_prev = 0.0
+    
+    for i in range(length, m):
+        value = 0.66 * position[i] + 0.67 * v_prev
+        # Bound v between -0.999 and 0.999 (NaN passes through unchanged)
+        if value < -0.999:
+            value = -0.999
+        if value > 0.999:
+            value = 0.999
+        v[i] = value
+        v_prev = value
+    
+    return v
+
+
+@njit
+def _fisher_kernel(log_ratio: np.ndarray, length: int) -> np.ndarray:
+    """
+    Recursive accumulation of the Fisher Transform.
+    
+    Args:
+        log_ratio (np.ndarray): ln((1 + v) / (1 - v)) of the smoothed position.
+        length (int): Lookback period used for the normalization.
+        
+    Returns:
+        np.ndarray: Fisher Transform values, NaN until enough data is available.
+    """
+    m = log_ratio.shape[0]
+    fisher = np.full(m, np.nan)
+    fisher_prev = 0.0
+    
+    # First values will be NaN until we have enough data
+    if length - 1 < m:
+        fisher[length - 1] = 0.0
+    
+    # Calculate Fisher Transform iteratively
+    for i in range(length, m):
+        fisher[i] = 0.5 * (log_ratio[i] + fisher_prev)
+        fisher_prev = fisher[i]
+    
+    return fisher
+
+
 fisher_transform.__doc__ = \
 """
 Name:
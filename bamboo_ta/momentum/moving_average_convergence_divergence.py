@@ -1,32 +1,41 @@
 # -*- coding: utf-8 -*-
 # moving_average_convergence_divergence.py
 
+from typing import List, Union
+
 import pandas as pd
-import numpy as np
+
+from bamboo_ta import core
+from bamboo_ta._results import _build_result, _source_values, _wide_columns
 
 def macd(
     df: pd.DataFrame, 
-    column: str = 'close', 
+    column: Union[str, List[str]] = 'close', 
     short_window: int = 12, 
     long_window: int = 26, 
-    signal_window: int = 9
+    signal_window: int = 9,
+    dtype=None,
+    state: dict = None,
+    return_type: str = "frame"
 ) -> pd.DataFrame:
     """Moving Average Convergence Divergence (MACD)"""
-    def ema_calculation(series, span):
-        return series.ewm(span=span, adjust=False).mean()
+    macd, signal, histogram = core.macd(
+        _source_values(df, column),
+        short_window=short_window,
+        long_window=long_window,
+        signal_window=signal_window,
+        dtype=dtype,
+        state=state,
+    )
 
-    short_ema = ema_calculation(df[column], span=short_window)
-    long_ema = ema_calculation(df[column], span=long_window)
-    macd = short_ema - long_ema
-    signal = ema_calculation(macd, span=signal_window)
-    histogram = macd - signal
+    return _build_result(
+        _wide_columns(
+            {'macd': macd, 'macd_signal': signal, 'macd_histogram': histogram}, column
+        ),
+        df.index,
+        return_type,
+    )
 
-    df_copy = df.copy()
-    df_copy['macd'] = macd
-    df_copy['macd_signal'] = signal
-    df_copy['macd_histogram'] = histogram
-    
-    return df_copy[['macd', 'macd_signal', 'macd_histogram']]
 
 macd.__doc__ = \
 """
@@ -42,10 +51,19 @@ More info:
 
 Parameters:
     - df (pandas.DataFrame): Input DataFrame which should contain at least the "close" column.
-    - column (str): The column on which MACD is to be calculated. Default is "close".
+    - column (str or list): The column on which MACD is to be calculated. Default is "close".
+      A list of columns is computed in one pass, with the outputs named
+      'macd_<column>', 'macd_signal_<column>' and 'macd_histogram_<column>'.
     - short_window (int): The short-term period for EMA. Default is 12.
     - long_window (int): The long-term period for EMA. Default is 26.
     - signal_window (int): The signal line period for EMA. Default is 9.
+    - dtype (np.dtype): Computation precision, np.float64 or np.float32. Default is None,
+      which uses the global setting (see bta.core.set_default_dtype).
+    - state (dict): State carried between calls on consecutive chunks of one series,
+      which then give the values of a single call (see bta.run_chunked). Single column
+      only. Default is None.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
 
 Call with:
     macd_result = bta.macd(df, 'close', 12, 26, 9)
@@ -2,13 +2,13 @@
 # pretty_good_oscillator.py
 
 import pandas as pd
-import numpy as np
 
+from bamboo_ta._results import _build_result
 
-def pretty_good_oscillator(df: pd.DataFrame, length: int = 14) -> pd.DataFrame:
+
+def pretty_good_oscillator(df: pd.DataFrame, length: int = 14,
+                           return_type: str = "frame") -> pd.DataFrame:
     """Pretty Good Oscillator"""
-    df_copy = df.copy()
-    
     # Ensure the DataFrame contains the required columns
     required_columns = ["high", "low", "close"]
     for col in required_columns:
@@ -16,22 +16,26 @@ def pretty_good_oscillator(df: pd.DataFrame, length: int = 14) -> pd.DataFrame:
             raise KeyError(f"DataFrame must contain '{col}' column")
     
     # Calculate SMA of close
-    sma_close = df_copy["close"].rolling(window=length).mean()
+    sma_close = df["close"].rolling(window=length).mean()
     
     # Calculate ATR (Average True Range)
-    tr = pd.DataFrame(index=df_copy.index)
-    tr['hl'] = df_copy["high"] - df_copy["low"]
-    tr['hc'] = (df_copy["high"] - df_copy["close"].shift(1)).abs()
-    tr['lc'] = (df_copy["low"] - df_copy["close"].shift(1)).abs()
-    atr = tr[['hl', 'hc', 'lc']].max(axis=1)
+    tr = pd.concat(
+        [
+            df["high"] - df["low"],
+            (df["high"] - df["close"].shift(1)).abs(),
+            (df["low"] - df["close"].shift(1)).abs(),
+        ],
+        axis=1,
+    )
+    atr = tr.max(axis=1)
     
     # Calculate EMA of ATR
     ema_atr = atr.ewm(span=length, adjust=False).mean()
     
     # Calculate PGO
-    df_copy["pgo"] = (df_copy["close"] - sma_close) / ema_atr
+    pgo = (df["close"] - sma_close) / ema_atr
     
-    return df_copy[["pgo"]]
+    return _build_result({"pgo": pgo}, df.index, return_type)
 
 
 pretty_good_oscillator.__doc__ = \
@@ -59,6 +63,8 @@ Parameters:
     - df (pandas.DataFrame): Input DataFrame which should contain 'high', 'low', 
       and 'close' columns.
     - length (int): The period for calculations. Default is 14.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
 
 Call with:
     df['pgo'] = bta.pretty_good_oscillator(df)['pgo']
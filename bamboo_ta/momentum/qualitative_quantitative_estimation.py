@@ -4,6 +4,8 @@
 import pandas as pd
 import numpy as np
 
+from bamboo_ta._jit import njit
+
 
 def qqe_mod(
     df: pd.DataFrame,
@@ -35,13 +37,22 @@ def qqe_mod(
         avg_loss = loss.rolling(window=period, min_periods=1).mean()
 
         # Apply the Wilder's smoothing technique for gain and loss averages
-        for i in range(period, len(df_rsi)):
-            avg_gain.iloc[i] = (
-                avg_gain.iloc[i - 1] * (period - 1) + gain.iloc[i]
-            ) / period
-            avg_loss.iloc[i] = (
-                avg_loss.iloc[i - 1] * (period - 1) + loss.iloc[i]
-            ) / period
+        avg_gain = pd.Series(
+            _wilders_smoothing_kernel(
+                avg_gain.to_numpy(dtype=np.float64),
+                gain.to_numpy(dtype=np.float64),
+                period,
+            ),
+            index=avg_gain.index,
+        )
+        avg_loss = pd.Series(
+            _wilders_smoothing_kernel(
+                avg_loss.to_numpy(dtype=np.float64),
+                loss.to_numpy(dtype=np.float64),
+                period,
+            ),
+            index=avg_loss.index,
+        )
 
         rs = avg_gain / avg_loss
         rsi = 100 - (100 / (1 + rs))
@@ -71,35 +82,10 @@ def qqe_mod(
     ma_atr_rsi = wilders_ema(atr_rsi, wilders_period)
     dar = wilders_ema(ma_atr_rsi, wilders_period) * qqe_factor
 
-    longband = np.zeros(len(df_copy))
-    shortband = np.zeros(len(df_copy))
-    trend = np.zeros(len(df_copy))
-
-    delta_fast_atr_rsi = dar
-    rsindex = rsi_ma
-
-    for i in range(1, len(df_copy)):
-        if i > 1:
-            if rsindex[i - 1] > longband[i - 1] and rsindex[i] > longband[i - 1]:
-                longband[i] = max(longband[i - 1], rsindex[i] - delta_fast_atr_rsi[i])
-            else:
-                longband[i] = rsindex[i] - delta_fast_atr_rsi[i]
-
-            if rsindex[i - 1] < shortband[i - 1] and rsindex[i] < shortband[i - 1]:
-                shortband[i] = min(shortband[i - 1], rsindex[i] + delta_fast_atr_rsi[i])
-            else:
-                shortband[i] = rsindex[i] + delta_fast_atr_rsi[i]
-
-        else:
-            longband[i] = rsindex[i] - delta_fast_atr_rsi[i]
-            shortband[i] = rsindex[i] + delta_fast_atr_rsi[i]
-
-        if rsindex[i] > shortband[i - 1]:
-            trend[i] = 1
-        elif rsindex[i] < longband[i - 1]:
-            trend[i] = 0
-        else:
-            trend[i] = trend[i - 1]
+    # Trailing long/short bands and the resulting trend
+    longband, shortband, trend = _qqe_trailing_bands_kernel(
+        rsi_ma.to_numpy(dtype=np.float64), dar.to_numpy(dtype=np.float64)
+    )
 
     fast_atr_rsi_tl = np.where(trend == 1, longband, shortband)
 
@@ -126,38 +112,10 @@ def qqe_mod(
     ma_atr_rsi2 = wilders_ema(atr_rsi2, wilders_period2)
     dar2 = wilders_ema(ma_atr_rsi2, wilders_period2) * qqe_factor2
 
-    longband2 = np.zeros(len(df_copy))
-    shortband2 = np.zeros(len(df_copy))
-    trend2 = np.zeros(len(df_copy))
-
-    delta_fast_atr_rsi2 = dar2
-    rsindex2 = rsi_ma2
-
-    for i in range(1, len(df_copy)):
-        if i > 1:
-            if rsindex2[i - 1] > longband2[i - 1] and rsindex2[i] > longband2[i - 1]:
-                longband2[i] = max(
-                    longband2[i - 1], rsindex2[i] - delta_fast_atr_rsi2[i]
-                )
-            else:
-                longband2[i] = rsindex2[i] - delta_fast_atr_rsi2[i]
-
-            if rsindex2[i - 1] < shortband2[i - 1] and rsindex2[i] < shortband2[i - 1]:
-                shortband2[i] = min(
-                    shortband2[i - 1], rsindex2[i] + delta_fast_atr_rsi2[i]
-                )
-            else:
-                shortband2[i] = rsindex2[i] + delta_fast_atr_rsi2[i]
-        else:
-            longband2[i] = rsindex2[i] - delta_fast_atr_rsi2[i]
-            shortband2[i] = rsindex2[i] + delta_fast_atr_rsi2[i]
-
-        if rsindex2[i] > shortband2[i - 1]:
-            trend2[i] = 1
-        elif rsindex2[i] < longband2[i - 1]:
-            trend2[i] = 0
-        else:
-            trend2[i] = trend2[i - 1]
+    # Trailing long/short bands and the resulting trend
+    longband2, shortband2, trend2 = _qqe_trailing_bands_kernel(
+        rsi_ma2.to_numpy(dtype=np.float64), dar2.to_numpy(dtype=np.float64)
+    )
 
     fast_atr_rsi2_tl = np.where(trend2 == 1, longband2, shortband2)
 
@@ -176,6 +134,82 @@ def qqe_mod(
     return df_copy[["qqe_line", "hist", "qqe_up", "qqe_down"]]
 
 
+@njit
+def _wilders_smoothing_kernel(
+    average: np.ndarray, values: np.ndarray, period: int
+) -> np.ndarray:
+    """
+    Wilder's smoothing seeded with a simple average.
+
+    Parameters:
+    - average (np.ndarray): Seed averages (rolling mean with min_periods=1).
+    - values (np.ndarray): Values being averaged (gains or losses).
+    - period (int): Smoothing period.
+
+    Returns:
+    - np.ndarray: Copy of ``average`` where every bar from ``period`` onwards
+      is replaced by the Wilder's smoothed value.
+    """
+    result = average.copy()
+    for i in range(period, result.shape[0]):
+        result[i] = (result[i - 1] * (period - 1) + values[i]) / period
+    return result
+
+
+@njit
+def _qqe_trailing_bands_kernel(rsindex: np.ndarray, delta_fast_atr_rsi: np.ndarray):
+    """
+    QQE trailing long/short bands around the smoothed RSI.
+
+    Parameters:
+    - rsindex (np.ndarray): Smoothed RSI values.
+    - delta_fast_atr_rsi (np.ndarray): Band distance (smoothed RSI ATR * QQE factor).
+
+    Returns:
+    - tuple: (longband, shortband, trend) arrays, where trend is 1 for an up
+      trend and 0 for a down trend.
+    """
+    m = rsindex.shape[0]
+    longband = np.zeros(m)
+    shortband = np.zeros(m)
+    trend = np.zeros(m)
+
+    for i in range(1, m):
+        if i > 1:
+            if rsindex[i - 1] > longband[i - 1] and rsindex[i] > longband[i - 1]:
+                # max(previous band, new band) with Python's NaN semantics
+                new_longband = rsindex[i] - delta_fast_atr_rsi[i]
+                if new_longband > longband[i - 1]:
+                    longband[i] = new_longband
+                else:
+                    longband[i] = longband[i - 1]
+            else:
+                longband[i] = rsindex[i] - delta_fast_atr_rsi[i]
+
+            if rsindex[i - 1] < shortband[i - 1] and rsindex[i] < shortband[i - 1]:
+                # min(previous band, new band) with Python's NaN semantics
+                new_shortband = rsindex[i] + delta_fast_atr_rsi[i]
+                if new_shortband < shortband[i - 1]:
+                    shortband[i] = new_shortband
+                else:
+                    shortband[i] = shortband[i - 1]
+            else:
+                shortband[i] = rsindex[i] + delta_fast_atr_rsi[i]
+
+        else:
+            longband[i] = rsindex[i] - delta_fast_atr_rsi[i]
+            shortband[i] = rsindex[i] + delta_fast_atr_rsi[i]
+
+        if rsindex[i] > shortband[i - 1]:
+            trend[i] = 1
+        elif rsindex[i] < longband[i - 1]:
+            trend[i] = 0
+        else:
+            trend[i] = trend[i - 1]
+
+    return longband, shortband, trend
+
+
 qqe_mod.__doc__ = """
 Name:
     Qualitative Quantitative Estimation Modified (QQE Mod)
@@ -1,39 +1,30 @@
 # -*- coding: utf-8 -*-
 # relative_strength_index.py
 
+from typing import List, Union
+
 import pandas as pd
-import numpy as np
+
+from bamboo_ta import core
+from bamboo_ta._results import _build_result, _source_values, _wide_columns
 
 
 def relative_strength_index(
-    df: pd.DataFrame, column: str = "close", period: int = 14, scalar: float = 100
+    df: pd.DataFrame,
+    column: Union[str, List[str]] = "close",
+    period: int = 14,
+    scalar: float = 100,
+    dtype=None,
+    state: dict = None,
+    return_type: str = "frame",
 ) -> pd.DataFrame:
     """Relative Strength Index (RSI)"""
+    # Gains and losses smoothed with Wilder's RMA (EWM with alpha = 1 / period)
+    rsi = core.relative_strength_index(
+        _source_values(df, column), period=period, scalar=scalar, dtype=dtype, state=state
+    )
 
-    df_copy = df.copy()
-
-    # Calculate price changes
-    delta = df_copy[column].diff()
-
-    # Separate gains and losses
-    positive = delta.copy()
-    negative = delta.copy()
-
-    positive[positive < 0] = 0  # Make negatives 0 for the positive series
-    negative[negative > 0] = 0  # Make positives 0 for the negative series
-
-    # Calculate Wilder's RMA (Rolling Moving Average)
-    # Using EWM with alpha=1/period which is equivalent to Wilder's RMA
-    alpha = 1.0 / period
-    positive_avg = positive.ewm(alpha=alpha, min_periods=period).mean()
-    negative_avg = negative.abs().ewm(alpha=alpha, min_periods=period).mean()
-
-    # Calculate RSI using pandas-ta's approach
-    rsi = scalar * positive_avg / (positive_avg + negative_avg)
-
-    df_copy["rsi"] = rsi
-
-    return df_copy[["rsi"]]
+    return _build_result(_wide_columns({"rsi": rsi}, column), df.index, return_type)
 
 
 relative_strength_index.__doc__ = """
@@ -55,9 +46,17 @@ Call with:
 
 Parameters:
     - df (pandas.DataFrame): Input DataFrame which should contain at least the column specified.
-    - column (str): The column on which RSI is to be calculated. Default is "close".
+    - column (str or list): The column on which RSI is to be calculated. Default is "close".
+      A list of columns is computed in one pass, with the outputs named 'rsi_<column>'.
     - period (int): The period over which RSI is to be calculated. Default is 14.
     - scalar (float): How much to magnify the result. Default is 100.
+    - dtype (np.dtype): Computation precision, np.float64 or np.float32. Default is None,
+      which uses the global setting (see bta.core.set_default_dtype).
+    - state (dict): State carried between calls on consecutive chunks of one series,
+      which then give the values of a single call (see bta.run_chunked). Single column
+      only. Default is None.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
 
 Returns:
     pd.DataFrame: DataFrame with 'rsi' column.
@@ -4,6 +4,8 @@
 import pandas as pd
 import numpy as np
 
+from bamboo_ta._jit import njit
+
 
 def relative_strength_index_exponential(df: pd.DataFrame, length: int = 14) -> pd.DataFrame:
     """Relative Strength Index Exponential"""
@@ -15,19 +17,42 @@ def relative_strength_index_exponential(df: pd.DataFrame, length: int = 14) -> p
     
     close = df_copy["close"]
     
+    # Calculate RSX
+    result = pd.Series(
+        _rsx_kernel(close.to_numpy(dtype=np.float64), length), index=close.index
+    )
+    
+    # Add result to the DataFrame
+    df_copy["rsx"] = result
+    
+    return df_copy[["rsx"]]
+
+
+@njit
+def _rsx_kernel(close: np.ndarray, length: int) -> np.ndarray:
+    """
+    Jurik-style RSX recursion over an array of close prices.
+    
+    Args:
+        close (np.ndarray): Close prices.
+        length (int): Period for the RSX calculation.
+        
+    Returns:
+        np.ndarray: RSX values, NaN until enough data is available.
+    """
     # Initialize variables
-    vC, v1C = 0, 0
-    v4, v8, v10, v14, v18, v20 = 0, 0, 0, 0, 0, 0
+    vC, v1C = 0.0, 0.0
+    v4, v8, v10, v14, v18, v20 = 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
     
-    f0, f8, f10, f18, f20, f28, f30, f38 = 0, 0, 0, 0, 0, 0, 0, 0
-    f40, f48, f50, f58, f60, f68, f70, f78 = 0, 0, 0, 0, 0, 0, 0, 0
-    f80, f88, f90 = 0, 0, 0
+    f0, f8, f10, f18, f20, f28, f30, f38 = 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+    f40, f48, f50, f58, f60, f68, f70, f78 = 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+    f80, f88, f90 = 0.0, 0.0, 0.0
     
     # Calculate RSX
-    m = len(close)
-    result = pd.Series(index=close.index)
-    result.iloc[:length-1] = np.nan
-    result.iloc[length-1] = 0
+    m = close.shape[0]
+    result = np.full(m, np.nan)
+    if length - 1 < m:
+        result[length - 1] = 0.0
     
     for i in range(length, m):
         if f90 == 0:
@@ -37,7 +62,7 @@ def relative_strength_index_exponential(df: pd.DataFrame, length: int = 14) -> p
                 f88 = length - 1.0
             else:
                 f88 = 5.0
-            f8 = 100.0 * close.iloc[i]
+            f8 = 100.0 * close[i]
             f18 = 3.0 / (length + 2.0)
             f20 = 1.0 - f18
         else:
@@ -46,7 +71,7 @@ def relative_strength_index_exponential(df: pd.DataFrame, length: int = 14) -> p
             else:
                 f90 = f90 + 1
             f10 = f8
-            f8 = 100 * close.iloc[i]
+            f8 = 100 * close[i]
             v8 = f8 - f10
             f28 = f20 * f28 + f18 * v8
             f30 = f18 * f28 + f20 * f30
@@ -80,12 +105,9 @@ def relative_strength_index_exponential(df: pd.DataFrame, length: int = 14) -> p
                 v4 = 0.0
         else:
             v4 = 50.0
-        result.iloc[i] = v4
+        result[i] = v4
     
-    # Add result to the DataFrame
-    df_copy["rsx"] = result
-    
-    return df_copy[["rsx"]]
+    return result
 
 
 relative_strength_index_exponential.__doc__ = \
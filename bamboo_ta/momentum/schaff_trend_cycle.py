@@ -4,6 +4,8 @@
 import pandas as pd
 import numpy as np
 
+from bamboo_ta._jit import njit
+
 
 def schaff_trend_cycle(df: pd.DataFrame, tc_length: int = 10, fast: int = 12, 
                        slow: int = 26, factor: float = 0.5) -> pd.DataFrame:
@@ -57,20 +59,13 @@ def _schaff_tc_calculation(close: pd.Series, xmacd: pd.Series, tc_length: int, f
     xmacd_range = highest_xmacd - lowest_xmacd
     xmacd_range = xmacd_range.where(xmacd_range != 0, 1)  # Replace zeros with 1 to avoid division by zero
     
-    # Initialize arrays
-    m = len(xmacd)
-    stoch1 = np.zeros(m)
-    pf = np.zeros(m)
-    
-    # Calculate first stochastic
-    for i in range(1, m):
-        if pd.notna(lowest_xmacd.iloc[i]) and pd.notna(xmacd_range.iloc[i]):
-            stoch1[i] = 100 * ((xmacd.iloc[i] - lowest_xmacd.iloc[i]) / xmacd_range.iloc[i])
-        else:
-            stoch1[i] = stoch1[i - 1]
-            
-        # Smoothed calculation for Fast D of MACD
-        pf[i] = pf[i - 1] + (factor * (stoch1[i] - pf[i - 1]))
+    # Smoothed calculation for Fast D of MACD
+    pf = _smoothed_stochastic_kernel(
+        xmacd.to_numpy(dtype=np.float64),
+        lowest_xmacd.to_numpy(dtype=np.float64),
+        xmacd_range.to_numpy(dtype=np.float64),
+        float(factor),
+    )
     
     # Convert to Series for further calculations
     pf_series = pd.Series(pf, index=close.index)
@@ -83,21 +78,49 @@ def _schaff_tc_calculation(close: pd.Series, xmacd: pd.Series, tc_length: int, f
     pf_range = highest_pf - lowest_pf
     pf_range = pf_range.where(pf_range != 0, 1)  # Replace zeros with 1 to avoid division by zero
     
-    # Initialize arrays for second stochastic
-    stoch2 = np.zeros(m)
-    pff = np.zeros(m)
+    # Smoothed calculation for Fast D of PF
+    pff = _smoothed_stochastic_kernel(
+        pf,
+        lowest_pf.to_numpy(dtype=np.float64),
+        pf_range.to_numpy(dtype=np.float64),
+        float(factor),
+    )
+    
+    return pff, pf
+
+
+@njit
+def _smoothed_stochastic_kernel(
+    values: np.ndarray, lowest: np.ndarray, value_range: np.ndarray, factor: float
+) -> np.ndarray:
+    """
+    Stochastic of a series followed by an exponential smoothing step.
+    
+    Bars where the rolling lowest value or the range is not yet available carry
+    the previous stochastic value forward. The smoothed result starts at zero.
+    
+    Args:
+        values (np.ndarray): Values to run the stochastic over.
+        lowest (np.ndarray): Rolling lowest value of ``values``.
+        value_range (np.ndarray): Rolling range of ``values`` (zeros replaced by 1).
+        factor (float): Smoothing factor.
+        
+    Returns:
+        np.ndarray: The smoothed stochastic values.
+    """
+    m = values.shape[0]
+    stoch = np.zeros(m)
+    smoothed = np.zeros(m)
     
-    # Calculate second stochastic
     for i in range(1, m):
-        if pd.notna(pf_range.iloc[i]) and pd.notna(lowest_pf.iloc[i]):
-            stoch2[i] = 100 * ((pf_series.iloc[i] - lowest_pf.iloc[i]) / pf_range.iloc[i])
+        if not np.isnan(lowest[i]) and not np.isnan(value_range[i]):
+            stoch[i] = 100 * ((values[i] - lowest[i]) / value_range[i])
         else:
-            stoch2[i] = stoch2[i - 1]
+            stoch[i] = stoch[i - 1]
             
-        # Smoothed calculation for Fast D of PF
-        pff[i] = pff[i - 1] + (factor * (stoch2[i] - pff[i - 1]))
+        smoothed[i] = smoothed[i - 1] + (factor * (stoch[i] - smoothed[i - 1]))
     
-    return pff, pf
+    return smoothed
 
 
 schaff_trend_cycle.__doc__ = \
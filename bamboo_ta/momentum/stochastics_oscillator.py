@@ -3,6 +3,9 @@
 
 import pandas as pd
 
+from bamboo_ta import core
+from bamboo_ta._results import _build_result
+
 
 def stochastics_oscillator(
     df: pd.DataFrame,
@@ -12,35 +15,25 @@ def stochastics_oscillator(
     window: int = 14,
     smooth_window: int = 3,
     fillna: bool = False,
+    dtype=None,
+    return_type: str = "frame",
 ) -> pd.DataFrame:
     """Stochastic Oscillator"""
-    df_copy = df.copy()
-
-    high = df_copy[high_col]
-    low = df_copy[low_col]
-    close = df_copy[close_col]
-
-    min_periods = 0 if fillna else window
-    smin = low.rolling(window, min_periods=min_periods).min()
-    smax = high.rolling(window, min_periods=min_periods).max()
-    stoch_k = 100 * (close - smin) / (smax - smin)
-    if fillna:
-        stoch_k = stoch_k.fillna(50)
-
-    min_periods = 0 if fillna else smooth_window
-    stoch_d = stoch_k.rolling(smooth_window, min_periods=min_periods).mean()
-    if fillna:
-        stoch_d = stoch_d.fillna(50)
-
-    stoch_hist = stoch_k - stoch_d
-    if fillna:
-        stoch_hist = stoch_hist.fillna(0)
-
-    df_copy["stoch"] = stoch_k
-    df_copy["stoch_signal"] = stoch_d
-    df_copy["stoch_hist"] = stoch_hist
-
-    return df_copy[["stoch", "stoch_signal", "stoch_hist"]]
+    stoch_k, stoch_d, stoch_hist = core.stochastics_oscillator(
+        df[high_col].to_numpy(),
+        df[low_col].to_numpy(),
+        df[close_col].to_numpy(),
+        window=window,
+        smooth_window=smooth_window,
+        fillna=fillna,
+        dtype=dtype,
+    )
+
+    return _build_result(
+        {"stoch": stoch_k, "stoch_signal": stoch_d, "stoch_hist": stoch_hist},
+        df.index,
+        return_type,
+    )
 
 
 stochastics_oscillator.__doc__ = """
@@ -65,6 +58,10 @@ Parameters:
     - window (int): Lookback period for stochastic calculation. Default is 14.
     - smooth_window (int): Lookback period for signal calculation. Default is 3.
     - fillna (bool): If True, fill nan values. Default is False.
+    - dtype (np.dtype): Computation precision, np.float64 or np.float32. Default is None,
+      which uses the global setting (see bta.core.set_default_dtype).
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
 
 Returns:
     pd.DataFrame: DataFrame with 'stoch', 'stoch_signal', and 'stoch_hist' columns.
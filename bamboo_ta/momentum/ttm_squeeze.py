@@ -4,25 +4,27 @@
 import pandas as pd
 import numpy as np
 
+from bamboo_ta._outputs import _flag_dtype
+from bamboo_ta._results import _build_result
+
 
 def ttm_squeeze(df: pd.DataFrame, bb_length: int = 20, bb_std: float = 2.0, 
                 kc_length: int = 20, kc_scalar: float = 1.5, 
                 mom_length: int = 12, mom_smooth: int = 6,
                 use_tr: bool = True, mamode: str = "sma", 
                 use_pro: bool = False, detailed: bool = False,
-                kc_scalar_wide: float = 2.0, kc_scalar_narrow: float = 1.0) -> pd.DataFrame:
+                kc_scalar_wide: float = 2.0, kc_scalar_narrow: float = 1.0,
+                return_type: str = "frame") -> pd.DataFrame:
     """TTM Squeeze Indicator"""
-    df_copy = df.copy()
-    
     # Ensure the DataFrame contains the required columns
     required_columns = ["high", "low", "close"]
     for col in required_columns:
         if col not in df.columns:
             raise KeyError(f"DataFrame must contain '{col}' column")
     
-    high = df_copy["high"]
-    low = df_copy["low"]
-    close = df_copy["close"]
+    high = df["high"]
+    low = df["low"]
+    close = df["close"]
     
     # Calculate Bollinger Bands
     bb_middle = close.rolling(window=bb_length).mean()
@@ -32,11 +34,11 @@ def ttm_squeeze(df: pd.DataFrame, bb_length: int = 20, bb_std: float = 2.0,
     
     # Calculate Keltner Channels with True Range if required
     if use_tr:
-        tr = pd.DataFrame(index=df_copy.index)
-        tr['hl'] = high - low
-        tr['hc'] = (high - close.shift(1)).abs()
-        tr['lc'] = (low - close.shift(1)).abs()
-        true_range = tr[['hl', 'hc', 'lc']].max(axis=1)
+        tr = pd.concat(
+            [high - low, (high - close.shift(1)).abs(), (low - close.shift(1)).abs()],
+            axis=1,
+        )
+        true_range = tr.max(axis=1)
         
         if mamode.lower() == "ema":
             kc_middle = close.ewm(span=kc_length, adjust=False).mean()
@@ -92,14 +94,14 @@ def ttm_squeeze(df: pd.DataFrame, bb_length: int = 20, bb_std: float = 2.0,
         no_squeeze = ~squeeze_on_wide & ~squeeze_off
         
         # Add results to DataFrame
-        df_copy["squeeze"] = squeeze
-        df_copy["squeeze_on_wide"] = squeeze_on_wide.astype(int)
-        df_copy["squeeze_on_normal"] = squeeze_on_normal.astype(int)
-        df_copy["squeeze_on_narrow"] = squeeze_on_narrow.astype(int)
-        df_copy["squeeze_off"] = squeeze_off.astype(int)
-        df_copy["no_squeeze"] = no_squeeze.astype(int)
-        
-        result_columns = ["squeeze", "squeeze_on_wide", "squeeze_on_normal", "squeeze_on_narrow", "squeeze_off", "no_squeeze"]
+        columns = {
+            "squeeze": squeeze,
+            "squeeze_on_wide": squeeze_on_wide.astype(_flag_dtype()),
+            "squeeze_on_normal": squeeze_on_normal.astype(_flag_dtype()),
+            "squeeze_on_narrow": squeeze_on_narrow.astype(_flag_dtype()),
+            "squeeze_off": squeeze_off.astype(_flag_dtype()),
+            "no_squeeze": no_squeeze.astype(_flag_dtype()),
+        }
     else:
         # Standard squeeze version
         squeeze_on = (bb_lower > kc_lower) & (bb_upper < kc_upper)
@@ -107,12 +109,12 @@ def ttm_squeeze(df: pd.DataFrame, bb_length: int = 20, bb_std: float = 2.0,
         no_squeeze = ~squeeze_on & ~squeeze_off
         
         # Add results to DataFrame
-        df_copy["squeeze"] = squeeze
-        df_copy["squeeze_on"] = squeeze_on.astype(int)
-        df_copy["squeeze_off"] = squeeze_off.astype(int)
-        df_copy["no_squeeze"] = no_squeeze.astype(int)
-        
-        result_columns = ["squeeze", "squeeze_on", "squeeze_off", "no_squeeze"]
+        columns = {
+            "squeeze": squeeze,
+            "squeeze_on": squeeze_on.astype(_flag_dtype()),
+            "squeeze_off": squeeze_off.astype(_flag_dtype()),
+            "no_squeeze": no_squeeze.astype(_flag_dtype()),
+        }
     
     # Add detailed columns if requested
     if detailed:
@@ -160,16 +162,16 @@ def ttm_squeeze(df: pd.DataFrame, bb_length: int = 20, bb_std: float = 2.0,
                     neg_dec.iloc[i] = np.nan
         
         # Add detailed results to DataFrame
-        df_copy["squeeze_inc"] = squeeze_inc
-        df_copy["squeeze_dec"] = squeeze_dec
-        df_copy["pos_inc"] = pos_inc
-        df_copy["pos_dec"] = pos_dec
-        df_copy["neg_inc"] = neg_inc
-        df_copy["neg_dec"] = neg_dec
-        
-        result_columns.extend(["squeeze_inc", "squeeze_dec", "pos_inc", "pos_dec", "neg_inc", "neg_dec"])
+        columns.update(
+            squeeze_inc=squeeze_inc,
+            squeeze_dec=squeeze_dec,
+            pos_inc=pos_inc,
+            pos_dec=pos_dec,
+            neg_inc=neg_inc,
+            neg_dec=neg_dec,
+        )
     
-    return df_copy[result_columns]
+    return _build_result(columns, df.index, return_type)
 
 
 ttm_squeeze.__doc__ = \
@@ -211,6 +213,8 @@ Parameters:
     - detailed (bool): If True, return additional data for visualization. Default is False.
     - kc_scalar_wide (float): Multiplier for wide Keltner Channels (Pro version only). Default is 2.0.
     - kc_scalar_narrow (float): Multiplier for narrow Keltner Channels (Pro version only). Default is 1.0.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
 
 Call with:
     # Basic usage:
@@ -1,3 +1,10 @@
 # -*- coding: utf-8 -*-
 # performance/__init__.py
 
+from .drawdown_duration import drawdown_duration
+from .max_drawdown_duration import max_drawdown_duration
+from .rolling_calmar_ratio import rolling_calmar_ratio
+from .rolling_compounded_annual_growth_rate import rolling_compounded_annual_growth_rate
+from .rolling_max_drawdown import rolling_max_drawdown
+from .rolling_sharpe_ratio import rolling_sharpe_ratio
+from .rolling_sortino_ratio import rolling_sortino_ratio
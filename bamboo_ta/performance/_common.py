@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+# _common.py
+
+"""
+Shared helpers for the performance analytics.
+
+All performance functions work column-wise on a 2D block of returns (one
+column per equity curve, e.g. strategies x pairs). Rolling statistics are
+derived from running window sums, so every window update is O(1) and a full
+pass is O(n) per column, regardless of the window length. Rolling extremes
+of the equity curve (max drawdown, time since the high-water mark) use the
+van Herk/Gil-Werman block decomposition, which is O(n) as well.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _prepare_returns(returns):
+    """
+    Convert the returns input into a 2D float64 array.
+
+    Parameters:
+    - returns (pd.DataFrame, pd.Series or np.ndarray): Periodic returns, one
+      column per equity curve. 1D input is treated as a single curve.
+
+    Returns:
+    - tuple: (values, wrap) where values is an (n, k) float64 array and wrap
+      converts an (n, k) result array back into the input's container type
+      (DataFrame for pandas input, ndarray of the input's shape otherwise).
+    """
+    if isinstance(returns, pd.DataFrame):
+        values = returns.to_numpy(dtype=np.float64)
+
+        def wrap(result):
+            return pd.DataFrame(result, index=returns.index, columns=returns.columns)
+
+    elif isinstance(returns, pd.Series):
+        values = returns.to_numpy(dtype=np.float64).reshape(-1, 1)
+        name = returns.name if returns.name is not None else "returns"
+
+        def wrap(result):
+            return pd.DataFrame(result, index=returns.index, columns=[name])
+
+    else:
+        values = np.asarray(returns, dtype=np.float64)
+        if values.ndim == 1:
+            values = values.reshape(-1, 1)
+
+            def wrap(result):
+                return result[:, 0]
+
+        elif values.ndim == 2:
+
+            def wrap(result):
+                return result
+
+        else:
+            raise ValueError("Returns must be a 1D or 2D array")
+
+    return values, wrap
+
+
+def _validate_window(window, min_periods, default_min_periods: int):
+    """
+    Validate the window and resolve the minimum number of observations.
+
+    Parameters:
+    - window (int or None): Rolling window length, None for expanding.
+    - min_periods (int or None): Requested minimum number of observations.
+    - default_min_periods (int): Default for expanding calculations.
+
+    Returns:
+    - int: The minimum number of observations.
+    """
+    if window is not None and int(window) < 1:
+        raise ValueError("Window must be a positive integer or None")
+    if min_periods is None:
+        return int(window) if window is not None else default_min_periods
+    if min_periods < 1:
+        raise ValueError("min_periods must be at least 1")
+    if window is not None and min_periods > window:
+        raise ValueError("min_periods must not be larger than the window")
+    return int(min_periods)
+
+
+def _window_sum(values: np.ndarray, window) -> np.ndarray:
+    """
+    Rolling (or expanding) column sums with O(1) updates per row.
+
+    Expanding sums are a plain cumulative sum. Rolling sums use pandas'
+    online add/remove algorithm, which is compensated (Kahan) and therefore
+    does not lose precision on long series the way differences of a
+    cumulative sum do.
+
+    Parameters:
+    - values (np.ndarray): (n, k) array without NaN values.
+    - window (int or None): Window length, None for an expanding sum.
+
+    Returns:
+    - np.ndarray: (n, k) array where row i holds the sum of the last
+      ``window`` rows up to and including row i.
+    """
+    if window is None or window >= values.shape[0]:
+        return np.cumsum(values, axis=0)
+    return pd.DataFrame(values).rolling(window, min_periods=1).sum().to_numpy()
+
+
+def _log_equity(values: np.ndarray, log_returns: bool = False) -> np.ndarray:
+    """
+    Logarithmic equity curve, starting at 0 before the first return.
+
+    Parameters:
+    - values (np.ndarray): (n, k) array of returns. NaN returns are treated
+      as flat periods (no change in equity).
+    - log_returns (bool): If True the values already are log returns.
+
+    Returns:
+    - np.ndarray: (n + 1, k) array of log equity levels.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_values = values if log_returns else np.log1p(values)
+    log_values = np.where(np.isnan(log_values), 0.0, log_values)
+    equity = np.zeros((values.shape[0] + 1, values.shape[1]))
+    np.cumsum(log_values, axis=0, out=equity[1:])
+    return equity
+
+
+def _block_view(points: np.ndarray, block: int, fill: float) -> np.ndarray:
+    """
+    Pad an (N, k) array to a multiple of ``block`` rows and reshape it.
+
+    Parameters:
+    - points (np.ndarray): (N, k) array.
+    - block (int): Block length.
+    - fill (float): Value used for the padding rows.
+
+    Returns:
+    - np.ndarray: (blocks, block, k) array.
+    """
+    total, k = points.shape
+    padded_len = -(-total // block) * block
+    padded = np.full((padded_len, k), fill)
+    padded[:total] = points
+    return padded.reshape(-1, block, k)
+
+
+def _rolling_max_drawdown_log(equity: np.ndarray, window) -> np.ndarray:
+    """
+    Largest peak-to-trough decline of the log equity over a trailing window.
+
+    Parameters:
+    - equity (np.ndarray): (n + 1, k) log equity from _log_equity.
+    - window (int or None): Number of returns per window, None for expanding.
+
+    Returns:
+    - np.ndarray: (n, k) array of the maximum log drawdown (>= 0) of the
+      equity path ending at each return, starting one point before the
+      window's first return.
+    """
+    total, k = equity.shape
+
+    if window is None or window + 1 >= total:
+        running_max = np.maximum.accumulate(equity, axis=0)
+        return np.maximum.accumulate(running_max - equity, axis=0)[1:]
+
+    # Windows contain window + 1 equity points; split into blocks of that size
+    block = window + 1
+    level = _block_view(equity, block, 0.0)
+    high = _block_view(equity, block, -np.inf)
+    low = _block_view(equity, block, np.inf)
+
+    # Aggregates of every block prefix (block start up to the point)
+    prefix_max = np.maximum.accumulate(level, axis=1)
+    prefix_min = np.minimum.accumulate(level, axis=1)
+    prefix_mdd = np.maximum.accumulate(prefix_max - level, axis=1)
+
+    # Aggregates of every block suffix (point up to the block end)
+    suffix_max = np.maximum.accumulate(high[:, ::-1], axis=1)[:, ::-1]
+    suffix_min = np.minimum.accumulate(low[:, ::-1], axis=1)[:, ::-1]
+    suffix_mdd = np.maximum.accumulate((high - suffix_min)[:, ::-1], axis=1)[:, ::-1]
+
+    prefix_max, prefix_min, prefix_mdd, suffix_max, suffix_min, suffix_mdd = (
+        array.reshape(-1, k)
+        for array in (prefix_max, prefix_min, prefix_mdd, suffix_max, suffix_min, suffix_mdd)
+    )
+
+    # A window [start, end] is either a block prefix or a block suffix
+    # followed by the prefix of the next block
+    end = np.arange(1, total)
+    start = np.maximum(end - window, 0)
+    combined = np.maximum(
+        np.maximum(suffix_mdd[start], prefix_mdd[end]),
+        suffix_max[start] - prefix_min[end],
+    )
+    return np.where((start % block == 0)[:, None], prefix_mdd[end], combined)
+
+
+def _rolling_bars_since_high(equity: np.ndarray, window) -> np.ndarray:
+    """
+    Number of periods since the highest log equity over a trailing window.
+
+    Parameters:
+    - equity (np.ndarray): (n + 1, k) log equity from _log_equity.
+    - window (int or None): Number of returns per window, None for expanding.
+
+    Returns:
+    - np.ndarray: (n, k) float array of periods since the latest equity high
+      (0 on a new high).
+    """
+    total, k = equity.shape
+    position = np.broadcast_to(np.arange(total, dtype=np.float64)[:, None], (total, k))
+
+    if window is None or window + 1 >= total:
+        running_max = np.maximum.accumulate(equity, axis=0)
+        last_high = np.maximum.accumulate(
+            np.where(equity >= running_max, position, 0.0), axis=0
+        )
+        return (position - last_high)[1:]
+
+    block = window + 1
+    level = _block_view(equity, block, -np.inf)
+    index = _block_view(position, block, np.inf)
+
+    # Latest position of the prefix maximum (ties resolve to the later bar)
+    prefix_max = np.maximum.accumulate(level, axis=1)
+    prefix_arg = np.maximum.accumulate(
+        np.where(level >= prefix_max, index, -np.inf), axis=1
+    )
+
+    # Latest position of the suffix maximum: walking backwards, only a strictly
+    # higher value moves the position to an earlier bar
+    reverse = level[:, ::-1]
+    reverse_max = np.maximum.accumulate(reverse, axis=1)
+    previous_max = np.concatenate(
+        [np.full((reverse.shape[0], 1, k), -np.inf), reverse_max[:, :-1]], axis=1
+    )
+    reverse_arg = np.minimum.accumulate(
+        np.where(reverse > previous_max, index[:, ::-1], np.inf), axis=1
+    )
+    suffix_max = reverse_max[:, ::-1]
+    suffix_arg = reverse_arg[:, ::-1]
+
+    prefix_max, prefix_arg, suffix_max, suffix_arg = (
+        array.reshape(-1, k) for array in (prefix_max, prefix_arg, suffix_max, suffix_arg)
+    )
+
+    end = np.arange(1, total)
+    start = np.maximum(end - window, 0)
+    use_prefix = (start % block == 0)[:, None] | (prefix_max[end] >= suffix_max[start])
+    last_high = np.where(use_prefix, prefix_arg[end], suffix_arg[start])
+    return end[:, None] - last_high
+
+
+def _apply_min_periods(result: np.ndarray, count: np.ndarray, min_periods: int) -> np.ndarray:
+    """
+    Set results with fewer than ``min_periods`` observations to NaN.
+
+    Parameters:
+    - result (np.ndarray): (n, k) result array (modified in place).
+    - count (np.ndarray): (n, k) number of observations per window.
+    - min_periods (int): Minimum number of observations.
+
+    Returns:
+    - np.ndarray: The result array.
+    """
+    result[count < min_periods] = np.nan
+    return result
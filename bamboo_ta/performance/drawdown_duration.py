@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# drawdown_duration.py
+
+import numpy as np
+import pandas as pd
+
+from bamboo_ta.performance._common import (
+    _log_equity,
+    _prepare_returns,
+    _rolling_bars_since_high,
+    _validate_window,
+)
+
+
+def drawdown_duration(
+    returns,
+    window: int = None,
+    log_returns: bool = False,
+):
+    """Rolling / Expanding Drawdown Duration of many return series"""
+    values, wrap = _prepare_returns(returns)
+    _validate_window(window, None, 1)
+
+    # Periods since the highest equity value (within the window)
+    equity = _log_equity(values, log_returns=log_returns)
+    return wrap(_rolling_bars_since_high(equity, window))
+
+
+drawdown_duration.__doc__ = """
+Name:
+    Drawdown Duration
+
+Description:
+    Calculates how long every equity curve has been under water: the number of
+    periods since the equity last made a new high. With a window, the high is
+    the highest equity value within the trailing window (the same window as
+    bta.rolling_max_drawdown), so the duration never exceeds the window
+    length. Without a window the high is the all-time high-water mark.
+
+    Works column-wise on a 2D block of returns. The rolling version finds the
+    latest window high with the same O(n) block decomposition as the rolling
+    maximum drawdown, independent of the window length.
+
+More info:
+    https://www.investopedia.com/terms/d/drawdown.asp
+
+    A new high (including a tie with the previous high) resets the duration
+    to 0. Use bta.max_drawdown_duration for the longest under water period.
+
+Parameters:
+    - returns (pandas.DataFrame, pandas.Series or numpy.ndarray): Periodic
+      returns, one column per series. NaN values are treated as flat periods.
+    - window (int): Number of periods per rolling window. None (default) uses
+      the all-time high-water mark.
+    - log_returns (bool): Set to True when the returns are log returns instead
+      of simple returns. Default is False.
+
+Call with:
+    duration = bta.drawdown_duration(returns)
+    duration_90 = bta.drawdown_duration(returns, window=90)
+
+Returns:
+    pd.DataFrame (for pandas input) or np.ndarray (for array input) with the
+    same shape as the returns, holding the number of periods since the last
+    equity high.
+"""
+
+
+def test():
+    """
+    Test function for the drawdown_duration function.
+
+    This function creates a panel of random daily returns for several
+    strategies and calculates their drawdown duration.
+
+    Returns:
+        None: Displays the results to the console
+    """
+    try:
+        # Daily returns of three strategies with different drift and volatility
+        np.random.seed(42)
+        dates = pd.date_range("2023-01-01", periods=500, freq="D")
+        returns = pd.DataFrame(
+            {
+                "steady": np.random.normal(0.0008, 0.01, 500),
+                "volatile": np.random.normal(0.0008, 0.03, 500),
+                "losing": np.random.normal(-0.0005, 0.02, 500),
+            },
+            index=dates,
+        )
+
+        print("Periods since the all-time high (last 5 rows):")
+        print(drawdown_duration(returns).tail())
+        print("\nPeriods since the 90 day high (last 5 rows):")
+        print(drawdown_duration(returns, window=90).tail())
+
+    except Exception as e:
+        print(f"Error during testing: {e}")
+
+
+# Execute the test if this file is run directly
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# max_drawdown_duration.py
+
+import numpy as np
+import pandas as pd
+
+from bamboo_ta.performance._common import (
+    _log_equity,
+    _prepare_returns,
+    _rolling_bars_since_high,
+    _validate_window,
+)
+
+
+def max_drawdown_duration(
+    returns,
+    window: int = None,
+    log_returns: bool = False,
+):
+    """Rolling / Expanding Maximum Drawdown Duration of many return series"""
+    values, wrap = _prepare_returns(returns)
+    _validate_window(window, None, 1)
+
+    # Periods below the all-time high-water mark
+    equity = _log_equity(values, log_returns=log_returns)
+    duration = _rolling_bars_since_high(equity, None)
+
+    if window is None:
+        longest = np.maximum.accumulate(duration, axis=0)
+    else:
+        # Longest under water stretch seen by the bars of the window
+        longest = (
+            pd.DataFrame(duration).rolling(window, min_periods=1).max().to_numpy()
+        )
+
+    return wrap(longest)
+
+
+max_drawdown_duration.__doc__ = """
+Name:
+    Maximum Drawdown Duration
+
+Description:
+    Calculates the longest time every equity curve spent under water, the
+    maximum number of consecutive periods below a previous equity high,
+    either since the start (expanding) or over the bars of a trailing
+    window. An ongoing drawdown counts with its current length.
+
+    Durations are measured against the all-time high-water mark, so a
+    drawdown that started before the window still counts with its full
+    length. The expanding version is a running maximum and the rolling
+    version a rolling maximum of bta.drawdown_duration, both O(n) per column.
+
+More info:
+    https://www.investopedia.com/terms/d/drawdown.asp
+
+Parameters:
+    - returns (pandas.DataFrame, pandas.Series or numpy.ndarray): Periodic
+      returns, one column per series. NaN values are treated as flat periods.
+    - window (int): Number of periods per rolling window. None (default)
+      calculates the expanding maximum.
+    - log_returns (bool): Set to True when the returns are log returns instead
+      of simple returns. Default is False.
+
+Call with:
+    longest = bta.max_drawdown_duration(returns)
+    longest_1y = bta.max_drawdown_duration(returns, window=365)
+
+Returns:
+    pd.DataFrame (for pandas input) or np.ndarray (for array input) with the
+    same shape as the returns, holding the longest drawdown duration in
+    periods.
+"""
+
+
+def test():
+    """
+    Test function for the max_drawdown_duration function.
+
+    This function creates a panel of random daily returns for several
+    strategies and calculates their longest drawdown duration.
+
+    Returns:
+        None: Displays the results to the console
+    """
+    try:
+        # Daily returns of three strategies with different drift and volatility
+        np.random.seed(42)
+        dates = pd.date_range("2023-01-01", periods=500, freq="D")
+        returns = pd.DataFrame(
+            {
+                "steady": np.random.normal(0.0008, 0.01, 500),
+                "volatile": np.random.normal(0.0008, 0.03, 500),
+                "losing": np.random.normal(-0.0005, 0.02, 500),
+            },
+            index=dates,
+        )
+
+        print("Longest drawdown duration since the start (last row):")
+        print(max_drawdown_duration(returns).iloc[-1])
+        print("\nLongest drawdown duration over the last 90 days (last 5 rows):")
+        print(max_drawdown_duration(returns, window=90).tail())
+
+    except Exception as e:
+        print(f"Error during testing: {e}")
+
+
+# Execute the test if this file is run directly
+if __name__ == "__main__":
+    test()
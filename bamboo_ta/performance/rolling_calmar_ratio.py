@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# rolling_calmar_ratio.py
+
+import numpy as np
+import pandas as pd
+
+from bamboo_ta.performance._common import (
+    _apply_min_periods,
+    _log_equity,
+    _prepare_returns,
+    _rolling_max_drawdown_log,
+    _validate_window,
+    _window_sum,
+)
+
+
+def rolling_calmar_ratio(
+    returns,
+    window: int = None,
+    periods_per_year: int = 252,
+    log_returns: bool = False,
+    min_periods: int = None,
+):
+    """Rolling / Expanding Calmar Ratio of many return series"""
+    values, wrap = _prepare_returns(returns)
+    min_periods = _validate_window(window, min_periods, 1)
+
+    valid = ~np.isnan(values)
+    count = _window_sum(valid.astype(np.float64), window)
+
+    # CAGR and maximum drawdown share the same log equity curve
+    equity = _log_equity(values, log_returns=log_returns)
+    log_growth = _window_sum(np.diff(equity, axis=0), window)
+    max_drawdown = -np.expm1(-_rolling_max_drawdown_log(equity, window))
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        cagr = np.expm1(log_growth * periods_per_year / count)
+        calmar = np.where(max_drawdown > 0, cagr / max_drawdown, np.nan)
+
+    return wrap(_apply_min_periods(calmar, count, min_periods))
+
+
+rolling_calmar_ratio.__doc__ = """
+Name:
+    Rolling Calmar Ratio
+
+Description:
+    Calculates the Calmar ratio, the compounded annual growth rate divided by
+    the maximum drawdown, over a trailing window (or an expanding window from
+    the first observation) for every column of a 2D block of returns.
+
+    Both parts are O(n) per column: the growth of a window comes from a
+    running sum of log returns and the maximum drawdown from the block
+    decomposition used by bta.rolling_max_drawdown.
+
+More info:
+    https://www.investopedia.com/terms/c/calmarratio.asp
+
+    Calmar = CAGR / Max Drawdown
+
+    The classic Calmar ratio uses a 36 month window; with daily crypto returns
+    that is window=1095 and periods_per_year=365. Windows without a drawdown
+    are NaN.
+
+Parameters:
+    - returns (pandas.DataFrame, pandas.Series or numpy.ndarray): Periodic
+      returns, one column per series. NaN values are treated as missing
+      observations (flat equity).
+    - window (int): Number of periods per rolling window. None (default)
+      calculates an expanding Calmar ratio.
+    - periods_per_year (int): Number of return periods per year. Default is
+      252.
+    - log_returns (bool): Set to True when the returns are log returns instead
+      of simple returns. Default is False.
+    - min_periods (int): Minimum number of observations required for a value.
+      Defaults to the window (1 for an expanding window).
+
+Call with:
+    calmar = bta.rolling_calmar_ratio(returns, window=1095, periods_per_year=365)
+
+Returns:
+    pd.DataFrame (for pandas input) or np.ndarray (for array input) with the
+    same shape as the returns, holding the Calmar ratio of every window.
+"""
+
+
+def test():
+    """
+    Test function for the rolling_calmar_ratio function.
+
+    This function creates a panel of random daily returns for several
+    strategies and calculates their rolling Calmar ratios.
+
+    Returns:
+        None: Displays the results to the console
+    """
+    try:
+        # Daily returns of three strategies with different drift and volatility
+        np.random.seed(42)
+        dates = pd.date_range("2023-01-01", periods=500, freq="D")
+        returns = pd.DataFrame(
+            {
+                "steady": np.random.normal(0.0008, 0.01, 500),
+                "volatile": np.random.normal(0.0008, 0.03, 500),
+                "losing": np.random.normal(-0.0005, 0.02, 500),
+            },
+            index=dates,
+        )
+
+        result = rolling_calmar_ratio(returns, window=180, periods_per_year=365)
+        print("Rolling 180 day Calmar ratio (last 5 rows):")
+        print(result.tail())
+
+    except Exception as e:
+        print(f"Error during testing: {e}")
+
+
+# Execute the test if this file is run directly
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# rolling_compounded_annual_growth_rate.py
+
+import numpy as np
+import pandas as pd
+
+from bamboo_ta.performance._common import (
+    _apply_min_periods,
+    _prepare_returns,
+    _validate_window,
+    _window_sum,
+)
+
+
+def rolling_compounded_annual_growth_rate(
+    returns,
+    window: int = None,
+    periods_per_year: int = 252,
+    log_returns: bool = False,
+    min_periods: int = None,
+):
+    """Rolling / Expanding Compounded Annual Growth Rate of many return series"""
+    values, wrap = _prepare_returns(returns)
+    min_periods = _validate_window(window, min_periods, 1)
+
+    # NaN returns are missing observations
+    valid = ~np.isnan(values)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_values = values if log_returns else np.log1p(values)
+    log_values = np.where(valid, log_values, 0.0)
+
+    count = _window_sum(valid.astype(np.float64), window)
+    log_growth = _window_sum(log_values, window)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # Total growth of the window, compounded to a yearly rate
+        cagr = np.expm1(log_growth * periods_per_year / count)
+
+    return wrap(_apply_min_periods(cagr, count, min_periods))
+
+
+rolling_compounded_annual_growth_rate.__doc__ = """
+Name:
+    Rolling Compounded Annual Growth Rate (Rolling CAGR)
+
+Description:
+    Calculates the compounded annual growth rate over a trailing window (or an
+    expanding window from the first observation) for every column of a 2D
+    block of returns. This is the walk-forward version of the scalar
+    bta.compounded_annual_growth_rate utility.
+
+    The growth of every window is the running sum of the log returns in the
+    window, so each window update is O(1) and all columns are processed in one
+    pass.
+
+More info:
+    https://www.investopedia.com/terms/c/cagr.asp
+
+    CAGR = (end_value / start_value) ^ (periods_per_year / periods) - 1
+         = exp(sum(log(1 + returns)) * periods_per_year / periods) - 1
+
+Parameters:
+    - returns (pandas.DataFrame, pandas.Series or numpy.ndarray): Periodic
+      returns, one column per series. NaN values are treated as missing
+      observations and do not count as elapsed periods.
+    - window (int): Number of periods per rolling window. None (default)
+      calculates an expanding CAGR.
+    - periods_per_year (int): Number of return periods per year. Default is
+      252.
+    - log_returns (bool): Set to True when the returns are log returns instead
+      of simple returns. Default is False.
+    - min_periods (int): Minimum number of observations required for a value.
+      Defaults to the window (1 for an expanding window).
+
+Call with:
+    cagr = bta.rolling_compounded_annual_growth_rate(returns, window=365, periods_per_year=365)
+
+Returns:
+    pd.DataFrame (for pandas input) or np.ndarray (for array input) with the
+    same shape as the returns, holding the CAGR (as a fraction) of every window.
+"""
+
+
+def test():
+    """
+    Test function for the rolling_compounded_annual_growth_rate function.
+
+    This function creates a panel of random daily returns for several
+    strategies and calculates their rolling CAGR.
+
+    Returns:
+        None: Displays the results to the console
+    """
+    try:
+        # Daily returns of three strategies with different drift and volatility
+        np.random.seed(42)
+        dates = pd.date_range("2023-01-01", periods=500, freq="D")
+        returns = pd.DataFrame(
+            {
+                "steady": np.random.normal(0.0008, 0.01, 500),
+                "volatile": np.random.normal(0.0008, 0.03, 500),
+                "losing": np.random.normal(-0.0005, 0.02, 500),
+            },
+            index=dates,
+        )
+
+        result = rolling_compounded_annual_growth_rate(
+            returns, window=180, periods_per_year=365
+        )
+        print("Rolling 180 day CAGR (last 5 rows):")
+        print(result.tail())
+
+    except Exception as e:
+        print(f"Error during testing: {e}")
+
+
+# Execute the test if this file is run directly
+if __name__ == "__main__":
+    test()
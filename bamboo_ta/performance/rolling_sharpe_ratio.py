@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# rolling_sharpe_ratio.py
+
+import numpy as np
+import pandas as pd
+
+from bamboo_ta.performance._common import _prepare_returns, _validate_window
+
+
+def rolling_sharpe_ratio(
+    returns,
+    window: int = None,
+    risk_free_rate: float = 0.0,
+    periods_per_year: int = 252,
+    min_periods: int = None,
+):
+    """Rolling / Expanding Sharpe Ratio of many return series"""
+    values, wrap = _prepare_returns(returns)
+    if window is not None and window < 2:
+        raise ValueError("The Sharpe ratio requires a window of at least 2 periods")
+    min_periods = max(_validate_window(window, min_periods, 2), 2)
+
+    # Online mean and variance (NaN returns are missing observations)
+    frame = pd.DataFrame(values)
+    if window is None:
+        windows = frame.expanding(min_periods=min_periods)
+    else:
+        windows = frame.rolling(window, min_periods=min_periods)
+    mean = windows.mean().to_numpy()
+    stdev = windows.std().to_numpy()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Annualised excess return over annualised volatility
+        excess = mean - risk_free_rate / periods_per_year
+        sharpe = np.where(stdev > 0, excess / stdev * np.sqrt(periods_per_year), np.nan)
+
+    return wrap(sharpe)
+
+
+rolling_sharpe_ratio.__doc__ = """
+Name:
+    Rolling Sharpe Ratio
+
+Description:
+    Calculates the Sharpe ratio over a trailing window (or an expanding window
+    from the first observation) for every column of a 2D block of returns, for
+    example one column per strategy x pair. This is the walk-forward version of
+    the scalar bta.sharpe_ratio utility.
+
+    The mean and standard deviation of each window are updated online (one
+    observation enters and one leaves per step), so each window update is O(1)
+    and the cost does not depend on the window length.
+
+More info:
+    https://www.investopedia.com/terms/s/sharperatio.asp
+
+    Sharpe = (mean(returns) - risk_free_rate / periods_per_year) / std(returns)
+             * sqrt(periods_per_year)
+
+    The standard deviation uses ddof=1, as in bta.sharpe_ratio.
+
+Parameters:
+    - returns (pandas.DataFrame, pandas.Series or numpy.ndarray): Periodic
+      (simple or log) returns, one column per series. NaN values are treated
+      as missing observations.
+    - window (int): Number of periods per rolling window. None (default)
+      calculates an expanding Sharpe ratio.
+    - risk_free_rate (float): Annual risk-free rate. Default is 0.0.
+    - periods_per_year (int): Number of return periods per year used for
+      annualisation (252 for daily stock data, 365 for daily crypto data,
+      8760 for hourly crypto data). Default is 252.
+    - min_periods (int): Minimum number of observations required for a value.
+      Defaults to the window (2 for an expanding window).
+
+Call with:
+    returns = prices.pct_change()  # prices: one column per strategy / pair
+    sharpe = bta.rolling_sharpe_ratio(returns, window=90, periods_per_year=365)
+
+Returns:
+    pd.DataFrame (for pandas input) or np.ndarray (for array input) with the
+    same shape as the returns, holding the Sharpe ratio of every window.
+"""
+
+
+def test():
+    """
+    Test function for the rolling_sharpe_ratio function.
+
+    This function creates a panel of random daily returns for several
+    strategies and calculates their rolling Sharpe ratios.
+
+    Returns:
+        None: Displays the results to the console
+    """
+    try:
+        # Daily returns of three strategies with different drift and volatility
+        np.random.seed(42)
+        dates = pd.date_range("2023-01-01", periods=500, freq="D")
+        returns = pd.DataFrame(
+            {
+                "steady": np.random.normal(0.0008, 0.01, 500),
+                "volatile": np.random.normal(0.0008, 0.03, 500),
+                "losing": np.random.normal(-0.0005, 0.02, 500),
+            },
+            index=dates,
+        )
+
+        result = rolling_sharpe_ratio(returns, window=90, periods_per_year=365)
+        print("Rolling 90 day Sharpe ratio (last 5 rows):")
+        print(result.tail())
+
+    except Exception as e:
+        print(f"Error during testing: {e}")
+
+
+# Execute the test if this file is run directly
+if __name__ == "__main__":
+    test()
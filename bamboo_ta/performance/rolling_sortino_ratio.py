@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# rolling_sortino_ratio.py
+
+import numpy as np
+import pandas as pd
+
+from bamboo_ta.performance._common import (
+    _apply_min_periods,
+    _prepare_returns,
+    _validate_window,
+    _window_sum,
+)
+
+
+def rolling_sortino_ratio(
+    returns,
+    window: int = None,
+    risk_free_rate: float = 0.0,
+    periods_per_year: int = 252,
+    min_periods: int = None,
+):
+    """Rolling / Expanding Sortino Ratio of many return series"""
+    values, wrap = _prepare_returns(returns)
+    min_periods = _validate_window(window, min_periods, 2)
+
+    # NaN returns are missing observations
+    valid = ~np.isnan(values)
+    target = risk_free_rate / periods_per_year
+    excess = np.where(valid, values - target, 0.0)
+    downside = np.minimum(excess, 0.0)
+
+    count = _window_sum(valid.astype(np.float64), window)
+    total_excess = _window_sum(excess, window)
+    total_downside_sq = _window_sum(downside * downside, window)
+    downside_count = _window_sum((downside < 0).astype(np.float64), window)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_excess = total_excess / count
+        # Downside deviation: root mean square of the returns below the target
+        downside_dev = np.sqrt(np.maximum(total_downside_sq, 0.0) / count)
+        sortino = np.where(
+            (downside_count > 0) & (downside_dev > 0),
+            mean_excess / downside_dev * np.sqrt(periods_per_year),
+            np.nan,
+        )
+
+    return wrap(_apply_min_periods(sortino, count, min_periods))
+
+
+rolling_sortino_ratio.__doc__ = """
+Name:
+    Rolling Sortino Ratio
+
+Description:
+    Calculates the Sortino ratio over a trailing window (or an expanding window
+    from the first observation) for every column of a 2D block of returns. The
+    Sortino ratio is a variation of the Sharpe ratio that only penalises
+    downside volatility: the excess return is divided by the downside
+    deviation, the root mean square of the returns below the target.
+
+    Window sums of the excess returns and the squared downside returns are
+    updated online (one observation enters and one leaves per step), so each
+    window update is O(1) and all columns are processed in one pass.
+
+More info:
+    https://www.investopedia.com/terms/s/sortinoratio.asp
+
+    Sortino = mean(returns - target) / sqrt(mean(min(returns - target, 0)^2))
+              * sqrt(periods_per_year)
+
+    where target = risk_free_rate / periods_per_year. Windows without any
+    return below the target have no downside deviation and are NaN.
+
+Parameters:
+    - returns (pandas.DataFrame, pandas.Series or numpy.ndarray): Periodic
+      (simple or log) returns, one column per series. NaN values are treated
+      as missing observations.
+    - window (int): Number of periods per rolling window. None (default)
+      calculates an expanding Sortino ratio.
+    - risk_free_rate (float): Annual risk-free rate, also used as the target
+      return. Default is 0.0.
+    - periods_per_year (int): Number of return periods per year used for
+      annualisation. Default is 252.
+    - min_periods (int): Minimum number of observations required for a value.
+      Defaults to the window (2 for an expanding window).
+
+Call with:
+    sortino = bta.rolling_sortino_ratio(returns, window=90, periods_per_year=365)
+
+Returns:
+    pd.DataFrame (for pandas input) or np.ndarray (for array input) with the
+    same shape as the returns, holding the Sortino ratio of every window.
+"""
+
+
+def test():
+    """
+    Test function for the rolling_sortino_ratio function.
+
+    This function creates a panel of random daily returns for several
+    strategies and calculates their rolling Sortino ratios.
+
+    Returns:
+        None: Displays the results to the console
+    """
+    try:
+        # Daily returns of three strategies with different drift and volatility
+        np.random.seed(42)
+        dates = pd.date_range("2023-01-01", periods=500, freq="D")
+        returns = pd.DataFrame(
+            {
+                "steady": np.random.normal(0.0008, 0.01, 500),
+                "volatile": np.random.normal(0.0008, 0.03, 500),
+                "losing": np.random.normal(-0.0005, 0.02, 500),
+            },
+            index=dates,
+        )
+
+        result = rolling_sortino_ratio(returns, window=90, periods_per_year=365)
+        print("Rolling 90 day Sortino ratio (last 5 rows):")
+        print(result.tail())
+
+    except Exception as e:
+        print(f"Error during testing: {e}")
+
+
+# Execute the test if this file is run directly
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+# screener.py
+
+"""
+Cross-sectional screening of the latest bar of many symbols.
+
+A market scanner needs the current value of a few dozen indicators for
+thousands of symbols, not their whole history. ``screen`` computes only
+that:
+
+- Every spec gets its minimal lookback from the indicator metadata: the
+  warm-up plus one row for windowed indicators and ``_RECURSIVE_LOOKBACK``
+  times that (at least ``_RECURSIVE_MIN_LOOKBACK`` rows) for recursive
+  ones, whose smoothing then has settled on the full-history value.
+  Unregistered indicators get the whole history.
+- The frames are sliced to the longest lookback and stacked into one 2D
+  block per input column, with one column per symbol, padded with NaN in
+  front of symbols with a shorter history.
+- The indicators whose core function runs over 2D blocks are computed for
+  all symbols in one column-wise call. The others, and the symbols with a
+  shorter history than the lookback, are called per symbol on its sliced
+  frame.
+
+The last row of every frame is its current bar. The result is a symbols x
+outputs table and optionally the cross-sectional percentile ranks.
+
+Call with:
+    specs = [
+        {"name": "rsi", "func": "relative_strength_index"},
+        {"name": "ema200", "func": "exponential_moving_average", "kwargs": {"period": 200}},
+        {"name": "atr", "func": "average_true_range"},
+    ]
+    table, ranks = bta.screen(frames, specs, ranks=True)  # frames: symbol -> DataFrame
+"""
+
+import inspect
+
+import numpy as np
+import pandas as pd
+
+from bamboo_ta import core
+from bamboo_ta.executor import _normalize_specs, _result_columns
+from bamboo_ta.metadata import (
+    _REGISTRY,
+    _bound_params,
+    _columns,
+    _indicator_name,
+    indicator_metadata,
+)
+
+# Lookback of recursive indicators in multiples of their warm-up + 1: Wilder
+# smoothing (factor 1 / period) forgets the sliced-off history down to e^-20.
+# Adaptive smoothers (JMA) carry a volatility history longer than their
+# nominal warm-up, hence the minimum.
+_RECURSIVE_LOOKBACK = 20
+_RECURSIVE_MIN_LOOKBACK = 500
+
+# Indicators whose core function takes 2D blocks -> number of input arrays
+_VECTORISED = {
+    "average_true_range": 3,
+    "bollinger_bands": 1,
+    "exponential_moving_average": 1,
+    "hull_moving_average": 1,
+    "jurik_moving_average": 1,
+    "macd": 1,
+    "on_balance_volume": 2,
+    "relative_strength_index": 1,
+    "rolling_moving_average": 1,
+    "simple_moving_average": 1,
+    "stochastics_oscillator": 3,
+    "true_range": 3,
+    "weighted_moving_average": 1,
+}
+
+
+def _spec_lookback(name: str, kwargs: dict, lookback: int):
+    """
+    Get the rows a spec needs for its latest value.
+
+    Parameters:
+    - name (str): Indicator name.
+    - kwargs (dict): Keyword arguments of the spec.
+    - lookback (int): Rows set for every spec, or None.
+
+    Returns:
+    - int or None: The rows, None for the whole history.
+    """
+    if lookback is not None:
+        return lookback
+    if name not in _REGISTRY:
+        return None
+    meta = indicator_metadata(name, **kwargs)
+    rows = meta["warmup"] + 1
+    if meta["recursive"]:
+        return max(rows * _RECURSIVE_LOOKBACK, _RECURSIVE_MIN_LOOKBACK)
+    return rows
+
+
+def _vectorised_inputs(func, name: str, kwargs: dict):
+    """
+    Get the input columns of a spec that runs over 2D blocks.
+
+    Parameters:
+    - func (Callable): The indicator of the spec.
+    - name (str): Its name.
+    - kwargs (dict): Keyword arguments of the spec.
+
+    Returns:
+    - list or None: The input columns in the order of the core function, or
+      None when the spec is called per symbol (other indicators, several
+      source columns).
+    """
+    import bamboo_ta.bamboo_ta as bta
+
+    if name not in _VECTORISED or func is not getattr(bta, name, None):
+        return None
+    inputs = _columns(_REGISTRY[name]["inputs"], name, _bound_params(func, kwargs))
+    return inputs if len(inputs) == _VECTORISED[name] else None
+
+
+def _stack(frames: list, lengths: dict) -> dict:
+    """
+    Stack the last rows of the frames column by column.
+
+    Parameters:
+    - frames (list): The frames (or dicts of arrays), one per symbol.
+    - lengths (dict): Column -> rows per symbol.
+
+    Returns:
+    - dict: Column -> column-major float64 array of shape (rows, symbols),
+      where rows is the length, or the longest history when shorter; NaN in
+      front of shorter histories.
+    """
+    blocks = {}
+    for column, length in lengths.items():
+        tails = [np.asarray(frame[column])[-length:] for frame in frames]
+        rows = max(len(values) for values in tails)
+        block = np.empty((rows, len(tails)), order="F")
+        for j, values in enumerate(tails):
+            block[: rows - len(values), j] = np.nan
+            block[rows - len(values) :, j] = values
+        blocks[column] = block
+    return blocks
+
+
+def _vectorised_latest(
+    name: str, func, kwargs: dict, inputs: list, blocks: dict, length: int
+) -> dict:
+    """
+    Compute the latest values of a spec for all symbols in one call.
+
+    Parameters:
+    - name (str): Indicator name.
+    - func (Callable): The indicator.
+    - kwargs (dict): Keyword arguments of the spec.
+    - inputs (list): Its input columns.
+    - blocks (dict): Column -> stacked block (see ``_stack``).
+    - length (int): Rows the spec needs.
+
+    Returns:
+    - dict: Output -> latest value per symbol.
+    """
+    core_func = getattr(core, name)
+    parameters = inspect.signature(core_func).parameters
+    bound = _bound_params(func, kwargs)
+    core_kwargs = {
+        key: value
+        for key, value in bound.items()
+        if key in parameters and key not in ("out", "workspace", "state")
+    }
+    result = core_func(*(blocks[column][-length:] for column in inputs), **core_kwargs)
+    results = result if isinstance(result, tuple) else (result,)
+    outputs = indicator_metadata(name, **kwargs)["outputs"]
+    return {output: values[-1] for output, values in zip(outputs, results)}
+
+
+def _per_symbol_latest(name: str, func, kwargs: dict, frames: list, length: int) -> dict:
+    """
+    Compute the latest values of a spec one symbol at a time.
+
+    Parameters:
+    - name (str): Spec name, for the output columns.
+    - func (Callable): The indicator.
+    - kwargs (dict): Keyword arguments of the spec.
+    - frames (list): The frames (or dicts of arrays), one per symbol.
+    - length (int): Rows the spec needs, or None for the whole history.
+
+    Returns:
+    - dict: Output column -> list of the latest value per symbol.
+    """
+    rows = {}
+    for frame in frames:
+        if not isinstance(frame, pd.DataFrame):
+            frame = pd.DataFrame(frame)
+        # Positional index, as in a full-history call: some indicators look
+        # rows up by label
+        sliced = frame if length is None else frame.iloc[-length:].reset_index(drop=True)
+        for column, values in _result_columns(name, func(sliced, **kwargs)).items():
+            rows.setdefault(column, []).append(values[-1] if len(values) else np.nan)
+    return rows
+
+
+def screen(
+    frames: dict,
+    specs: list,
+    lookback: int = None,
+    ranks: bool = False,
+):
+    """Compute the latest value of many indicators across many symbols"""
+    specs = _normalize_specs(specs)
+    for name, spec in specs.items():
+        if spec["args"] or spec["depends_on"]:
+            raise ValueError(f"{name!r}: screen specs take keyword arguments only")
+    if lookback is not None and lookback < 1:
+        raise ValueError("lookback must be a positive integer")
+    symbols = list(frames)
+    frames = [frames[symbol] for symbol in symbols]
+
+    plans = {}
+    for name, spec in specs.items():
+        indicator = _indicator_name(spec["func"])
+        plans[name] = (
+            indicator,
+            _spec_lookback(indicator, spec["kwargs"], lookback),
+            _vectorised_inputs(spec["func"], indicator, spec["kwargs"]),
+        )
+
+    # Stack every input column as deep as the longest spec reading it
+    lengths = {}
+    for _, length, inputs in plans.values():
+        for column in inputs or ():
+            lengths[column] = max(lengths.get(column, 0), length)
+    blocks = _stack(frames, lengths) if symbols else {}
+
+    table = {}
+    for name, spec in specs.items():
+        indicator, length, inputs = plans[name]
+        if inputs is None or not symbols:
+            table.update(
+                _per_symbol_latest(name, spec["func"], spec["kwargs"], frames, length)
+            )
+            continue
+
+        latest = _vectorised_latest(
+            indicator, spec["func"], spec["kwargs"], inputs, blocks, length
+        )
+        if len(latest) == 1:
+            columns = {name: next(iter(latest.values()))}
+        else:
+            columns = {f"{name}_{output}": values for output, values in latest.items()}
+
+        # The NaN padding of shorter histories would shift the warm-up of the
+        # kernels, so these symbols are computed on their own history
+        short = [j for j, frame in enumerate(frames) if len(frame[inputs[0]]) < length]
+        if short:
+            columns = {column: np.array(values) for column, values in columns.items()}
+            rows = _per_symbol_latest(
+                name, spec["func"], spec["kwargs"], [frames[j] for j in short], length
+            )
+            for column, values in rows.items():
+                columns[column][short] = values
+        table.update(columns)
+
+    table = pd.DataFrame(table, index=pd.Index(symbols, name="symbol"))
+    if not ranks:
+        return table
+    return table, table.rank(pct=True)
+
+
+screen.__doc__ = """
+Name:
+    Screen
+
+Description:
+    Computes the current value of many indicators across many symbols, for market
+    scanners that only need the latest bar. Instead of full-history calls per symbol:
+
+    - Each spec only uses the last rows its latest value depends on: the warm-up + 1
+      rows declared in the indicator metadata (see indicator_metadata), or 20 times as
+      many (at least 500) for recursive indicators, after which their smoothing
+      matches the full-history value closely. Indicators without metadata use the
+      whole history.
+    - The symbols are stacked into 2D blocks (bars x symbols) per input column. The
+      indicators whose core function runs column-wise over such blocks are computed
+      for all symbols in a single call: the moving averages (SMA, EMA, RMA, WMA, HMA,
+      JMA), RSI, MACD, Bollinger Bands, true range, ATR, stochastics and OBV. The
+      others are called once per symbol on its sliced frame.
+
+    The last row of every frame is taken as its current bar. Symbols with a shorter
+    history than a lookback are computed per symbol on their whole history, so they
+    get the same warm-up as a direct call. Cumulative indicators (such
+    as OBV) refer to the sliced history, so their level differs from a full-history
+    call; pass a lookback to choose it.
+
+Parameters:
+    - frames (dict): Symbol -> OHLCV DataFrame, oldest row first. A dict of NumPy
+      arrays per symbol ('open', 'high', 'low', 'close', 'volume') works too and
+      skips pandas' column lookups, which dominate the stacking of new frames.
+    - specs (list): One dict per indicator with the keys:
+        - name (str): Unique name, used for the output columns.
+        - func (str or callable): Indicator name in the bta namespace, or a function
+          taking the frame as first argument.
+        - kwargs (dict, optional): Keyword arguments.
+    - lookback (int): Rows per symbol for every spec. Default is None, the declared
+      lookback of each spec.
+    - ranks (bool): Also return the cross-sectional ranks. Default is False.
+
+Call with:
+    specs = [
+        {"name": "rsi", "func": "relative_strength_index"},
+        {"name": "ema200", "func": "exponential_moving_average", "kwargs": {"period": 200}},
+        {"name": "bb", "func": "bollinger_bands", "kwargs": {"period": 20}},
+        {"name": "atr", "func": "average_true_range"},
+    ]
+    table, ranks = bta.screen(frames, specs, ranks=True)
+    oversold = table[table["rsi"] < 30].index
+
+Returns:
+    pd.DataFrame: One row per symbol (index 'symbol', in the order of frames) and one
+    column per output, named as in run_many: the spec name for single-output
+    indicators, otherwise '<name>_<output>'.
+    With ranks=True a tuple (table, ranks), where ranks holds the percentile rank of
+    every value among the symbols (1.0 for the largest, NaN for missing values).
+"""
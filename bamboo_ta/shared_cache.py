@@ -0,0 +1,511 @@
+# -*- coding: utf-8 -*-
+# shared_cache.py
+
+"""
+Cross-process cache of indicator outputs in shared memory.
+
+Several bots and hyperopt workers on one host compute the same indicators
+on the same candles, each in its own process. ``compute`` lets them share
+the results without a daemon:
+
+- The key of a call is a fingerprint (BLAKE2b) of the bytes of the input
+  columns the indicator reads (see ``metadata``: its inputs and the
+  optional inputs the frame has; every column for unregistered
+  indicators), of the index, of the indicator name and of its arguments
+  with the defaults filled in.
+- Each result is published as one ``multiprocessing.shared_memory``
+  segment holding its output columns back to back. An index file in the
+  cache directory maps the keys to the segments and their column layout,
+  and a lock file serialises the access to it across processes.
+- A hit attaches the segment and returns read-only NumPy views of it, so
+  nothing is copied or deserialised.
+- The segments are capped at ``max_bytes`` in total. Publishing evicts the
+  least recently used entries. Evicted segments are unlinked; processes
+  that still hold views of them keep their mapping.
+
+Segments outlive the process that published them, until they are evicted
+or ``clear`` is called (on Windows, as long as one process has them
+attached). Only numeric and boolean outputs are cached; other results are
+computed and returned as usual.
+
+Call with:
+    from bamboo_ta import shared_cache
+    rsi = shared_cache.compute(df, "relative_strength_index", period=14)
+    bands = shared_cache.compute(df, "bollinger_bands", return_type="dict", period=20)
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from bamboo_ta._results import _build_result, _validate_return_type, _values
+from bamboo_ta.executor import _resolve_func
+from bamboo_ta.metadata import _REGISTRY, _bound_params, _indicator_name, indicator_metadata
+from bamboo_ta.store import _replace, _result_frame
+
+_INDEX_FILE = "index.json"
+_LOCK_FILE = "index.lock"
+_MAX_BYTES = 1 << 30
+# Offsets of the columns in a segment are multiples of a cache line
+_ALIGNMENT = 64
+
+# Segments this process has attached, by name; their views must stay valid
+_ATTACHED = {}
+
+
+def _directory(directory) -> str:
+    """
+    Get the cache directory, creating it when needed.
+
+    Parameters:
+    - directory (str or os.PathLike): The directory, or None for the default
+      'bamboo_ta_cache' in the temporary directory.
+
+    Returns:
+    - str: The directory.
+    """
+    if directory is None:
+        directory = os.path.join(tempfile.gettempdir(), "bamboo_ta_cache")
+    directory = os.path.abspath(os.fspath(directory))
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+@contextlib.contextmanager
+def _locked(directory: str):
+    """
+    Hold the cache lock of a directory, across processes.
+
+    Parameters:
+    - directory (str): The cache directory.
+    """
+    with open(os.path.join(directory, _LOCK_FILE), "a+b") as handle:
+        if os.name == "nt":
+            import msvcrt
+
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _read_index(directory: str) -> dict:
+    """
+    Read the index of a cache directory.
+
+    Parameters:
+    - directory (str): The cache directory.
+
+    Returns:
+    - dict: Key -> entry ('segment', 'indicator', 'params', 'rows',
+      'columns' as [name, dtype, offset] lists, 'nbytes' and 'last_used').
+    """
+    path = os.path.join(directory, _INDEX_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _write_index(directory: str, index: dict) -> None:
+    """
+    Write the index of a cache directory atomically.
+
+    Parameters:
+    - directory (str): The cache directory.
+    - index (dict): Key -> entry.
+
+    Returns:
+    - None
+    """
+
+    def write(path):
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(index, handle)
+
+    _replace(os.path.join(directory, _INDEX_FILE), write)
+
+
+def _segment(name: str, create: bool = False, size: int = 0):
+    """
+    Open a shared memory segment that is not removed when this process exits.
+
+    Parameters:
+    - name (str): Segment name.
+    - create (bool): Create it instead of attaching it. Default is False.
+    - size (int): Size in bytes of a new segment.
+
+    Returns:
+    - shared_memory.SharedMemory: The segment.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, create=create, size=size, track=False)
+    segment = shared_memory.SharedMemory(name, create=create, size=size)
+    if os.name == "posix":
+        # The resource tracker would unlink it when this process exits
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(segment._name, "shared_memory")
+    return segment
+
+
+def _unlink(name: str) -> None:
+    """
+    Remove a shared memory segment; mappings of other processes stay valid.
+
+    Parameters:
+    - name (str): Segment name.
+
+    Returns:
+    - None
+    """
+    try:
+        segment = _segment(name)
+    except FileNotFoundError:
+        return
+    if os.name == "posix" and sys.version_info < (3, 13):
+        # unlink() unregisters the segment from the resource tracker again
+        from multiprocessing import resource_tracker
+
+        resource_tracker.register(segment._name, "shared_memory")
+    segment.unlink()
+    segment.close()
+
+
+def _release(index: dict) -> None:
+    """
+    Detach the evicted segments of this process that are no longer viewed.
+
+    Parameters:
+    - index (dict): The current index.
+
+    Returns:
+    - None
+    """
+    live = {entry["segment"] for entry in index.values()}
+    for name in [name for name in _ATTACHED if name not in live]:
+        try:
+            _ATTACHED[name].close()
+        except BufferError:
+            continue  # Views of it are still in use
+        del _ATTACHED[name]
+
+
+def _views(entry: dict):
+    """
+    Attach the segment of an entry and view its columns.
+
+    Parameters:
+    - entry (dict): The index entry.
+
+    Returns:
+    - dict or None: Column name -> read-only array, None when the segment is
+      gone.
+    """
+    name = entry["segment"]
+    if name not in _ATTACHED:
+        try:
+            _ATTACHED[name] = _segment(name)
+        except FileNotFoundError:
+            return None
+    buffer = _ATTACHED[name].buf
+    views = {}
+    for column, dtype, offset in entry["columns"]:
+        view = np.ndarray((entry["rows"],), dtype=np.dtype(dtype), buffer=buffer, offset=offset)
+        view.flags.writeable = False
+        views[column] = view
+    return views
+
+
+def _fingerprint(df: pd.DataFrame, name: str, bound: dict) -> str:
+    """
+    Key a call by its input data and arguments.
+
+    Parameters:
+    - df (pd.DataFrame): The input.
+    - name (str): Indicator name.
+    - bound (dict): Arguments of the call, defaults included.
+
+    Returns:
+    - str: Hex digest of the input columns the indicator reads, the index
+      (time anchors read it), the name and the arguments.
+    """
+    columns = list(df.columns)
+    if name in _REGISTRY:
+        meta = indicator_metadata(name, **bound)
+        if meta["inputs"] is not None:
+            optional = [column for column in meta["optional_inputs"] if column in df.columns]
+            columns = meta["inputs"] + optional
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps([name, bound], sort_keys=True, default=str).encode())
+    sources = [("<index>", df.index.to_series())]
+    sources += [(column, df[column]) for column in columns]
+    for column, series in sources:
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biufcmM":
+            values = np.ascontiguousarray(series.to_numpy())
+        else:
+            values = pd.util.hash_pandas_object(series, index=False).to_numpy()
+        digest.update(f"{column}:{values.dtype.str}:{len(values)}".encode())
+        digest.update(values.view(np.uint8))
+    return digest.hexdigest()
+
+
+def _evict(directory: str, index: dict, max_bytes: int) -> None:
+    """
+    Unlink the least recently used entries until the cap is met.
+
+    Parameters:
+    - directory (str): The cache directory.
+    - index (dict): Key -> entry, updated in place.
+    - max_bytes (int): The cap of the total size.
+
+    Returns:
+    - None
+    """
+    total = sum(entry["nbytes"] for entry in index.values())
+    for key in sorted(index, key=lambda key: index[key]["last_used"]):
+        if total <= max_bytes:
+            break
+        entry = index.pop(key)
+        _unlink(entry["segment"])
+        total -= entry["nbytes"]
+
+
+def _publish(directory: str, index: dict, key: str, name: str, bound: dict, columns: dict):
+    """
+    Copy outputs into a new segment and add it to the index.
+
+    Parameters:
+    - directory (str): The cache directory.
+    - index (dict): Key -> entry, updated in place.
+    - key (str): Fingerprint of the call.
+    - name (str): Indicator name.
+    - bound (dict): Arguments of the call.
+    - columns (dict): Output name -> numeric values.
+
+    Returns:
+    - dict: The new entry.
+    """
+    layout = []
+    offset = 0
+    for column, values in columns.items():
+        layout.append([column, values.dtype.str, offset])
+        offset += -(-values.nbytes // _ALIGNMENT) * _ALIGNMENT
+    # Segment names are short (31 characters on macOS) and unique per directory
+    segment_name = "bta_" + hashlib.blake2b(
+        f"{directory}:{key}".encode(), digest_size=10
+    ).hexdigest()
+    _unlink(segment_name)  # Left over by an index written before a crash
+    segment = _segment(segment_name, create=True, size=max(offset, 1))
+    for (column, dtype, start), values in zip(layout, columns.values()):
+        target = np.ndarray(values.shape, dtype=values.dtype, buffer=segment.buf, offset=start)
+        target[:] = values
+    _ATTACHED[segment_name] = segment
+
+    entry = {
+        "segment": segment_name,
+        "indicator": name,
+        "params": json.loads(json.dumps(bound, default=str)),
+        "rows": len(next(iter(columns.values()))),
+        "columns": layout,
+        "nbytes": segment.size,
+        "last_used": time.time(),
+    }
+    index[key] = entry
+    return entry
+
+
+def compute(
+    df: pd.DataFrame,
+    indicator,
+    return_type: str = "frame",
+    directory=None,
+    max_bytes: int = _MAX_BYTES,
+    **params,
+):
+    """Compute an indicator through the shared-memory cache"""
+    _validate_return_type(return_type)
+    if params.get("state") is not None:
+        raise ValueError("stateful calls cannot be cached, do not pass a state")
+    func = _resolve_func(indicator)
+    name = _indicator_name(indicator)
+    params.pop("return_type", None)
+    bound = _bound_params(func, params)
+    bound.pop("return_type", None)
+    bound.pop("state", None)
+    directory = _directory(directory)
+    key = _fingerprint(df, name, bound)
+
+    with _locked(directory):
+        index = _read_index(directory)
+        entry = index.get(key)
+        views = None if entry is None else _views(entry)
+        if views is not None:
+            entry["last_used"] = time.time()
+            _write_index(directory, index)
+            return _build_result(views, df.index, return_type)
+
+    frame = _result_frame(func(df, **params), name)
+    columns = {column: _values(frame[column]) for column in frame.columns}
+    numeric = all(
+        isinstance(values, np.ndarray) and values.dtype.kind in "biuf"
+        for values in columns.values()
+    )
+    nbytes = sum(values.nbytes for values in columns.values())
+    if not columns or not numeric or nbytes > max_bytes:
+        return _build_result(columns, df.index, return_type)
+
+    with _locked(directory):
+        index = _read_index(directory)
+        entry = index.get(key)
+        # Another process may have published it meanwhile
+        views = None if entry is None else _views(entry)
+        if views is None:
+            index.pop(key, None)
+            _evict(directory, index, max_bytes - nbytes)
+            entry = _publish(directory, index, key, name, bound, columns)
+            views = _views(entry)
+        entry["last_used"] = time.time()
+        _write_index(directory, index)
+        _release(index)
+    return _build_result(views, df.index, return_type)
+
+
+compute.__doc__ = """
+Name:
+    Shared Cache Compute
+
+Description:
+    Computes an indicator through a cache in shared memory that all processes on the
+    host using the same cache directory share, without a daemon. Bots and hyperopt
+    workers that compute the same indicator on the same candles compute it once.
+
+    The call is keyed by a fingerprint of the input columns the indicator reads (every
+    column for indicators without metadata), its name and its arguments with the
+    defaults filled in. A hit attaches the shared memory segment of the result and
+    wraps read-only NumPy views of it, without copying or deserialising; with
+    return_type='dict' the views themselves are returned. A miss computes the result,
+    publishes it as a new segment and evicts the least recently used entries beyond
+    max_bytes. A lock file in the directory serialises the access to its index.
+
+    Results with non-numeric outputs, or larger than max_bytes, are computed and
+    returned without caching. Stateful calls (a state argument) are rejected.
+
+Parameters:
+    - df (pandas.DataFrame): Input DataFrame.
+    - indicator (str or callable): Indicator name in the bta namespace, or the function.
+    - return_type (str): Result container, 'frame' (pd.DataFrame, a copy of the
+      shared values), 'dict' (column name -> read-only np.ndarray view of shared
+      memory) or 'ndarray'. Default is 'frame'.
+    - directory (str or os.PathLike): Cache directory holding the index and its lock.
+      Processes share the cache when they use the same directory. Default is None,
+      'bamboo_ta_cache' in the temporary directory.
+    - max_bytes (int): Cap of the total size of the cached results. Default is 1 GiB.
+    - **params: Keyword arguments of the indicator.
+
+Call with:
+    from bamboo_ta import shared_cache
+    df['rsi'] = shared_cache.compute(df, "relative_strength_index", period=14)['rsi']
+    bands = shared_cache.compute(df, "bollinger_bands", return_type="dict", period=20)
+    df['bb_upper'] = bands['bb_upper']
+
+Returns:
+    pd.DataFrame, dict or np.ndarray: The outputs of the indicator, as for a call with
+    the given return_type.
+"""
+
+
+def info(directory=None) -> list:
+    """List the entries of the shared cache"""
+    directory = _directory(directory)
+    with _locked(directory):
+        index = _read_index(directory)
+    return sorted(
+        (
+            {
+                "indicator": entry["indicator"],
+                "params": entry["params"],
+                "rows": entry["rows"],
+                "columns": [column for column, _, _ in entry["columns"]],
+                "nbytes": entry["nbytes"],
+                "last_used": entry["last_used"],
+            }
+            for entry in index.values()
+        ),
+        key=lambda entry: -entry["last_used"],
+    )
+
+
+info.__doc__ = """
+Name:
+    Shared Cache Info
+
+Description:
+    Lists the results in the shared cache, most recently used first.
+
+Parameters:
+    - directory (str or os.PathLike): Cache directory. Default is None, the default
+      directory of compute.
+
+Call with:
+    from bamboo_ta import shared_cache
+    entries = shared_cache.info()
+    print(len(entries), sum(entry["nbytes"] for entry in entries))
+
+Returns:
+    list: Dicts with 'indicator', 'params', 'rows', 'columns', 'nbytes' and
+    'last_used' (Unix time).
+"""
+
+
+def clear(directory=None) -> int:
+    """Remove every result from the shared cache"""
+    directory = _directory(directory)
+    with _locked(directory):
+        index = _read_index(directory)
+        for entry in index.values():
+            _unlink(entry["segment"])
+        _write_index(directory, {})
+        _release({})
+    return len(index)
+
+
+clear.__doc__ = """
+Name:
+    Shared Cache Clear
+
+Description:
+    Unlinks the shared memory segments of all cached results and empties the index.
+    Processes that still hold views of them keep their mappings until they release
+    them.
+
+Parameters:
+    - directory (str or os.PathLike): Cache directory. Default is None, the default
+      directory of compute.
+
+Call with:
+    from bamboo_ta import shared_cache
+    shared_cache.clear()
+
+Returns:
+    int: Number of results removed.
+"""
@@ -1,3 +1,6 @@
 # -*- coding: utf-8 -*-
 # statistics/__init__.py
 
+from .rolling_beta import rolling_beta
+from .rolling_correlation import rolling_correlation
+from .rolling_covariance import rolling_covariance
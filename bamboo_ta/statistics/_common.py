@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+# _common.py
+
+"""
+Shared engine for the rolling cross-asset statistics.
+
+Rolling covariance, correlation and beta of any pair of columns follow from
+a handful of window sums: the number of joint observations, the sums and
+squared sums of both columns and the sum of their cross-product. The window
+sums are the compensated running sums of the performance analytics (see
+``performance._common._window_sum``), so a full pass costs O(n) per pair
+regardless of the window length, and all pairs of a panel are processed
+together as 2D array operations instead of one pandas ``rolling().corr()``
+call per pair.
+
+Variances follow from the difference of the squared sum and the squared sum
+of the values, which cancels on flat windows. Variances within the rounding
+error of that difference are taken as zero, so flat stretches give NaN
+correlations and betas as pandas does, instead of amplified noise.
+"""
+
+import numpy as np
+import pandas as pd
+
+from bamboo_ta.performance._common import _window_sum
+
+
+# Upper bound for the number of elements of the temporary (rows x pairs)
+# arrays, so hundreds of columns can be processed without running out of memory
+BLOCK_ELEMENTS = 4_000_000
+
+STATISTICS = ("covariance", "correlation", "beta")
+
+# Variances below this share of the mean squared (centred) value are rounding
+# noise of the window sums
+VARIANCE_TOLERANCE = 1e-10
+
+
+def _variance(square: np.ndarray, total: np.ndarray, count: np.ndarray, ddof: int):
+    """
+    Variance from window sums, with the cancellation noise set to zero.
+
+    Parameters:
+    - square (np.ndarray): Window sums of the squared values.
+    - total (np.ndarray): Window sums of the values.
+    - count (np.ndarray): Observations per window.
+    - ddof (int): Delta degrees of freedom.
+
+    Returns:
+    - np.ndarray: The variance, 0 where it is within the rounding error of
+      the squared sum.
+    """
+    variance = (square - total * total / count) / (count - ddof)
+    noise = VARIANCE_TOLERANCE * square / (count - ddof)
+    return np.where(variance > noise, variance, 0.0)
+
+
+def _resolve_panel(df: pd.DataFrame, columns, benchmark):
+    """
+    Extract the asset columns and the optional benchmark from the input.
+
+    Parameters:
+    - df (pandas.DataFrame): Panel with one column per asset.
+    - columns (list or None): Asset columns to use. Defaults to every numeric
+      column except the benchmark column.
+    - benchmark (str, pd.Series, array-like or None): Benchmark column name or
+      benchmark values aligned with df.
+
+    Returns:
+    - tuple: (names, values, benchmark_values) where values is an (n, k)
+      float64 array and benchmark_values an (n,) array or None.
+    """
+    benchmark_name = benchmark if isinstance(benchmark, str) else None
+
+    if columns is None:
+        columns = [
+            col
+            for col in df.select_dtypes(include="number").columns
+            if col != benchmark_name
+        ]
+    else:
+        columns = list(columns)
+        for col in columns:
+            if col not in df.columns:
+                raise KeyError(f"DataFrame must contain '{col}' column")
+        columns = [col for col in columns if col != benchmark_name]
+
+    if len(columns) == 0:
+        raise ValueError("At least one asset column is required")
+
+    values = df[columns].to_numpy(dtype=np.float64)
+
+    if benchmark is None:
+        benchmark_values = None
+    elif benchmark_name is not None:
+        if benchmark_name not in df.columns:
+            raise KeyError(f"DataFrame must contain '{benchmark_name}' column")
+        benchmark_values = df[benchmark_name].to_numpy(dtype=np.float64)
+    else:
+        if isinstance(benchmark, pd.Series):
+            benchmark = benchmark.reindex(df.index)
+        benchmark_values = np.asarray(benchmark, dtype=np.float64)
+        if benchmark_values.shape != (len(df),):
+            raise ValueError("Benchmark must have the same length as the DataFrame")
+
+    return columns, values, benchmark_values
+
+
+def _rolling_pair_statistic(
+    df: pd.DataFrame,
+    statistic: str,
+    window=30,
+    benchmark=None,
+    columns=None,
+    min_periods=None,
+    ddof: int = 1,
+    dtype=np.float64,
+) -> pd.DataFrame:
+    """
+    Rolling covariance, correlation or beta for a panel of columns.
+
+    Parameters:
+    - df (pandas.DataFrame): Panel with one column per asset.
+    - statistic (str): 'covariance', 'correlation' or 'beta'.
+    - window (int or None): Window length, None for expanding statistics.
+    - benchmark (str, pd.Series, array-like or None): With a benchmark every
+      column is compared to it; without one all column pairs are compared.
+    - columns (list or None): Asset columns to use.
+    - min_periods (int or None): Minimum number of joint observations.
+      Defaults to the window (2 for expanding statistics).
+    - ddof (int): Delta degrees of freedom of the (co)variances.
+    - dtype: Output dtype, e.g. np.float32 to halve the memory of the result.
+
+    Returns:
+    - pd.DataFrame: One column per asset (benchmark mode) or per pair with
+      ('asset', 'other') MultiIndex columns (pairwise mode).
+    """
+    if statistic not in STATISTICS:
+        raise ValueError(f"Invalid statistic: {statistic}. Use one of {STATISTICS}")
+    if window is not None and window < 2:
+        raise ValueError("Window must be at least 2 or None")
+    if min_periods is None:
+        min_periods = window if window is not None else 2
+    min_periods = max(int(min_periods), 2)
+
+    names, values, benchmark_values = _resolve_panel(df, columns, benchmark)
+    n, k = values.shape
+
+    if benchmark_values is not None:
+        # Every asset against the benchmark, which is appended as the last column
+        values = np.column_stack([values, benchmark_values])
+        left = np.arange(k)
+        right = np.full(k, k)
+    elif statistic == "covariance":
+        # Upper triangle including the variances on the diagonal
+        left, right = np.triu_indices(k)
+    elif statistic == "correlation":
+        left, right = np.triu_indices(k, 1)
+    else:
+        # Beta is not symmetric: regress every asset on every other asset
+        left, right = np.nonzero(~np.eye(k, dtype=bool))
+
+    # Centre every column on its mean so the window sums stay small
+    valid = ~np.isnan(values)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        centre = np.nan_to_num(np.nansum(values, axis=0) / valid.sum(axis=0))
+    x = np.where(valid, values - centre, 0.0)
+
+    # Without missing values the per-column sums are shared by all pairs
+    complete = bool(valid.all())
+    if complete:
+        count_all = _window_sum(np.ones((n, 1)), window)
+        sum_all = _window_sum(x, window)
+        square_all = _window_sum(x * x, window)
+
+    out = np.empty((n, len(left)), dtype=dtype)
+    block = max(1, BLOCK_ELEMENTS // max(n, 1))
+
+    for first in range(0, len(left), block):
+        i = left[first : first + block]
+        j = right[first : first + block]
+        xi = x[:, i]
+        xj = x[:, j]
+
+        if complete:
+            count = count_all
+            sum_i, sum_j = sum_all[:, i], sum_all[:, j]
+            square_i, square_j = square_all[:, i], square_all[:, j]
+        else:
+            # Pairwise complete observations
+            joint = valid[:, i] & valid[:, j]
+            xi = np.where(joint, xi, 0.0)
+            xj = np.where(joint, xj, 0.0)
+            count = _window_sum(joint.astype(np.float64), window)
+            sum_i, sum_j = _window_sum(xi, window), _window_sum(xj, window)
+            square_i, square_j = _window_sum(xi * xi, window), _window_sum(xj * xj, window)
+
+        cross = _window_sum(xi * xj, window)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            covariance = (cross - sum_i * sum_j / count) / (count - ddof)
+            if statistic == "covariance":
+                result = covariance
+            else:
+                variance_j = _variance(square_j, sum_j, count, ddof)
+                if statistic == "beta":
+                    result = np.where(variance_j > 0, covariance / variance_j, np.nan)
+                else:
+                    variance_i = _variance(square_i, sum_i, count, ddof)
+                    denominator = np.sqrt(variance_i * variance_j)
+                    result = np.where(
+                        denominator > 0,
+                        np.clip(covariance / denominator, -1.0, 1.0),
+                        np.nan,
+                    )
+
+        result = np.where(count >= min_periods, result, np.nan)
+        out[:, first : first + block] = result
+
+    if benchmark_values is not None:
+        return pd.DataFrame(out, index=df.index, columns=names)
+
+    names = np.asarray(names, dtype=object)
+    pairs = pd.MultiIndex.from_arrays([names[left], names[right]], names=["asset", "other"])
+    return pd.DataFrame(out, index=df.index, columns=pairs)
+
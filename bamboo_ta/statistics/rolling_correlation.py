@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# rolling_correlation.py
+
+import numpy as np
+import pandas as pd
+
+from bamboo_ta.statistics._common import _rolling_pair_statistic
+
+
+def rolling_correlation(
+    df: pd.DataFrame,
+    window: int = 30,
+    benchmark=None,
+    columns: list = None,
+    min_periods: int = None,
+    dtype=np.float64,
+) -> pd.DataFrame:
+    """Rolling Correlation of a panel of assets"""
+    return _rolling_pair_statistic(
+        df,
+        "correlation",
+        window=window,
+        benchmark=benchmark,
+        columns=columns,
+        min_periods=min_periods,
+        dtype=dtype,
+    )
+
+
+rolling_correlation.__doc__ = """
+Name:
+    Rolling Correlation
+
+Description:
+    Calculates the rolling Pearson correlation of every column of a panel
+    (e.g. the returns of hundreds of pairs) either against a benchmark, such
+    as BTC, or between all pairs of columns.
+
+    All correlations come from one pass over window sums of the columns,
+    their squares and their cross-products. Each window sum is a compensated
+    running sum, so the cost is O(n) per pair regardless of the window length,
+    and pairs are processed in blocks of 2D array operations instead of one
+    pandas rolling().corr() call per pair. Missing values are handled pairwise:
+    only rows where both columns are present count. Windows where a column is
+    flat (its variance is within rounding error of zero) give NaN.
+
+More info:
+    https://www.investopedia.com/terms/c/correlationcoefficient.asp
+
+    corr(a, b) = cov(a, b) / (std(a) * std(b))
+
+    Pairwise output only holds the pairs above the diagonal (k * (k - 1) / 2
+    columns for k assets). Use result.iloc[-1].unstack() to view the latest
+    window as a matrix.
+
+Parameters:
+    - df (pandas.DataFrame): Panel with one column per asset, typically returns
+      (e.g. prices.pct_change()) rather than prices.
+    - window (int): Number of rows per rolling window. None calculates
+      expanding statistics. Default is 30.
+    - benchmark (str, pandas.Series, array-like or None): Benchmark column name
+      (excluded from the assets) or benchmark values aligned with df. When
+      None, all pairs of columns are compared. Default is None.
+    - columns (list): Asset columns to use. Default is every numeric column.
+    - min_periods (int): Minimum number of joint (non-NaN) observations
+      required for a value. Defaults to the window (2 when expanding).
+    - dtype: Output dtype. np.float32 halves the memory of the result, which
+      matters for pairwise output on hundreds of columns. Default is np.float64.
+
+Call with:
+    returns = prices.pct_change()  # one column per pair
+    corr_btc = bta.rolling_correlation(returns, window=90, benchmark='BTC/USDT')
+    corr_pairs = bta.rolling_correlation(returns, window=90, dtype=np.float32)
+
+Returns:
+    pd.DataFrame: With a benchmark, one correlation column per asset. Without
+    a benchmark, one column per pair with ('asset', 'other') MultiIndex columns.
+"""
+
+
+def test():
+    """
+    Test function for the rolling_correlation function.
+
+    This function creates a panel of random daily returns for several
+    pairs that all partly follow a benchmark and calculates their correlations.
+
+    Returns:
+        None: Displays the results to the console
+    """
+    try:
+        # Daily returns of a benchmark and three pairs with a different exposure
+        np.random.seed(42)
+        dates = pd.date_range("2023-01-01", periods=500, freq="D")
+        btc = np.random.normal(0.001, 0.03, 500)
+        returns = pd.DataFrame(
+            {
+                "BTC": btc,
+                "ETH": 1.2 * btc + np.random.normal(0, 0.02, 500),
+                "SOL": 1.5 * btc + np.random.normal(0, 0.04, 500),
+                "XRP": 0.5 * btc + np.random.normal(0, 0.03, 500),
+            },
+            index=dates,
+        )
+
+        print("Rolling correlation against BTC (last 5 rows):")
+        print(rolling_correlation(returns, window=90, benchmark="BTC").tail())
+        print("\nPairwise correlations (last row):")
+        print(rolling_correlation(returns, window=90).iloc[-1].unstack())
+
+    except Exception as e:
+        print(f"Error during testing: {e}")
+
+
+# Execute the test if this file is run directly
+if __name__ == "__main__":
+    test()
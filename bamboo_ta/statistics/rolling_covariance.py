@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# rolling_covariance.py
+
+import numpy as np
+import pandas as pd
+
+from bamboo_ta.statistics._common import _rolling_pair_statistic
+
+
+def rolling_covariance(
+    df: pd.DataFrame,
+    window: int = 30,
+    benchmark=None,
+    columns: list = None,
+    min_periods: int = None,
+    ddof: int = 1,
+    dtype=np.float64,
+) -> pd.DataFrame:
+    """Rolling Covariance of a panel of assets"""
+    return _rolling_pair_statistic(
+        df,
+        "covariance",
+        window=window,
+        benchmark=benchmark,
+        columns=columns,
+        min_periods=min_periods,
+        ddof=ddof,
+        dtype=dtype,
+    )
+
+
+rolling_covariance.__doc__ = """
+Name:
+    Rolling Covariance
+
+Description:
+    Calculates the rolling covariance of every column of a panel either
+    against a benchmark or between all pairs of columns, including the
+    variance of every column.
+
+    All covariances come from one pass over window sums of the columns and
+    their cross-products. Each window sum is a compensated running sum, so the
+    cost is O(n) per pair regardless of the window length, and pairs are
+    processed in blocks of 2D array operations. Missing values are handled
+    pairwise: only rows where both columns are present count.
+
+More info:
+    https://www.investopedia.com/terms/c/covariance.asp
+
+    cov(a, b) = (sum(a * b) - sum(a) * sum(b) / n) / (n - ddof)
+
+    Pairwise output holds the upper triangle including the diagonal
+    (k * (k + 1) / 2 columns for k assets). Use result.iloc[-1].unstack() to
+    view the latest window as a matrix.
+
+Parameters:
+    - df (pandas.DataFrame): Panel with one column per asset, typically returns
+      (e.g. prices.pct_change()) rather than prices.
+    - window (int): Number of rows per rolling window. None calculates
+      expanding statistics. Default is 30.
+    - benchmark (str, pandas.Series, array-like or None): Benchmark column name
+      (excluded from the assets) or benchmark values aligned with df. When
+      None, all pairs of columns are compared. Default is None.
+    - columns (list): Asset columns to use. Default is every numeric column.
+    - min_periods (int): Minimum number of joint (non-NaN) observations
+      required for a value. Defaults to the window (2 when expanding).
+    - ddof (int): Delta degrees of freedom. Default is 1 (sample covariance).
+    - dtype: Output dtype. np.float32 halves the memory of the result, which
+      matters for pairwise output on hundreds of columns. Default is np.float64.
+
+Call with:
+    cov_btc = bta.rolling_covariance(returns, window=90, benchmark='BTC/USDT')
+    cov_matrix = bta.rolling_covariance(returns, window=90).iloc[-1].unstack()
+
+Returns:
+    pd.DataFrame: With a benchmark, one covariance column per asset. Without
+    a benchmark, one column per pair with ('asset', 'other') MultiIndex columns.
+"""
+
+
+def test():
+    """
+    Test function for the rolling_covariance function.
+
+    This function creates a panel of random daily returns for several
+    pairs that all partly follow a benchmark and calculates their covariances.
+
+    Returns:
+        None: Displays the results to the console
+    """
+    try:
+        # Daily returns of a benchmark and three pairs with a different exposure
+        np.random.seed(42)
+        dates = pd.date_range("2023-01-01", periods=500, freq="D")
+        btc = np.random.normal(0.001, 0.03, 500)
+        returns = pd.DataFrame(
+            {
+                "BTC": btc,
+                "ETH": 1.2 * btc + np.random.normal(0, 0.02, 500),
+                "SOL": 1.5 * btc + np.random.normal(0, 0.04, 500),
+                "XRP": 0.5 * btc + np.random.normal(0, 0.03, 500),
+            },
+            index=dates,
+        )
+
+        print("Rolling covariance against BTC (last 5 rows):")
+        print(rolling_covariance(returns, window=90, benchmark="BTC").tail())
+        print("\nPairwise covariances (last row):")
+        print(rolling_covariance(returns, window=90).iloc[-1].unstack())
+
+    except Exception as e:
+        print(f"Error during testing: {e}")
+
+
+# Execute the test if this file is run directly
+if __name__ == "__main__":
+    test()
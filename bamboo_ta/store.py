@@ -0,0 +1,480 @@
+# -*- coding: utf-8 -*-
+# store.py
+
+"""
+Append-only local store of computed indicator outputs.
+
+Strategies compute the same indicator columns for the same pairs every day.
+The store keeps them on disk, one entry per (pair, timeframe, indicator,
+parameters), so a backtest loads them instead of recomputing them:
+
+    root/BTC_USDT/1h/relative_strength_index/<parameters hash>/
+        _meta.json           pair, timeframe, indicator, parameters, columns
+        part-000000.parquet  the rows of the first update
+        part-000001.parquet  the rows appended by the next one
+        _state.pkl           the carried state of a stateful indicator
+
+``update`` appends only the rows of the input that are newer than the last
+stored timestamp, and computes them with the continuation the indicator
+needs:
+
+- Indicators that take a ``state`` argument (the moving averages, RSI,
+  MACD, Bollinger Bands, (A)TR, Supertrend and PSAR) resume from the state
+  stored with the entry and only run on the new rows. The stored values are
+  those of a single call on the whole history.
+- Windowed indicators run on the new rows and the ``warmup`` rows before
+  them, taken from their metadata (see ``metadata``).
+- Other recursive indicators are recomputed on the whole input, which must
+  then hold the whole history, unless a ``warmup`` is given.
+
+``read`` loads an entry memory-mapped, with only the requested columns and
+the rows between two timestamps (the Parquet statistics skip the other row
+groups). Needs pyarrow.
+
+Call with:
+    from bamboo_ta import store
+    store.update("features", df, "BTC/USDT", "1h", "relative_strength_index", period=14)
+    rsi = store.read("features", "BTC/USDT", "1h", "relative_strength_index",
+                     start="2024-01-01", period=14)
+"""
+
+import hashlib
+import json
+import os
+import pickle
+
+import pandas as pd
+
+from bamboo_ta.chunked import _accepts_state, _declared_warmup
+from bamboo_ta.executor import _resolve_func
+from bamboo_ta.metadata import _bound_params, _indicator_name
+
+_META_FILE = "_meta.json"
+_STATE_FILE = "_state.pkl"
+# Rows per Parquet row group, the unit a time range read can skip
+_ROW_GROUP_SIZE = 65_536
+
+
+def _entry_path(root, pair: str, timeframe: str, name: str, params: dict) -> str:
+    """
+    Get the directory of a store entry.
+
+    Parameters:
+    - root (str or os.PathLike): Root directory of the store.
+    - pair (str): Pair, e.g. 'BTC/USDT'.
+    - timeframe (str): Timeframe, e.g. '1h'.
+    - name (str): Indicator name.
+    - params (dict): Arguments of the call, defaults included.
+
+    Returns:
+    - str: The directory, named after a hash of the parameters.
+    """
+    pair_dir = pair.replace("/", "_").replace(":", "_")
+    key = json.dumps(params, sort_keys=True, default=str)
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return os.path.join(os.fspath(root), pair_dir, timeframe, name, digest)
+
+
+def _entry_params(func, name: str, params: dict) -> dict:
+    """
+    Complete the arguments of an entry with the defaults of the indicator.
+
+    Parameters:
+    - func (Callable): The indicator.
+    - name (str): Its name, for error messages.
+    - params (dict): Keyword arguments of the call.
+
+    Returns:
+    - dict: Parameter name -> value, without the carried state.
+    """
+    if "state" in params:
+        raise ValueError("the store keeps the state of an entry itself, do not pass one")
+    if params.get("return_type", "frame") != "frame":
+        raise ValueError(f"the store needs the frame result of {name}")
+    bound = _bound_params(func, params)
+    bound.pop("state", None)
+    return bound
+
+
+def _parts(entry: str) -> list:
+    """
+    List the Parquet parts of an entry.
+
+    Parameters:
+    - entry (str): Directory of the entry.
+
+    Returns:
+    - list: Part file names, in the order they were written.
+    """
+    if not os.path.isdir(entry):
+        return []
+    return sorted(
+        name
+        for name in os.listdir(entry)
+        if name.startswith("part-") and name.endswith(".parquet")
+    )
+
+
+def _read_meta(entry: str):
+    """
+    Read the description of an entry.
+
+    Parameters:
+    - entry (str): Directory of the entry.
+
+    Returns:
+    - dict or None: The description, None for a new entry.
+    """
+    path = os.path.join(entry, _META_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _replace(path: str, write) -> None:
+    """
+    Write a file atomically through a temporary file in the same directory.
+
+    Parameters:
+    - path (str): Target path.
+    - write (Callable): Writes the content to the path it is given.
+
+    Returns:
+    - None
+    """
+    directory, name = os.path.split(path)
+    temporary = os.path.join(directory, f".{name}.tmp")
+    write(temporary)
+    os.replace(temporary, path)
+
+
+def _result_frame(result, name: str) -> pd.DataFrame:
+    """
+    Get the outputs of an indicator as a frame.
+
+    Parameters:
+    - result (pd.DataFrame or pd.Series): What the indicator returned.
+    - name (str): Indicator name, the column of an unnamed Series.
+
+    Returns:
+    - pd.DataFrame: The outputs.
+    """
+    if isinstance(result, pd.Series):
+        return result.to_frame(result.name if result.name is not None else name)
+    if not isinstance(result, pd.DataFrame):
+        raise TypeError(
+            f"the store needs a DataFrame or Series result, {name} returned "
+            f"{type(result).__name__}"
+        )
+    return result
+
+
+def _continuation(func, df, first_new, stored_rows, state, warmup, params, name):
+    """
+    Compute the outputs of the new rows.
+
+    Parameters:
+    - func (Callable): The indicator.
+    - df (pd.DataFrame): The input.
+    - first_new (int): Position of the first row to append.
+    - stored_rows (int): Rows already stored.
+    - state (dict or None): Carried state of a stateful indicator.
+    - warmup (int or None): Rows of look-back before the new rows, None for
+      the whole input.
+    - params (dict): Keyword arguments of the indicator.
+    - name (str): Indicator name, for error messages.
+
+    Returns:
+    - pd.DataFrame or pd.Series: The outputs of the rows from ``first_new``.
+    """
+    if state is not None:
+        return func(df.iloc[first_new:], state=state, **params)
+
+    if warmup is None:
+        if first_new != stored_rows:
+            raise ValueError(
+                f"{name} is recursive: pass the whole history ({stored_rows} stored "
+                f"rows, df has {first_new} before the new ones) or a warmup"
+            )
+        start = 0
+    else:
+        if first_new < min(warmup, stored_rows):
+            raise ValueError(
+                f"{name} needs {min(warmup, stored_rows)} rows before the new ones, "
+                f"df has {first_new}"
+            )
+        start = max(first_new - warmup, 0)
+    result = func(df.iloc[start:], **params)
+    return result.iloc[first_new - start :]
+
+
+def _dump_state(state: dict, path: str) -> None:
+    """
+    Write the carried state of an entry.
+
+    Parameters:
+    - state (dict): The state.
+    - path (str): Target file.
+
+    Returns:
+    - None
+    """
+    with open(path, "wb") as handle:
+        pickle.dump(state, handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _dump_meta(meta: dict, path: str) -> None:
+    """
+    Write the description of an entry.
+
+    Parameters:
+    - meta (dict): The description.
+    - path (str): Target file.
+
+    Returns:
+    - None
+    """
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(meta, handle, indent=1, default=str)
+
+
+def update(
+    root,
+    df: pd.DataFrame,
+    pair: str,
+    timeframe: str,
+    indicator,
+    time_column: str = "date",
+    warmup: int = None,
+    **params,
+) -> int:
+    """Append the outputs of the new rows of df to a store entry"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    func = _resolve_func(indicator)
+    name = _indicator_name(indicator)
+    bound = _entry_params(func, name, params)
+    entry = _entry_path(root, pair, timeframe, name, bound)
+    meta = _read_meta(entry)
+    parts = _parts(entry)
+    times = df[time_column]
+    if meta is not None and meta["time_column"] != time_column:
+        raise ValueError(
+            f"the entry is indexed by {meta['time_column']!r}, not {time_column!r}"
+        )
+
+    stored_rows = 0 if meta is None else meta["rows"]
+    first_new = 0
+    if parts:
+        last = pq.read_table(
+            os.path.join(entry, parts[-1]), columns=[time_column], memory_map=True
+        ).column(0)
+        last = last[len(last) - 1].as_py()
+        first_new = int(times.searchsorted(last, side="right"))
+    if first_new >= len(df):
+        return 0
+
+    state_path = os.path.join(entry, _STATE_FILE)
+    state = None
+    if warmup is None and _accepts_state(func):
+        if parts and not os.path.exists(state_path):
+            raise ValueError(f"no state stored for this {name} entry, pass a warmup")
+        state = {}
+        if parts:
+            with open(state_path, "rb") as handle:
+                state = pickle.load(handle)
+    elif warmup is None:
+        warmup = _declared_warmup(func, params)
+
+    result = _continuation(func, df, first_new, stored_rows, state, warmup, params, name)
+    outputs = _result_frame(result, name)
+    frame = pd.DataFrame({time_column: times.iloc[first_new:].to_numpy()})
+    for column in outputs.columns:
+        frame[column] = outputs[column].to_numpy()
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+
+    os.makedirs(entry, exist_ok=True)
+    part = os.path.join(entry, f"part-{len(parts):06d}.parquet")
+    _replace(
+        part, lambda path: pq.write_table(table, path, row_group_size=_ROW_GROUP_SIZE)
+    )
+    if state is not None:
+        _replace(state_path, lambda path: _dump_state(state, path))
+    elif os.path.exists(state_path):
+        # Rows computed without the state leave it behind
+        os.remove(state_path)
+
+    meta = {
+        "pair": pair,
+        "timeframe": timeframe,
+        "indicator": name,
+        "params": bound,
+        "time_column": time_column,
+        "columns": list(outputs.columns),
+        "rows": stored_rows + len(frame),
+    }
+    _replace(os.path.join(entry, _META_FILE), lambda path: _dump_meta(meta, path))
+    return len(frame)
+
+
+update.__doc__ = """
+Name:
+    Store Update
+
+Description:
+    Appends the outputs of an indicator for the rows of df newer than the last stored
+    timestamp to the store entry of (pair, timeframe, indicator, parameters), and
+    creates the entry on the first call. The rows are written as a new Parquet part,
+    so earlier rows are never rewritten.
+
+    Stateful indicators resume from the state stored with the entry and only run on
+    the new rows. Windowed indicators run on the new rows and the rows of their
+    warm-up (see indicator_metadata). Other recursive indicators are recomputed on df,
+    which must then hold the whole history, unless a warmup is given. Needs pyarrow.
+
+Parameters:
+    - root (str or os.PathLike): Root directory of the store.
+    - df (pd.DataFrame): The input, sorted by time_column. Rows up to the last stored
+      timestamp are only used as warm-up.
+    - pair (str): Pair, e.g. 'BTC/USDT'.
+    - timeframe (str): Timeframe, e.g. '1h'.
+    - indicator (str or callable): Indicator name in the bta namespace, or the function.
+    - time_column (str): Column of the timestamps. Default is 'date'.
+    - warmup (int): Rows of look-back before the new rows, instead of the stored state
+      or the declared warm-up. Default is None.
+    - **params: Keyword arguments of the indicator. Entries with other arguments are
+      stored separately.
+
+Call with:
+    from bamboo_ta import store
+    store.update("features", df, "BTC/USDT", "1h", "bollinger_bands", period=20)
+    store.update("features", df, "BTC/USDT", "1h", "keltner_channel", warmup=500)
+
+Returns:
+    int: Number of rows appended.
+"""
+
+
+def _bound(value, entry: str, time_column: str):
+    """
+    Convert a range bound to the type of the time column.
+
+    Parameters:
+    - value: Timestamp, date string or number.
+    - entry (str): Directory of the entry.
+    - time_column (str): Column of the timestamps.
+
+    Returns:
+    - The bound, a pd.Timestamp for a timestamp column.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    field = pq.read_schema(os.path.join(entry, _parts(entry)[0])).field(time_column)
+    if pa.types.is_timestamp(field.type):
+        value = pd.Timestamp(value)
+        if field.type.tz is not None and value.tzinfo is None:
+            value = value.tz_localize(field.type.tz)
+    return value
+
+
+def read(
+    root,
+    pair: str,
+    timeframe: str,
+    indicator,
+    columns: list = None,
+    start=None,
+    end=None,
+    **params,
+) -> pd.DataFrame:
+    """Load stored indicator outputs"""
+    import pyarrow.parquet as pq
+
+    func = _resolve_func(indicator)
+    name = _indicator_name(indicator)
+    entry = _entry_path(root, pair, timeframe, name, _entry_params(func, name, params))
+    meta = _read_meta(entry)
+    if meta is None or not _parts(entry):
+        raise FileNotFoundError(
+            f"no stored {name} for {pair} {timeframe} with these arguments"
+        )
+
+    time_column = meta["time_column"]
+    filters = []
+    if start is not None:
+        filters.append((time_column, ">=", _bound(start, entry, time_column)))
+    if end is not None:
+        filters.append((time_column, "<=", _bound(end, entry, time_column)))
+    selected = [time_column] + list(meta["columns"] if columns is None else columns)
+    table = pq.read_table(
+        entry, columns=selected, filters=filters or None, memory_map=True
+    )
+    return table.to_pandas()
+
+
+read.__doc__ = """
+Name:
+    Store Read
+
+Description:
+    Loads the stored outputs of an indicator for a pair and timeframe. The Parquet
+    parts are memory-mapped, only the requested columns are read, and with start or
+    end only the rows in that time range (row groups outside it are skipped from
+    their statistics). Needs pyarrow.
+
+Parameters:
+    - root (str or os.PathLike): Root directory of the store.
+    - pair (str): Pair, e.g. 'BTC/USDT'.
+    - timeframe (str): Timeframe, e.g. '1h'.
+    - indicator (str or callable): Indicator name in the bta namespace, or the function.
+    - columns (list): Output columns to load. Default is None (all).
+    - start: First timestamp to load, inclusive (a timestamp, a date string, or a
+      number for numeric time columns). Default is None.
+    - end: Last timestamp to load, inclusive. Default is None.
+    - **params: Keyword arguments the outputs were computed with.
+
+Call with:
+    from bamboo_ta import store
+    bb = store.read("features", "BTC/USDT", "1h", "bollinger_bands",
+                    columns=["bb_upper", "bb_lower"], start="2024-01-01", period=20)
+    df = df.merge(bb, on="date", how="left")
+
+Returns:
+    pd.DataFrame: The time column followed by the output columns, one row per stored
+    row in the range.
+"""
+
+
+def entries(root) -> list:
+    """List the entries of a store"""
+    found = []
+    for directory, _, files in os.walk(os.fspath(root)):
+        if _META_FILE in files:
+            found.append(_read_meta(directory))
+    found.sort(key=lambda meta: (meta["pair"], meta["timeframe"], meta["indicator"]))
+    return found
+
+
+entries.__doc__ = """
+Name:
+    Store Entries
+
+Description:
+    Lists what a store holds: one description per (pair, timeframe, indicator,
+    parameters) entry.
+
+Parameters:
+    - root (str or os.PathLike): Root directory of the store.
+
+Call with:
+    from bamboo_ta import store
+    for entry in store.entries("features"):
+        print(entry["pair"], entry["indicator"], entry["params"], entry["rows"])
+
+Returns:
+    list: Dicts with 'pair', 'timeframe', 'indicator', 'params', 'time_column',
+    'columns' and 'rows'.
+"""
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # breakouts.py
-import numpy as np
 import pandas as pd
 
 
@@ -23,48 +22,38 @@ def breakouts(df: pd.DataFrame, length: int = 20) -> pd.DataFrame:
     ph = high.rolling(window=length * 2 + 1).max()
 
     # Calculate locations for support and resistance
-    s_yLoc = low.shift(length + 1).where(
-        low.shift(length + 1) > low.shift(length - 1), low.shift(length - 1)
-    )
-    r_yLoc = high.shift(length + 1).where(
-        high.shift(length + 1) > high.shift(length - 1), high.shift(length + 1)
-    )
+    low_before, low_after = low.shift(length + 1), low.shift(length - 1)
+    high_before, high_after = high.shift(length + 1), high.shift(length - 1)
+    s_yLoc = low_before.where(low_before > low_after, low_after)
+    r_yLoc = high_before.where(high_before > high_after, high_before)
+
+    # Levels as of length bars ago, shifted once and shared by the conditions
+    s_loc = s_yLoc.shift(length)
+    r_loc = r_yLoc.shift(length)
+    pl_prev = pl.shift(length)
+    ph_prev = ph.shift(length)
 
     # Determine breakouts
-    cu = close < s_yLoc.shift(length)
-    co = close > r_yLoc.shift(length)
+    cu = close < s_loc
+    co = close > r_loc
 
     # Calculate retest conditions for support
-    s1 = (high >= s_yLoc.shift(length)) & (close <= pl.shift(length))
-    s2 = (
-        (high >= s_yLoc.shift(length))
-        & (close >= pl.shift(length))
-        & (close <= s_yLoc.shift(length))
-    )
-    s3 = (high >= pl.shift(length)) & (high <= s_yLoc.shift(length))
-    s4 = (
-        (high >= pl.shift(length))
-        & (high <= s_yLoc.shift(length))
-        & (close < pl.shift(length))
-    )
+    s1 = (high >= s_loc) & (close <= pl_prev)
+    s2 = (high >= s_loc) & (close >= pl_prev) & (close <= s_loc)
+    s3 = (high >= pl_prev) & (high <= s_loc)
+    s4 = (high >= pl_prev) & (high <= s_loc) & (close < pl_prev)
 
     # Calculate retest conditions for resistance
-    r1 = (low <= r_yLoc.shift(length)) & (close >= ph.shift(length))
-    r2 = (
-        (low <= r_yLoc.shift(length))
-        & (close <= ph.shift(length))
-        & (close >= r_yLoc.shift(length))
-    )
-    r3 = (low <= ph.shift(length)) & (low >= r_yLoc.shift(length))
-    r4 = (
-        (low <= ph.shift(length))
-        & (low >= r_yLoc.shift(length))
-        & (close > ph.shift(length))
-    )
+    r1 = (low <= r_loc) & (close >= ph_prev)
+    r2 = (low <= r_loc) & (close <= ph_prev) & (close >= r_loc)
+    r3 = (low <= ph_prev) & (low >= r_loc)
+    r4 = (low <= ph_prev) & (low >= r_loc) & (close > ph_prev)
 
     # Calculate support and resistance levels
-    df_copy["support_level"] = pl.diff().where(pl.diff().notna())
-    df_copy["resistance_level"] = ph.diff().where(ph.diff().notna())
+    pl_change = pl.diff()
+    ph_change = ph.diff()
+    df_copy["support_level"] = pl_change.where(pl_change.notna())
+    df_copy["resistance_level"] = ph_change.where(ph_change.notna())
 
     df_copy["support_level"] = df_copy["support_level"].combine_first(
         df_copy["support_level"].shift()
@@ -4,6 +4,8 @@
 import pandas as pd
 import numpy as np
 
+from bamboo_ta.events import _flag_events
+
 
 def cross_signals(
     df: pd.DataFrame,
@@ -13,7 +15,8 @@ def cross_signals(
     above: bool = True,
     long: bool = True,
     as_bool: bool = False,
-    trade_offset: int = 0
+    trade_offset: int = 0,
+    events: bool = False
 ) -> pd.DataFrame:
     """Cross Signals Indicator"""
     df_copy = df.copy()
@@ -114,6 +117,12 @@ def cross_signals(
         # Remove temporary column
         result = result.drop(trend_col, axis=1, errors='ignore')
         
+        if events:
+            return {
+                "cross_entries": _flag_events(result["cross_entries"]),
+                "cross_exits": _flag_events(result["cross_exits"]),
+            }
+        
         return result[["cross_trend", "cross_trades", "cross_entries", "cross_exits", "cross_long", "cross_short"]]
         
     except ImportError:
@@ -147,6 +156,12 @@ def cross_signals(
         # Remove temporary column
         df_copy = df_copy.drop(trend_col, axis=1, errors='ignore')
         
+        if events:
+            return {
+                "cross_entries": _flag_events(entries),
+                "cross_exits": _flag_events(exits),
+            }
+        
         return df_copy[["cross_trend", "cross_trades", "cross_entries", "cross_exits", "cross_long", "cross_short"]]
 
 
@@ -187,6 +202,9 @@ Parameters:
       Default is False.
     - trade_offset (int): Value used to shift the trade entries/exits. Use 1 for backtesting
       and 0 for live trading. Default is 0.
+    - events (bool): Return only the entries and exits, as sparse events: a dict
+      {'cross_entries': ..., 'cross_exits': ...} of {'positions': sorted int32 row
+      positions, 'values': None} (see bta.densify_events). Default is False.
 
 Call with:
     # Example for RSI crossing above 30 (entry) and below 70 (exit)
@@ -1,21 +1,28 @@
 # -*- coding: utf-8 -*-
 # exponential_moving_average.py
+from typing import List, Union
+
 import pandas as pd
 
+from bamboo_ta import core
+from bamboo_ta._results import _build_result, _source_values, _wide_columns
+
 
 def exponential_moving_average(
-    df: pd.DataFrame, column: str = "close", period: int = 21
+    df: pd.DataFrame,
+    column: Union[str, List[str]] = "close",
+    period: int = 21,
+    dtype=None,
+    state: dict = None,
+    return_type: str = "frame"
 ) -> pd.DataFrame:
     """Exponential Moving Average (EMA)"""
-    df_copy = df.copy()
-
-    # Calculate Exponential Moving Average
-    df_copy["ema"] = df_copy[column].ewm(span=period, adjust=False).mean()
-
-    # Set first `period - 1` values to NaN using `.loc[]` to avoid chained assignment warning
-    df_copy.loc[: period - 1, "ema"] = pd.NA
+    # The first `period` values are NaN
+    ema = core.exponential_moving_average(
+        _source_values(df, column), period, dtype=dtype, state=state
+    )
 
-    return df_copy[["ema"]]
+    return _build_result(_wide_columns({"ema": ema}, column), df.index, return_type)
 
 
 exponential_moving_average.__doc__ = """
@@ -31,8 +38,16 @@ More info:
 
 Parameters:
     - df (pandas.DataFrame): Input DataFrame which should contain at least the column specified.
-    - column (str): The column on which EMA is to be calculated. Default is 'close'.
+    - column (str or list): The column on which EMA is to be calculated. Default is 'close'.
+      A list of columns is computed in one pass, with the outputs named 'ema_<column>'.
     - period (int): The period over which EMA is to be calculated. Default is 21.
+    - dtype (np.dtype): Computation precision, np.float64 or np.float32. Default is None,
+      which uses the global setting (see bta.core.set_default_dtype).
+    - state (dict): State carried between calls on consecutive chunks of one series,
+      which then give the values of a single call (see bta.run_chunked). Single column
+      only. Default is None.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
 
 Call with:
     df['ema'] = bta.exponential_moving_average(df, "close", 21)['ema']
@@ -4,6 +4,12 @@ import numpy as np
 import pandas as pd
 import math
 
+from bamboo_ta._outputs import _flag_dtype, _labels
+from bamboo_ta._results import _build_result
+from bamboo_ta.events import _flag_events, _value_events
+
+FRAMA_COLORS = ["neutral", "up", "down"]
+
 
 def frama_channel(
     df: pd.DataFrame,
@@ -13,12 +19,12 @@ def frama_channel(
     smoothing: int = 5,
     color_candles: bool = True,
     signals_data: str = "Price",  # "Price" or "Average Volume"
-    debug: bool = False
+    debug: bool = False,
+    return_type: str = "frame",
+    events: bool = False
 ) -> pd.DataFrame:
     """FRAMA Channel"""
     
-    df_copy = df.copy()
-    
     # Ensure the DataFrame contains the required columns
     required_columns = ["open", "high", "low", "close"]
     if signals_data == "Average Volume" and "volume" not in df.columns:
@@ -34,10 +40,10 @@ def frama_channel(
         N = N + 1
     
     # Source price (hl2 equivalent)
-    price = (df_copy['high'] + df_copy['low']) / 2
+    price = (df['high'] + df['low']) / 2
     
     # Calculate volatility using SMA of (high - low)
-    volatility = (df_copy['high'] - df_copy['low']).rolling(window=volatility_period).mean()
+    volatility = (df['high'] - df['low']).rolling(window=volatility_period).mean()
     
     # Initialize FRAMA calculation
     frama_raw = []
@@ -46,7 +52,7 @@ def frama_channel(
     if debug:
         debug_info = []
     
-    for i in range(len(df_copy)):
+    for i in range(len(df)):
         current_price = price.iloc[i]
         
         if i == 0:
@@ -62,8 +68,8 @@ def frama_channel(
         else:
             # Full FRAMA calculation for bars >= N
             window_start = i - N + 1
-            highs = df_copy['high'].iloc[window_start:i+1].values
-            lows = df_copy['low'].iloc[window_start:i+1].values
+            highs = df['high'].iloc[window_start:i+1].values
+            lows = df['low'].iloc[window_start:i+1].values
             
             # Calculate N3 (price range over entire period divided by N)
             highest_high = np.max(highs)
@@ -113,7 +119,7 @@ def frama_channel(
             frama_val = alpha * current_price + (1 - alpha) * prev_frama
             
             # Store debug info for key periods
-            if debug and i >= len(df_copy) - 5:  # Last 5 values
+            if debug and i >= len(df) - 5:  # Last 5 values
                 debug_info.append({
                     'index': i,
                     'bar_index': i,
@@ -130,19 +136,19 @@ def frama_channel(
         frama_raw.append(frama_val)
     
     # Convert to pandas Series
-    frama_raw_series = pd.Series(frama_raw, index=df_copy.index)
+    frama_raw_series = pd.Series(frama_raw, index=df.index)
     
     # Apply Pine Script smoothing logic:
     # ta.sma((bar_index < N + 1) ? price : Filt, 5)
     pre_smooth_series = []
-    for i in range(len(df_copy)):
+    for i in range(len(df)):
         if i < N + 1:  # bar_index < N + 1
             pre_smooth_series.append(price.iloc[i])
         else:
             pre_smooth_series.append(frama_raw_series.iloc[i])
     
     # Apply SMA(5)
-    pre_smooth = pd.Series(pre_smooth_series, index=df_copy.index)
+    pre_smooth = pd.Series(pre_smooth_series, index=df.index)
     frama_final = pre_smooth.rolling(window=smoothing, min_periods=1).mean()
     
     # Calculate channel bands
@@ -150,27 +156,27 @@ def frama_channel(
     lower_band = frama_final - volatility * distance
     
     # Calculate signals data based on user choice
-    if signals_data == "Average Volume" and "volume" in df_copy.columns:
-        signal_values = df_copy['volume'].rolling(window=10).mean()
+    if signals_data == "Average Volume" and "volume" in df.columns:
+        signal_values = df['volume'].rolling(window=10).mean()
     else:
-        signal_values = df_copy['close']
+        signal_values = df['close']
     
     # Calculate hlc3 for breakout detection
-    hlc3 = (df_copy['high'] + df_copy['low'] + df_copy['close']) / 3
+    hlc3 = (df['high'] + df['low'] + df['close']) / 3
     
     # Breakout conditions
     break_up = (hlc3 > upper_band) & (hlc3.shift(1) <= upper_band.shift(1))
     break_down = (hlc3 < lower_band) & (hlc3.shift(1) >= lower_band.shift(1))
     
     # Cross detection for neutral state
-    close_cross_frama = ((df_copy['close'] > frama_final) & (df_copy['close'].shift(1) <= frama_final.shift(1))) | \
-                       ((df_copy['close'] < frama_final) & (df_copy['close'].shift(1) >= frama_final.shift(1)))
+    close_cross_frama = ((df['close'] > frama_final) & (df['close'].shift(1) <= frama_final.shift(1))) | \
+                       ((df['close'] < frama_final) & (df['close'].shift(1) >= frama_final.shift(1)))
     
     # Color logic
-    color_state = pd.Series(index=df_copy.index, dtype='object')
+    color_state = pd.Series(index=df.index, dtype='object')
     color_state[:] = 'neutral'
     
-    for i in range(len(df_copy)):
+    for i in range(len(df)):
         if i == 0:
             color_state.iloc[i] = 'neutral'
         else:
@@ -185,15 +191,15 @@ def frama_channel(
                 color_state.iloc[i] = 'down'
     
     # Signal labels with counting logic
-    signal_up = pd.Series(0, index=df_copy.index)
-    signal_down = pd.Series(0, index=df_copy.index)
-    signal_up_value = pd.Series(np.nan, index=df_copy.index)
-    signal_down_value = pd.Series(np.nan, index=df_copy.index)
+    signal_up = pd.Series(0, index=df.index)
+    signal_down = pd.Series(0, index=df.index)
+    signal_up_value = pd.Series(np.nan, index=df.index)
+    signal_down_value = pd.Series(np.nan, index=df.index)
     
     count1 = 0
     count2 = 0
     
-    for i in range(len(df_copy)):
+    for i in range(len(df)):
         if break_up.iloc[i]:
             count2 = 0
             count1 += 1
@@ -230,28 +236,38 @@ def frama_channel(
             print(f"Index {i}: Raw FRAMA={frama_raw_series.iloc[i]:.2f}, "
                   f"Final FRAMA={frama_final.iloc[i]:.2f}")
     
+    if events:
+        return {
+            'frama_signal_up': _flag_events(signal_up),
+            'frama_signal_down': _flag_events(signal_down),
+            'frama_signal_up_value': _value_events(signal_up, signal_up_value),
+            'frama_signal_down_value': _value_events(signal_down, signal_down_value),
+        }
+    
     # Create result DataFrame
-    result = pd.DataFrame(index=df_copy.index)
-    result['frama'] = frama_final
-    result['frama_upper'] = upper_band
-    result['frama_lower'] = lower_band
-    result['frama_volatility'] = volatility
-    result['frama_breakout_up'] = break_up.astype(int)
-    result['frama_breakout_down'] = break_down.astype(int)
-    result['frama_signal_up'] = signal_up
-    result['frama_signal_down'] = signal_down
-    result['frama_signal_up_value'] = signal_up_value
-    result['frama_signal_down_value'] = signal_down_value
-    result['frama_color'] = color_state
-    result['frama_raw'] = frama_raw_series
-    result['frama_pre_smooth'] = pre_smooth
-    result['hlc3'] = hlc3
-    result['close_cross_frama'] = close_cross_frama.astype(int)
+    color_state = _labels(color_state, FRAMA_COLORS)
+    columns = {
+        'frama': frama_final,
+        'frama_upper': upper_band,
+        'frama_lower': lower_band,
+        'frama_volatility': volatility,
+        'frama_breakout_up': break_up.astype(_flag_dtype()),
+        'frama_breakout_down': break_down.astype(_flag_dtype()),
+        'frama_signal_up': signal_up.astype(_flag_dtype()),
+        'frama_signal_down': signal_down.astype(_flag_dtype()),
+        'frama_signal_up_value': signal_up_value,
+        'frama_signal_down_value': signal_down_value,
+        'frama_color': color_state,
+        'frama_raw': frama_raw_series,
+        'frama_pre_smooth': pre_smooth,
+        'hlc3': hlc3,
+        'close_cross_frama': close_cross_frama.astype(_flag_dtype()),
+    }
     
     if color_candles:
-        result['candle_color'] = color_state
+        columns['candle_color'] = color_state
     
-    return result
+    return _build_result(columns, df.index, return_type)
 
 
 frama_channel.__doc__ = """
@@ -294,6 +310,13 @@ Parameters:
     - color_candles (bool): Whether to include candle coloring information. Default is True.
     - signals_data (str): Display "Price" or "Average Volume" in signals. Default is "Price".
     - debug (bool): If True, prints detailed calculation information. Default is False.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
+    - events (bool): Return only the signals, as sparse events: a dict of
+      {'positions': sorted int32 row positions, 'values': ...} for the flags
+      'frama_signal_up' and 'frama_signal_down' (values None) and for
+      'frama_signal_up_value' and 'frama_signal_down_value' (the signal values), so
+      bta.densify_events gives the same columns as the dense output. Default is False.
 
 Call with:
     frama_result = bta.frama_channel(df, length=26, distance=1.5, signals_data="Price")
@@ -3,6 +3,8 @@
 import numpy as np
 import pandas as pd
 
+from bamboo_ta._results import _build_result
+
 
 def gaussian_channel(
     df: pd.DataFrame,
@@ -11,12 +13,11 @@ def gaussian_channel(
     period: int = 144,
     multiplier: float = 1.414,
     reduced_lag: bool = False,
-    fast_response: bool = False
+    fast_response: bool = False,
+    return_type: str = "frame"
 ) -> pd.DataFrame:
     """Gaussian Channel"""
     
-    df_copy = df.copy()
-    
     # Ensure the DataFrame contains the required columns
     required_columns = ["high", "low", "close"]
     for col in required_columns:
@@ -25,39 +26,39 @@ def gaussian_channel(
     
     # Calculate source data based on input
     if source == "hlc3":
-        src_data = (df_copy["high"] + df_copy["low"] + df_copy["close"]) / 3
+        src_data = (df["high"] + df["low"] + df["close"]) / 3
     elif source == "close":
-        src_data = df_copy["close"]
+        src_data = df["close"]
     elif source == "open":
         if "open" not in df.columns:
             raise KeyError("DataFrame must contain 'open' column for open source")
-        src_data = df_copy["open"]
+        src_data = df["open"]
     elif source == "hl2":
-        src_data = (df_copy["high"] + df_copy["low"]) / 2
+        src_data = (df["high"] + df["low"]) / 2
     elif source == "ohlc4":
         if "open" not in df.columns:
             raise KeyError("DataFrame must contain 'open' column for ohlc4 source")
-        src_data = (df_copy["open"] + df_copy["high"] + df_copy["low"] + df_copy["close"]) / 4
+        src_data = (df["open"] + df["high"] + df["low"] + df["close"]) / 4
     else:
         # Assume it's a column name
         if source not in df.columns:
             raise KeyError(f"DataFrame must contain '{source}' column")
-        src_data = df_copy[source]
+        src_data = df[source]
     
     # Calculate True Range exactly like Pine Script tr(true)
-    high = df_copy["high"]
-    low = df_copy["low"]
-    close = df_copy["close"]
+    high = df["high"]
+    low = df["low"]
+    close = df["close"]
     
     # Pine Script tr(true) calculation - vectorized
-    tr_data = pd.Series(index=df_copy.index, dtype=float)
+    tr_data = pd.Series(index=df.index, dtype=float)
     prev_close = close.shift(1)
     
     # For the first bar, Pine Script tr(true) returns high - low
     tr_data.iloc[0] = high.iloc[0] - low.iloc[0]
     
     # For subsequent bars
-    for i in range(1, len(df_copy)):
+    for i in range(1, len(df)):
         tr1 = high.iloc[i] - low.iloc[i]
         tr2 = abs(high.iloc[i] - prev_close.iloc[i])
         tr3 = abs(low.iloc[i] - prev_close.iloc[i])
@@ -217,7 +218,7 @@ def gaussian_channel(
     lower_band = filt - filt_tr * multiplier
     
     # Determine filter direction
-    filter_direction = pd.Series(index=df_copy.index, dtype=float)
+    filter_direction = pd.Series(index=df.index, dtype=float)
     filter_direction.iloc[0] = 0
     
     for i in range(1, len(filt)):
@@ -232,7 +233,7 @@ def gaussian_channel(
     # fcolor = filt > filt[1] ? #0aff68 : filt < filt[1] ? #ff0a5a : #cccccc
     
     # Bar color logic - exact Pine Script implementation
-    bar_signal = pd.Series(index=df_copy.index, dtype=float)
+    bar_signal = pd.Series(index=df.index, dtype=float)
     bar_signal.iloc[0] = 0
     
     for i in range(1, len(src_data)):
@@ -266,14 +267,17 @@ def gaussian_channel(
             bar_signal.iloc[i] = 0  # #cccccc - gray
     
     # Create result DataFrame
-    result = pd.DataFrame(index=df_copy.index)
-    result["gc_middle"] = filt  # The main Gaussian filter line (centerline)
-    result["gc_upper"] = upper_band
-    result["gc_lower"] = lower_band
-    result["gc_direction"] = filter_direction
-    result["gc_bar_signal"] = bar_signal
-    
-    return result
+    return _build_result(
+        {
+            "gc_middle": filt,  # The main Gaussian filter line (centerline)
+            "gc_upper": upper_band,
+            "gc_lower": lower_band,
+            "gc_direction": filter_direction,
+            "gc_bar_signal": bar_signal,
+        },
+        df.index,
+        return_type,
+    )
 
 
 gaussian_channel.__doc__ = """
@@ -313,6 +317,8 @@ Parameters:
     - reduced_lag (bool): Enable reduced lag mode for faster response. Default is False.
     - fast_response (bool): Enable fast response mode by averaging N-pole and 1-pole filters. 
       Default is False.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
 
 Call with:
     gc_result = bta.gaussian_channel(df, source='hlc3', poles=4, period=144, multiplier=1.414)
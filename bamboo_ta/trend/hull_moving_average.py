@@ -1,79 +1,28 @@
 # -*- coding: utf-8 -*-
 # hull_moving_average.py
-import math
-import numpy as np
+from typing import List, Union
+
 import pandas as pd
 
+from bamboo_ta import core
+from bamboo_ta._results import _build_result, _source_values, _wide_columns
+
 
 def hull_moving_average(
-    df: pd.DataFrame, column: str = "close", period: int = 9
+    df: pd.DataFrame,
+    column: Union[str, List[str]] = "close",
+    period: int = 9,
+    dtype=None,
+    state: dict = None,
+    return_type: str = "frame"
 ) -> pd.DataFrame:
     """Hull Moving Average (HMA)"""
-    df_copy = df.copy()
-
-    half_length = math.floor(period / 2)
-    sqrt_length = math.floor(math.sqrt(period))
-
-    # Calculate WMA with half period
-    wma_half_values = []
-    for i in range(len(df_copy)):
-        if i < half_length - 1:
-            wma_half_values.append(np.nan)
-            continue
-
-        # Get data for the window
-        window = df_copy[column].iloc[max(0, i - half_length + 1) : i + 1].values
-
-        # Calculate weights
-        weights = np.arange(1, len(window) + 1)
-
-        # Calculate WMA
-        wma_half_values.append(np.sum(window * weights) / np.sum(weights))
-
-    wma_half = pd.Series(wma_half_values, index=df_copy.index)
-
-    # Calculate WMA with full period
-    wma_full_values = []
-    for i in range(len(df_copy)):
-        if i < period - 1:
-            wma_full_values.append(np.nan)
-            continue
-
-        # Get data for the window
-        window = df_copy[column].iloc[max(0, i - period + 1) : i + 1].values
-
-        # Calculate weights
-        weights = np.arange(1, len(window) + 1)
-
-        # Calculate WMA
-        wma_full_values.append(np.sum(window * weights) / np.sum(weights))
-
-    wma_full = pd.Series(wma_full_values, index=df_copy.index)
-
-    # Calculate 2 * WMA(half_period) - WMA(full_period)
-    h = 2 * wma_half - wma_full
-
-    # Calculate WMA of the result with sqrt(period)
-    hma_values = []
-    for i in range(len(df_copy)):
-        if (
-            i < period - 1 + sqrt_length - 1
-        ):  # Need sqrt_length more points after having period points
-            hma_values.append(np.nan)
-            continue
-
-        # Get data for the window
-        window = h.iloc[max(0, i - sqrt_length + 1) : i + 1].values
-
-        # Calculate weights
-        weights = np.arange(1, len(window) + 1)
-
-        # Calculate WMA
-        hma_values.append(np.sum(window * weights) / np.sum(weights))
-
-    df_copy["hma"] = pd.Series(hma_values, index=df_copy.index)
+    # 2 * WMA(period / 2) - WMA(period), smoothed by a WMA(sqrt(period))
+    hma = core.hull_moving_average(
+        _source_values(df, column), period, dtype=dtype, state=state
+    )
 
-    return df_copy[["hma"]]
+    return _build_result(_wide_columns({"hma": hma}, column), df.index, return_type)
 
 
 hull_moving_average.__doc__ = """
@@ -90,8 +39,16 @@ More info:
 
 Parameters:
     - df (pandas.DataFrame): Input DataFrame which should contain at least the column specified.
-    - column (str): The column on which HMA is to be calculated. Default is 'close'.
+    - column (str or list): The column on which HMA is to be calculated. Default is 'close'.
+      A list of columns is computed in one pass, with the outputs named 'hma_<column>'.
     - period (int): The period over which HMA is to be calculated. Default is 9.
+    - dtype (np.dtype): Computation precision, np.float64 or np.float32. Default is None,
+      which uses the global setting (see bta.core.set_default_dtype).
+    - state (dict): State carried between calls on consecutive chunks of one series,
+      which then give the values of a single call (see bta.run_chunked). Single column
+      only. Default is None.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
 
 Call with:
     df['hma'] = bta.hull_moving_average(df, 'close', 9)['hma']
@@ -3,8 +3,12 @@
 import numpy as np
 import pandas as pd
 
+from bamboo_ta.events import _signed_events
 
-def nadaraya_watson_smoothers(df, src='close', bandwidth=8.0, repaint=True, lookback=500):
+
+def nadaraya_watson_smoothers(
+    df, src='close', bandwidth=8.0, repaint=True, lookback=500, events=False
+):
     """Nadaraya-Watson Smoothers"""
     
     df_copy = df.copy()
@@ -85,6 +89,9 @@ def nadaraya_watson_smoothers(df, src='close', bandwidth=8.0, repaint=True, look
             
             prev_direction = current_direction
     
+    if events:
+        return {'nwe_reversal': _signed_events(reversal_signals)}
+    
     # Store results in the dataframe
     df_copy['nwe'] = nwe_values
     df_copy['nwe_trend'] = trend_direction
@@ -131,6 +138,9 @@ Parameters:
     - repaint (bool): If True, uses repainting mode for smoothest results. If False, 
       uses non-repainting endpoint method. Default is True.
     - lookback (int): Maximum number of bars to look back for calculations. Default is 500.
+    - events (bool): Return only the reversals, as sparse events: a dict
+      {'nwe_reversal': {'positions': sorted int32 row positions, 'values': 1 for bullish
+      and -1 for bearish reversals (int8)}} (see bta.densify_events). Default is False.
 
 Call with:
     nw_result = bta.nadaraya_watson_smoothers(df, src='close', bandwidth=8.0, repaint=True)
@@ -2,7 +2,11 @@
 # parabolic_sar.py
 
 import pandas as pd
-import numpy as np
+
+from bamboo_ta import core
+from bamboo_ta._outputs import _flag_dtype
+from bamboo_ta._results import _build_result
+from bamboo_ta.events import _flag_events
 
 
 def parabolic_sar(
@@ -10,11 +14,13 @@ def parabolic_sar(
     initial_af: float = 0.02,
     af_step: float = 0.02,
     max_af: float = 0.2,
-    use_close: bool = False
+    use_close: bool = False,
+    dtype=None,
+    state: dict = None,
+    return_type: str = "frame",
+    events: bool = False
 ) -> pd.DataFrame:
     """Parabolic Stop and Reverse (PSAR)"""
-    df_copy = df.copy()
-    
     # Ensure the DataFrame contains the required columns
     required_columns = ["high", "low"]
     if use_close:
@@ -24,116 +30,32 @@ def parabolic_sar(
         if col not in df.columns:
             raise KeyError(f"DataFrame must contain '{col}' column")
     
-    # Validate parameters
-    initial_af = float(initial_af) if initial_af > 0 else 0.02
-    af_step = float(af_step) if af_step > 0 else 0.02
-    max_af = float(max_af) if max_af > 0 else 0.2
-    
-    # Get price series
-    high = df_copy["high"]
-    low = df_copy["low"]
-    
-    # Helper function to determine if price is falling at the start
-    def is_falling(high_vals, low_vals):
-        """Returns True if -DM is positive (indicating falling)"""
-        h_diff = high_vals[1] - high_vals[0]
-        l_diff = low_vals[0] - low_vals[1]
-        return l_diff > h_diff and l_diff > 0
-    
-    # Initialize series for results
-    psar_long = pd.Series(np.nan, index=df_copy.index)
-    psar_short = pd.Series(np.nan, index=df_copy.index)
-    psar_af = pd.Series(np.nan, index=df_copy.index)
-    psar_reversal = pd.Series(0, index=df_copy.index)
-    
-    # Check initial trend direction (falling?)
-    falling = is_falling(high.iloc[:2].values, low.iloc[:2].values)
-    
-    # Set initial values
-    if use_close and len(df_copy) > 0:
-        sar = df_copy["close"].iloc[0]
-    else:
-        sar = high.iloc[0] if falling else low.iloc[0]
-    
-    # Set initial extreme point
-    ep = low.iloc[0] if falling else high.iloc[0]
-    
-    # Set initial acceleration factor
-    af = initial_af
-    psar_af.iloc[0] = af
-    
-    # Fill first value in appropriate series
-    if falling:
-        psar_short.iloc[0] = sar
-    else:
-        psar_long.iloc[0] = sar
-    
-    # Calculate PSAR for the rest of the series
-    for i in range(1, len(df_copy)):
-        high_val = high.iloc[i]
-        low_val = low.iloc[i]
-        
-        # Calculate SAR value for this period
-        sar_val = sar + af * (ep - sar)
-        
-        # Check for trend reversal
-        if falling:
-            # In downtrend, SAR must not be above prior two highs
-            sar_val = max(sar_val, high.iloc[i-1])
-            if i >= 2:
-                sar_val = max(sar_val, high.iloc[i-2])
-            
-            # Check for reversal (price above SAR)
-            reverse = high_val > sar_val
-            
-            # Update extreme point and acceleration factor if trend continues
-            if low_val < ep:
-                ep = low_val
-                af = min(af + af_step, max_af)
-        else:
-            # In uptrend, SAR must not be below prior two lows
-            sar_val = min(sar_val, low.iloc[i-1])
-            if i >= 2:
-                sar_val = min(sar_val, low.iloc[i-2])
-            
-            # Check for reversal (price below SAR)
-            reverse = low_val < sar_val
-            
-            # Update extreme point and acceleration factor if trend continues
-            if high_val > ep:
-                ep = high_val
-                af = min(af + af_step, max_af)
-        
-        # Handle reversal if it occurred
-        if reverse:
-            # Reset SAR and AF, switch trend direction
-            sar_val = ep
-            af = initial_af
-            falling = not falling
-            # Reset extreme point
-            ep = low_val if falling else high_val
-            # Record reversal
-            psar_reversal.iloc[i] = 1
-        
-        # Update SAR for next iteration
-        sar = sar_val
-        
-        # Store current AF value
-        psar_af.iloc[i] = af
-        
-        # Store SAR value in appropriate series based on trend direction
-        if falling:
-            psar_short.iloc[i] = sar
-        else:
-            psar_long.iloc[i] = sar
-    
-    # Store results in DataFrame
-    df_copy["psar_long"] = psar_long
-    df_copy["psar_short"] = psar_short
-    df_copy["psar_af"] = psar_af
-    df_copy["psar_reversal"] = psar_reversal
-    
-    return df_copy[["psar_long", "psar_short", "psar_af", "psar_reversal"]]
+    # Trailing stop recursion, see core.parabolic_sar
+    psar_long, psar_short, psar_af, psar_reversal = core.parabolic_sar(
+        df["high"].to_numpy(),
+        df["low"].to_numpy(),
+        df["close"].to_numpy() if use_close else None,
+        initial_af=initial_af,
+        af_step=af_step,
+        max_af=max_af,
+        use_close=use_close,
+        dtype=dtype,
+        state=state,
+    )
+    
+    if events:
+        return {"psar_reversal": _flag_events(psar_reversal)}
+    
+    return _build_result(
+        {
+            "psar_long": psar_long,
+            "psar_short": psar_short,
+            "psar_af": psar_af,
+            "psar_reversal": psar_reversal.astype(_flag_dtype()),
+        },
+        df.index,
+        return_type,
+    )
 
 
 parabolic_sar.__doc__ = \
@@ -175,6 +97,16 @@ Parameters:
     - af_step (float): Acceleration factor increment. Default is 0.02.
     - max_af (float): Maximum acceleration factor. Default is 0.2.
     - use_close (bool): Whether to use close price for initial SAR calculation. Default is False.
+    - dtype (np.dtype): Computation precision, np.float64 or np.float32. Default is None,
+      which uses the global setting (see bta.core.set_default_dtype).
+    - state (dict): State carried between calls on consecutive chunks of one series,
+      which then give the values of a single call (see bta.run_chunked).
+      Default is None.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
+    - events (bool): Return only the SAR reversals, as sparse events: a dict
+      {'psar_reversal': {'positions': sorted int32 row positions, 'values': None}}
+      (see bta.densify_events). Default is False.
 
 Call with:
     result = bta.parabolic_sar(df)
@@ -1,16 +1,27 @@
 # -*- coding: utf-8 -*-
 # rolling_moving_average.py
+from typing import List, Union
+
 import pandas as pd
 
+from bamboo_ta import core
+from bamboo_ta._results import _build_result, _source_values, _wide_columns
+
 
 def rolling_moving_average(
-    df: pd.DataFrame, column: str = "close", period: int = 14
+    df: pd.DataFrame,
+    column: Union[str, List[str]] = "close",
+    period: int = 14,
+    dtype=None,
+    state: dict = None,
+    return_type: str = "frame"
 ) -> pd.DataFrame:
     """Rolling Moving Average (RMA) calculation."""
-    df_copy = df.copy()
-    df_copy["rma"] = df_copy[column].ewm(alpha=1 / period, adjust=False).mean()
+    rma = core.rolling_moving_average(
+        _source_values(df, column), period, dtype=dtype, state=state
+    )
 
-    return df_copy[["rma"]]
+    return _build_result(_wide_columns({"rma": rma}, column), df.index, return_type)
 
 
 rolling_moving_average.__doc__ = """
@@ -30,8 +41,16 @@ More info:
 
 Parameters:
     - df (pandas.DataFrame): Input DataFrame which should contain the specified column.
-    - column (str): The column on which RMA is to be calculated.
+    - column (str or list): The column on which RMA is to be calculated.
+      A list of columns is computed in one pass, with the outputs named 'rma_<column>'.
     - period (int): The period over which RMA is to be calculated.
+    - dtype (np.dtype): Computation precision, np.float64 or np.float32. Default is None,
+      which uses the global setting (see bta.core.set_default_dtype).
+    - state (dict): State carried between calls on consecutive chunks of one series,
+      which then give the values of a single call (see bta.run_chunked). Single column
+      only. Default is None.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
 
 Call with:
     df['rma'] = bta.rolling_moving_average(df, 'close', 14)['rma']
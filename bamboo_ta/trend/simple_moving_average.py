@@ -1,16 +1,27 @@
 # -*- coding: utf-8 -*-
 # simple_moving_average.py
+from typing import List, Union
+
 import pandas as pd
 
+from bamboo_ta import core
+from bamboo_ta._results import _build_result, _source_values, _wide_columns
+
 
 def simple_moving_average(
-    df: pd.DataFrame, column: str = "close", period: int = 21
+    df: pd.DataFrame,
+    column: Union[str, List[str]] = "close",
+    period: int = 21,
+    dtype=None,
+    state: dict = None,
+    return_type: str = "frame"
 ) -> pd.DataFrame:
     """Simple Moving Average (SMA)"""
-    df_copy = df.copy()
-    df_copy["sma"] = df_copy[column].rolling(window=period).mean()
+    sma = core.simple_moving_average(
+        _source_values(df, column), period, dtype=dtype, state=state
+    )
 
-    return df_copy[["sma"]]
+    return _build_result(_wide_columns({"sma": sma}, column), df.index, return_type)
 
 
 simple_moving_average.__doc__ = """
@@ -25,8 +36,16 @@ More info:
 
 Parameters:
     - df (pandas.DataFrame): Input DataFrame which should contain at least the column specified.
-    - column (str): The column on which SMA is to be calculated. Default is 'close'.
+    - column (str or list): The column on which SMA is to be calculated. Default is 'close'.
+      A list of columns is computed in one pass, with the outputs named 'sma_<column>'.
     - period (int): The period over which SMA is to be calculated. Default is 21.
+    - dtype (np.dtype): Computation precision, np.float64 or np.float32. Default is None,
+      which uses the global setting (see bta.core.set_default_dtype).
+    - state (dict): State carried between calls on consecutive chunks of one series,
+      which then give the values of a single call (see bta.run_chunked). Single column
+      only. Default is None.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
 
 Call with:
     df['sma'] = bta.simple_moving_average(df, 'close', 50)['sma']
@@ -2,7 +2,9 @@
 # trend_signals.py
 
 import pandas as pd
-import numpy as np
+
+from bamboo_ta._outputs import _flag_dtype, _signal_dtype
+from bamboo_ta.events import _flag_events
 
 
 def trend_signals(
@@ -10,7 +12,8 @@ def trend_signals(
     trend_column: str,
     as_bool: bool = False,
     trade_offset: int = 0,
-    drift: int = 1
+    drift: int = 1,
+    events: bool = False
 ) -> pd.DataFrame:
     """Trend Signals Indicator"""
     df_copy = df.copy()
@@ -32,11 +35,20 @@ def trend_signals(
     entries = (trades > 0).astype(int)
     exits = (trades < 0).abs().astype(int)
     
-    # Convert to boolean if requested
+    # Convert to boolean if requested, otherwise to the compact flag dtype
     if as_bool:
         trend = trend.astype(bool)
         entries = entries.astype(bool)
         exits = exits.astype(bool)
+    else:
+        # A trend column with values beyond 0/1 keeps int64 instead of wrapping
+        trend = trend.astype(_signal_dtype(trend))
+        entries = entries.astype(_flag_dtype())
+        exits = exits.astype(_flag_dtype())
+    trades = trades.astype(_signal_dtype(trades))
+    
+    if events:
+        return {"entries": _flag_events(entries), "exits": _flag_events(exits)}
     
     # Store results in DataFrame
     df_copy["trend"] = trend
@@ -80,6 +92,9 @@ Parameters:
     - trade_offset (int): Value used to shift the trade entries/exits. Use 1 for backtesting 
       and 0 for live trading. Default is 0.
     - drift (int): The difference period for calculating changes in trend. Default is 1.
+    - events (bool): Return only the entries and exits, as sparse events: a dict
+      {'entries': ..., 'exits': ...} of {'positions': sorted int32 row positions,
+      'values': None} (see bta.densify_events). Default is False.
 
 Call with:
     # Assuming you have a DataFrame with a trend column (e.g., 'sma_trend' = close > sma)
@@ -3,6 +3,9 @@
 import numpy as np
 import pandas as pd
 
+from bamboo_ta import core
+from bamboo_ta._results import _build_result
+
 
 def volumatic_variable_index_dynamic_average(
     df: pd.DataFrame,
@@ -13,12 +16,11 @@ def volumatic_variable_index_dynamic_average(
     pivot_left_bars: int = 3,
     pivot_right_bars: int = 3,
     smooth_length: int = 15,
-    column: str = 'close'
+    column: str = 'close',
+    return_type: str = "frame"
 ) -> pd.DataFrame:
     """Volumatic Variable Index Dynamic Average (VIDYA)"""
     
-    df_copy = df.copy()
-    
     # Ensure required columns exist
     required_columns = ['open', 'high', 'low', 'close', 'volume']
     for col in required_columns:
@@ -26,7 +28,7 @@ def volumatic_variable_index_dynamic_average(
             raise KeyError(f"DataFrame must contain '{col}' column")
     
     # Calculate momentum for VIDYA
-    momentum = df_copy[column].diff()
+    momentum = df[column].diff()
     
     # Calculate positive and negative momentum sums
     pos_momentum = np.where(momentum >= 0, momentum, 0.0)
@@ -41,13 +43,13 @@ def volumatic_variable_index_dynamic_average(
     
     # Calculate VIDYA
     alpha = 2 / (vidya_length + 1)
-    vidya_value = pd.Series(index=df_copy.index, dtype=float)
-    vidya_value.iloc[0] = df_copy[column].iloc[0]
+    vidya_value = pd.Series(index=df.index, dtype=float)
+    vidya_value.iloc[0] = df[column].iloc[0]
     
-    for i in range(1, len(df_copy)):
+    for i in range(1, len(df)):
         if pd.notna(abs_cmo.iloc[i]):
             adaptive_alpha = alpha * abs_cmo.iloc[i] / 100
-            vidya_value.iloc[i] = (adaptive_alpha * df_copy[column].iloc[i] + 
+            vidya_value.iloc[i] = (adaptive_alpha * df[column].iloc[i] + 
                                  (1 - adaptive_alpha) * vidya_value.iloc[i-1])
         else:
             vidya_value.iloc[i] = vidya_value.iloc[i-1]
@@ -56,18 +58,18 @@ def volumatic_variable_index_dynamic_average(
     vidya_smoothed = vidya_value.rolling(window=smooth_length).mean()
     
     # Calculate Average True Range (ATR) - TradingView compatible
-    high_low = df_copy['high'] - df_copy['low']
-    high_close = np.abs(df_copy['high'] - df_copy['close'].shift(1))
-    low_close = np.abs(df_copy['low'] - df_copy['close'].shift(1))
+    high_low = df['high'] - df['low']
+    high_close = np.abs(df['high'] - df['close'].shift(1))
+    low_close = np.abs(df['low'] - df['close'].shift(1))
     
     true_range = np.maximum(high_low, np.maximum(high_close, low_close))
     
     # Use RMA (Wilder's smoothing) instead of SMA - this is what TradingView uses
-    atr = pd.Series(index=df_copy.index, dtype=float)
+    atr = pd.Series(index=df.index, dtype=float)
     atr.iloc[0] = true_range.iloc[0] if not pd.isna(true_range.iloc[0]) else 0
     
     alpha_atr = 1.0 / atr_length  # Wilder's smoothing factor
-    for i in range(1, len(df_copy)):
+    for i in range(1, len(df)):
         if pd.notna(true_range.iloc[i]):
             atr.iloc[i] = alpha_atr * true_range.iloc[i] + (1 - alpha_atr) * atr.iloc[i-1]
         else:
@@ -78,46 +80,39 @@ def volumatic_variable_index_dynamic_average(
     lower_band = vidya_smoothed - atr * band_distance
     
     # Detect trend direction using crossovers - explicitly set dtype to bool
-    trend_up = pd.Series(False, index=df_copy.index, dtype=bool)
-    smoothed_value = pd.Series(np.nan, index=df_copy.index, dtype=float)
+    trend_up = pd.Series(False, index=df.index, dtype=bool)
+    smoothed_value = pd.Series(np.nan, index=df.index, dtype=float)
     
-    for i in range(1, len(df_copy)):
+    for i in range(1, len(df)):
         # Check for crossover above upper band (uptrend start)
-        if (df_copy[column].iloc[i] > upper_band.iloc[i] and 
-            df_copy[column].iloc[i-1] <= upper_band.iloc[i-1]):
+        if (df[column].iloc[i] > upper_band.iloc[i] and 
+            df[column].iloc[i-1] <= upper_band.iloc[i-1]):
             trend_up.iloc[i] = True
         # Check for crossunder below lower band (downtrend start)
-        elif (df_copy[column].iloc[i] < lower_band.iloc[i] and 
-              df_copy[column].iloc[i-1] >= lower_band.iloc[i-1]):
+        elif (df[column].iloc[i] < lower_band.iloc[i] and 
+              df[column].iloc[i-1] >= lower_band.iloc[i-1]):
             trend_up.iloc[i] = False
         else:
             trend_up.iloc[i] = trend_up.iloc[i-1]
     
     # Set smoothed value based on trend
-    for i in range(len(df_copy)):
+    for i in range(len(df)):
         if trend_up.iloc[i]:
             smoothed_value.iloc[i] = lower_band.iloc[i]
         else:
             smoothed_value.iloc[i] = upper_band.iloc[i]
     
-    # Detect pivot highs and lows
-    pivot_highs = pd.Series(False, index=df_copy.index, dtype=bool)
-    pivot_lows = pd.Series(False, index=df_copy.index, dtype=bool)
-    
-    for i in range(pivot_left_bars, len(df_copy) - pivot_right_bars):
-        # Check for pivot high
-        window_high = df_copy['high'].iloc[i-pivot_left_bars:i+pivot_right_bars+1]
-        if df_copy['high'].iloc[i] == window_high.max():
-            pivot_highs.iloc[i] = True
-            
-        # Check for pivot low
-        window_low = df_copy['low'].iloc[i-pivot_left_bars:i+pivot_right_bars+1]
-        if df_copy['low'].iloc[i] == window_low.min():
-            pivot_lows.iloc[i] = True
+    # Detect pivot highs and lows (ties with the neighbouring bars count)
+    pivot_highs = pd.Series(False, index=df.index, dtype=bool)
+    pivot_lows = pd.Series(False, index=df.index, dtype=bool)
+    high_positions = core.pivot_high(df['high'], pivot_left_bars, pivot_right_bars)[0]
+    low_positions = core.pivot_low(df['low'], pivot_left_bars, pivot_right_bars)[0]
+    pivot_highs.iloc[high_positions] = True
+    pivot_lows.iloc[low_positions] = True
     
     # Calculate volume analysis
-    up_volume = np.where(df_copy['close'] > df_copy['open'], df_copy['volume'], 0)
-    down_volume = np.where(df_copy['close'] < df_copy['open'], df_copy['volume'], 0)
+    up_volume = np.where(df['close'] > df['open'], df['volume'], 0)
+    down_volume = np.where(df['close'] < df['open'], df['volume'], 0)
     
     # Calculate trend change signals - FIX: Use proper dtype and infer_objects()
     trend_up_prev = trend_up.shift(1)
@@ -128,13 +123,13 @@ def volumatic_variable_index_dynamic_average(
     trend_change_down = ~trend_up & trend_up_prev
     
     # Calculate cumulative volume during trends
-    cumulative_up_volume = pd.Series(0.0, index=df_copy.index, dtype=float)
-    cumulative_down_volume = pd.Series(0.0, index=df_copy.index, dtype=float)
+    cumulative_up_volume = pd.Series(0.0, index=df.index, dtype=float)
+    cumulative_down_volume = pd.Series(0.0, index=df.index, dtype=float)
     
     current_up_vol = 0.0
     current_down_vol = 0.0
     
-    for i in range(1, len(df_copy)):
+    for i in range(1, len(df)):
         if trend_change_up.iloc[i] or trend_change_down.iloc[i]:
             current_up_vol = 0.0
             current_down_vol = 0.0
@@ -152,23 +147,26 @@ def volumatic_variable_index_dynamic_average(
                                0)
     
     # Store results - ensure proper data types
-    result_df = pd.DataFrame(index=df_copy.index)
-    result_df['vidya'] = vidya_value.astype(float)
-    result_df['vidya_smoothed'] = vidya_smoothed.astype(float)
-    result_df['upper_band'] = upper_band.astype(float)
-    result_df['lower_band'] = lower_band.astype(float)
-    result_df['smoothed_value'] = smoothed_value.astype(float)
-    result_df['trend_up'] = trend_up.astype(int)
-    result_df['trend_change_up'] = trend_change_up.astype(int)
-    result_df['trend_change_down'] = trend_change_down.astype(int)
-    result_df['pivot_high'] = pivot_highs.astype(int)
-    result_df['pivot_low'] = pivot_lows.astype(int)
-    result_df['up_volume'] = cumulative_up_volume.astype(float)
-    result_df['down_volume'] = cumulative_down_volume.astype(float)
-    result_df['volume_delta_pct'] = pd.Series(volume_delta_pct).astype(float)
-    result_df['atr'] = atr.astype(float)
-    
-    return result_df
+    return _build_result(
+        {
+            'vidya': vidya_value.astype(float),
+            'vidya_smoothed': vidya_smoothed.astype(float),
+            'upper_band': upper_band.astype(float),
+            'lower_band': lower_band.astype(float),
+            'smoothed_value': smoothed_value.astype(float),
+            'trend_up': trend_up.astype(int),
+            'trend_change_up': trend_change_up.astype(int),
+            'trend_change_down': trend_change_down.astype(int),
+            'pivot_high': pivot_highs.astype(int),
+            'pivot_low': pivot_lows.astype(int),
+            'up_volume': cumulative_up_volume.astype(float),
+            'down_volume': cumulative_down_volume.astype(float),
+            'volume_delta_pct': volume_delta_pct.astype(float),
+            'atr': atr.astype(float),
+        },
+        df.index,
+        return_type,
+    )
 
 
 volumatic_variable_index_dynamic_average.__doc__ = """
@@ -205,6 +203,8 @@ Parameters:
     - pivot_right_bars (int): Right side bars for pivot detection. Default is 3.
     - smooth_length (int): Smoothing period for VIDYA. Default is 15.
     - column (str): The column name to use for calculations. Default is 'close'.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
 
 Call with:
     result = bta.volumatic_variable_index_dynamic_average(df)
@@ -1,21 +1,27 @@
 # -*- coding: utf-8 -*-
 # weighted_moving_average.py
+from typing import List, Union
+
 import pandas as pd
 
+from bamboo_ta import core
+from bamboo_ta._results import _build_result, _source_values, _wide_columns
+
 
 def weighted_moving_average(
-    df: pd.DataFrame, column: str = "close", period: int = 10
+    df: pd.DataFrame,
+    column: Union[str, List[str]] = "close",
+    period: int = 10,
+    dtype=None,
+    state: dict = None,
+    return_type: str = "frame"
 ) -> pd.DataFrame:
     """Weighted Moving Average (WMA)"""
-    df_copy = df.copy()
-    weights = pd.Series(range(1, period + 1))
-    df_copy["wma"] = (
-        df_copy[column]
-        .rolling(period)
-        .apply(lambda prices: (prices * weights).sum() / weights.sum(), raw=True)
+    wma = core.weighted_moving_average(
+        _source_values(df, column), period, dtype=dtype, state=state
     )
 
-    return df_copy[["wma"]]
+    return _build_result(_wide_columns({"wma": wma}, column), df.index, return_type)
 
 
 weighted_moving_average.__doc__ = """
@@ -31,8 +37,16 @@ More info:
 
 Parameters:
     - df (pandas.DataFrame): Input DataFrame.
-    - column (str): The column to calculate the WMA on.
+    - column (str or list): The column to calculate the WMA on.
+      A list of columns is computed in one pass, with the outputs named 'wma_<column>'.
     - period (int): The period for the WMA calculation.
+    - dtype (np.dtype): Computation precision, np.float64 or np.float32. Default is None,
+      which uses the global setting (see bta.core.set_default_dtype).
+    - state (dict): State carried between calls on consecutive chunks of one series,
+      which then give the values of a single call (see bta.run_chunked). Single column
+      only. Default is None.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
 
 Call with:
     df['wma'] = bta.weighted_moving_average(df, 'close', 10)['wma']
@@ -4,6 +4,8 @@
 import pandas as pd
 import numpy as np
 
+from bamboo_ta._outputs import _flag_dtype
+
 
 def cross(
     df: pd.DataFrame,
@@ -48,7 +50,7 @@ def cross(
     
     # Convert to integer if requested
     if as_int:
-        cross_result = cross_result.astype(int)
+        cross_result = cross_result.astype(_flag_dtype())
     
     # Create result column name
     cross_type = "xa" if direction == "above" else "xb"
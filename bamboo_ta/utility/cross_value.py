@@ -4,6 +4,8 @@
 import pandas as pd
 import numpy as np
 
+from bamboo_ta._outputs import _flag_dtype
+
 
 def cross_value(
     df: pd.DataFrame,
@@ -52,7 +54,7 @@ def cross_value(
     
     # Convert to integer if requested
     if as_int:
-        cross_result = cross_result.astype(int)
+        cross_result = cross_result.astype(_flag_dtype())
     
     # Create result column name
     cross_type = "xav" if direction == "above" else "xbv"
@@ -3,7 +3,8 @@
 import numpy as np
 import pandas as pd
 from typing import Tuple
-from scipy.signal import argrelextrema
+
+from bamboo_ta import core
 
 
 def exhaustion_lengths(df: pd.DataFrame) -> Tuple[int, int]:
@@ -21,9 +22,16 @@ def exhaustion_lengths(df: pd.DataFrame) -> Tuple[int, int]:
     Returns:
     - int, int: Average peak distance and average valley distance.
     """
-    # Find relative maxima (peaks) and minima (valleys) in the 'high' and 'low' columns
-    high_indices = argrelextrema(df["high"].to_numpy(), np.greater)[0]
-    low_indices = argrelextrema(df["low"].to_numpy(), np.less)[0]
+    # Find relative maxima (peaks) and minima (valleys) in the 'high' and 'low' columns:
+    # bars strictly beyond both neighbours
+    high = df["high"].to_numpy(dtype=np.float64)
+    low = df["low"].to_numpy(dtype=np.float64)
+    high_indices = core.pivot_high(high, 1, 1, strict=True)[0]
+    low_indices = core.pivot_low(low, 1, 1, strict=True)[0]
+
+    # A bar next to a missing value is no extremum
+    high_indices = high_indices[~np.isnan(high[high_indices - 1] + high[high_indices + 1])]
+    low_indices = low_indices[~np.isnan(low[low_indices - 1] + low[low_indices + 1])]
 
     # If there are fewer than two peaks or valleys, return zero
     if len(high_indices) < 2 or len(low_indices) < 2:
@@ -62,8 +70,9 @@ More info:
     extremes, traders can better calibrate indicators to match the natural rhythm
     of the market being analyzed.
     
-    The function uses scipy's argrelextrema to find local maxima and minima in the
-    price series, then calculates statistics about their spacing.
+    The function finds the local maxima and minima of the price series (bars strictly
+    above or below both neighbours, see core.pivot_high and core.pivot_low), then
+    calculates statistics about their spacing.
 
 Parameters:
     - df (pandas.DataFrame): Input DataFrame containing 'high' and 'low' columns.
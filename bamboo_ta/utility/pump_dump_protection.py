@@ -58,8 +58,8 @@ def pump_dump_protection(
     delta = df_copy["close"].diff()
     gain = np.where(delta > 0, delta, 0)
     loss = np.where(delta < 0, -delta, 0)
-    avg_gain = pd.Series(gain).rolling(window=rsi_period).mean()
-    avg_loss = pd.Series(loss).rolling(window=rsi_period).mean()
+    avg_gain = pd.Series(gain, index=df_copy.index).rolling(window=rsi_period).mean()
+    avg_loss = pd.Series(loss, index=df_copy.index).rolling(window=rsi_period).mean()
     rs = avg_gain / avg_loss
     df_copy["rsi"] = 100 - (100 / (1 + rs))
 
@@ -3,8 +3,11 @@
 import numpy as np
 import pandas as pd
 
+from bamboo_ta._results import _build_result
 
-def regression_slope(df: pd.DataFrame, lookback_period: int = 20) -> pd.DataFrame:
+
+def regression_slope(df: pd.DataFrame, lookback_period: int = 20,
+                     return_type: str = "frame") -> pd.DataFrame:
     """
     Calculate the slope of the linear regression for a given lookback period.
 
@@ -14,6 +17,7 @@ def regression_slope(df: pd.DataFrame, lookback_period: int = 20) -> pd.DataFram
     Parameters:
     - df (pandas.DataFrame): Input DataFrame containing the 'close' prices.
     - lookback_period (int): The lookback period for calculating the regression slope. Default is 20.
+    - return_type (str): 'frame', 'dict' or 'ndarray'. Default is 'frame'.
 
     Returns:
     - pd.DataFrame: DataFrame containing the regression slopes in the 'slope' column.
@@ -42,10 +46,7 @@ def regression_slope(df: pd.DataFrame, lookback_period: int = 20) -> pd.DataFram
     )
 
     # Create a DataFrame with the slope column and return it
-    result_df = pd.DataFrame(index=df.index)
-    result_df['slope'] = slope_series
-
-    return result_df
+    return _build_result({'slope': slope_series}, df.index, return_type)
 
 
 regression_slope.__doc__ = """
@@ -73,6 +74,8 @@ Parameters:
     - df (pd.DataFrame): Input DataFrame containing the 'close' price column.
     - lookback_period (int): Number of periods to use for the regression calculation.
       Default is 20.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
 
 Call with:
     # Calculate regression slope with default 20-period lookback
@@ -4,17 +4,18 @@
 import pandas as pd
 import numpy as np
 
+from bamboo_ta._results import _build_result
+
 
 def tos_standard_deviation_all(
     df: pd.DataFrame,
     length: int = None,
     stds: list = None,
     ddof: int = 1,
-    column: str = "close"
+    column: str = "close",
+    return_type: str = "frame"
 ) -> pd.DataFrame:
     """TD Ameritrade's Think or Swim Standard Deviation All Indicator"""
-    df_copy = df.copy()
-    
     # Ensure the DataFrame contains the required column
     if column not in df.columns:
         raise KeyError(f"DataFrame must contain '{column}' column")
@@ -36,13 +37,10 @@ def tos_standard_deviation_all(
     if not isinstance(ddof, int) or ddof < 0:
         raise ValueError("ddof must be a non-negative integer")
     
-    # Set up result DataFrame
-    result = pd.DataFrame(index=df.index)
-    
     # Determine the calculation length
     if length is None:
         # Use all available data
-        calc_df = df_copy
+        calc_df = df
         prop_name = "TOS_STDEVALL"
     else:
         # Validate length
@@ -50,7 +48,7 @@ def tos_standard_deviation_all(
             length = 30
         
         # Use only the specified length of data
-        calc_df = df_copy.iloc[-length:]
+        calc_df = df.iloc[-length:]
         prop_name = f"TOS_STDEVALL_{length}"
     
     # Extract price series
@@ -64,33 +62,21 @@ def tos_standard_deviation_all(
     
     # Calculate linear regression
     m, b = np.polyfit(X, price.values, 1)
-    lr = pd.Series(m * X + b, index=price.index)
+    lr = np.full(len(df), np.nan)
+    lr[len(df) - len(price):] = m * X + b
     
     # Calculate standard deviation
     stdev_val = np.std(price.values, ddof=ddof)
     
-    # Set up result DataFrame with the linear regression line
-    result[f"{prop_name}_LR"] = np.nan
-    result.loc[lr.index, f"{prop_name}_LR"] = lr
+    # The linear regression line, NaN before the calculation window
+    columns = {f"{prop_name}_LR": lr}
     
     # Create upper and lower bands for each standard deviation level
     for i in stds:
-        lower_col = f"{prop_name}_L_{i}"
-        upper_col = f"{prop_name}_U_{i}"
-        
-        result[lower_col] = np.nan
-        result[upper_col] = np.nan
-        
-        result.loc[lr.index, lower_col] = lr - i * stdev_val
-        result.loc[lr.index, upper_col] = lr + i * stdev_val
-    
-    # Create a list of column names to return
-    cols = [f"{prop_name}_LR"]
-    for i in stds:
-        cols.append(f"{prop_name}_L_{i}")
-        cols.append(f"{prop_name}_U_{i}")
+        columns[f"{prop_name}_L_{i}"] = lr - i * stdev_val
+        columns[f"{prop_name}_U_{i}"] = lr + i * stdev_val
     
-    return result[cols]
+    return _build_result(columns, df.index, return_type)
 
 
 tos_standard_deviation_all.__doc__ = """
@@ -118,6 +104,8 @@ Parameters:
     - ddof (int): Delta Degrees of Freedom. The divisor used in calculations is N - ddof,
       where N represents the number of elements. Default is 1.
     - column (str): The column to calculate on. Default is 'close'.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
 
 Call with:
     tos_sd = bta.tos_standard_deviation_all(df)
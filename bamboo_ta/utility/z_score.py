@@ -1,15 +1,21 @@
 # -*- coding: utf-8 -*-
 # z_score.py
+from typing import List, Union
+
 import pandas as pd
 
 
-def z_score(series: pd.Series, window: int = 500) -> pd.Series:
+def z_score(
+    series: pd.Series, window: int = 500, column: Union[str, List[str]] = None
+):
     """
     Calculate the z-score of a series.
 
     Parameters:
-    - series (pd.Series): Input series.
+    - series (pd.Series or pd.DataFrame): Input series, or a frame to take the
+      columns from.
     - window (int): Lookback window for mean and standard deviation calculation.
+    - column (str or list): Column or columns of a DataFrame input. Optional.
 
     Call with:
         df['zscore']  = bta.z_score(series)
@@ -18,8 +24,12 @@ def z_score(series: pd.Series, window: int = 500) -> pd.Series:
         df['zscore']  = bta.z_score(df['close'])
 
     Returns:
-    - pd.Series: Z-score series.
+    - pd.Series: Z-score series, or a DataFrame with one 'z_score_<column>'
+      column per column of a list.
     """
+    if column is not None:
+        # Rolling windows over a frame run column-wise in one call
+        series = series[column] if isinstance(column, str) else series[list(column)]
     mean = series.rolling(window=window, min_periods=1).mean()
     std = series.rolling(window=window, min_periods=1).std(ddof=0)
     zscore = (series - mean) / std
@@ -27,6 +37,8 @@ def z_score(series: pd.Series, window: int = 500) -> pd.Series:
         0
     )  # Fill NaN values with 0 to avoid issues with calculations
 
+    if column is not None and not isinstance(column, str):
+        zscore.columns = [f"z_score_{source}" for source in column]
     return zscore
 
 
@@ -52,12 +64,16 @@ More info:
 Parameters:
     - series (pd.Series): Input series of values to analyze.
     - window (int, default=500): Lookback window for calculating the mean and standard deviation.
+    - column (str or list, optional): With a DataFrame as input, the column or the list of
+      columns to score. The columns of a list are scored together, column by column.
 
 Call with:
     df['zscore'] = bta.z_score(df['close'], window=200)
+    zscores = bta.z_score(df, window=200, column=feature_columns)
 
 Returns:
-    pd.Series: The Z-Score values for each point in the input series.
+    pd.Series: The Z-Score values for each point in the input series. With a list of
+    columns, a DataFrame with one 'z_score_<column>' column per column.
 
 Important Notes:
     - This function requires a numeric Series as input and will raise an error 
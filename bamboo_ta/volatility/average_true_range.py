@@ -1,31 +1,32 @@
 # -*- coding: utf-8 -*-
 # average_true_range.py
-import numpy as np
 import pandas as pd
 
+from bamboo_ta import core
+from bamboo_ta._results import _build_result
 
-def average_true_range(df: pd.DataFrame, period: int = 14) -> pd.DataFrame:
-    """Average True Range"""
-    df_copy = df.copy()
 
+def average_true_range(
+    df: pd.DataFrame, period: int = 14, dtype=None, state: dict = None, return_type: str = "frame"
+) -> pd.DataFrame:
+    """Average True Range"""
     # Ensure the DataFrame contains the required columns
     required_columns = ["high", "low", "close"]
     for col in required_columns:
         if col not in df.columns:
             raise KeyError(f"DataFrame must contain '{col}' column")
 
-    # Calculate True Range components
-    df_copy["high_low"] = df_copy["high"] - df_copy["low"]
-    df_copy["high_close"] = (df_copy["high"] - df_copy["close"].shift()).abs()
-    df_copy["low_close"] = (df_copy["low"] - df_copy["close"].shift()).abs()
-
-    # Calculate True Range
-    df_copy["true_range"] = df_copy[["high_low", "high_close", "low_close"]].max(axis=1)
-
-    # Calculate ATR as the rolling mean of True Range
-    df_copy["atr"] = df_copy["true_range"].rolling(window=period, min_periods=1).mean()
+    # ATR as the rolling mean of the True Range
+    atr = core.average_true_range(
+        df["high"].to_numpy(),
+        df["low"].to_numpy(),
+        df["close"].to_numpy(),
+        period=period,
+        dtype=dtype,
+        state=state,
+    )
 
-    return df_copy[["atr"]]
+    return _build_result({"atr": atr}, df.index, return_type)
 
 
 average_true_range.__doc__ = """
@@ -44,6 +45,13 @@ More info:
 Parameters:
     - df (pandas.DataFrame): Input DataFrame which should contain columns 'high', 'low', and 'close'.
     - period (int): Period for the ATR calculation. Default is 14.
+    - dtype (np.dtype): Computation precision, np.float64 or np.float32. Default is None,
+      which uses the global setting (see bta.core.set_default_dtype).
+    - state (dict): State carried between calls on consecutive chunks of one series,
+      which then give the values of a single call (see bta.run_chunked).
+      Default is None.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
 
 Call with:
     df['atr'] = bta.average_true_range(df, 14)['atr']
@@ -1,31 +1,39 @@
 # -*- coding: utf-8 -*-
 # bollinger_bands.py
-import numpy as np
+from typing import List, Union
+
 import pandas as pd
 
+from bamboo_ta import core
+from bamboo_ta._results import _build_result, _source_values, _wide_columns
+
 
 def bollinger_bands(
     df: pd.DataFrame,
-    column: str = "close",
+    column: Union[str, List[str]] = "close",
     period: int = 20,
     std_dev: float = 2.0,
     ddof: int = 0,
+    dtype=None,
+    state: dict = None,
+    return_type: str = "frame",
 ) -> pd.DataFrame:
     """Bollinger Bands"""
-    df_copy = df.copy()
-
-    # Calculate middle band (SMA)
-    sma = df_copy[column].rolling(window=period).mean()
-
-    # Calculate standard deviation of the specified column
-    rolling_std = df_copy[column].rolling(window=period).std(ddof=ddof)
-
-    # Calculate upper and lower bands
-    df_copy["bb_upper"] = sma + (rolling_std * std_dev)
-    df_copy["bb_middle"] = sma
-    df_copy["bb_lower"] = sma - (rolling_std * std_dev)
-
-    return df_copy[["bb_upper", "bb_middle", "bb_lower"]]
+    # SMA middle band with bands at std_dev rolling standard deviations
+    upper, middle, lower = core.bollinger_bands(
+        _source_values(df, column),
+        period=period,
+        std_dev=std_dev,
+        ddof=ddof,
+        dtype=dtype,
+        state=state,
+    )
+
+    return _build_result(
+        _wide_columns({"bb_upper": upper, "bb_middle": middle, "bb_lower": lower}, column),
+        df.index,
+        return_type,
+    )
 
 
 bollinger_bands.__doc__ = """
@@ -44,10 +52,19 @@ More info:
 
 Parameters:
     - df (pandas.DataFrame): DataFrame containing the data.
-    - column (str): The column name on which the BBANDS is to be applied. Default is 'close'.
+    - column (str or list): The column name on which the BBANDS is to be applied. Default is 'close'.
+      A list of columns is computed in one pass, with the outputs named
+      'bb_upper_<column>', 'bb_middle_<column>' and 'bb_lower_<column>'.
     - period (int): Look-back period to compute the moving average. Default is 20.
     - std_dev (float): Number of standard deviations to compute the upper and lower bands. Default is 2.0.
     - ddof (int): Degrees of Freedom to use in standard deviation calculation. Default is 0.
+    - dtype (np.dtype): Computation precision, np.float64 or np.float32. Default is None,
+      which uses the global setting (see bta.core.set_default_dtype).
+    - state (dict): State carried between calls on consecutive chunks of one series,
+      which then give the values of a single call (see bta.run_chunked). Single column
+      only. Default is None.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
 
 Call with:
     bb_result = bta.bollinger_bands(df, 'close', 20, 2, 0)
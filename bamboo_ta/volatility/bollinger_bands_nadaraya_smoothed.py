@@ -3,6 +3,8 @@
 import numpy as np
 import pandas as pd
 
+from bamboo_ta._results import _build_result
+
 
 def bollinger_bands_nadaraya_smoothed(
     df: pd.DataFrame,
@@ -13,12 +15,11 @@ def bollinger_bands_nadaraya_smoothed(
     med_stdev: float = 4.0,
     long_period: int = 100,
     long_stdev: float = 4.25,
-    n: int = 100  # Reduced default for better performance
+    n: int = 100,  # Reduced default for better performance
+    return_type: str = "frame"
 ) -> pd.DataFrame:
     """Bollinger Bands (Nadaraya Smoothed)"""
     
-    df_copy = df.copy()
-    
     # Ensure the DataFrame contains the required columns
     required_columns = ["high", "low", "close"]
     for col in required_columns:
@@ -26,7 +27,7 @@ def bollinger_bands_nadaraya_smoothed(
             raise KeyError(f"DataFrame must contain '{col}' column")
     
     # Calculate typical price (HLC3) - matches Pine Script exactly
-    tp = (df_copy["high"] + df_copy["low"] + df_copy["close"]) / 3
+    tp = (df["high"] + df["low"] + df["close"]) / 3
     
     def gaussian_weight(x, h):
         """
@@ -114,34 +115,35 @@ def bollinger_bands_nadaraya_smoothed(
     smoothed_bolu_4 = running_nadaraya_watson(bolu_fourth, n, h)
     smoothed_bold_4 = running_nadaraya_watson(bold_fourth, n, h)
     
-    # Create result DataFrame
-    result = pd.DataFrame(index=df_copy.index)
-    
-    # All bands
-    result['bb_upper_1'] = smoothed_bolu_1
-    result['bb_lower_1'] = smoothed_bold_1
-    result['bb_upper_2'] = smoothed_bolu_2
-    result['bb_lower_2'] = smoothed_bold_2
-    result['bb_upper_3'] = smoothed_bolu_3
-    result['bb_lower_3'] = smoothed_bold_3
-    result['bb_upper_4'] = smoothed_bolu_4
-    result['bb_lower_4'] = smoothed_bold_4
-    
     # Calculate band break signals
-    result['upper_band_break'] = (
-        (df_copy['close'] > result['bb_upper_1']) & 
-        (df_copy['close'].shift(1) <= result['bb_upper_1'].shift(1))
+    upper_band_break = (
+        (df['close'] > smoothed_bolu_1) & 
+        (df['close'].shift(1) <= smoothed_bolu_1.shift(1))
     ).astype(int)
     
-    result['lower_band_break'] = (
-        (df_copy['close'] < result['bb_lower_1']) & 
-        (df_copy['close'].shift(1) >= result['bb_lower_1'].shift(1))
+    lower_band_break = (
+        (df['close'] < smoothed_bold_1) & 
+        (df['close'].shift(1) >= smoothed_bold_1.shift(1))
     ).astype(int)
     
-    # Add typical price for reference
-    result['typical_price'] = tp
-    
-    return result
+    # All bands, the break signals and the typical price for reference
+    return _build_result(
+        {
+            'bb_upper_1': smoothed_bolu_1,
+            'bb_lower_1': smoothed_bold_1,
+            'bb_upper_2': smoothed_bolu_2,
+            'bb_lower_2': smoothed_bold_2,
+            'bb_upper_3': smoothed_bolu_3,
+            'bb_lower_3': smoothed_bold_3,
+            'bb_upper_4': smoothed_bolu_4,
+            'bb_lower_4': smoothed_bold_4,
+            'upper_band_break': upper_band_break,
+            'lower_band_break': lower_band_break,
+            'typical_price': tp,
+        },
+        df.index,
+        return_type,
+    )
 
 
 bollinger_bands_nadaraya_smoothed.__doc__ = """
@@ -190,6 +192,8 @@ Parameters:
     - long_period (int): Period for long-term Bollinger Bands. Default is 100.
     - long_stdev (float): Standard deviation multiplier for long-term bands. Default is 4.25.
     - n (int): Number of historical bars to consider for smoothing. Default is 100 (reduced from 499 for performance).
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
 
 Call with:
     result = bta.bollinger_bands_nadaraya_smoothed(df)
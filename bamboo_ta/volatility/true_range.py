@@ -1,27 +1,28 @@
 # -*- coding: utf-8 -*-
 # true_range.py
-import numpy as np
 import pandas as pd
 
+from bamboo_ta import core
+from bamboo_ta._results import _build_result
 
-def true_range(df: pd.DataFrame) -> pd.DataFrame:
-    """True Range"""
-    df_copy = df.copy()
-    prev_close = df_copy["close"].shift()
-
-    # Calculate the true range components
-    true_range = pd.concat(
-        [
-            df_copy["high"] - df_copy["low"],
-            (df_copy["high"] - prev_close).abs(),
-            (df_copy["low"] - prev_close).abs(),
-        ],
-        axis=1,
-    ).max(axis=1)
 
-    df_copy["true_range"] = true_range
+def true_range(
+    df: pd.DataFrame,
+    dtype=None,
+    state: dict = None,
+    return_type: str = "frame"
+) -> pd.DataFrame:
+    """True Range"""
+    # Largest of high - low, |high - prev close| and |low - prev close|
+    true_range = core.true_range(
+        df["high"].to_numpy(),
+        df["low"].to_numpy(),
+        df["close"].to_numpy(),
+        dtype=dtype,
+        state=state,
+    )
 
-    return df_copy[["true_range"]]
+    return _build_result({"true_range": true_range}, df.index, return_type)
 
 
 true_range.__doc__ = """
@@ -42,6 +43,13 @@ More info:
 
 Parameters:
     - df (pandas.DataFrame): Input DataFrame which should contain 'high', 'low', and 'close' columns.
+    - dtype (np.dtype): Computation precision, np.float64 or np.float32. Default is None,
+      which uses the global setting (see bta.core.set_default_dtype).
+    - state (dict): State carried between calls on consecutive chunks of one series,
+      which then give the values of a single call (see bta.run_chunked).
+      Default is None.
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
 
 Call with:
     df['true_range'] = bta.true_range(df)['true_range']
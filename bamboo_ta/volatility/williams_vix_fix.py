@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 # williams_vix_fix.py
 import pandas as pd
-import numpy as np
 
+from bamboo_ta._outputs import _flag_dtype
+from bamboo_ta.events import _flag_events
 
-def williams_vix_fix(df, vix_length=22, mult=2.0, bbl=20, ph=0.85):
+
+def williams_vix_fix(df, vix_length=22, mult=2.0, bbl=20, ph=0.85, events=False):
     """Williams VIX Fix"""
     
     # Ensure the DataFrame contains the required columns
@@ -40,12 +42,15 @@ def williams_vix_fix(df, vix_length=22, mult=2.0, bbl=20, ph=0.85):
     
     # VIX Fix signal conditions (green flash criteria)
     # Signal when VIX Fix >= upper_band OR VIX Fix >= range_high
-    vix_signal = ((wvf >= upper_band) | (wvf >= range_high)).astype(int)
+    vix_signal = ((wvf >= upper_band) | (wvf >= range_high)).astype(_flag_dtype())
     
     # Green flash signal - triggers when signal goes from 0 to 1
     green_flash = (
         (vix_signal == 1) & (vix_signal.shift(1) == 0)
-    ).astype(int)
+    ).astype(_flag_dtype())
+    
+    if events:
+        return {'williams_vix_fix_green_flash': _flag_events(green_flash)}
     
     # Store results in the copy DataFrame
     df_copy['williams_vix_fix'] = wvf
@@ -91,6 +96,9 @@ Parameters:
     - mult (float): Multiplier for standard deviation bands. Default is 2.0.
     - bbl (int): Period for calculating Bollinger Band levels. Default is 20.
     - ph (float): Percentile threshold for range high signals. Default is 0.85.
+    - events (bool): Return only the green flashes, as sparse events: a dict
+      {'williams_vix_fix_green_flash': {'positions': sorted int32 row positions,
+      'values': None}} (see bta.densify_events). Default is False.
 
 Call with:
     vix_result = bta.williams_vix_fix(df, vix_length=22, mult=2.0, bbl=20, ph=0.85)
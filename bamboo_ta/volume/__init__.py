@@ -4,6 +4,9 @@
 from .accumulation_distribution_index import accumulation_distribution_index
 from .accumulation_distribution_oscillator import accumulation_distribution_oscillator
 from .accumulation_on_balance_volume import accumulation_on_balance_volume
+from .anchored_volume_weighted_average_price import (
+    anchored_volume_weighted_average_price,
+)
 from .chaikin_money_flow import chaikin_money_flow
 from .ease_of_movement import ease_of_movement
 from .force_index import force_index
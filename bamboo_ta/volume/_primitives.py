@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# _primitives.py
+
+"""
+Shared array primitives for the volume indicators.
+
+Most volume indicators are conditional accumulations: add the volume (or a
+price change weighted by volume) only on bars that satisfy a condition, or
+sum such flows over a rolling window. Instead of looping bar by bar, these
+helpers express those recursions as masked cumulative sums and plain
+rolling sums, both of which run in O(n) inside NumPy/pandas.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def signed_volume(change, volume) -> np.ndarray:
+    """
+    Volume signed by the direction of a change series (OBV-style flow).
+
+    Parameters:
+    - change (array-like): Price change per bar (e.g. close.diff()).
+    - volume (array-like): Volume per bar.
+
+    Returns:
+    - np.ndarray: +volume where change > 0, -volume where change < 0 and
+      0 otherwise (including bars where change is NaN).
+    """
+    change = np.asarray(change, dtype=np.float64)
+    volume = np.asarray(volume, dtype=np.float64)
+    return np.where(change > 0, volume, np.where(change < 0, -volume, 0.0))
+
+
+def masked_cumsum(values, mask=None, initial=None, skipna: bool = False) -> np.ndarray:
+    """
+    Cumulative sum of the values on bars where the mask is True.
+
+    Bars where the mask is False carry the running total forward unchanged,
+    which is exactly the recursion ``x[i] = x[i-1] + (values[i] if mask[i]
+    else 0)`` used by NVI, PVI and PVT.
+
+    Parameters:
+    - values (array-like): Values to accumulate.
+    - mask (array-like of bool, optional): Bars that contribute. All bars
+      contribute when omitted.
+    - initial (float, optional): Value of the first bar. When given, the
+      first bar is set to this value and accumulation starts from the
+      second bar.
+    - skipna (bool): If True, NaN values contribute nothing and their own
+      positions are NaN in the output (pandas ``cumsum`` semantics). If
+      False, a NaN propagates to every later bar. Default is False.
+
+    Returns:
+    - np.ndarray: The running totals as float64.
+    """
+    values = np.array(values, dtype=np.float64)
+    if mask is not None:
+        values = np.where(np.asarray(mask, dtype=bool), values, 0.0)
+    if initial is not None and values.shape[0] > 0:
+        values[0] = initial
+
+    if not skipna:
+        return np.cumsum(values)
+
+    missing = np.isnan(values)
+    values[missing] = 0.0
+    result = np.cumsum(values)
+    result[missing] = np.nan
+    return result
+
+
+def rolling_sum(values, window: int, min_periods: int = None) -> np.ndarray:
+    """
+    Rolling sum over a fixed window, skipping NaN values.
+
+    Parameters:
+    - values (array-like): Values to sum.
+    - window (int): Window length.
+    - min_periods (int, optional): Minimum number of non-NaN observations
+      required for a value. Defaults to the window length.
+
+    Returns:
+    - np.ndarray: The rolling sums as float64 (NaN where not enough data).
+    """
+    values = pd.Series(np.asarray(values, dtype=np.float64))
+    return values.rolling(window, min_periods=min_periods).sum().to_numpy()
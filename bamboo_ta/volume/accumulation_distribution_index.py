@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 # accumulation_distribution_index.py
-import numpy as np
 import pandas as pd
 
+from bamboo_ta.volume._primitives import masked_cumsum
+
 
 def accumulation_distribution_index(
     df: pd.DataFrame, fillna: bool = False
@@ -21,8 +22,9 @@ def accumulation_distribution_index(
         (df_copy["close"] - df_copy["low"]) - (df_copy["high"] - df_copy["close"])
     ) / (df_copy["high"] - df_copy["low"])
     clv = clv.fillna(0.0)  # Handling division by zero
-    adi = clv * df_copy["volume"]
-    adi = adi.cumsum()
+    adi = pd.Series(
+        masked_cumsum(clv * df_copy["volume"], skipna=True), index=df_copy.index
+    )
 
     if fillna:
         adi = adi.fillna(0)
@@ -2,7 +2,8 @@
 # accumulation_distribution_oscillator.py
 
 import pandas as pd
-import numpy as np
+
+from bamboo_ta.volume._primitives import masked_cumsum
 
 
 def accumulation_distribution_oscillator(
@@ -26,8 +27,9 @@ def accumulation_distribution_oscillator(
         (df_copy["close"] - df_copy["low"]) - (df_copy["high"] - df_copy["close"])
     ) / (df_copy["high"] - df_copy["low"])
     clv = clv.fillna(0.0)  # Handling division by zero
-    ad = clv * df_copy["volume"]
-    ad = ad.cumsum()
+    ad = pd.Series(
+        masked_cumsum(clv * df_copy["volume"], skipna=True), index=df_copy.index
+    )
     
     # Calculate fast and slow EMAs of AD
     fast_ad = ad.ewm(span=fast_length, adjust=False).mean()
@@ -4,6 +4,12 @@
 import pandas as pd
 import numpy as np
 
+from bamboo_ta.volume._primitives import (
+    masked_cumsum,
+    rolling_sum,
+    signed_volume,
+)
+
 
 def accumulation_on_balance_volume(
     df: pd.DataFrame,
@@ -36,12 +42,9 @@ def accumulation_on_balance_volume(
 
     # Calculate OBV
     df_copy["change"] = df_copy["close"].diff()
-    df_copy["obv"] = np.where(
-        df_copy["change"] > 0,
-        df_copy["volume"],
-        np.where(df_copy["change"] < 0, -df_copy["volume"], 0),
+    df_copy["obv"] = masked_cumsum(
+        signed_volume(df_copy["change"], df_copy["volume"]), skipna=True
     )
-    df_copy["obv"] = df_copy["obv"].cumsum()
 
     # Calculate fast and slow MAs of OBV
     if ma_type.upper() == "EMA":
@@ -57,29 +60,19 @@ def accumulation_on_balance_volume(
     df_copy["obv_min"] = df_copy["obv"].rolling(window=min_lookback).min()
     df_copy["obv_max"] = df_copy["obv"].rolling(window=max_lookback).max()
 
-    # Determine long and short runs
-    df_copy["obv_long_run"] = 0
-    df_copy["obv_short_run"] = 0
-
-    # Calculate runs
-    for i in range(run_length, len(df_copy)):
-        # Check for long run
-        is_long_run = True
-        for j in range(run_length):
-            if df_copy["obv_fast"].iloc[i - j] <= df_copy["obv_slow"].iloc[i - j]:
-                is_long_run = False
-                break
-        # Use .loc instead of chained indexing to avoid SettingWithCopyWarning and FutureWarning
-        df_copy.loc[i, "obv_long_run"] = 1 if is_long_run else 0
-
-        # Check for short run
-        is_short_run = True
-        for j in range(run_length):
-            if df_copy["obv_fast"].iloc[i - j] >= df_copy["obv_slow"].iloc[i - j]:
-                is_short_run = False
-                break
-        # Use .loc instead of chained indexing to avoid SettingWithCopyWarning and FutureWarning
-        df_copy.loc[i, "obv_short_run"] = 1 if is_short_run else 0
+    # Determine long and short runs: the fast MA stayed above (long) or below
+    # (short) the slow MA for the last run_length bars
+    fast_above = ~(df_copy["obv_fast"] <= df_copy["obv_slow"])
+    fast_below = ~(df_copy["obv_fast"] >= df_copy["obv_slow"])
+    long_run = rolling_sum(fast_above, run_length) == run_length
+    short_run = rolling_sum(fast_below, run_length) == run_length
+
+    # Runs are only evaluated once run_length bars of history are available
+    long_run[:run_length] = False
+    short_run[:run_length] = False
+
+    df_copy["obv_long_run"] = long_run.astype(np.int64)
+    df_copy["obv_short_run"] = short_run.astype(np.int64)
 
     # Select and return only the relevant columns
     result_columns = [
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+# anchored_volume_weighted_average_price.py
+import numpy as np
+import pandas as pd
+
+
+# Anchor names that reset the VWAP on calendar boundaries
+TIME_ANCHORS = ("session", "day", "week", "month", "quarter", "year")
+
+
+def anchored_volume_weighted_average_price(
+    df: pd.DataFrame,
+    anchor="session",
+    source: str = "hlc3",
+    multipliers: tuple = (1.0, 2.0, 3.0),
+    volume_col: str = "volume",
+) -> pd.DataFrame:
+    """Anchored Volume Weighted Average Price with standard deviation bands"""
+    df_copy = df.copy()
+
+    # Ensure the DataFrame contains the required columns
+    required_columns = ["high", "low", "close", volume_col]
+    for col in required_columns:
+        if col not in df.columns:
+            raise KeyError(f"DataFrame must contain '{col}' column")
+
+    # Calculate the source price
+    price = _vwap_source(df_copy, source)
+
+    # Determine where each anchored segment starts
+    starts = _anchor_starts(df_copy, anchor)
+
+    # VWAP, volume-weighted standard deviation and bands in one pass
+    result = _anchored_vwap(
+        price.to_numpy(dtype=np.float64),
+        df_copy[volume_col].to_numpy(dtype=np.float64),
+        starts=starts,
+        multipliers=multipliers,
+    )
+
+    return pd.DataFrame(result, index=df_copy.index)
+
+
+def _vwap_source(df: pd.DataFrame, source: str) -> pd.Series:
+    """
+    Price series used for the VWAP calculation.
+
+    Parameters:
+    - df (pandas.DataFrame): Input DataFrame with OHLC columns.
+    - source (str): 'hlc3', 'hl2', 'ohlc4', 'close' or the name of any column.
+
+    Returns:
+    - pd.Series: The source price series.
+    """
+    if source == "hlc3":
+        return (df["high"] + df["low"] + df["close"]) / 3
+    if source == "hl2":
+        return (df["high"] + df["low"]) / 2
+    if source == "ohlc4":
+        return (df["open"] + df["high"] + df["low"] + df["close"]) / 4
+    if source in df.columns:
+        return df[source]
+    raise ValueError("Invalid source. Use 'hlc3', 'hl2', 'ohlc4' or a column name")
+
+
+def _anchor_starts(df: pd.DataFrame, anchor) -> np.ndarray:
+    """
+    Boolean array marking the first bar of every anchored VWAP segment.
+
+    Parameters:
+    - df (pandas.DataFrame): Input DataFrame. Time based anchors use the 'date'
+      column when present, otherwise a DatetimeIndex.
+    - anchor: One of:
+        - None: a single segment covering the whole DataFrame.
+        - 'session' / 'day', 'week', 'month', 'quarter', 'year': reset on the
+          first bar of every calendar period ('session' equals 'day' for
+          24/7 markets).
+        - str: name of a boolean column; a new segment starts where it is True.
+        - array-like of bool (same length as df): a new segment starts where
+          it is True.
+
+    Returns:
+    - np.ndarray: Boolean array, True on the first bar of each segment.
+    """
+    n = len(df)
+
+    if anchor is None:
+        starts = np.zeros(n, dtype=bool)
+
+    elif isinstance(anchor, str) and anchor in TIME_ANCHORS:
+        if "date" in df.columns:
+            dates = pd.DatetimeIndex(pd.to_datetime(df["date"]))
+        elif isinstance(df.index, pd.DatetimeIndex):
+            dates = df.index
+        else:
+            raise KeyError(
+                f"Anchor '{anchor}' requires a 'date' column or a DatetimeIndex"
+            )
+
+        # Integer key per calendar period; a segment starts where the key changes
+        if anchor in ("session", "day"):
+            key = dates.normalize().asi8
+        elif anchor == "week":
+            key = (dates.normalize() - pd.to_timedelta(dates.dayofweek, unit="D")).asi8
+        elif anchor == "month":
+            key = np.asarray(dates.year * 12 + dates.month)
+        elif anchor == "quarter":
+            key = np.asarray(dates.year * 4 + dates.quarter)
+        else:
+            key = np.asarray(dates.year)
+        starts = np.empty(n, dtype=bool)
+        starts[1:] = key[1:] != key[:-1]
+
+    elif isinstance(anchor, str):
+        if anchor not in df.columns:
+            raise ValueError(
+                f"Invalid anchor: {anchor}. Use None, one of {TIME_ANCHORS}, "
+                "a boolean column name or a boolean array"
+            )
+        starts = df[anchor].fillna(False).to_numpy(dtype=bool)
+
+    else:
+        starts = np.asarray(anchor, dtype=bool)
+        if starts.shape != (n,):
+            raise ValueError("Anchor array must have the same length as the DataFrame")
+        starts = starts.copy()
+
+    # The first bar always starts a segment
+    if n > 0:
+        starts[0] = True
+
+    return starts
+
+
+def _anchored_vwap(
+    price: np.ndarray,
+    volume: np.ndarray,
+    starts: np.ndarray = None,
+    window: int = None,
+    min_periods: int = None,
+    multipliers: tuple = (),
+) -> dict:
+    """
+    Shared VWAP engine used by the VWAP family of indicators.
+
+    The sums of price * volume, volume and (when bands are requested)
+    price^2 * volume are accumulated together, either as segmented
+    cumulative sums that reset on every anchor start, or as rolling sums over
+    a fixed window. From those the VWAP and the volume-weighted standard
+    deviation, sqrt(sum(v * p^2) / sum(v) - vwap^2), are derived.
+
+    Parameters:
+    - price (np.ndarray): Source price per bar.
+    - volume (np.ndarray): Volume per bar.
+    - starts (np.ndarray, optional): Boolean array marking the first bar of
+      each anchored segment. Ignored when ``window`` is given.
+    - window (int, optional): Use rolling sums over this window instead of
+      anchored cumulative sums.
+    - min_periods (int, optional): Minimum observations for the rolling sums.
+      Defaults to ``window``.
+    - multipliers (tuple): Standard deviation multipliers of the bands. No
+      standard deviation is calculated when empty.
+
+    Returns:
+    - dict: 'vwap' and, when multipliers are given, 'vwap_stdev' plus
+      'vwap_upper_<m>' / 'vwap_lower_<m>' arrays for every multiplier.
+    """
+    multipliers = tuple(multipliers or ())
+    sums = {"pv": price * volume, "v": volume}
+    if multipliers:
+        sums["p2v"] = price * price * volume
+    sums = pd.DataFrame(sums)
+
+    if window is not None:
+        sums = sums.rolling(window, min_periods=min_periods).sum()
+    elif starts is None or not starts[1:].any():
+        sums = sums.cumsum()
+    else:
+        sums = sums.groupby(np.cumsum(starts)).cumsum()
+
+    total_pv = sums["pv"].to_numpy()
+    total_v = sums["v"].to_numpy()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vwap = total_pv / total_v
+    result = {"vwap": vwap}
+
+    if multipliers:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variance = sums["p2v"].to_numpy() / total_v - vwap * vwap
+        # Rounding can make the variance of a flat segment slightly negative
+        stdev = np.sqrt(np.maximum(variance, 0.0))
+        result["vwap_stdev"] = stdev
+        for multiplier in multipliers:
+            suffix = f"{multiplier:g}".replace(".", "_")
+            result[f"vwap_upper_{suffix}"] = vwap + multiplier * stdev
+            result[f"vwap_lower_{suffix}"] = vwap - multiplier * stdev
+
+    return result
+
+
+anchored_volume_weighted_average_price.__doc__ = """
+Name:
+    Anchored Volume Weighted Average Price (Anchored VWAP) with Bands
+
+Description:
+    The Anchored VWAP is the volume weighted average price accumulated from an
+    anchor point: it resets at the start of every session, week, month, quarter
+    or year, or at any custom event (for example a swing low, an earnings date
+    or a breakout) supplied as a boolean column or array.
+
+    Around the VWAP, bands are drawn at multiples of the volume-weighted standard
+    deviation of price within the same anchored segment, as in TradingView's
+    VWAP indicator. All segments, the VWAP, the standard deviation and every
+    band are calculated in a single vectorised pass using segmented cumulative
+    sums of price * volume, volume and price^2 * volume.
+
+More info:
+    https://www.investopedia.com/terms/v/vwap.asp
+    https://www.tradingview.com/support/solutions/43000502018-volume-weighted-average-price-vwap/
+
+Parameters:
+    - df (pandas.DataFrame): Input DataFrame which should contain 'high', 'low',
+      'close' and volume columns ('open' as well for the 'ohlc4' source). Time
+      based anchors use the 'date' column, or the DatetimeIndex when there is
+      no 'date' column.
+    - anchor (str, array-like or None): Where the VWAP resets. One of 'session'
+      (= 'day'), 'day', 'week', 'month', 'quarter', 'year', the name of a boolean
+      column, a boolean array of the same length as df, or None for a VWAP
+      over the whole DataFrame. Default is 'session'.
+    - source (str): Price source: 'hlc3', 'hl2', 'ohlc4' or any column name.
+      Default is 'hlc3'.
+    - multipliers (tuple): Standard deviation multipliers of the bands.
+      Default is (1.0, 2.0, 3.0).
+    - volume_col (str): Name of the volume column. Default is 'volume'.
+
+Call with:
+    avwap = bta.anchored_volume_weighted_average_price(df, anchor='week', multipliers=(1, 2))
+    df['vwap'] = avwap['vwap']
+    df['vwap_upper_1'] = avwap['vwap_upper_1']
+    df['vwap_lower_1'] = avwap['vwap_lower_1']
+
+    # Anchor on a custom event, e.g. every new 50 bar low
+    new_low = df['low'] <= df['low'].rolling(50).min()
+    avwap = bta.anchored_volume_weighted_average_price(df, anchor=new_low)
+
+Returns:
+    pd.DataFrame: DataFrame with 'vwap', 'vwap_stdev' and a 'vwap_upper_<m>' and
+    'vwap_lower_<m>' column per multiplier (e.g. 'vwap_upper_1', 'vwap_lower_1_5').
+"""
+
+
+def test():
+    """
+    Test function for the anchored_volume_weighted_average_price indicator.
+
+    This function uses the generic test_indicator function from bamboo_ta.py
+    to test the anchored_volume_weighted_average_price indicator.
+
+    Returns:
+        None: Displays the results to the console
+    """
+    try:
+        # Import the test_indicator function from bamboo_ta
+        from bamboo_ta.bamboo_ta import test_indicator
+
+        # Test the indicator
+        test_indicator(anchored_volume_weighted_average_price, "1d", "week")
+
+    except ImportError:
+        print("Error: Could not import test_indicator from bamboo_ta.bamboo_ta")
+    except Exception as e:
+        print(f"Error during testing: {e}")
+
+
+# Execute the test if this file is run directly
+if __name__ == "__main__":
+    test()
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 # chaikin_money_flow.py
-import numpy as np
 import pandas as pd
 
+from bamboo_ta.volume._primitives import rolling_sum
+
 
 def chaikin_money_flow(
     df: pd.DataFrame, window: int = 20, fillna: bool = False
@@ -25,10 +26,9 @@ def chaikin_money_flow(
 
     # Calculate CMF: sum of MFV over window divided by the sum of volume over the same window
     min_periods = 0 if fillna else window
-    cmf = (
-        mfv.rolling(window, min_periods=min_periods).sum()
-        / df_copy["volume"].rolling(window, min_periods=min_periods).sum()
-    )
+    cmf = pd.Series(
+        rolling_sum(mfv, window, min_periods), index=df_copy.index
+    ) / rolling_sum(df_copy["volume"], window, min_periods)
 
     # Fill NaN values if fillna is True
     if fillna:
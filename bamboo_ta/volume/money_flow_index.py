@@ -3,6 +3,8 @@
 import numpy as np
 import pandas as pd
 
+from bamboo_ta.volume._primitives import rolling_sum
+
 
 def money_flow_index(
     df: pd.DataFrame, window: int = 14, fillna: bool = False
@@ -27,14 +29,12 @@ def money_flow_index(
 
     # Calculate positive and negative money flow
     min_periods = 0 if fillna else window
-    n_positive_mf = mfr.rolling(window, min_periods=min_periods).apply(
-        lambda x: np.sum(np.where(x >= 0.0, x, 0.0)), raw=True
-    )
-    n_negative_mf = abs(
-        mfr.rolling(window, min_periods=min_periods).apply(
-            lambda x: np.sum(np.where(x < 0.0, x, 0.0)), raw=True
-        )
+    n_positive_mf = pd.Series(
+        rolling_sum(mfr.clip(lower=0.0), window, min_periods), index=df_copy.index
     )
+    n_negative_mf = pd.Series(
+        rolling_sum(mfr.clip(upper=0.0), window, min_periods), index=df_copy.index
+    ).abs()
 
     # Calculate Money Flow Index
     mfi = n_positive_mf / n_negative_mf
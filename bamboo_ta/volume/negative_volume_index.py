@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 # negative_volume_index.py
-import numpy as np
 import pandas as pd
 
+from bamboo_ta.volume._primitives import masked_cumsum
+
 
 def negative_volume_index(
     df: pd.DataFrame,
@@ -22,17 +23,10 @@ def negative_volume_index(
     # Calculate Rate of Change (ROC)
     df_copy["roc"] = df_copy["close"].pct_change() * 100
 
-    # Initialize the NVI starting from the first valid value with float type
-    df_copy["nvi"] = 1000.0  # Starting point for NVI, common practice
-
-    # Calculate NVI values only when volume decreases
-    for i in range(1, len(df_copy)):
-        if df_copy["volume"].iloc[i] < df_copy["volume"].iloc[i - 1]:
-            df_copy.loc[df_copy.index[i], "nvi"] = (
-                df_copy["nvi"].iloc[i - 1] + df_copy["roc"].iloc[i]
-            )
-        else:
-            df_copy.loc[df_copy.index[i], "nvi"] = df_copy["nvi"].iloc[i - 1]
+    # Calculate NVI: starting at 1000 (common practice), the ROC is only
+    # accumulated on bars where the volume decreases
+    volume_decreased = df_copy["volume"] < df_copy["volume"].shift(1)
+    df_copy["nvi"] = masked_cumsum(df_copy["roc"], volume_decreased, initial=1000.0)
 
     # Calculate NVI Signal
     if signal_type == "EMA":
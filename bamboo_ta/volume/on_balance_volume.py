@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 # on_balance_volume.py
-import numpy as np
 import pandas as pd
 
+from bamboo_ta import core
+from bamboo_ta._results import _build_result
+
 
 def on_balance_volume(
     df: pd.DataFrame,
@@ -10,46 +12,28 @@ def on_balance_volume(
     signal_length: int = 21,
     show_signal: bool = True,
     fillna: bool = False,
+    dtype=None,
+    return_type: str = "frame",
 ) -> pd.DataFrame:
     """On Balance Volume"""
-    df_copy = df.copy()
-
     # Ensure the DataFrame contains the required columns
     required_columns = ["close", "volume"]
     for col in required_columns:
         if col not in df.columns:
             raise KeyError(f"DataFrame must contain '{col}' column")
 
-    # Calculate OBV
-    df_copy["change"] = df_copy["close"].diff()
-    df_copy["obv"] = np.where(
-        df_copy["change"] > 0,
-        df_copy["volume"],
-        np.where(df_copy["change"] < 0, -df_copy["volume"], 0),
+    # Cumulative signed volume and its signal line
+    obv, signal = core.on_balance_volume(
+        df["close"].to_numpy(),
+        df["volume"].to_numpy(),
+        signal_type=signal_type,
+        signal_length=signal_length,
+        show_signal=show_signal,
+        fillna=fillna,
+        dtype=dtype,
     )
-    df_copy["obv"] = df_copy["obv"].cumsum()
-
-    # Calculate Signal if requested
-    if show_signal:
-        if signal_type == "EMA":
-            df_copy["signal"] = (
-                df_copy["obv"].ewm(span=signal_length, adjust=False).mean()
-            )
-        elif signal_type == "SMA":
-            df_copy["signal"] = (
-                df_copy["obv"].rolling(window=signal_length, min_periods=1).mean()
-            )
-        else:
-            raise ValueError(f"Invalid signal_type: {signal_type}. Use 'EMA' or 'SMA'.")
-    else:
-        df_copy["signal"] = np.nan
-
-    # Fill NaN values if requested
-    if fillna:
-        df_copy["obv"] = df_copy["obv"].fillna(0)
-        df_copy["signal"] = df_copy["signal"].fillna(0)
 
-    return df_copy[["obv", "signal"]]
+    return _build_result({"obv": obv, "signal": signal}, df.index, return_type)
 
 
 on_balance_volume.__doc__ = """
@@ -72,6 +56,10 @@ Parameters:
     - signal_length (int): Length for the signal smoothing. Default is 21.
     - show_signal (bool): If True, calculate and return the signal line. Default is True.
     - fillna (bool): If True, fill nan values with 0. Default is False.
+    - dtype (np.dtype): Computation precision, np.float64 or np.float32. Default is None,
+      which uses the global setting (see bta.core.set_default_dtype).
+    - return_type (str): Result container, 'frame' (pd.DataFrame), 'dict' (column name ->
+      np.ndarray) or 'ndarray' (2D array, one column per output). Default is 'frame'.
 
 Call with:
     obv_df = bta.on_balance_volume(df, signal_type='SMA', signal_length=21, show_signal=True, fillna=True)
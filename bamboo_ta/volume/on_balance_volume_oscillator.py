@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 # on_balance_volume_oscillator.py
-import numpy as np
 import pandas as pd
 
+from bamboo_ta.volume._primitives import masked_cumsum, signed_volume
+
 
 def on_balance_volume_oscillator(
     df: pd.DataFrame, length: int = 20, fillna: bool = False
@@ -18,12 +19,9 @@ def on_balance_volume_oscillator(
 
     # Calculate OBV
     df_copy["change"] = df_copy["close"].diff()
-    df_copy["obv"] = np.where(
-        df_copy["change"] > 0,
-        df_copy["volume"],
-        np.where(df_copy["change"] < 0, -df_copy["volume"], 0),
+    df_copy["obv"] = masked_cumsum(
+        signed_volume(df_copy["change"], df_copy["volume"]), skipna=True
     )
-    df_copy["obv"] = df_copy["obv"].cumsum()
 
     # Calculate OBV Oscillator
     df_copy["ema_obv"] = df_copy["obv"].ewm(span=length, adjust=False).mean()
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 # positive_volume_index.py
-import numpy as np
 import pandas as pd
 
+from bamboo_ta.volume._primitives import masked_cumsum
+
 
 def positive_volume_index(
     df: pd.DataFrame,
@@ -22,13 +23,10 @@ def positive_volume_index(
     # Calculate Rate of Change (ROC)
     df_copy["roc"] = df_copy["close"].pct_change() * 100
 
-    # Initialize PVI column with appropriate dtype
-    df_copy["pvi"] = 0.0
-
-    # Calculate PVI
+    # Calculate PVI: the ROC is only accumulated on bars where the volume increases
     pvi_condition = df_copy["volume"] > df_copy["volume"].shift(1)
-    df_copy.loc[pvi_condition, "pvi"] = df_copy["roc"]
-    df_copy["pvi"] = df_copy["pvi"].cumsum().shift(1).fillna(0)
+    df_copy["pvi"] = masked_cumsum(df_copy["roc"], pvi_condition, skipna=True)
+    df_copy["pvi"] = df_copy["pvi"].shift(1).fillna(0)
 
     # Calculate PVI Signal
     if signal_type == "EMA":
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 # price_volume_trend.py
-import numpy as np
 import pandas as pd
 
+from bamboo_ta.volume._primitives import masked_cumsum
+
 
 def price_volume_trend(
     df: pd.DataFrame,
@@ -21,18 +22,13 @@ def price_volume_trend(
         if col not in df.columns:
             raise KeyError(f"DataFrame must contain '{col}' column")
 
-    # Initialize PVT column
-    df_copy["price_volume_trend"] = 0.0
-
-    # Calculate PVT iteratively
-    for i in range(1, len(df_copy)):
-        prev_pvt = df_copy.at[i - 1, "price_volume_trend"]
-        price_change = (
-            df_copy.at[i, "close"] - df_copy.at[i - 1, "close"]
-        ) / df_copy.at[i - 1, "close"]
-        df_copy.at[i, "price_volume_trend"] = (
-            price_change * df_copy.at[i, "volume"] + prev_pvt
-        )
+    # Calculate PVT: cumulative sum of the relative price change times volume,
+    # starting at 0 on the first bar
+    prev_close = df_copy["close"].shift(1)
+    price_change = (df_copy["close"] - prev_close) / prev_close
+    df_copy["price_volume_trend"] = masked_cumsum(
+        price_change * df_copy["volume"], initial=0.0
+    )
 
     # Optional smoothing
     if smoothing_factor:
@@ -3,9 +3,14 @@
 import numpy as np
 import pandas as pd
 
+from bamboo_ta.volume.anchored_volume_weighted_average_price import (
+    _anchor_starts,
+    _anchored_vwap,
+)
+
 
 def volume_weighted_average_price(
-    df: pd.DataFrame, window: int = 14, fillna: bool = False
+    df: pd.DataFrame, window: int = 14, fillna: bool = False, anchor=None
 ) -> pd.DataFrame:
     """Volume Weighted Average Price"""
     df_copy = df.copy()
@@ -18,15 +23,17 @@ def volume_weighted_average_price(
 
     # Calculate typical price
     typical_price = (df_copy["high"] + df_copy["low"] + df_copy["close"]) / 3.0
-    typical_price_volume = typical_price * df_copy["volume"]
 
-    # Calculate VWAP over the rolling window
+    # Calculate VWAP over the rolling window, or from each anchor when given
     min_periods = 0 if fillna else window
-    total_pv = typical_price_volume.rolling(window, min_periods=min_periods).sum()
-    total_volume = df_copy["volume"].rolling(window, min_periods=min_periods).sum()
-
-    # VWAP calculation
-    vwap = total_pv / total_volume
+    vwap = _anchored_vwap(
+        typical_price.to_numpy(dtype=np.float64),
+        df_copy["volume"].to_numpy(dtype=np.float64),
+        starts=_anchor_starts(df_copy, anchor) if anchor is not None else None,
+        window=window if anchor is None else None,
+        min_periods=min_periods,
+    )["vwap"]
+    vwap = pd.Series(vwap, index=df_copy.index)
     if fillna:
         vwap = vwap.fillna(0)
 
@@ -44,7 +51,9 @@ Description:
     The Volume Weighted Average Price (VWAP) equals the dollar value of all trading periods 
     divided by the total trading volume for the current day. VWAP is often used by institutional 
     traders to determine the quality of execution. This implementation provides a rolling VWAP 
-    over a specified window period, making it usable across multiple timeframes.
+    over a specified window period, making it usable across multiple timeframes. When an
+    anchor is given, the VWAP is instead accumulated from the start of every anchored
+    period (see anchored_volume_weighted_average_price for bands around it).
 
 More info:
     https://www.investopedia.com/terms/v/vwap.asp
@@ -53,9 +62,13 @@ Parameters:
     - df (pandas.DataFrame): Input DataFrame which should contain 'high', 'low', 'close', and 'volume' columns.
     - window (int): n period for rolling calculation. Default is 14.
     - fillna (bool): If True, fill nan values.
+    - anchor (str, array-like or None): If given, reset the VWAP on every anchor
+      ('session', 'day', 'week', 'month', 'quarter', 'year', a boolean column name or
+      a boolean array) instead of using the rolling window. Default is None.
 
 Call with:
     df['vwap'] = bta.volume_weighted_average_price(df, window=14, fillna=True)['vwap']
+    df['vwap_daily'] = bta.volume_weighted_average_price(df, anchor='session')['vwap']
 
 Returns:
     pd.DataFrame: DataFrame with 'vwap' column.
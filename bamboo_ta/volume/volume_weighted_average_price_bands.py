@@ -3,9 +3,14 @@
 import numpy as np
 import pandas as pd
 
+from bamboo_ta.volume.anchored_volume_weighted_average_price import (
+    _anchor_starts,
+    _anchored_vwap,
+)
+
 
 def volume_weighted_average_price_bands(
-    df: pd.DataFrame, window_size: int = 20, num_of_std: float = 1.0
+    df: pd.DataFrame, window_size: int = 20, num_of_std: float = 1.0, anchor=None
 ) -> pd.DataFrame:
     """Volume-Weighted Average Price Bands"""
     if not {"close", "high", "low", "volume"}.issubset(df.columns):
@@ -19,12 +24,12 @@ def volume_weighted_average_price_bands(
     # Calculate typical price
     df_copy["typical_price"] = (df_copy["close"] + df_copy["high"] + df_copy["low"]) / 3
 
-    # Calculate cumulative VWAP
-    df_copy["cum_typical_volume"] = (
-        df_copy["typical_price"] * df_copy["volume"]
-    ).cumsum()
-    df_copy["cum_volume"] = df_copy["volume"].cumsum()
-    df_copy["vwap"] = df_copy["cum_typical_volume"] / df_copy["cum_volume"]
+    # Calculate cumulative VWAP (reset on every anchor when given)
+    df_copy["vwap"] = _anchored_vwap(
+        df_copy["typical_price"].to_numpy(dtype=np.float64),
+        df_copy["volume"].to_numpy(dtype=np.float64),
+        starts=_anchor_starts(df_copy, anchor),
+    )["vwap"]
 
     # Calculate rolling standard deviation for VWAP
     rolling_std = df_copy["vwap"].rolling(window=window_size).std()
@@ -59,6 +64,10 @@ Parameters:
         - 'volume': Trading volume for each interval.
     - window_size (int, default=20): The rolling window size for VWAP and standard deviation calculations.
     - num_of_std (float, default=1.0): The number of standard deviations to calculate the upper and lower bands.
+    - anchor (str, array-like or None, default=None): Reset the cumulative VWAP on every anchor
+      ('session', 'day', 'week', 'month', 'quarter', 'year', a boolean column name or a boolean
+      array). None accumulates over the whole DataFrame. For bands based on the volume-weighted
+      standard deviation use anchored_volume_weighted_average_price.
 
 Call with:
     vwapb_result = bta.volume_weighted_average_price_bands(df, window_size=20, num_of_std=1.0)
@@ -3,6 +3,12 @@
 import numpy as np
 import pandas as pd
 
+from bamboo_ta.volume.anchored_volume_weighted_average_price import (
+    TIME_ANCHORS,
+    _anchor_starts,
+    _anchored_vwap,
+)
+
 
 def vwap_divergence(
     df: pd.DataFrame,
@@ -48,42 +54,22 @@ def vwap_divergence(
         atr = true_range.rolling(window=length).mean()
         return atr
     
-    # Calculate VWAP
-    def calculate_vwap(price, volume, anchor_type="session"):
-        """Calculate Volume Weighted Average Price"""
-        # For simplicity, we'll calculate VWAP for the entire period
-        # In a real implementation, you might want to reset VWAP based on anchor periods
-        if anchor_type == "session":
-            # Reset VWAP daily (simplified approach)
-            if 'date' in df.columns or df.index.name == 'date':
-                # Group by date and calculate VWAP for each day
-                if 'date' in df.columns:
-                    df_temp = df.copy()
-                    df_temp['date_only'] = pd.to_datetime(df_temp['date']).dt.date
-                else:
-                    df_temp = df.copy()
-                    df_temp['date_only'] = df.index.date
-                
-                def calc_group_vwap(group, price_series, vol_series):
-                    group_price = price_series.loc[group.index]
-                    group_vol = vol_series.loc[group.index]
-                    return (group_price * group_vol).cumsum() / group_vol.cumsum()
-                
-                vwap = df_temp.groupby('date_only').apply(
-                    lambda x: calc_group_vwap(x, src, df_copy[volume_col])
-                ).reset_index(level=0, drop=True).sort_index()
-            else:
-                # Simple cumulative VWAP
-                vwap = (price * volume).cumsum() / volume.cumsum()
-        else:
-            # Simple cumulative VWAP for other anchor types
-            vwap = (price * volume).cumsum() / volume.cumsum()
-        
-        return vwap
-    
     # Calculate indicators
     atr = calculate_atr(df_copy, atr_length)
-    vwap = calculate_vwap(src, df_copy[volume_col], anchor)
+    
+    # Calculate VWAP, resetting on every anchor period. Without date information
+    # the time based anchors fall back to a cumulative VWAP over the whole DataFrame
+    has_dates = "date" in df.columns or isinstance(df.index, pd.DatetimeIndex)
+    if isinstance(anchor, str) and anchor in TIME_ANCHORS and not has_dates:
+        anchor = None
+    vwap = pd.Series(
+        _anchored_vwap(
+            src.to_numpy(dtype=np.float64),
+            df_copy[volume_col].to_numpy(dtype=np.float64),
+            starts=_anchor_starts(df_copy, anchor),
+        )["vwap"],
+        index=df_copy.index,
+    )
     
     # Initialize output columns
     df_copy["vwap"] = vwap
@@ -199,8 +185,10 @@ Parameters:
       prevent clustering. Default is 15.
     - gap_threshold_multiplier (float): ATR multiplier for gap detection threshold. 
       Default is 1.0.
-    - anchor (str): VWAP anchor period. Options: 'session', 'week', 'month'. 
-      Default is 'session'.
+    - anchor (str, array-like or None): VWAP anchor period. Options: 'session', 'day', 
+      'week', 'month', 'quarter', 'year', a boolean column name, a boolean array or None 
+      (no reset). Time based anchors need a 'date' column or a DatetimeIndex and fall 
+      back to a cumulative VWAP without one. Default is 'session'.
     - source (str): Price source for VWAP calculation. Options: 'hlc3', 'hl2', 
       'ohlc4', 'close'. Default is 'hlc3'.
     - volume_col (str): Name of the volume column. Default is 'volume'.
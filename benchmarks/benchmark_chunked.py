@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# benchmark_chunked.py
+"""
+Peak memory of an in-memory run vs a chunked run over a Parquet file.
+
+Writes a random-walk OHLCV Parquet file with row groups of 100,000 rows,
+computes a set of indicators once on the whole frame (``run_many``) and once
+row group by row group (``bta.run_chunked``), checks that both give the same
+values and reports the time and the peak traced memory of each. The chunked
+peak depends on the row group size, not on the length of the file.
+
+Usage:
+    python benchmarks/benchmark_chunked.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import bamboo_ta.bamboo_ta as bta  # noqa: E402
+
+SPECS = [
+    {"name": "ema200", "func": "exponential_moving_average", "kwargs": {"period": 200}},
+    {"name": "sma50", "func": "simple_moving_average", "kwargs": {"period": 50}},
+    {"name": "hma", "func": "hull_moving_average", "kwargs": {"period": 25}},
+    {"name": "jma", "func": "jurik_moving_average"},
+    {"name": "rsi", "func": "relative_strength_index"},
+    {"name": "macd", "func": "macd"},
+    {"name": "bb", "func": "bollinger_bands"},
+    {"name": "atr", "func": "average_true_range"},
+    {"name": "st", "func": "supertrend"},
+    {"name": "psar", "func": "parabolic_sar"},
+]
+
+
+def make_ohlcv(rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Build a random-walk OHLCV DataFrame.
+
+    Parameters:
+    - rows (int): Number of rows.
+    - seed (int): Random seed.
+
+    Returns:
+    - pd.DataFrame: DataFrame with 'open', 'high', 'low', 'close' and 'volume'.
+    """
+    rng = np.random.default_rng(seed)
+    close = 30_000 * np.exp(np.cumsum(rng.normal(0, 0.001, rows)))
+    spread = close * rng.uniform(0.0001, 0.002, rows)
+    return pd.DataFrame(
+        {
+            "open": close * (1 + rng.normal(0, 0.0005, rows)),
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.uniform(100, 10_000, rows),
+        }
+    )
+
+
+def traced(func) -> tuple:
+    """
+    Run a call and trace its memory.
+
+    Parameters:
+    - func (Callable): The call, without arguments.
+
+    Returns:
+    - tuple: (result, seconds, peak traced bytes).
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main():
+    rows = 2_000_000
+    path = os.path.join(tempfile.mkdtemp(), "ohlcv.parquet")
+    pq.write_table(
+        pa.Table.from_pandas(make_ohlcv(rows), preserve_index=False),
+        path,
+        row_group_size=100_000,
+    )
+
+    # Compile the kernels before timing
+    bta.run_many(make_ohlcv(500), SPECS, workers=1)
+
+    def in_memory():
+        return bta.run_many(pq.read_table(path).to_pandas(), SPECS, workers=1)
+
+    def chunked():
+        # Keep only a summary per chunk, as a pipeline writing features would
+        return [result.iloc[-1] for result in bta.run_chunked(path, SPECS)]
+
+    expected, memory_time, memory_peak = traced(in_memory)
+    last, chunked_time, chunked_peak = traced(chunked)
+
+    # Same values: the last row of each chunk equals the in-memory row
+    for result in last:
+        assert np.array_equal(
+            expected.loc[result.name].to_numpy(), result.to_numpy(), equal_nan=True
+        ), result.name
+
+    print(f"{len(SPECS)} indicators, {rows:,} rows, row groups of 100,000")
+    print(f"{'run':<10} {'time (s)':>9} {'peak memory (MB)':>17}")
+    print(f"{'in-memory':<10} {memory_time:>9.2f} {memory_peak / 1e6:>17.1f}")
+    print(f"{'chunked':<10} {chunked_time:>9.2f} {chunked_peak / 1e6:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
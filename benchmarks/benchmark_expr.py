@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# benchmark_expr.py
+"""
+Peak memory and speed of fused formulas against chained pandas expressions.
+
+Evaluates composite formulas over a long frame once with chained pandas
+operations and once with ``bta.expr``, and reports for each the peak array
+memory allocated during the evaluation (traced with tracemalloc, which sees
+NumPy's data buffers) and the best time of three untraced calls, and checks
+that both give the same values. The result itself takes one full-length
+column; pandas adds a full-length temporary per intermediate step, ``expr``
+a few small blocks. The last formula calls the same indicator three times,
+``expr`` computes it once.
+
+Usage:
+    python benchmarks/benchmark_expr.py [rows]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import bamboo_ta.bamboo_ta as bta  # noqa: E402
+
+
+def make_ohlcv(rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Build a random-walk OHLCV DataFrame with Bollinger Bands and two EMAs.
+
+    Parameters:
+    - rows (int): Number of rows.
+    - seed (int): Random seed.
+
+    Returns:
+    - pd.DataFrame: DataFrame with 'open', 'high', 'low', 'close', 'volume',
+      'bb_upper', 'bb_lower', 'ema_fast' and 'ema_slow'.
+    """
+    rng = np.random.default_rng(seed)
+    close = 30_000 * np.exp(np.cumsum(rng.normal(0, 0.001, rows)))
+    spread = close * rng.uniform(0.0001, 0.002, rows)
+    df = pd.DataFrame(
+        {
+            "open": close * (1 + rng.normal(0, 0.0005, rows)),
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.uniform(100, 10_000, rows),
+        }
+    )
+    bands = bta.bollinger_bands(df, period=20)
+    df["bb_upper"] = bands["bb_upper"]
+    df["bb_lower"] = bands["bb_lower"]
+    df["ema_fast"] = bta.exponential_moving_average(df, period=12)["ema"]
+    df["ema_slow"] = bta.exponential_moving_average(df, period=26)["ema"]
+    return df
+
+
+def cases(df: pd.DataFrame) -> list:
+    """
+    The formulas, with their chained pandas equivalents.
+
+    Parameters:
+    - df (pd.DataFrame): The input frame.
+
+    Returns:
+    - list: (formula, callable evaluating it with pandas) tuples.
+    """
+
+    def bands():
+        return bta.bollinger_bands(df, period=20)
+
+    return [
+        (
+            "(high + low + close) / 3",
+            lambda: (df["high"] + df["low"] + df["close"]) / 3,
+        ),
+        (
+            "(close - bb_lower) / (bb_upper - bb_lower)",
+            lambda: (df["close"] - df["bb_lower"]) / (df["bb_upper"] - df["bb_lower"]),
+        ),
+        (
+            "(ema_fast - ema_slow) / ema_slow * 100",
+            lambda: (df["ema_fast"] - df["ema_slow"]) / df["ema_slow"] * 100,
+        ),
+        (
+            "(close > ema_slow) & (ema_fast > ema_slow) & (volume > 1000)",
+            lambda: (df["close"] > df["ema_slow"])
+            & (df["ema_fast"] > df["ema_slow"])
+            & (df["volume"] > 1000),
+        ),
+        (
+            "maximum(high - low, maximum(abs(high - close), abs(low - close))) / close",
+            lambda: np.maximum(
+                df["high"] - df["low"],
+                np.maximum(
+                    (df["high"] - df["close"]).abs(), (df["low"] - df["close"]).abs()
+                ),
+            )
+            / df["close"],
+        ),
+        (
+            "(close - bollinger_bands(period=20).bb_lower) / "
+            "(bollinger_bands(period=20).bb_upper - bollinger_bands(period=20).bb_lower)",
+            lambda: (df["close"] - bands()["bb_lower"])
+            / (bands()["bb_upper"] - bands()["bb_lower"]),
+        ),
+    ]
+
+
+def measure(func, repeat: int = 3) -> tuple:
+    """
+    Measure the peak traced memory and the best time of a call.
+
+    Parameters:
+    - func (Callable): The call, without arguments.
+    - repeat (int): Untraced calls to time.
+
+    Returns:
+    - tuple: (result, peak MB, seconds).
+    """
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    seconds = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        seconds = min(seconds, time.perf_counter() - start)
+    return result, peak / 2**20, seconds
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    df = make_ohlcv(rows)
+    print(f"{rows:,} rows, one result column is {rows * 8 / 2**20:.0f} MB")
+    header = f"{'pandas MB':>10} {'expr MB':>8} {'pandas ms':>10} {'expr ms':>8}"
+    print(f"{'formula':<48} {header}")
+    for formula, chained in cases(df):
+        expected, pandas_peak, pandas_time = measure(chained)
+        result, expr_peak, expr_time = measure(lambda: bta.expr(df, formula))
+        assert np.allclose(result, expected, equal_nan=True), formula
+
+        label = formula if len(formula) <= 48 else formula[:45] + "..."
+        print(
+            f"{label:<48} {pandas_peak:>10.1f} {expr_peak:>8.1f} "
+            f"{pandas_time * 1e3:>10.1f} {expr_time * 1e3:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
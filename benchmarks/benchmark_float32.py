@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+# benchmark_float32.py
+"""
+Accuracy and speed of the float32 mode of the core layer.
+
+Runs every core indicator (and candlestick_patterns) in float32 and float64
+and reports, per output, the largest deviation of the float32 result
+relative to the scale of the float64 series (max |f32 - f64| / max |f64|),
+the number of bars where the NaN pattern differs and, for discrete outputs
+(directions, reversals, patterns), the number of bars that disagree. The
+tolerance table in documentation/float32.md is produced with this script.
+
+Usage:
+    python benchmarks/benchmark_float32.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import bamboo_ta.bamboo_ta as bta  # noqa: E402
+from bamboo_ta import core  # noqa: E402
+
+DISCRETE = {"direction", "psar_reversal"}
+
+
+def make_ohlcv(rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Build a random-walk OHLCV DataFrame.
+
+    Parameters:
+    - rows (int): Number of rows.
+    - seed (int): Random seed.
+
+    Returns:
+    - pd.DataFrame: DataFrame with 'open', 'high', 'low', 'close' and 'volume'.
+    """
+    rng = np.random.default_rng(seed)
+    close = 30_000 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    spread = close * rng.uniform(0.001, 0.02, rows)
+    return pd.DataFrame(
+        {
+            "open": close * (1 + rng.normal(0, 0.005, rows)),
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.uniform(100, 10_000, rows),
+        }
+    )
+
+
+def indicators(df: pd.DataFrame) -> dict:
+    """
+    Core calls to compare, keyed by indicator name.
+
+    Parameters:
+    - df (pd.DataFrame): OHLCV data.
+
+    Returns:
+    - dict: Name -> (callable taking a dtype, output names).
+    """
+    h, l, c, v = (df[col].to_numpy() for col in ("high", "low", "close", "volume"))
+    return {
+        "simple_moving_average": (
+            lambda dtype: core.simple_moving_average(c, 21, dtype=dtype), ["sma"]
+        ),
+        "exponential_moving_average": (
+            lambda dtype: core.exponential_moving_average(c, 21, dtype=dtype), ["ema"]
+        ),
+        "rolling_moving_average": (
+            lambda dtype: core.rolling_moving_average(c, 14, dtype=dtype), ["rma"]
+        ),
+        "weighted_moving_average": (
+            lambda dtype: core.weighted_moving_average(c, 10, dtype=dtype), ["wma"]
+        ),
+        "hull_moving_average": (
+            lambda dtype: core.hull_moving_average(c, 9, dtype=dtype), ["hma"]
+        ),
+        "jurik_moving_average": (
+            lambda dtype: core.jurik_moving_average(c, 7, 0, dtype=dtype), ["jma"]
+        ),
+        "supertrend": (
+            lambda dtype: core.supertrend(h, l, c, dtype=dtype),
+            ["supertrend", "direction", "long", "short", "upper_band", "lower_band"],
+        ),
+        "parabolic_sar": (
+            lambda dtype: core.parabolic_sar(h, l, dtype=dtype),
+            ["psar_long", "psar_short", "psar_af", "psar_reversal"],
+        ),
+        "relative_strength_index": (
+            lambda dtype: core.relative_strength_index(c, 14, dtype=dtype), ["rsi"]
+        ),
+        "macd": (
+            lambda dtype: core.macd(c, dtype=dtype),
+            ["macd", "macd_signal", "macd_histogram"],
+        ),
+        "stochastics_oscillator": (
+            lambda dtype: core.stochastics_oscillator(h, l, c, dtype=dtype),
+            ["stoch", "stoch_signal", "stoch_hist"],
+        ),
+        "true_range": (lambda dtype: core.true_range(h, l, c, dtype=dtype), ["true_range"]),
+        "average_true_range": (
+            lambda dtype: core.average_true_range(h, l, c, 14, dtype=dtype), ["atr"]
+        ),
+        "bollinger_bands": (
+            lambda dtype: core.bollinger_bands(c, 20, 2.0, dtype=dtype),
+            ["bb_upper", "bb_middle", "bb_lower"],
+        ),
+        "on_balance_volume": (
+            lambda dtype: core.on_balance_volume(c, v, dtype=dtype), ["obv", "signal"]
+        ),
+    }
+
+
+def compare(reference: np.ndarray, values: np.ndarray) -> tuple:
+    """
+    Compare a float32 result with its float64 reference.
+
+    Parameters:
+    - reference (np.ndarray): float64 result.
+    - values (np.ndarray): float32 result.
+
+    Returns:
+    - tuple: (scale-relative max error, NaN mismatches, differing bars).
+    """
+    values = values.astype(np.float64)
+    both = ~np.isnan(reference) & ~np.isnan(values)
+    nan_mismatch = int((np.isnan(reference) != np.isnan(values)).sum())
+    differing = int((reference[both] != values[both]).sum())
+    if not both.any():
+        return 0.0, nan_mismatch, differing
+    scale = np.abs(reference[both]).max()
+    error = np.abs(values[both] - reference[both]).max()
+    return (error / scale if scale > 0 else error), nan_mismatch, differing
+
+
+def report(df: pd.DataFrame, title: str, patterns: bool = True) -> None:
+    """
+    Print the float32 deviations of all core indicators on one dataset.
+
+    Parameters:
+    - df (pd.DataFrame): OHLCV data.
+    - title (str): Name of the dataset.
+    - patterns (bool): Also compare candlestick_patterns (row loop, slow on
+      large inputs). Default is True.
+    """
+    print(f"\n{title} ({len(df):,} rows)")
+    print(f"{'output':<40} {'max rel error':>14} {'NaN diff':>9} {'flips':>7}")
+    for name, (func, outputs) in indicators(df).items():
+        reference = func(np.float64)
+        values = func(np.float32)
+        if not isinstance(reference, tuple):
+            reference, values = (reference,), (values,)
+        for output, ref, val in zip(outputs, reference, values):
+            error, nan_mismatch, differing = compare(ref, val)
+            flips = str(differing) if output in DISCRETE else "-"
+            print(f"{name + '.' + output:<40} {error:>14.2e} {nan_mismatch:>9} {flips:>7}")
+
+    if not patterns:
+        return
+    reference = bta.candlestick_patterns(df, dtype=np.float64)
+    values = bta.candlestick_patterns(df, dtype=np.float32)
+    for column in reference.columns:
+        differing = int((reference[column] != values[column]).sum())
+        print(f"{'candlestick_patterns.' + column:<40} {'-':>14} {0:>9} {differing:>7}")
+
+
+def timed(func, *args, repeat: int = 3, **kwargs) -> float:
+    """Best wall-clock time in seconds of ``repeat`` calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    data = pd.read_json(
+        os.path.join(os.path.dirname(__file__), "..", "data", "BTC_USDT-1d.json")
+    )
+    data.columns = ["date", "open", "high", "low", "close", "volume"]
+    report(data, "BTC/USDT 1d")
+    report(make_ohlcv(500_000), "Random walk", patterns=False)
+
+    # Inputs stored in the computation precision, as in a float32 panel
+    rows = 2_000_000
+    df = make_ohlcv(rows)
+    inputs = {
+        dtype: {col: df[col].to_numpy(dtype=dtype) for col in ("high", "low", "close")}
+        for dtype in (np.float64, np.float32)
+    }
+    cases = {
+        "true_range": lambda x, dtype: core.true_range(
+            x["high"], x["low"], x["close"], dtype=dtype
+        ),
+        "weighted_moving_average": lambda x, dtype: core.weighted_moving_average(
+            x["close"], 20, dtype=dtype
+        ),
+        "hull_moving_average": lambda x, dtype: core.hull_moving_average(
+            x["close"], 20, dtype=dtype
+        ),
+        "bollinger_bands": lambda x, dtype: core.bollinger_bands(x["close"], dtype=dtype),
+        "supertrend": lambda x, dtype: core.supertrend(
+            x["high"], x["low"], x["close"], dtype=dtype
+        ),
+    }
+    print(f"\nTimings on {rows:,} rows (inputs stored in the computation dtype)")
+    print(f"{'indicator':<28} {'float64 (s)':>12} {'float32 (s)':>12}")
+    for name, func in cases.items():
+        times = [timed(func, inputs[dtype], dtype) for dtype in (np.float64, np.float32)]
+        print(f"{name:<28} {times[0]:>12.4f} {times[1]:>12.4f}")
+
+if __name__ == "__main__":
+    main()
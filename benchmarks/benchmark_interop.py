@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+# benchmark_interop.py
+"""
+Conversion-count benchmark for the Apache Arrow and Polars inputs in
+bamboo_ta/interop.py.
+
+For null-free float columns the indicators read the Arrow/Polars buffers
+through zero-copy NumPy views and wrap their numeric results without
+copying. This script counts, per column, how many buffers are copied on the
+way in (source column -> array handed to the indicator) and on the way out
+(indicator result -> Arrow/Polars column), both for the direct path and for
+the usual "convert to pandas first" path, and times both on a large input.
+
+Usage:
+    python benchmarks/benchmark_interop.py
+"""
+
+import os
+import pickle
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import bamboo_ta.bamboo_ta as bta  # noqa: E402
+from bamboo_ta import interop  # noqa: E402
+
+COLUMNS = ["open", "high", "low", "close", "volume"]
+
+
+def make_ohlcv(rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Build a random-walk OHLCV DataFrame.
+
+    Parameters:
+    - rows (int): Number of rows.
+    - seed (int): Random seed.
+
+    Returns:
+    - pd.DataFrame: DataFrame with 'open', 'high', 'low', 'close' and 'volume'.
+    """
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, rows))
+    spread = rng.uniform(0.1, 2.0, rows)
+    return pd.DataFrame(
+        {
+            "open": close + rng.normal(0, 0.5, rows),
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.uniform(100, 10_000, rows),
+        }
+    )
+
+
+def source_buffers(data) -> dict:
+    """
+    Get the data buffers of the numeric input columns.
+
+    Parameters:
+    - data (pa.Table or pl.DataFrame): The input.
+
+    Returns:
+    - dict: Column name -> NumPy view of the column buffer.
+    """
+    if isinstance(data, pa.Table):
+        return {c: data.column(c).chunk(0).to_numpy(zero_copy_only=True) for c in COLUMNS}
+    return {c: data[c].to_numpy(allow_copy=False) for c in COLUMNS}
+
+
+def result_buffer(column) -> np.ndarray:
+    """
+    Get the data buffer of a result column.
+
+    Parameters:
+    - column (pa.ChunkedArray, pa.Array or pl.Series): The column.
+
+    Returns:
+    - np.ndarray: NumPy view of the column buffer, or a copy when the column
+      has nulls (pandas NaN converted to Arrow/Polars nulls).
+    """
+    if isinstance(column, pa.ChunkedArray):
+        column = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+    if isinstance(column, pa.Array):
+        return column.to_numpy(zero_copy_only=column.null_count == 0)
+    return column.to_numpy(allow_copy=column.null_count() > 0)
+
+
+def count_copies(data, convert_in, convert_out) -> tuple:
+    """
+    Count the copied columns of one conversion path.
+
+    Parameters:
+    - data (pa.Table or pl.DataFrame): The input.
+    - convert_in (Callable): Input container -> pandas DataFrame.
+    - convert_out (Callable): pandas result -> output container.
+
+    Returns:
+    - tuple: (input copies, output copies).
+    """
+    sources = source_buffers(data)
+    frame = convert_in(data)
+    input_copies = sum(
+        not np.shares_memory(frame[c].to_numpy(dtype=np.float64), sources[c])
+        for c in COLUMNS
+    )
+
+    result = bta.bollinger_bands.__wrapped__(frame, "close", 20, 2.0)
+    converted = convert_out(result)
+    output_copies = sum(
+        not np.shares_memory(result_buffer(converted[c]), result[c].to_numpy())
+        for c in result.columns
+    )
+    return input_copies, output_copies
+
+
+def timed(func, *args, repeat: int = 5, **kwargs) -> float:
+    """Best wall-clock time in seconds of ``repeat`` calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    rows = 1_000_000
+    df = make_ohlcv(rows)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    frame = pl.from_pandas(df)
+
+    paths = {
+        "arrow direct": (
+            table,
+            interop.to_pandas,
+            lambda result: interop.from_pandas(result, "arrow"),
+        ),
+        "arrow via pandas": (
+            table,
+            lambda data: data.to_pandas(),
+            lambda result: pa.Table.from_pandas(result, preserve_index=False),
+        ),
+        "polars direct": (
+            frame,
+            interop.to_pandas,
+            lambda result: interop.from_pandas(result, "polars"),
+        ),
+        "polars via pandas": (
+            frame,
+            lambda data: data.to_pandas(),
+            pl.from_pandas,
+        ),
+    }
+
+    print(f"Bollinger Bands on {rows:,} rows ({len(COLUMNS)} input, 3 output columns)")
+    print(f"{'path':<20} {'input copies':>14} {'output copies':>15} {'time (s)':>10}")
+    for name, (data, convert_in, convert_out) in paths.items():
+        input_copies, output_copies = count_copies(data, convert_in, convert_out)
+
+        def run():
+            return convert_out(bta.bollinger_bands.__wrapped__(convert_in(data)))
+
+        print(
+            f"{name:<20} {input_copies:>14} {output_copies:>15} {timed(run):>10.4f}"
+        )
+
+    # The wrapped indicators give the same values as the pandas path
+    expected = bta.bollinger_bands(df)
+    for data in (table, frame):
+        result = bta.bollinger_bands(data)
+        for c in expected.columns:
+            column = result[c] if isinstance(data, pl.DataFrame) else result.column(c)
+            values = result_buffer(column)
+            assert np.array_equal(values, expected[c].to_numpy(), equal_nan=True)
+    print("\nArrow and Polars results match the pandas results")
+
+    # Indicators returning another index (heiken_ashi) keep the pandas schema
+    sample = df.iloc[:1_000]
+    expected = bta.heiken_ashi(sample)
+    for data in (pa.Table.from_pandas(sample, preserve_index=False), pl.from_pandas(sample)):
+        converted = bta.heiken_ashi(data).to_pandas()
+        assert list(converted.columns) == list(expected.columns)
+        assert np.allclose(converted.to_numpy(), expected.to_numpy(), equal_nan=True)
+    print("heiken_ashi keeps its columns through Arrow and Polars")
+
+    # The wrapped indicators pickle by reference, e.g. for process pools
+    wrapped = [func for func in vars(bta).values() if hasattr(func, "__wrapped__")]
+    for func in wrapped:
+        assert pickle.loads(pickle.dumps(func)) is func
+    print(f"{len(wrapped)} wrapped indicators survive a pickle round trip")
+
+
+if __name__ == "__main__":
+    main()
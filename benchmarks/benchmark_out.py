@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+# benchmark_out.py
+"""
+Allocations and speed of the core layer with preallocated outputs.
+
+A live loop recomputes the same indicators on a fixed-length window (here
+the last 2,000 candles) over and over. With ``out=`` and ``workspace=`` the
+core functions write into the caller's result arrays and reuse their scratch
+buffers, so repeated calls of the same shape allocate no array memory.
+
+For each hot indicator this script reports the array memory allocated by
+one repeated call (traced with tracemalloc, which sees NumPy's data buffers)
+and the time per call, with and without preallocation, in float64 and
+float32, and checks that both paths give the same values, also when ``out``
+is one of the inputs.
+
+Usage:
+    python benchmarks/benchmark_out.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from bamboo_ta import core  # noqa: E402
+
+
+def make_prices(rows: int, seed: int = 42) -> tuple:
+    """
+    Build random-walk high, low and close prices.
+
+    Parameters:
+    - rows (int): Number of rows.
+    - seed (int): Random seed.
+
+    Returns:
+    - tuple: (high, low, close) float64 arrays.
+    """
+    rng = np.random.default_rng(seed)
+    close = 30_000 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    spread = close * rng.uniform(0.001, 0.02, rows)
+    return close + spread, close - spread, close
+
+
+def cases(high, low, close, dtype) -> dict:
+    """
+    Calls of the hot indicators, keyed by name.
+
+    Parameters:
+    - high, low, close (np.ndarray): Prices in the computation dtype.
+    - dtype (np.dtype): Computation dtype.
+
+    Returns:
+    - dict: Name -> (callable taking out and workspace, number of outputs).
+    """
+    return {
+        "exponential_moving_average": (
+            lambda out, ws: core.exponential_moving_average(
+                close, 21, dtype=dtype, out=out, workspace=ws
+            ),
+            1,
+        ),
+        "relative_strength_index": (
+            lambda out, ws: core.relative_strength_index(
+                close, 14, dtype=dtype, out=out, workspace=ws
+            ),
+            1,
+        ),
+        "average_true_range": (
+            lambda out, ws: core.average_true_range(
+                high, low, close, 14, dtype=dtype, out=out, workspace=ws
+            ),
+            1,
+        ),
+        "bollinger_bands": (
+            lambda out, ws: core.bollinger_bands(
+                close, 20, 2.0, dtype=dtype, out=out, workspace=ws
+            ),
+            3,
+        ),
+        "supertrend": (
+            lambda out, ws: core.supertrend(
+                high, low, close, dtype=dtype, out=out, workspace=ws
+            ),
+            6,
+        ),
+        "macd": (lambda out, ws: core.macd(close, dtype=dtype, out=out, workspace=ws), 3),
+        "stochastics_oscillator": (
+            lambda out, ws: core.stochastics_oscillator(
+                high, low, close, dtype=dtype, out=out, workspace=ws
+            ),
+            3,
+        ),
+    }
+
+
+def allocated(func) -> int:
+    """
+    Peak memory allocated by one call, in bytes.
+
+    Parameters:
+    - func (Callable): The call, without arguments.
+
+    Returns:
+    - int: Peak traced memory above the level before the call.
+    """
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak - before
+
+
+def timed(func, repeat: int = 2000) -> float:
+    """Mean wall-clock time in microseconds of ``repeat`` calls."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def check_aliased_out(prices, dtype) -> None:
+    """
+    Check that an ``out`` array that is one of the inputs gets the values
+    of a separate one.
+
+    Parameters:
+    - prices (tuple): (high, low, close) float64 arrays.
+    - dtype (np.dtype): Computation dtype.
+    """
+    names = ("high", "low", "close")
+    calls = {
+        "simple_moving_average": (
+            lambda p, out: core.simple_moving_average(
+                p["close"], 21, dtype=dtype, out=out
+            ),
+            ("close",),
+        ),
+        "true_range": (
+            lambda p, out: core.true_range(
+                p["high"], p["low"], p["close"], dtype=dtype, out=out
+            ),
+            names,
+        ),
+        "bollinger_bands": (
+            lambda p, out: core.bollinger_bands(p["close"], 20, dtype=dtype, out=out),
+            ("close",),
+        ),
+        "supertrend": (
+            lambda p, out: core.supertrend(
+                p["high"], p["low"], p["close"], dtype=dtype, out=out
+            ),
+            names,
+        ),
+    }
+    for name, (func, inputs) in calls.items():
+        fresh = dict(zip(names, (values.astype(dtype) for values in prices)))
+        expected = func(fresh, None)
+        count = len(expected) if isinstance(expected, tuple) else 1
+        for source in inputs:
+            for position in range(count):
+                aliased = dict(zip(names, (values.astype(dtype) for values in prices)))
+                out = [np.empty(len(prices[0]), dtype=dtype) for _ in range(count)]
+                out[position] = aliased[source]
+                result = func(aliased, tuple(out) if count > 1 else out[0])
+                for a, b in zip(np.atleast_2d(expected), np.atleast_2d(result)):
+                    assert np.array_equal(a, b, equal_nan=True), f"{name} {source}"
+
+
+def main():
+    rows = 2_000
+    prices = make_prices(rows)
+    for dtype in (np.float64, np.float32):
+        high, low, close = (values.astype(dtype) for values in prices)
+        check_aliased_out(prices, dtype)
+        print(f"\n{np.dtype(dtype).name}, {rows:,} rows")
+        print(
+            f"{'indicator':<28} {'alloc (B)':>10} {'alloc out= (B)':>15} "
+            f"{'time (us)':>10} {'time out= (us)':>15}"
+        )
+        for name, (func, count) in cases(high, low, close, dtype).items():
+            out = tuple(np.empty(rows, dtype=dtype) for _ in range(count))
+            out = out[0] if count == 1 else out
+            workspace = {}
+
+            def fresh():
+                return func(None, None)
+
+            def reused():
+                return func(out, workspace)
+
+            # Same values, written into the caller's arrays
+            expected = fresh()
+            result = reused()
+            for a, b in zip(np.atleast_2d(expected), np.atleast_2d(result)):
+                assert np.array_equal(a, b, equal_nan=True), name
+            assert result is out or all(r is o for r, o in zip(result, out)), name
+
+            print(
+                f"{name:<28} {allocated(fresh):>10,} {allocated(reused):>15,} "
+                f"{timed(fresh):>10.1f} {timed(reused):>15.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
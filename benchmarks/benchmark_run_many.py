@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# benchmark_run_many.py
+"""
+Serial vs thread-pool execution of a strategy's indicator set.
+
+Builds a set of about 50 indicator calls, as a strategy populates them on
+one pair, runs them with ``bta.run_many`` on 1 (one after the other), 2, 4
+and 8 threads, and prints the wall times and the speedup that ``run_many``
+reports. The speedup is bounded by the number of cores and by the parts of
+the indicators that hold the GIL (pandas bookkeeping, Python loops).
+
+Usage:
+    python benchmarks/benchmark_run_many.py
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import bamboo_ta.bamboo_ta as bta  # noqa: E402
+
+
+def make_ohlcv(rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Build a random-walk OHLCV DataFrame.
+
+    Parameters:
+    - rows (int): Number of rows.
+    - seed (int): Random seed.
+
+    Returns:
+    - pd.DataFrame: DataFrame with 'open', 'high', 'low', 'close' and 'volume'.
+    """
+    rng = np.random.default_rng(seed)
+    close = 30_000 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    spread = close * rng.uniform(0.001, 0.02, rows)
+    return pd.DataFrame(
+        {
+            "open": close * (1 + rng.normal(0, 0.005, rows)),
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.uniform(100, 10_000, rows),
+        }
+    )
+
+
+def strategy_specs() -> list:
+    """
+    Indicator calls of a typical strategy.
+
+    Returns:
+    - list: run_many specs.
+    """
+    specs = []
+    for period in (8, 13, 21, 34, 55, 89, 144, 200):
+        specs.append({"name": f"ema{period}", "func": "exponential_moving_average",
+                      "kwargs": {"period": period}})
+        specs.append({"name": f"sma{period}", "func": "simple_moving_average",
+                      "kwargs": {"period": period}})
+    for period in (7, 14, 21):
+        specs.append({"name": f"rsi{period}", "func": "relative_strength_index",
+                      "kwargs": {"period": period}})
+        specs.append({"name": f"atr{period}", "func": "average_true_range",
+                      "kwargs": {"period": period}})
+        specs.append({"name": f"rsi_ema{period}", "func": "relative_strength_index",
+                      "kwargs": {"column": "ema21", "period": period},
+                      "depends_on": ["ema21"]})
+    for period in (9, 16, 25):
+        specs.append({"name": f"hma{period}", "func": "hull_moving_average",
+                      "kwargs": {"period": period}})
+        specs.append({"name": f"wma{period}", "func": "weighted_moving_average",
+                      "kwargs": {"period": period}})
+    for length in (7, 14, 28):
+        specs.append({"name": f"jma{length}", "func": "jurik_moving_average",
+                      "kwargs": {"length": length}})
+    for multiplier in (2.0, 3.0):
+        specs.append({"name": f"st{multiplier:g}", "func": "supertrend",
+                      "kwargs": {"multiplier": multiplier}})
+    specs += [
+        {"name": "bb", "func": "bollinger_bands"},
+        {"name": "macd", "func": "macd"},
+        {"name": "stoch", "func": "stochastics_oscillator"},
+        {"name": "psar", "func": "parabolic_sar"},
+        {"name": "obv", "func": "on_balance_volume"},
+        {"name": "tr", "func": "true_range"},
+        {"name": "mfi", "func": "money_flow_index"},
+        {"name": "cci", "func": "commodity_channel_index"},
+        {"name": "ao", "func": "awesome_oscillator"},
+        {"name": "williams_r", "func": "williams_r"},
+    ]
+    return specs
+
+
+def main():
+    rows = 200_000
+    df = make_ohlcv(rows)
+    specs = strategy_specs()
+
+    # Compile the kernels before timing
+    bta.run_many(df.iloc[:500], specs, workers=1)
+
+    print(f"{len(specs)} indicators, {rows:,} rows, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'wall (s)':>9} {'vs 1 worker':>12} {'reported speedup':>17}")
+    serial = None
+    for workers in (1, 2, 4, 8):
+        _, report = bta.run_many(df, specs, workers=workers, report=True)
+        serial = serial or report["wall_time"]
+        print(
+            f"{workers:>8} {report['wall_time']:>9.3f} "
+            f"{serial / report['wall_time']:>12.2f} {report['speedup']:>17.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# benchmark_screener.py
+"""
+A latest-bar scan of many symbols against full-history calls per symbol.
+
+Computes 20 indicators for thousands of random-walk symbols with
+``bta.screen``, on fresh DataFrames and on dicts of NumPy arrays, and as a
+full-history ``run_many`` call per symbol (on a sample of the symbols,
+extrapolated), reports the times and checks that the screened values match
+the last rows of the full-history calls, for the per-symbol path (ADX) too.
+
+Usage:
+    python benchmarks/benchmark_screener.py [symbols] [bars]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import bamboo_ta.bamboo_ta as bta  # noqa: E402
+
+SPECS = [
+    {"name": "ema9", "func": "exponential_moving_average", "kwargs": {"period": 9}},
+    {"name": "ema21", "func": "exponential_moving_average", "kwargs": {"period": 21}},
+    {"name": "ema50", "func": "exponential_moving_average", "kwargs": {"period": 50}},
+    {"name": "ema200", "func": "exponential_moving_average", "kwargs": {"period": 200}},
+    {"name": "sma20", "func": "simple_moving_average", "kwargs": {"period": 20}},
+    {"name": "sma50", "func": "simple_moving_average", "kwargs": {"period": 50}},
+    {"name": "sma200", "func": "simple_moving_average", "kwargs": {"period": 200}},
+    {"name": "rma14", "func": "rolling_moving_average", "kwargs": {"period": 14}},
+    {"name": "wma10", "func": "weighted_moving_average", "kwargs": {"period": 10}},
+    {"name": "hma9", "func": "hull_moving_average", "kwargs": {"period": 9}},
+    {"name": "jma7", "func": "jurik_moving_average", "kwargs": {"length": 7}},
+    {"name": "rsi7", "func": "relative_strength_index", "kwargs": {"period": 7}},
+    {"name": "rsi14", "func": "relative_strength_index", "kwargs": {"period": 14}},
+    {"name": "macd", "func": "macd"},
+    {"name": "bb", "func": "bollinger_bands", "kwargs": {"period": 20}},
+    {"name": "atr", "func": "average_true_range", "kwargs": {"period": 14}},
+    {"name": "tr", "func": "true_range"},
+    {"name": "stoch", "func": "stochastics_oscillator"},
+    {"name": "obv", "func": "on_balance_volume"},
+    {"name": "sma100", "func": "simple_moving_average", "kwargs": {"period": 100}},
+]
+
+
+def make_frames(symbols: int, bars: int, seed: int = 42) -> dict:
+    """
+    Build random-walk 1-minute OHLCV frames.
+
+    Parameters:
+    - symbols (int): Number of symbols.
+    - bars (int): Rows per symbol.
+    - seed (int): Random seed.
+
+    Returns:
+    - dict: Symbol -> DataFrame with 'open', 'high', 'low', 'close' and 'volume'.
+    """
+    rng = np.random.default_rng(seed)
+    frames = {}
+    for i in range(symbols):
+        close = rng.uniform(1, 1_000) * np.exp(np.cumsum(rng.normal(0, 0.002, bars)))
+        spread = close * rng.uniform(0.0001, 0.003, bars)
+        frames[f"SYM{i:04d}/USDT"] = pd.DataFrame(
+            {
+                "open": close * (1 + rng.normal(0, 0.001, bars)),
+                "high": close + spread,
+                "low": close - spread,
+                "close": close,
+                "volume": rng.uniform(100, 10_000, bars),
+            }
+        )
+    return frames
+
+
+def main():
+    symbols = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    bars = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    frames = make_frames(symbols, bars)
+    bta.screen(dict(list(frames.items())[:2]), SPECS)  # compile the kernels
+
+    start = time.perf_counter()
+    table, ranks = bta.screen(frames, SPECS, ranks=True)
+    screen_time = time.perf_counter() - start
+
+    # Scanners that keep NumPy buffers per symbol skip pandas' column lookups
+    arrays = {
+        symbol: {column: frame[column].to_numpy() for column in frame.columns}
+        for symbol, frame in make_frames(symbols, bars).items()
+    }
+    start = time.perf_counter()
+    from_arrays = bta.screen(arrays, SPECS)
+    arrays_time = time.perf_counter() - start
+    assert from_arrays.equals(table)
+
+    sample = list(frames)[:: max(symbols // 100, 1)]
+    start = time.perf_counter()
+    for symbol in sample:
+        full = bta.run_many(frames[symbol], SPECS, workers=1)
+        last = full.iloc[-1]
+        # OBV is cumulative: the screened level refers to the sliced history
+        compared = [column for column in table.columns if not column.startswith("obv")]
+        assert np.allclose(
+            table.loc[symbol, compared].to_numpy(dtype=float),
+            last[compared].to_numpy(dtype=float),
+            rtol=1e-8,
+            equal_nan=True,
+        ), symbol
+    full_time = (time.perf_counter() - start) * symbols / len(sample)
+
+    # Indicators called per symbol on their sliced frame match too, recursive
+    # ones and symbols with a shorter history than the lookback included
+    checked = {symbol: frames[symbol] for symbol in sample[:5]}
+    checked["SHORT/USDT"] = frames[sample[0]].iloc[:300]
+    adx = bta.screen(checked, [{"name": "adx", "func": "average_directional_index"}])
+    for symbol, frame in checked.items():
+        last = bta.average_directional_index(frame).iloc[-1]
+        assert np.allclose(
+            adx.loc[symbol].to_numpy(dtype=float),
+            last.to_numpy(dtype=float),
+            rtol=1e-8,
+            equal_nan=True,
+        ), symbol
+
+    print(f"{symbols:,} symbols x {bars:,} bars, {len(SPECS)} indicators")
+    print(f"{table.shape[1]} output columns, ranks {ranks.shape}")
+    print(f"full history per symbol (extrapolated): {full_time:8.2f} s")
+    print(f"screen:                                  {screen_time:8.2f} s")
+    print(f"screen on NumPy arrays:                  {arrays_time:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
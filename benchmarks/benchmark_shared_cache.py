@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# benchmark_shared_cache.py
+"""
+Worker processes computing the same indicators, with and without the shared cache.
+
+Starts a number of worker processes that each compute the same indicators on
+the same long frame, the way hyperopt workers or several bots on one host
+do, once with direct calls and once through ``shared_cache.compute`` with a
+fresh cache directory, reports the wall times and checks that the cached
+values match the direct ones.
+
+Usage:
+    python benchmarks/benchmark_shared_cache.py [workers] [rows]
+"""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import bamboo_ta.bamboo_ta as bta  # noqa: E402
+from bamboo_ta import shared_cache  # noqa: E402
+
+CALLS = [
+    ("relative_strength_index", {"period": 14}),
+    ("bollinger_bands", {"period": 20}),
+    ("average_true_range", {"period": 14}),
+    ("jurik_moving_average", {"length": 7}),
+    ("macd", {}),
+    ("stochastics_oscillator", {}),
+]
+
+
+def make_ohlcv(rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Build a random-walk OHLCV DataFrame.
+
+    Parameters:
+    - rows (int): Number of rows.
+    - seed (int): Random seed.
+
+    Returns:
+    - pd.DataFrame: DataFrame with 'open', 'high', 'low', 'close' and 'volume'.
+    """
+    rng = np.random.default_rng(seed)
+    close = 30_000 * np.exp(np.cumsum(rng.normal(0, 0.001, rows)))
+    spread = close * rng.uniform(0.0001, 0.002, rows)
+    return pd.DataFrame(
+        {
+            "open": close * (1 + rng.normal(0, 0.0005, rows)),
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.uniform(100, 10_000, rows),
+        }
+    )
+
+
+def work(args: tuple) -> float:
+    """
+    Compute every call once, in a worker process.
+
+    Parameters:
+    - args (tuple): (rows, cache directory or None for direct calls).
+
+    Returns:
+    - float: Sum of the outputs, to compare the runs.
+    """
+    rows, directory = args
+    df = make_ohlcv(rows)
+    total = 0.0
+    for name, params in CALLS:
+        if directory is None:
+            result = getattr(bta, name)(df, **params)
+        else:
+            result = shared_cache.compute(
+                df, name, return_type="dict", directory=directory, **params
+            )
+        total += sum(float(np.nansum(values)) for values in dict(result).values())
+    return total
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+    directory = tempfile.mkdtemp(prefix="bamboo_ta_bench_")
+    with multiprocessing.Pool(min(workers, os.cpu_count() or 1)) as pool:
+        pool.map(work, [(1_000, None)])  # compile the kernels
+
+        start = time.perf_counter()
+        direct = pool.map(work, [(rows, None)] * workers)
+        direct_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cached = pool.map(work, [(rows, directory)] * workers)
+        cached_time = time.perf_counter() - start
+    assert np.allclose(direct, cached)
+
+    entries = shared_cache.info(directory)
+    size = sum(entry["nbytes"] for entry in entries) / 2**20
+    shared_cache.clear(directory)
+    print(f"{workers} workers x {len(CALLS)} indicators on {rows:,} rows")
+    print(f"{len(entries)} cached results, {size:.0f} MB of shared memory")
+    print(f"direct calls:  {direct_time:8.2f} s")
+    print(f"shared cache:  {cached_time:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# benchmark_store.py
+"""
+Recomputing features vs loading them from the feature store.
+
+Stores a set of indicators for a long 1-minute history, appends one day of
+candles with ``store.update`` and compares, per indicator, the time of a
+full recomputation, of the daily update and of a read of the last month
+with ``store.read``. Checks that the stored values equal a single call on
+the whole history.
+
+Usage:
+    python benchmarks/benchmark_store.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import bamboo_ta.bamboo_ta as bta  # noqa: E402
+from bamboo_ta import store  # noqa: E402
+
+CALLS = [
+    ("exponential_moving_average", {"period": 200}),
+    ("relative_strength_index", {}),
+    ("bollinger_bands", {"period": 20}),
+    ("supertrend", {}),
+    ("commodity_channel_index", {}),
+    ("donchian_channel", {"period": 55}),
+]
+
+
+def make_ohlcv(rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Build a random-walk 1-minute OHLCV DataFrame.
+
+    Parameters:
+    - rows (int): Number of rows.
+    - seed (int): Random seed.
+
+    Returns:
+    - pd.DataFrame: DataFrame with 'date', 'open', 'high', 'low', 'close' and 'volume'.
+    """
+    rng = np.random.default_rng(seed)
+    close = 30_000 * np.exp(np.cumsum(rng.normal(0, 0.001, rows)))
+    spread = close * rng.uniform(0.0001, 0.002, rows)
+    return pd.DataFrame(
+        {
+            "date": pd.date_range("2022-01-01", periods=rows, freq="min"),
+            "open": close * (1 + rng.normal(0, 0.0005, rows)),
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.uniform(100, 10_000, rows),
+        }
+    )
+
+
+def timed(func) -> tuple:
+    """
+    Time a call.
+
+    Parameters:
+    - func (Callable): The call, without arguments.
+
+    Returns:
+    - tuple: (result, seconds).
+    """
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    day = 1_440
+    rows = 500 * day
+    df = make_ohlcv(rows + day)
+    root = tempfile.mkdtemp()
+    month_start = df["date"].iloc[-30 * day]
+
+    print(f"{rows:,} stored rows, one day appended, last month read")
+    print(f"{'indicator':<28} {'full (ms)':>10} {'update (ms)':>12} {'read (ms)':>10}")
+    for name, kwargs in CALLS:
+        func = getattr(bta, name)
+        store.update(root, df.iloc[:rows], "BTC/USDT", "1m", name, **kwargs)
+
+        full, full_time = timed(lambda: func(df, **kwargs))
+        _, update_time = timed(
+            lambda: store.update(root, df, "BTC/USDT", "1m", name, **kwargs)
+        )
+        _, read_time = timed(
+            lambda: store.read(root, "BTC/USDT", "1m", name, start=month_start, **kwargs)
+        )
+
+        stored = store.read(root, "BTC/USDT", "1m", name, **kwargs)
+        # Same values up to the rounding of pandas' running window sums
+        assert np.allclose(
+            stored.drop(columns="date").to_numpy(dtype=float),
+            full.to_numpy(dtype=float).reshape(len(df), -1),
+            rtol=1e-6,
+            equal_nan=True,
+        ), name
+
+        print(
+            f"{name:<28} {full_time * 1e3:>10.1f} {update_time * 1e3:>12.1f} "
+            f"{read_time * 1e3:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
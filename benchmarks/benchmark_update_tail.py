@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# benchmark_update_tail.py
+"""
+Full recomputation vs ``bta.update_tail`` when one candle is appended.
+
+Computes a set of windowed indicators on a long frame, appends one candle
+and times a full recomputation against ``bta.update_tail``, which only
+recomputes the new row from the rows its window covers. The full run grows
+with the length of the frame, the tail update with the window.
+
+Usage:
+    python benchmarks/benchmark_update_tail.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import bamboo_ta.bamboo_ta as bta  # noqa: E402
+
+CALLS = [
+    ("bollinger_bands", {"period": 20}),
+    ("donchian_channel", {"period": 55}),
+    ("williams_r", {}),
+    ("momentum", {}),
+    ("rate_of_change", {}),
+    ("commodity_channel_index", {}),
+    ("simple_moving_average", {"period": 200}),
+    ("money_flow_index", {}),
+]
+
+
+def make_ohlcv(rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Build a random-walk OHLCV DataFrame.
+
+    Parameters:
+    - rows (int): Number of rows.
+    - seed (int): Random seed.
+
+    Returns:
+    - pd.DataFrame: DataFrame with 'open', 'high', 'low', 'close' and 'volume'.
+    """
+    rng = np.random.default_rng(seed)
+    close = 30_000 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    spread = close * rng.uniform(0.001, 0.02, rows)
+    return pd.DataFrame(
+        {
+            "open": close * (1 + rng.normal(0, 0.005, rows)),
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.uniform(100, 10_000, rows),
+        }
+    )
+
+
+def best_of(func, repeat: int = 5) -> tuple:
+    """
+    Time a call several times.
+
+    Parameters:
+    - func (Callable): The call, without arguments.
+    - repeat (int): Number of runs.
+
+    Returns:
+    - tuple: (result of the last run, fastest time in seconds).
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    rows = 200_000
+    df = make_ohlcv(rows + 1)
+    previous = df.iloc[:-1]
+
+    print(f"{rows:,} rows, one candle appended")
+    print(f"{'indicator':<26} {'warmup':>7} {'full (ms)':>10} {'tail (ms)':>10} {'speedup':>8}")
+    for name, kwargs in CALLS:
+        func = getattr(bta, name)
+        prev_result = func(previous, **kwargs)
+        full, full_time = best_of(lambda: func(df, **kwargs))
+        tail, tail_time = best_of(lambda: bta.update_tail(prev_result, df, name, **kwargs))
+
+        # Same values up to the rounding that running window sums accumulate
+        # over the full frame
+        assert np.allclose(
+            full.to_numpy(dtype=float), tail.to_numpy(dtype=float), rtol=1e-6, equal_nan=True
+        ), name
+
+        warmup = bta.indicator_metadata(name, **kwargs)["warmup"]
+        print(
+            f"{name:<26} {warmup:>7} {full_time * 1e3:>10.2f} "
+            f"{tail_time * 1e3:>10.2f} {full_time / tail_time:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
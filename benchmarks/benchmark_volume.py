@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# benchmark_volume.py
+"""
+Benchmark for the volume indicators built on the masked-cumsum and
+rolling-sum primitives in bamboo_ta/volume/_primitives.py.
+
+The Negative Volume Index used to be calculated with a per-row Python loop
+that wrote every value back with ``df.loc``. This script times that loop
+(kept here as a reference implementation) against the current O(n) NumPy
+version on growing inputs, checks that both produce identical values and
+also reports the timings of the other rebuilt volume indicators.
+
+Usage:
+    python benchmarks/benchmark_volume.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import bamboo_ta.bamboo_ta as bta  # noqa: E402
+
+
+def nvi_loop_reference(df: pd.DataFrame) -> pd.Series:
+    """
+    The former per-row NVI implementation, kept as a reference.
+
+    Parameters:
+    - df (pandas.DataFrame): Input DataFrame with 'close' and 'volume' columns.
+
+    Returns:
+    - pd.Series: The Negative Volume Index.
+    """
+    df_copy = df.copy()
+    df_copy["roc"] = df_copy["close"].pct_change() * 100
+    df_copy["nvi"] = 1000.0
+    for i in range(1, len(df_copy)):
+        if df_copy["volume"].iloc[i] < df_copy["volume"].iloc[i - 1]:
+            df_copy.loc[df_copy.index[i], "nvi"] = (
+                df_copy["nvi"].iloc[i - 1] + df_copy["roc"].iloc[i]
+            )
+        else:
+            df_copy.loc[df_copy.index[i], "nvi"] = df_copy["nvi"].iloc[i - 1]
+    return df_copy["nvi"]
+
+
+def make_ohlcv(rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Build a random-walk OHLCV DataFrame.
+
+    Parameters:
+    - rows (int): Number of rows.
+    - seed (int): Random seed.
+
+    Returns:
+    - pd.DataFrame: DataFrame with 'open', 'high', 'low', 'close' and 'volume'.
+    """
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, rows))
+    spread = rng.uniform(0.1, 2.0, rows)
+    return pd.DataFrame(
+        {
+            "open": close + rng.normal(0, 0.5, rows),
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.uniform(100, 10_000, rows),
+        }
+    )
+
+
+def timed(func, *args, repeat: int = 3, **kwargs) -> float:
+    """Best wall-clock time in seconds of ``repeat`` calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print("Negative Volume Index: per-row loop vs masked cumulative sum")
+    print(f"{'rows':>10} {'loop (s)':>12} {'numpy (s)':>12} {'speedup':>10}")
+    for rows in (1_000, 5_000, 20_000):
+        df = make_ohlcv(rows)
+        loop_time = timed(nvi_loop_reference, df, repeat=1)
+        fast_time = timed(bta.negative_volume_index, df)
+
+        # Both implementations must produce exactly the same values
+        reference = nvi_loop_reference(df).to_numpy()
+        result = bta.negative_volume_index(df)["nvi"].to_numpy()
+        assert np.array_equal(reference, result, equal_nan=True)
+
+        print(
+            f"{rows:>10} {loop_time:>12.4f} {fast_time:>12.4f} "
+            f"{loop_time / fast_time:>9.0f}x"
+        )
+
+    # The vectorised version scales linearly, so it can run on much larger inputs
+    print("\nVolume indicators on large inputs (O(n) scaling)")
+    indicators = [
+        bta.negative_volume_index,
+        bta.positive_volume_index,
+        bta.price_volume_trend,
+        bta.money_flow_index,
+        bta.on_balance_volume,
+        bta.accumulation_on_balance_volume,
+    ]
+    sizes = (100_000, 1_000_000)
+    print(f"{'indicator':<34}" + "".join(f"{rows:>14,}" for rows in sizes))
+    frames = {rows: make_ohlcv(rows) for rows in sizes}
+    for indicator in indicators:
+        times = [timed(indicator, frames[rows]) for rows in sizes]
+        print(f"{indicator.__name__:<34}" + "".join(f"{t:>13.4f}s" for t in times))
+
+
+if __name__ == "__main__":
+    main()
@@ -61,8 +61,10 @@ def get_indicator_doc(module, indicator_name: str) -> str:
     for name, obj in inspect.getmembers(module):
         if name == f"{indicator_name}.__doc__" and isinstance(obj, str):
             return obj
-    # Try to find any function with a docstring
+    # Try to find any public function defined in the module with a docstring
     for name, obj in inspect.getmembers(module):
+        if name.startswith("_") or getattr(obj, "__module__", None) != module.__name__:
+            continue
         if callable(obj) and obj.__doc__:
             return obj.__doc__
     return "*No docstring found.*"
@@ -79,7 +81,7 @@ def collect_indicators_by_category():
         
         indicators = []
         for file in sorted(category_dir.glob("*.py")):
-            if file.name.startswith("__"):
+            if file.name.startswith("_"):
                 continue
             indicator_name = file.stem
             indicators.append(snake_to_title(indicator_name))
@@ -185,7 +187,7 @@ def main():
                 continue
             out.write(f"# {snake_to_title(category)}\n\n")
             for file in sorted(category_dir.glob("*.py")):
-                if file.name.startswith("__"):
+                if file.name.startswith("_"):
                     continue
                 indicator_name = file.stem
                 module_path = f"bamboo_ta.{category}.{indicator_name}"
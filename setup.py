@@ -39,6 +39,11 @@ setup(
     install_requires=["pandas", "numpy"],
     extras_require={
         "def": ["pytest", "twine"],
+        "jit": ["numba"],
+        "arrow": ["pyarrow"],
+        "polars": ["polars"],
+        "yaml": ["pyyaml"],
     },
+    entry_points={"console_scripts": ["bamboo-ta=bamboo_ta.cli:main"]},
     python_requres=">=3.10",
 )
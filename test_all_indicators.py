@@ -37,7 +37,7 @@ def find_indicator_modules():
             continue
             
         for file_path in category_dir.glob("*.py"):
-            if file_path.name.startswith("__"):
+            if file_path.name.startswith("_"):
                 continue
                 
             # Convert path to module format